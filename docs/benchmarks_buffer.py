@@ -0,0 +1,56 @@
+"""Report the time taken to send a large buffer over a socket, directly and
+through a proxy, as a measure of the cost of copying the buffer.
+
+Run as ``python benchmarks_buffer.py``. Set ``WRAPT_DISABLE_EXTENSIONS=1``
+in the environment to measure the pure Python implementation instead.
+"""
+
+import socket
+import threading
+import time
+
+import wrapt
+
+SIZE = 100 * 1024 * 1024
+
+REPEAT = 5
+
+
+def receive(sock, size):
+    buffer = bytearray(1024 * 1024)
+
+    while size:
+        size -= sock.recv_into(buffer)
+
+
+def measure(factory):
+    data = bytearray(SIZE)
+
+    timings = []
+
+    for _ in range(REPEAT):
+        reader, writer = socket.socketpair()
+
+        thread = threading.Thread(target=receive, args=(reader, SIZE))
+        thread.start()
+
+        start = time.perf_counter()
+        writer.sendall(factory(data))
+        thread.join()
+        timings.append(time.perf_counter() - start)
+
+        reader.close()
+        writer.close()
+
+    return min(timings)
+
+
+BENCHMARKS = [
+    ("bytearray", lambda data: data),
+    ("BufferObjectProxy", wrapt.BufferObjectProxy),
+    ("ObjectProxy (bytes copy)", lambda data: bytes(wrapt.ObjectProxy(data))),
+]
+
+if __name__ == "__main__":
+    for name, factory in BENCHMARKS:
+        print("%-30s %6.1f ms" % (name, measure(factory) * 1000))
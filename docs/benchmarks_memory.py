@@ -0,0 +1,69 @@
+"""Report the memory used per proxy instance, as measured by tracemalloc.
+
+Run as ``python benchmarks_memory.py``. Set ``WRAPT_DISABLE_EXTENSIONS=1``
+in the environment to measure the pure Python implementation instead.
+"""
+
+import gc
+import tracemalloc
+
+import wrapt
+
+COUNT = 100000
+
+
+def function():
+    pass
+
+
+class Proxy(wrapt.ObjectProxy):
+
+    def __init__(self, wrapped):
+        super().__init__(wrapped)
+        self._self_first = 1
+        self._self_second = 2
+
+
+class SlotsProxy(wrapt.ObjectProxy):
+
+    __slots__ = ("_self_first", "_self_second")
+
+    def __init__(self, wrapped):
+        super().__init__(wrapped)
+        self._self_first = 1
+        self._self_second = 2
+
+
+def wrapper(wrapped, instance, args, kwargs):
+    return wrapped(*args, **kwargs)
+
+
+def measure(factory):
+    gc.collect()
+
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+
+    del objects
+
+    return (after - before) / COUNT
+
+
+BENCHMARKS = [
+    ("ObjectProxy", lambda: wrapt.ObjectProxy(function)),
+    ("ObjectProxy subclass", lambda: Proxy(function)),
+    ("ObjectProxy subclass (slots)", lambda: SlotsProxy(function)),
+    ("FunctionWrapper", lambda: wrapt.FunctionWrapper(function, wrapper)),
+    ("lru_cache", lambda: wrapt.lru_cache(function)),
+    ("synchronized", lambda: wrapt.synchronized(function)),
+    ("WeakFunctionProxy", lambda: wrapt.WeakFunctionProxy(function)),
+]
+
+if __name__ == "__main__":
+    for name, factory in BENCHMARKS:
+        print("%-30s %6.0f bytes" % (name, measure(factory)))
@@ -1,16 +1,22 @@
 import sys
 
 if sys.version_info >= (3, 10):
+    from concurrent.futures import Executor
     from inspect import FullArgSpec, Signature
+    from os import PathLike
     from types import GenericAlias, ModuleType, TracebackType
     from typing import (
         Any,
         AsyncIterator,
+        Awaitable,
         Callable,
         Concatenate,
         Generator,
         Generic,
+        Iterable,
         Iterator,
+        Mapping,
+        NamedTuple,
         ParamSpec,
         Protocol,
         TypeVar,
@@ -21,25 +27,36 @@ if sys.version_info >= (3, 10):
     # listed here is a private stub-internal helper (TypeVar, Protocol,
     # type alias) and is prefixed with a leading underscore.
     __all__ = (
+        "AtomicObjectProxy",
         "AutoObjectProxy",
         "BaseObjectProxy",
         "BoundFunctionWrapper",
+        "BufferObjectProxy",
         "CallableObjectProxy",
+        "CopyOnWriteProxy",
         "FunctionWrapper",
         "LazyObjectProxy",
         "ObjectProxy",
         "PartialCallableObjectProxy",
+        "PooledObjectProxy",
+        "RefreshingObjectProxy",
+        "TrackingProxy",
         "partial",
+        "snapshot_wrapped",
+        "swap_wrapped",
         "AdapterFactory",
         "adapter_factory",
         "bind_state_to_wrapper",
         "async_to_sync",
+        "batched_async",
         "decorator",
+        "hedged",
         "lru_cache",
         "mark_as_async",
         "mark_as_sync",
         "sync_to_async",
         "synchronized",
+        "timeout",
         "with_signature",
         "discover_post_import_hooks",
         "notify_module_loaded",
@@ -48,6 +65,9 @@ if sys.version_info >= (3, 10):
         "apply_patch",
         "function_wrapper",
         "lazy_import",
+        "lazy_load",
+        "warm_up",
+        "warm_up_async",
         "patch_function_wrapper",
         "resolve_path",
         "transient_function_wrapper",
@@ -55,6 +75,8 @@ if sys.version_info >= (3, 10):
         "wrap_object",
         "wrap_object_attribute",
         "WeakFunctionProxy",
+        "WeakSignal",
+        "proxy_for",
     )
 
     _P = ParamSpec("_P")
@@ -259,6 +281,11 @@ if sys.version_info >= (3, 10):
         # object; subclasses may override it to run additional fixup logic
         # when the wrapped object changes.
         def __wrapped_setattr_fixups__(self) -> None: ...
+
+        # Hook called with the result of a NumPy ufunc or function
+        # dispatched to the wrapped object through __array_ufunc__ or
+        # __array_function__; subclasses may override it to wrap the result.
+        def __wrapped_array_result__(self, result: Any) -> Any: ...
         def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
         def __iter__(self) -> Iterator[Any]: ...
         def __next__(self) -> Any: ...
@@ -285,17 +312,130 @@ if sys.version_info >= (3, 10):
         ) -> None: ...
 
     @overload
-    def lazy_import(name: str) -> LazyObjectProxy[ModuleType]: ...
+    def lazy_import(
+        name: str, *, rebind: bool = False
+    ) -> LazyObjectProxy[ModuleType]: ...
     @overload
     def lazy_import(
-        name: str, attribute: str, *, interface: Any = ...
+        name: str, attribute: str, *, interface: Any = ..., rebind: bool = False
     ) -> LazyObjectProxy[Any]: ...
 
+    # lazy_load
+
+    _K = TypeVar("_K")
+
+    @overload
+    def lazy_load(
+        path: str | PathLike[str],
+        loader: Callable[[Any], _T] = ...,
+        *,
+        interface: Any = ...,
+    ) -> LazyObjectProxy[_T]: ...
+    @overload
+    def lazy_load(
+        path: str | PathLike[str],
+        loader: Callable[[Any], _T] = ...,
+        *,
+        segments: Mapping[_K, tuple[int, int]],
+        interface: Any = ...,
+    ) -> dict[_K, LazyObjectProxy[_T]]: ...
+
+    # warm_up
+
+    def warm_up(*proxies: Any, max_workers: int | None = None) -> list[Any]: ...
+    async def warm_up_async(*proxies: Any) -> list[Any]: ...
+
+    # CopyOnWriteProxy
+
+    class CopyOnWriteProxy(BaseObjectProxy[_T]):
+        def __init__(self, wrapped: _T, *, depth: int | None = 1) -> None: ...
+
+    # TrackingProxy
+
+    class TrackingProxy(BaseObjectProxy[_T]):
+        def __init__(self, wrapped: _T, *, nested: bool = False) -> None: ...
+        def dirty(self) -> frozenset[Any]: ...
+        def reset_dirty(self) -> frozenset[Any]: ...
+
+    # PooledObjectProxy
+
+    class _PooledCheckout(Generic[_T]):
+        def __enter__(self) -> _T: ...
+        def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_value: BaseException | None,
+            traceback: TracebackType | None,
+        ) -> None: ...
+        async def __aenter__(self) -> _T: ...
+        async def __aexit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_value: BaseException | None,
+            traceback: TracebackType | None,
+        ) -> None: ...
+
+    class PooledObjectProxy(BaseObjectProxy[_T]):
+        def __init__(
+            self,
+            factory: Callable[[], _T],
+            *,
+            size: int = 8,
+            check: Callable[[_T], bool] | None = None,
+            discard: Callable[[_T], Any] | None = None,
+            timeout: float | None = None,
+        ) -> None: ...
+        def checkout(self, timeout: float | None = ...) -> _PooledCheckout[_T]: ...
+
+    # RefreshingObjectProxy
+
+    class RefreshingObjectProxy(LazyObjectProxy[_T]):
+        def __new__(
+            cls,
+            callback: Callable[[], _T],
+            *,
+            ttl: float,
+            refresh_in_background: bool = True,
+            retry: float | None = None,
+            on_error: Callable[[Exception], Any] | None = None,
+            interface: Any = ...,
+        ) -> RefreshingObjectProxy[_T]: ...
+        def __init__(
+            self,
+            callback: Callable[[], _T],
+            *,
+            ttl: float,
+            refresh_in_background: bool = True,
+            retry: float | None = None,
+            on_error: Callable[[Exception], Any] | None = None,
+            interface: Any = ...,
+        ) -> None: ...
+        def refresh(self) -> None: ...
+        def stale(self) -> bool: ...
+        def stop(self) -> None: ...
+
+    # AtomicObjectProxy
+
+    class AtomicObjectProxy(BaseObjectProxy[_T]):
+        def __init__(self, wrapped: _T) -> None: ...
+
+    def swap_wrapped(
+        pairs: Iterable[tuple[BaseObjectProxy[Any], Any]], /
+    ) -> list[Any]: ...
+    def snapshot_wrapped(*proxies: BaseObjectProxy[Any]) -> tuple[Any, ...]: ...
+
     # CallableObjectProxy
 
     class CallableObjectProxy(BaseObjectProxy[_T]):
         def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
+    # BufferObjectProxy
+
+    class BufferObjectProxy(BaseObjectProxy[_T]):
+        if sys.version_info >= (3, 12):
+            def __buffer__(self, flags: int, /) -> memoryview: ...
+            def __release_buffer__(self, view: memoryview, /) -> None: ...
+
     # PartialCallableObjectProxy
 
     class PartialCallableObjectProxy(BaseObjectProxy[Callable[..., Any]]):
@@ -318,6 +458,33 @@ if sys.version_info >= (3, 10):
         ) -> None: ...
         def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
 
+    # WeakSignal
+
+    _ListenerT = TypeVar("_ListenerT", bound=Callable[..., Any])
+
+    class WeakSignal:
+        def __init__(
+            self,
+            on_error: Callable[[WeakFunctionProxy, Exception], Any] | None = None,
+        ) -> None: ...
+        def connect(self, listener: _ListenerT) -> _ListenerT: ...
+        def disconnect(self, listener: Callable[..., Any]) -> bool: ...
+        def is_connected(self, listener: Callable[..., Any]) -> bool: ...
+        def clear(self) -> None: ...
+        def __len__(self) -> int: ...
+        def send(
+            self, /, *args: Any, **kwargs: Any
+        ) -> list[tuple[WeakFunctionProxy, Any]]: ...
+        async def send_async(
+            self, /, *args: Any, **kwargs: Any
+        ) -> list[tuple[WeakFunctionProxy, Any]]: ...
+
+    # proxy_for
+
+    _ProxyT = TypeVar("_ProxyT")
+
+    def proxy_for(obj: _T, proxy_type: Callable[[_T], _ProxyT]) -> _ProxyT: ...
+
     # FunctionWrapper
 
     _WrappedFunction = Callable[_P, _R]
@@ -651,8 +818,22 @@ if sys.version_info >= (3, 10):
     def mark_as_async(
         *, generator: bool | None = None
     ) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]: ...
-    def async_to_sync(wrapped: Callable[_P, _R]) -> Callable[_P, _R]: ...
-    def sync_to_async(wrapped: Callable[_P, _R]) -> Callable[_P, _R]: ...
+    @overload
+    def async_to_sync(wrapped: Callable[_P, _R], /) -> Callable[_P, _R]: ...
+    @overload
+    def async_to_sync(
+        *, persistent_loop: bool = False, prefetch: int = 0
+    ) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]: ...
+    @overload
+    def sync_to_async(wrapped: Callable[_P, _R], /) -> Callable[_P, _R]: ...
+    @overload
+    def sync_to_async(
+        *,
+        executor: Executor | None = None,
+        thread_sensitive: bool = False,
+        max_workers: int | None = None,
+        prefetch: int = 0,
+    ) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]: ...
 
     # bind_state_to_wrapper()
 
@@ -687,9 +868,83 @@ if sys.version_info >= (3, 10):
     def lru_cache(func: Callable[_P, _R], /) -> _LRUCacheFunctionWrapper[_P, _R]: ...
     @overload
     def lru_cache(
-        func: None = None, /, **kwargs: Any
+        func: None = None,
+        /,
+        *,
+        scope: str | None = None,
+        clear_at_fork: bool = False,
+        **kwargs: Any,
     ) -> Callable[[Callable[_P, _R]], _LRUCacheFunctionWrapper[_P, _R]]: ...
 
+    # batched_async()
+
+    @overload
+    def batched_async(
+        batch_fn: Callable[[list[Any]], Awaitable[Any]],
+        /,
+        *,
+        max_batch: int | None = None,
+        max_delay: float = 0.0,
+    ) -> Callable[[Any], Awaitable[Any]]: ...
+    @overload
+    def batched_async(
+        batch_fn: None = None,
+        /,
+        *,
+        max_batch: int | None = None,
+        max_delay: float = 0.0,
+    ) -> Callable[
+        [Callable[[list[Any]], Awaitable[Any]]], Callable[[Any], Awaitable[Any]]
+    ]: ...
+
+    # hedged()
+
+    class _HedgeInfo(NamedTuple):
+        calls: int
+        hedged: int
+        wins: int
+        delay: float | None
+
+    class _BoundHedgedFunctionWrapper(BoundFunctionWrapper[_P1, _R1]):
+        def hedge_info(self) -> _HedgeInfo: ...
+        def hedge_clear(self) -> None: ...
+
+    class _HedgedFunctionWrapper(FunctionWrapper[_P1, _R1]):
+        __bound_function_wrapper__: type[_BoundHedgedFunctionWrapper[_P1, _R1]]
+        def hedge_info(self) -> _HedgeInfo: ...
+        def hedge_clear(self) -> None: ...
+
+    @overload
+    def hedged(
+        wrapped: Callable[_P, _R],
+        /,
+        *,
+        delay: float | None = None,
+        max_attempts: int = 2,
+        percentile: float | None = None,
+        window: int = 100,
+    ) -> _HedgedFunctionWrapper[_P, _R]: ...
+    @overload
+    def hedged(
+        wrapped: None = None,
+        /,
+        *,
+        delay: float | None = None,
+        max_attempts: int = 2,
+        percentile: float | None = None,
+        window: int = 100,
+    ) -> Callable[[Callable[_P, _R]], _HedgedFunctionWrapper[_P, _R]]: ...
+
+    # timeout()
+
+    def timeout(
+        seconds: float | None,
+        /,
+        *,
+        thread: bool = False,
+        max_abandoned: int | None = 8,
+    ) -> Callable[[Callable[_P, _R]], FunctionWrapper[_P, _R]]: ...
+
     # with_signature()
 
     def with_signature(
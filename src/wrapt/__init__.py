@@ -17,13 +17,18 @@ __version_info__ = ("2", "4", "0", "rc1")
 __version__ = _format_version(__version_info__)
 
 from .__wrapt__ import (
+    AtomicObjectProxy,
     BaseObjectProxy,
     BoundFunctionWrapper,
+    BufferObjectProxy,
     CallableObjectProxy,
     FunctionWrapper,
     PartialCallableObjectProxy,
     partial,
+    snapshot_wrapped,
+    swap_wrapped,
 )
+from .batching import batched_async
 from .caching import lru_cache
 from .decorators import (
     AdapterFactory,
@@ -31,6 +36,7 @@ from .decorators import (
     bind_state_to_wrapper,
     decorator,
 )
+from .hedging import hedged
 from .importer import (
     discover_post_import_hooks,
     notify_module_loaded,
@@ -47,7 +53,19 @@ from .patches import (
     wrap_object,
     wrap_object_attribute,
 )
-from .proxies import AutoObjectProxy, LazyObjectProxy, ObjectProxy, lazy_import
+from .proxies import (
+    AutoObjectProxy,
+    CopyOnWriteProxy,
+    LazyObjectProxy,
+    ObjectProxy,
+    PooledObjectProxy,
+    RefreshingObjectProxy,
+    TrackingProxy,
+    lazy_import,
+    lazy_load,
+    warm_up,
+    warm_up_async,
+)
 from .signature import with_signature
 from .synchronization import (
     async_to_sync,
@@ -56,28 +74,40 @@ from .synchronization import (
     sync_to_async,
     synchronized,
 )
-from .weakrefs import WeakFunctionProxy
+from .timeouts import timeout
+from .weakrefs import WeakFunctionProxy, WeakSignal, proxy_for
 
 __all__ = (
+    "AtomicObjectProxy",
     "AutoObjectProxy",
     "BaseObjectProxy",
     "BoundFunctionWrapper",
+    "BufferObjectProxy",
     "CallableObjectProxy",
+    "CopyOnWriteProxy",
     "FunctionWrapper",
     "LazyObjectProxy",
     "ObjectProxy",
     "PartialCallableObjectProxy",
+    "PooledObjectProxy",
+    "RefreshingObjectProxy",
+    "TrackingProxy",
     "partial",
+    "snapshot_wrapped",
+    "swap_wrapped",
     "AdapterFactory",
     "adapter_factory",
     "bind_state_to_wrapper",
     "async_to_sync",
+    "batched_async",
     "decorator",
+    "hedged",
     "lru_cache",
     "mark_as_async",
     "mark_as_sync",
     "sync_to_async",
     "synchronized",
+    "timeout",
     "with_signature",
     "discover_post_import_hooks",
     "notify_module_loaded",
@@ -86,6 +116,9 @@ __all__ = (
     "apply_patch",
     "function_wrapper",
     "lazy_import",
+    "lazy_load",
+    "warm_up",
+    "warm_up_async",
     "patch_function_wrapper",
     "resolve_path",
     "transient_function_wrapper",
@@ -93,4 +126,6 @@ __all__ = (
     "wrap_object",
     "wrap_object_attribute",
     "WeakFunctionProxy",
+    "WeakSignal",
+    "proxy_for",
 )
@@ -4,9 +4,34 @@ wrappers.
 
 import os
 
-from .wrappers import BoundFunctionWrapper, CallableObjectProxy, FunctionWrapper
+from .wrappers import (
+    AtomicObjectProxy,
+    BoundFunctionWrapper,
+    BufferObjectProxy,
+    CallableObjectProxy,
+    FunctionWrapper,
+)
 from .wrappers import ObjectProxy as BaseObjectProxy
-from .wrappers import PartialCallableObjectProxy, _FunctionWrapperBase
+from .wrappers import (
+    PartialCallableObjectProxy,
+    _AutoObjectProxyAiter,
+    _AutoObjectProxyAnext,
+    _AutoObjectProxyAwait,
+    _AutoObjectProxyCall,
+    _AutoObjectProxyDelete,
+    _AutoObjectProxyFspath,
+    _AutoObjectProxyGet,
+    _AutoObjectProxyIter,
+    _AutoObjectProxyLengthHint,
+    _AutoObjectProxyNext,
+    _AutoObjectProxySet,
+    _AutoObjectProxySetName,
+    _FunctionWrapperBase,
+    _TrackingProxyBase,
+    _WeakFunctionProxyBase,
+    snapshot_wrapped,
+    swap_wrapped,
+)
 
 # Try to use C extensions if not disabled.
 
@@ -17,14 +42,32 @@ _use_extensions = not os.environ.get("WRAPT_DISABLE_EXTENSIONS")
 if _use_extensions:
     try:
         from ._wrappers import (  # type: ignore[no-redef,import-not-found,import-untyped]
+            AtomicObjectProxy,
             BoundFunctionWrapper,
+            BufferObjectProxy,
             CallableObjectProxy,
             FunctionWrapper,
         )
         from ._wrappers import ObjectProxy as BaseObjectProxy  # type: ignore[no-redef,import-untyped]
         from ._wrappers import (  # type: ignore[no-redef,import-not-found,import-untyped]
             PartialCallableObjectProxy,
+            _AutoObjectProxyAiter,
+            _AutoObjectProxyAnext,
+            _AutoObjectProxyAwait,
+            _AutoObjectProxyCall,
+            _AutoObjectProxyDelete,
+            _AutoObjectProxyFspath,
+            _AutoObjectProxyGet,
+            _AutoObjectProxyIter,
+            _AutoObjectProxyLengthHint,
+            _AutoObjectProxyNext,
+            _AutoObjectProxySet,
+            _AutoObjectProxySetName,
             _FunctionWrapperBase,
+            _TrackingProxyBase,
+            _WeakFunctionProxyBase,
+            snapshot_wrapped,
+            swap_wrapped,
         )
 
         _using_c_extension = True
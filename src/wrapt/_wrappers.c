@@ -6,6 +6,33 @@
 
 /* ------------------------------------------------------------------------- */
 
+/* Deferred reclamation state used by AtomicObjectProxy. Readers of the
+ * wrapped object never lock, instead counting themselves in and out
+ * around loading the field and taking their own reference to the value.
+ * A writer atomically exchanges the field and, rather than releasing the
+ * replaced object immediately, pushes it onto a lock free list of retired
+ * objects which are only released once no reader is in flight. Relies on
+ * the atomic operations API which is only provided from Python 3.13,
+ * which is also the first version with free-threaded builds. */
+
+#if PY_VERSION_HEX >= 0x030D0000
+#define WRAPT_HAVE_RCU 1
+#endif
+
+typedef struct wrapt_retired
+{
+  PyObject *object;
+  struct wrapt_retired *next;
+} wrapt_retired;
+
+typedef struct
+{
+  Py_ssize_t readers[2];
+  int epoch;
+  Py_ssize_t pending;
+  wrapt_retired *retired;
+} wrapt_rcu;
+
 typedef struct
 {
   PyObject_HEAD
@@ -14,6 +41,7 @@ typedef struct
   PyObject *wrapped;
   PyObject *weakreflist;
   int init_called;
+  wrapt_rcu *rcu;
 } WraptObjectProxyObject;
 
 typedef struct
@@ -24,6 +52,24 @@ typedef struct
   PyObject *kwargs;
 } WraptPartialCallableObjectProxyObject;
 
+typedef struct
+{
+  WraptObjectProxyObject object_proxy;
+
+  PyObject *instance;
+  vectorcallfunc vectorcall;
+} WraptWeakFunctionProxyObject;
+
+typedef struct
+{
+  WraptObjectProxyObject object_proxy;
+
+  PyObject *dirty;
+  PyObject *parent;
+  PyObject *key;
+  int nested;
+} WraptTrackingProxyObject;
+
 typedef struct
 {
   WraptObjectProxyObject object_proxy;
@@ -42,6 +88,25 @@ typedef struct
 
 static struct PyModuleDef moduledef;
 
+/* Indexes of the mixin types used by AutoObjectProxy, see below. */
+
+enum
+{
+  WRAPT_AUTO_MIXIN_CALL,
+  WRAPT_AUTO_MIXIN_ITER,
+  WRAPT_AUTO_MIXIN_NEXT,
+  WRAPT_AUTO_MIXIN_AITER,
+  WRAPT_AUTO_MIXIN_ANEXT,
+  WRAPT_AUTO_MIXIN_LENGTH_HINT,
+  WRAPT_AUTO_MIXIN_FSPATH,
+  WRAPT_AUTO_MIXIN_AWAIT,
+  WRAPT_AUTO_MIXIN_GET,
+  WRAPT_AUTO_MIXIN_SET,
+  WRAPT_AUTO_MIXIN_DELETE,
+  WRAPT_AUTO_MIXIN_SET_NAME,
+  WRAPT_AUTO_MIXIN_COUNT,
+};
+
 /* Per-interpreter module state. Holds the heap type objects so that methods
  * can reach them via PyType_GetModuleByDef without using static globals,
  * along with the cached interned strings and exception type below. */
@@ -49,11 +114,16 @@ static struct PyModuleDef moduledef;
 typedef struct
 {
   PyTypeObject *ObjectProxy_Type;
+  PyTypeObject *AtomicObjectProxy_Type;
   PyTypeObject *CallableObjectProxy_Type;
+  PyTypeObject *BufferObjectProxy_Type;
   PyTypeObject *PartialCallableObjectProxy_Type;
+  PyTypeObject *WeakFunctionProxyBase_Type;
+  PyTypeObject *TrackingProxyBase_Type;
   PyTypeObject *FunctionWrapperBase_Type;
   PyTypeObject *BoundFunctionWrapper_Type;
   PyTypeObject *FunctionWrapper_Type;
+  PyTypeObject *AutoObjectProxyMixin_Types[WRAPT_AUTO_MIXIN_COUNT];
 
   /* Cached interned attribute / argument names. Initialized eagerly in
    * wrapt_exec, released in wrapt_clear. Per-interpreter so they remain
@@ -91,12 +161,36 @@ typedef struct
   PyObject *str_set_name;               /* "__set_name__" */
   PyObject *str_self_binding;           /* "_self_binding" */
   PyObject *str_dict;                   /* "__dict__" */
+  PyObject *str_next;                   /* "__next__" */
+  PyObject *str_aiter;                  /* "__aiter__" */
+  PyObject *str_anext;                  /* "__anext__" */
+  PyObject *str_await;                  /* "__await__" */
+  PyObject *str_get;                    /* "__get__" */
+  PyObject *str_set;                    /* "__set__" */
+  PyObject *str_delete;                 /* "__delete__" */
+  PyObject *str_length_hint;            /* "__length_hint__" */
+  PyObject *str_fspath;                 /* "__fspath__" */
+  PyObject *str_mutating_methods;       /* "_self_mutating_methods" */
+  PyObject *str_wrapped_method;         /* "__wrapped_method__" */
+  PyObject *str_wrapped_track;          /* "__wrapped_track__" */
+  PyObject *str_wrapped_record;         /* "__wrapped_record__" */
 
   /* Cached exception type from wrapt.wrappers. Initialized eagerly in
    * wrapt_exec after type creation. The wrapt.wrappers module is guaranteed
    * to be imported before _wrappers because __wrapt__.py imports it first. */
 
   PyObject *WrapperNotInitializedError;
+
+  /* Sequence counter used by swap_wrapped() and snapshot_wrapped(). It is
+   * odd while a group of proxies is being swapped, so a snapshot which
+   * overlaps a swap can detect it and retry. Swaps are serialised by the
+   * mutex on Python 3.13+, and by the GIL on older versions, where no
+   * Python code is run while the counter is odd. */
+
+  Py_ssize_t swap_sequence;
+#if PY_VERSION_HEX >= 0x030D0000
+  PyMutex swap_mutex;
+#endif
 } wrapt_module_state;
 
 static inline wrapt_module_state *wrapt_get_state(PyObject *module)
@@ -204,13 +298,220 @@ static inline PyObject *wrapt_acquire_field(PyObject *owner, PyObject **field)
   return value;
 }
 
+/* Deferred reclamation for AtomicObjectProxy. See wrapt_rcu above.
+ *
+ * Retired objects are pushed onto the list by writers and detached from
+ * it in bulk for release. An object which was detached can be released
+ * only if no reader is in flight at some point after it was replaced in
+ * the field, since any reader which could have loaded it must have
+ * counted itself in before loading it. Detaching the list before checking
+ * the reader counts guarantees this for everything detached. If readers
+ * are in flight the detached objects are pushed back, to be released by
+ * the last reader out or by a later writer.
+ *
+ * Readers count themselves against one of two counters, selected by the
+ * current epoch. Under a steady stream of overlapping reads neither
+ * counter may ever drop to zero, so once the number of retired objects
+ * reaches WRAPT_RCU_RETIRED_LIMIT the writer waits for a grace period
+ * instead. It flips the epoch, so new readers count against the other
+ * counter, and waits for the counter of the previous epoch to drain,
+ * doing this twice so both counters have drained after the objects were
+ * detached. Only readers which were already in flight are waited on, and
+ * readers are only counted while loading the field and taking a
+ * reference, so the wait is short. All atomic operations used are
+ * sequentially consistent. */
+
+#define WRAPT_RCU_RETIRED_LIMIT 64
+
+#ifdef WRAPT_HAVE_RCU
+static void wrapt_rcu_free(wrapt_rcu *rcu, wrapt_retired *node)
+{
+  Py_ssize_t count = 0;
+
+  while (node)
+  {
+    wrapt_retired *next = node->next;
+    Py_DECREF(node->object);
+    PyMem_RawFree(node);
+    node = next;
+    count++;
+  }
+
+  _Py_atomic_add_ssize(&rcu->pending, -count);
+}
+
+static int wrapt_rcu_idle(wrapt_rcu *rcu)
+{
+  return _Py_atomic_load_ssize(&rcu->readers[0]) == 0 &&
+         _Py_atomic_load_ssize(&rcu->readers[1]) == 0;
+}
+
+static void wrapt_rcu_synchronize(wrapt_rcu *rcu)
+{
+  int i;
+
+  for (i = 0; i < 2; i++)
+  {
+    int epoch = _Py_atomic_load_int(&rcu->epoch);
+
+    _Py_atomic_store_int(&rcu->epoch, !epoch);
+
+    while (_Py_atomic_load_ssize(&rcu->readers[epoch]) != 0)
+      ;
+  }
+}
+
+static void wrapt_rcu_push(wrapt_rcu *rcu, wrapt_retired *first)
+{
+  wrapt_retired *last = first;
+  wrapt_retired *head;
+
+  while (last->next)
+    last = last->next;
+
+  head = (wrapt_retired *)_Py_atomic_load_ptr(&rcu->retired);
+
+  do
+  {
+    last->next = head;
+  } while (!_Py_atomic_compare_exchange_ptr(&rcu->retired, &head, first));
+}
+
+static void wrapt_rcu_reclaim(wrapt_rcu *rcu)
+{
+  wrapt_retired *node;
+
+  node = (wrapt_retired *)_Py_atomic_exchange_ptr(&rcu->retired, NULL);
+
+  if (!node)
+    return;
+
+  if (!wrapt_rcu_idle(rcu))
+  {
+    wrapt_rcu_push(rcu, node);
+    return;
+  }
+
+  wrapt_rcu_free(rcu, node);
+}
+
+static void wrapt_rcu_retire(wrapt_rcu *rcu, PyObject *object)
+{
+  wrapt_retired *node;
+
+  node = (wrapt_retired *)PyMem_RawMalloc(sizeof(wrapt_retired));
+
+  if (!node)
+  {
+    /* Unable to defer the release, so wait for a grace period instead. */
+
+    wrapt_rcu_synchronize(rcu);
+
+    Py_DECREF(object);
+    return;
+  }
+
+  node->object = object;
+  node->next = NULL;
+
+  _Py_atomic_add_ssize(&rcu->pending, 1);
+
+  wrapt_rcu_push(rcu, node);
+
+  if (_Py_atomic_load_ssize(&rcu->pending) >= WRAPT_RCU_RETIRED_LIMIT)
+  {
+    node = (wrapt_retired *)_Py_atomic_exchange_ptr(&rcu->retired, NULL);
+
+    if (node)
+    {
+      wrapt_rcu_synchronize(rcu);
+      wrapt_rcu_free(rcu, node);
+    }
+
+    return;
+  }
+
+  wrapt_rcu_reclaim(rcu);
+}
+
+static PyObject *wrapt_rcu_acquire(WraptObjectProxyObject *self)
+{
+  wrapt_rcu *rcu = self->rcu;
+  int epoch = _Py_atomic_load_int(&rcu->epoch);
+  PyObject *value;
+
+  _Py_atomic_add_ssize(&rcu->readers[epoch], 1);
+
+  value = (PyObject *)_Py_atomic_load_ptr(&self->wrapped);
+  Py_XINCREF(value);
+
+  if (_Py_atomic_add_ssize(&rcu->readers[epoch], -1) == 1 &&
+      _Py_atomic_load_ptr(&rcu->retired) != NULL)
+  {
+    wrapt_rcu_reclaim(rcu);
+  }
+
+  return value;
+}
+#endif
+
 /* Convenience form for the common case of the wrapped object field. */
 
 static inline PyObject *wrapt_acquire_wrapped(WraptObjectProxyObject *self)
 {
+#ifdef WRAPT_HAVE_RCU
+  if (self->rcu)
+    return wrapt_rcu_acquire(self);
+#endif
+
   return wrapt_acquire_field((PyObject *)self, &self->wrapped);
 }
 
+/* Replace the wrapped object field, stealing the reference to value and
+ * returning the reference to the replaced object, which must be released
+ * using wrapt_release_wrapped(). Writers must hold the critical section
+ * of the proxy, which serialises them against each other and, for other
+ * than an AtomicObjectProxy, against readers. */
+
+static inline PyObject *wrapt_exchange_wrapped_locked(
+    WraptObjectProxyObject *self, PyObject *value)
+{
+  PyObject *old;
+
+#ifdef WRAPT_HAVE_RCU
+  if (self->rcu)
+    return (PyObject *)_Py_atomic_exchange_ptr(&self->wrapped, value);
+#endif
+
+  old = self->wrapped;
+  self->wrapped = value;
+
+  return old;
+}
+
+static inline void wrapt_release_wrapped(WraptObjectProxyObject *self,
+                                         PyObject *old)
+{
+  if (!old)
+    return;
+
+#ifdef WRAPT_HAVE_RCU
+  if (self->rcu)
+  {
+    wrapt_rcu_retire(self->rcu, old);
+    return;
+  }
+#endif
+
+  Py_DECREF(old);
+}
+
+static inline void wrapt_store_wrapped_locked(WraptObjectProxyObject *self,
+                                              PyObject *value)
+{
+  wrapt_release_wrapped(self, wrapt_exchange_wrapped_locked(self, value));
+}
+
 /* ------------------------------------------------------------------------- */
 
 /* Get module state for the wrapt module given any type whose MRO includes
@@ -222,6 +523,22 @@ static wrapt_module_state *wrapt_state_from_type(PyTypeObject *type)
   return m ? wrapt_get_state(m) : NULL;
 }
 
+/* Check whether an attribute name is the given interned string. Names
+ * used in attribute access from Python code are usually interned, so the
+ * identity check is normally sufficient, but a name constructed at runtime
+ * is not, and must still be matched. */
+
+static int wrapt_name_is(PyObject *name, PyObject *interned)
+{
+  if (name == interned)
+    return 1;
+
+  if (PyUnicode_CHECK_INTERNED(name))
+    return 0;
+
+  return PyUnicode_Compare(name, interned) == 0;
+}
+
 /* Walk type's MRO checking each tp_dict directly for the named attribute.
  * Does not invoke type's tp_getattro, so it does NOT trigger Python's lazy
  * creation of class-level attributes such as __annotations__. Used by
@@ -468,17 +785,16 @@ static PyObject *WraptObjectProxy_new(PyTypeObject *type, PyObject *args,
   if (!self)
     return NULL;
 
-  self->dict = PyDict_New();
-
-  if (!self->dict)
-  {
-    Py_DECREF(self);
-    return NULL;
-  }
+  /* The instance dictionary is only created when an attribute is first
+   * stored in it, so proxies which only use attributes held in type slots,
+   * including those declared using __slots__ in a derived class, do not
+   * need one. */
 
+  self->dict = NULL;
   self->wrapped = NULL;
   self->weakreflist = NULL;
   self->init_called = 0;
+  self->rcu = NULL;
 
   return (PyObject *)self;
 }
@@ -492,12 +808,8 @@ static int WraptObjectProxy_raw_init(WraptObjectProxyObject *self,
   if (!state)
     return -1;
 
-  PyObject *module_str = state->str_module;
-  PyObject *doc_str = state->str_doc;
   PyObject *wrapped_factory_str = state->str_wrapped_factory;
 
-  PyObject *object = NULL;
-
   // If wrapped is Py_None and we have a __wrapped_factory__ attribute
   // then we defer initialization of the wrapped object until it is first needed.
 
@@ -536,47 +848,11 @@ static int WraptObjectProxy_raw_init(WraptObjectProxyObject *self,
 
   Py_INCREF(wrapped);
   Py_BEGIN_CRITICAL_SECTION(self);
-  Py_XSETREF(self->wrapped, wrapped);
+  wrapt_store_wrapped_locked(self, wrapped);
   Py_END_CRITICAL_SECTION();
 
   self->init_called = 1;
 
-  object = PyObject_GetAttr(wrapped, module_str);
-
-  if (object)
-  {
-    if (PyDict_SetItem(self->dict, module_str, object) == -1)
-    {
-      Py_DECREF(object);
-      return -1;
-    }
-    Py_DECREF(object);
-  }
-  else
-  {
-    if (!PyErr_ExceptionMatches(PyExc_AttributeError))
-      return -1;
-    PyErr_Clear();
-  }
-
-  object = PyObject_GetAttr(wrapped, doc_str);
-
-  if (object)
-  {
-    if (PyDict_SetItem(self->dict, doc_str, object) == -1)
-    {
-      Py_DECREF(object);
-      return -1;
-    }
-    Py_DECREF(object);
-  }
-  else
-  {
-    if (!PyErr_ExceptionMatches(PyExc_AttributeError))
-      return -1;
-    PyErr_Clear();
-  }
-
   return 0;
 }
 
@@ -607,6 +883,14 @@ static int WraptObjectProxy_traverse(WraptObjectProxyObject *self,
   Py_VISIT(self->dict);
   Py_VISIT(self->wrapped);
 
+  if (self->rcu)
+  {
+    wrapt_retired *node;
+
+    for (node = self->rcu->retired; node; node = node->next)
+      Py_VISIT(node->object);
+  }
+
   return 0;
 }
 
@@ -617,6 +901,25 @@ static int WraptObjectProxy_clear(WraptObjectProxyObject *self)
   Py_CLEAR(self->dict);
   Py_CLEAR(self->wrapped);
 
+  /* Nothing can be reading from a proxy which is being cleared, so any
+   * retired objects can be released immediately. */
+
+  if (self->rcu)
+  {
+    wrapt_retired *node = self->rcu->retired;
+
+    self->rcu->retired = NULL;
+    self->rcu->pending = 0;
+
+    while (node)
+    {
+      wrapt_retired *next = node->next;
+      Py_DECREF(node->object);
+      PyMem_RawFree(node);
+      node = next;
+    }
+  }
+
   return 0;
 }
 
@@ -633,6 +936,12 @@ static void WraptObjectProxy_dealloc(WraptObjectProxyObject *self)
 
   WraptObjectProxy_clear(self);
 
+  if (self->rcu)
+  {
+    PyMem_RawFree(self->rcu);
+    self->rcu = NULL;
+  }
+
   tp->tp_free(self);
 
 #if PY_VERSION_HEX >= 0x030C0000
@@ -1133,7 +1442,7 @@ static PyObject *WraptObjectProxy_inplace_add(WraptObjectProxyObject *self,
      * all of the in-place operators which follow. */
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1221,7 +1530,7 @@ static PyObject *WraptObjectProxy_inplace_subtract(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1309,7 +1618,7 @@ static PyObject *WraptObjectProxy_inplace_multiply(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1398,7 +1707,7 @@ WraptObjectProxy_inplace_remainder(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1487,7 +1796,7 @@ static PyObject *WraptObjectProxy_inplace_power(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1575,7 +1884,7 @@ static PyObject *WraptObjectProxy_inplace_lshift(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1663,7 +1972,7 @@ static PyObject *WraptObjectProxy_inplace_rshift(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1751,7 +2060,7 @@ static PyObject *WraptObjectProxy_inplace_and(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1839,7 +2148,7 @@ static PyObject *WraptObjectProxy_inplace_xor(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -1927,7 +2236,7 @@ static PyObject *WraptObjectProxy_inplace_or(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -2058,7 +2367,7 @@ WraptObjectProxy_inplace_floor_divide(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -2147,7 +2456,7 @@ WraptObjectProxy_inplace_true_divide(WraptObjectProxyObject *self,
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -2275,7 +2584,7 @@ static PyObject *WraptObjectProxy_inplace_matrix_multiply(
       return NULL;
 
     Py_BEGIN_CRITICAL_SECTION(self);
-    Py_SETREF(self->wrapped, object);
+    wrapt_store_wrapped_locked(self, object);
     Py_END_CRITICAL_SECTION();
 
     Py_INCREF(self);
@@ -3026,7 +3335,7 @@ static int WraptObjectProxy_set_module(WraptObjectProxyObject *self,
 
   Py_DECREF(wrapped);
 
-  return PyDict_SetItemString(self->dict, "__module__", value);
+  return 0;
 }
 
 /* ------------------------------------------------------------------------- */
@@ -3077,7 +3386,7 @@ static int WraptObjectProxy_set_doc(WraptObjectProxyObject *self,
 
   Py_DECREF(wrapped);
 
-  return PyDict_SetItemString(self->dict, "__doc__", value);
+  return 0;
 }
 
 /* ------------------------------------------------------------------------- */
@@ -3219,22 +3528,12 @@ static int WraptObjectProxy_set_dict(WraptObjectProxyObject *self,
 
 static PyObject *WraptObjectProxy_get_self_dict(WraptObjectProxyObject *self)
 {
-  PyObject *result = NULL;
-
-  /* self->dict is only NULL after tp_clear has run. Perform the lazy
-   * recreation and the reference acquisition inside a critical section
-   * so that two threads racing here on a free-threaded build cannot both
-   * create a dict, leaking one of them, or return a dict which the other
-   * thread has already replaced. */
-
-  Py_BEGIN_CRITICAL_SECTION(self);
-  if (!self->dict)
-    self->dict = PyDict_New();
-  result = self->dict;
-  Py_XINCREF(result);
-  Py_END_CRITICAL_SECTION();
+  /* The instance dictionary is created lazily, either here or when an
+   * attribute is first stored in it. Use the same generic function as
+   * attribute assignment does to create it, so that on a free-threaded
+   * build two threads racing to create it cannot both do so. */
 
-  return result;
+  return PyObject_GenericGetDict((PyObject *)self, NULL);
 }
 
 /* ------------------------------------------------------------------------- */
@@ -3290,7 +3589,7 @@ static int WraptObjectProxy_set_wrapped(WraptObjectProxyObject *self,
 
   Py_INCREF(value);
   Py_BEGIN_CRITICAL_SECTION(self);
-  Py_XSETREF(self->wrapped, value);
+  wrapt_store_wrapped_locked(self, value);
   Py_END_CRITICAL_SECTION();
 
   fixups = PyObject_GetAttr((PyObject *)self, state->str_setattr_fixups);
@@ -3335,9 +3634,9 @@ static PyObject *WraptObjectProxy_getattro(WraptObjectProxyObject *self,
    * __module__/__doc__ strings that type.__module__ reads via raw dict
    * lookup. */
 
-  if (name == state->str_module)
+  if (wrapt_name_is(name, state->str_module))
     return WraptObjectProxy_get_module(self);
-  if (name == state->str_doc)
+  if (wrapt_name_is(name, state->str_doc))
     return WraptObjectProxy_get_doc(self);
 
   object = PyObject_GenericGetAttr((PyObject *)self, name);
@@ -3417,9 +3716,9 @@ static int WraptObjectProxy_setattro(WraptObjectProxyObject *self,
    * values in the type dict (from PyType_FromModuleAndSpec) would cause
    * wrapt_type_has_attr to match and GenericSetAttr to store locally. */
 
-  if (name == state->str_module)
+  if (wrapt_name_is(name, state->str_module))
     return WraptObjectProxy_set_module(self, value);
-  if (name == state->str_doc)
+  if (wrapt_name_is(name, state->str_doc))
     return WraptObjectProxy_set_doc(self, value);
 
   if (wrapt_type_has_attr(Py_TYPE(self), name))
@@ -3711,241 +4010,1789 @@ static PyType_Spec WraptCallableObjectProxy_spec = {
 
 /* ------------------------------------------------------------------------- */
 
-static PyObject *WraptPartialCallableObjectProxy_new(PyTypeObject *type,
-                                                     PyObject *args,
-                                                     PyObject *kwds)
+static int WraptBufferObjectProxy_getbuffer(WraptObjectProxyObject *self,
+                                            Py_buffer *view, int flags)
 {
-  WraptPartialCallableObjectProxyObject *self;
+  if (!self->wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(self) == -1)
+      return -1;
+  }
 
-  self = (WraptPartialCallableObjectProxyObject *)WraptObjectProxy_new(
-      type, args, kwds);
+  PyObject *wrapped = wrapt_acquire_wrapped(self);
 
-  if (!self)
-    return NULL;
+  /*
+   * The exporter fills in view->obj with a new reference to the wrapped
+   * object itself, so PyBuffer_Release() calls the release function of
+   * the wrapped object directly and the proxy needs no bf_releasebuffer.
+   */
 
-  self->args = NULL;
-  self->kwargs = NULL;
+  int result = PyObject_GetBuffer(wrapped, view, flags);
 
-  return (PyObject *)self;
+  Py_DECREF(wrapped);
+
+  return result;
 }
 
 /* ------------------------------------------------------------------------- */
 
-static int WraptPartialCallableObjectProxy_raw_init(
-    WraptPartialCallableObjectProxyObject *self, PyObject *wrapped,
-    PyObject *args, PyObject *kwargs)
+static PyType_Slot WraptBufferObjectProxy_slots[] = {
+    {Py_tp_dealloc, WraptObjectProxy_dealloc},
+    {Py_tp_traverse, WraptObjectProxy_traverse},
+    {Py_tp_clear, WraptObjectProxy_clear},
+    {Py_tp_init, WraptObjectProxy_init},
+    {Py_bf_getbuffer, WraptBufferObjectProxy_getbuffer},
+    {0, NULL},
+};
+
+static PyType_Spec WraptBufferObjectProxy_spec = {
+    .name = "_wrappers.BufferObjectProxy",
+    .basicsize = sizeof(WraptObjectProxyObject),
+    .itemsize = 0,
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+    .slots = WraptBufferObjectProxy_slots,
+};
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptAtomicObjectProxy_new(PyTypeObject *type, PyObject *args,
+                                            PyObject *kwds)
 {
-  int result = 0;
+  WraptObjectProxyObject *self;
 
-  result = WraptObjectProxy_raw_init((WraptObjectProxyObject *)self, wrapped);
+  self = (WraptObjectProxyObject *)WraptObjectProxy_new(type, args, kwds);
 
-  if (result == 0)
-  {
-    /* Serialise the swaps for the same reason as in the __wrapped__
-     * setter. Initialisation normally happens before the proxy is shared,
-     * but __init__ can be re-invoked on an already published proxy, in
-     * which case concurrent callers on a free-threaded build could
-     * otherwise decref the same old args or kwargs twice. */
+  if (!self)
+    return NULL;
 
-    Py_INCREF(args);
-    Py_XINCREF(kwargs);
+#ifdef WRAPT_HAVE_RCU
+  self->rcu = (wrapt_rcu *)PyMem_RawCalloc(1, sizeof(wrapt_rcu));
 
-    Py_BEGIN_CRITICAL_SECTION(self);
-    Py_XSETREF(self->args, args);
-    Py_XSETREF(self->kwargs, kwargs);
-    Py_END_CRITICAL_SECTION();
+  if (!self->rcu)
+  {
+    Py_DECREF(self);
+    return PyErr_NoMemory();
   }
+#endif
 
-  return result;
+  return (PyObject *)self;
 }
 
 /* ------------------------------------------------------------------------- */
 
-static int WraptPartialCallableObjectProxy_init(
-    WraptPartialCallableObjectProxyObject *self, PyObject *args,
-    PyObject *kwds)
-{
-  PyObject *wrapped = NULL;
-  PyObject *fnargs = NULL;
-
+static PyType_Slot WraptAtomicObjectProxy_slots[] = {
+    {Py_tp_dealloc, WraptObjectProxy_dealloc},
+    {Py_tp_traverse, WraptObjectProxy_traverse},
+    {Py_tp_clear, WraptObjectProxy_clear},
+    {Py_tp_init, WraptObjectProxy_init},
+    {Py_tp_new, WraptAtomicObjectProxy_new},
+    {0, NULL},
+};
+
+static PyType_Spec WraptAtomicObjectProxy_spec = {
+    .name = "_wrappers.AtomicObjectProxy",
+    .basicsize = sizeof(WraptObjectProxyObject),
+    .itemsize = 0,
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+    .slots = WraptAtomicObjectProxy_slots,
+};
+
+/* ------------------------------------------------------------------------- */
+
+/* Mixin types used by AutoObjectProxy and LazyObjectProxy. Each adds a
+ * single special method, implemented natively using the corresponding
+ * type slot. The per instance class created by AutoObjectProxy lists the
+ * mixins it needs for the wrapped object as additional base classes, so
+ * that those slots are inherited directly rather than dispatching through
+ * Python functions. As the mixins add no fields, any combination of them
+ * can be used as bases together. The wrapped object is looked up on each
+ * call, using the slot of the wrapped object directly where it has one. */
+
+static PyObject *WraptAutoObjectProxy_iter(WraptObjectProxyObject *self)
+{
+  if (!self->wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(self) == -1)
+      return NULL;
+  }
+
+  PyObject *wrapped = wrapt_acquire_wrapped(self);
+
+  PyObject *result = PyObject_GetIter(wrapped);
+
+  Py_DECREF(wrapped);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptAutoObjectProxy_iternext(WraptObjectProxyObject *self)
+{
+  PyObject *result = NULL;
+
+  if (!self->wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(self) == -1)
+      return NULL;
+  }
+
+  PyObject *wrapped = wrapt_acquire_wrapped(self);
+
+  if (PyIter_Check(wrapped))
+  {
+    result = Py_TYPE(wrapped)->tp_iternext(wrapped);
+  }
+  else
+  {
+    wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+
+    if (state)
+      result = PyObject_CallMethodObjArgs(wrapped, state->str_next, NULL);
+  }
+
+  Py_DECREF(wrapped);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+/* Call a unary async slot of the wrapped object, falling back to calling
+ * the named method where the type of the wrapped object does not provide
+ * the slot. */
+
+static PyObject *wrapt_call_async_slot(WraptObjectProxyObject *self,
+                                       size_t offset, PyObject *name)
+{
+  PyObject *result = NULL;
+
+  if (!self->wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(self) == -1)
+      return NULL;
+  }
+
+  PyObject *wrapped = wrapt_acquire_wrapped(self);
+
+  PyAsyncMethods *methods = Py_TYPE(wrapped)->tp_as_async;
+  unaryfunc slot = NULL;
+
+  if (methods)
+    slot = *(unaryfunc *)((char *)methods + offset);
+
+  if (slot)
+    result = slot(wrapped);
+  else
+    result = PyObject_CallMethodObjArgs(wrapped, name, NULL);
+
+  Py_DECREF(wrapped);
+
+  return result;
+}
+
+static PyObject *WraptAutoObjectProxy_aiter(WraptObjectProxyObject *self)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  return wrapt_call_async_slot(self, offsetof(PyAsyncMethods, am_aiter),
+                               state->str_aiter);
+}
+
+static PyObject *WraptAutoObjectProxy_anext(WraptObjectProxyObject *self)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  return wrapt_call_async_slot(self, offsetof(PyAsyncMethods, am_anext),
+                               state->str_anext);
+}
+
+static PyObject *WraptAutoObjectProxy_await(WraptObjectProxyObject *self)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  return wrapt_call_async_slot(self, offsetof(PyAsyncMethods, am_await),
+                               state->str_await);
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptAutoObjectProxy_descr_get(WraptObjectProxyObject *self,
+                                                PyObject *obj, PyObject *type)
+{
+  PyObject *result = NULL;
+
+  if (!self->wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(self) == -1)
+      return NULL;
+  }
+
+  PyObject *wrapped = wrapt_acquire_wrapped(self);
+
+  descrgetfunc slot = Py_TYPE(wrapped)->tp_descr_get;
+
+  if (slot)
+  {
+    result = slot(wrapped, obj, type);
+  }
+  else
+  {
+    wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+
+    if (state)
+    {
+      result = PyObject_CallMethodObjArgs(wrapped, state->str_get,
+                                          obj ? obj : Py_None,
+                                          type ? type : Py_None, NULL);
+    }
+  }
+
+  Py_DECREF(wrapped);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+/* Used for both __set__ and __delete__, the latter when value is NULL. */
+
+static int WraptAutoObjectProxy_descr_set(WraptObjectProxyObject *self,
+                                          PyObject *obj, PyObject *value)
+{
+  int result = -1;
+
+  if (!self->wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(self) == -1)
+      return -1;
+  }
+
+  PyObject *wrapped = wrapt_acquire_wrapped(self);
+
+  descrsetfunc slot = Py_TYPE(wrapped)->tp_descr_set;
+
+  if (slot)
+  {
+    result = slot(wrapped, obj, value);
+  }
+  else
+  {
+    wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+
+    if (state)
+    {
+      PyObject *object;
+
+      if (value)
+        object = PyObject_CallMethodObjArgs(wrapped, state->str_set, obj,
+                                            value, NULL);
+      else
+        object =
+            PyObject_CallMethodObjArgs(wrapped, state->str_delete, obj, NULL);
+
+      if (object)
+      {
+        Py_DECREF(object);
+        result = 0;
+      }
+    }
+  }
+
+  Py_DECREF(wrapped);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+/* Call the named method of the wrapped object with the given arguments.
+ * Used for the special methods which do not correspond to a type slot. */
+
+static PyObject *wrapt_call_wrapped_method(WraptObjectProxyObject *self,
+                                           PyObject *name, PyObject *args)
+{
+  PyObject *method = NULL;
+  PyObject *result = NULL;
+
+  if (!self->wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(self) == -1)
+      return NULL;
+  }
+
+  PyObject *wrapped = wrapt_acquire_wrapped(self);
+
+  method = PyObject_GetAttr(wrapped, name);
+
+  Py_DECREF(wrapped);
+
+  if (!method)
+    return NULL;
+
+  if (args)
+    result = PyObject_Call(method, args, NULL);
+  else
+    result = PyObject_CallNoArgs(method);
+
+  Py_DECREF(method);
+
+  return result;
+}
+
+static PyObject *WraptAutoObjectProxy_length_hint(WraptObjectProxyObject *self,
+                                                  PyObject *args)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  return wrapt_call_wrapped_method(self, state->str_length_hint, NULL);
+}
+
+static PyObject *WraptAutoObjectProxy_fspath(WraptObjectProxyObject *self,
+                                             PyObject *args)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  return wrapt_call_wrapped_method(self, state->str_fspath, NULL);
+}
+
+static PyObject *WraptAutoObjectProxy_set_name(WraptObjectProxyObject *self,
+                                               PyObject *args)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  return wrapt_call_wrapped_method(self, state->str_set_name, args);
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyMethodDef WraptAutoObjectProxyLengthHint_methods[] = {
+    {"__length_hint__", (PyCFunction)WraptAutoObjectProxy_length_hint,
+     METH_NOARGS, 0},
+    {NULL, NULL},
+};
+
+static PyMethodDef WraptAutoObjectProxyFspath_methods[] = {
+    {"__fspath__", (PyCFunction)WraptAutoObjectProxy_fspath, METH_NOARGS, 0},
+    {NULL, NULL},
+};
+
+static PyMethodDef WraptAutoObjectProxySetName_methods[] = {
+    {"__set_name__", (PyCFunction)WraptAutoObjectProxy_set_name, METH_VARARGS,
+     0},
+    {NULL, NULL},
+};
+
+#define WRAPT_AUTO_MIXIN_SLOTS(name, slot, function)                         \
+  static PyType_Slot name[] = {                                             \
+      {Py_tp_dealloc, WraptObjectProxy_dealloc},                            \
+      {Py_tp_traverse, WraptObjectProxy_traverse},                          \
+      {Py_tp_clear, WraptObjectProxy_clear},                                \
+      {Py_tp_init, WraptObjectProxy_init},                                  \
+      {slot, function},                                                     \
+      {0, NULL},                                                            \
+  }
+
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyCall_slots, Py_tp_call,
+                       WraptCallableObjectProxy_call);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyIter_slots, Py_tp_iter,
+                       WraptAutoObjectProxy_iter);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyNext_slots, Py_tp_iternext,
+                       WraptAutoObjectProxy_iternext);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyAiter_slots, Py_am_aiter,
+                       WraptAutoObjectProxy_aiter);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyAnext_slots, Py_am_anext,
+                       WraptAutoObjectProxy_anext);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyAwait_slots, Py_am_await,
+                       WraptAutoObjectProxy_await);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyGet_slots, Py_tp_descr_get,
+                       WraptAutoObjectProxy_descr_get);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxySet_slots, Py_tp_descr_set,
+                       WraptAutoObjectProxy_descr_set);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyDelete_slots, Py_tp_descr_set,
+                       WraptAutoObjectProxy_descr_set);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyLengthHint_slots, Py_tp_methods,
+                       WraptAutoObjectProxyLengthHint_methods);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxyFspath_slots, Py_tp_methods,
+                       WraptAutoObjectProxyFspath_methods);
+WRAPT_AUTO_MIXIN_SLOTS(WraptAutoObjectProxySetName_slots, Py_tp_methods,
+                       WraptAutoObjectProxySetName_methods);
+
+#undef WRAPT_AUTO_MIXIN_SLOTS
+
+#define WRAPT_AUTO_MIXIN_SPEC(type_name, type_slots)                         \
+  {                                                                         \
+    .name = "_wrappers." type_name,                                         \
+    .basicsize = sizeof(WraptObjectProxyObject), .itemsize = 0,             \
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC, \
+    .slots = type_slots,                                                    \
+  }
+
+/* The specs are indexed by the WRAPT_AUTO_MIXIN_* constants. The slot for
+ * tp_descr_set implements both __set__ and __delete__, so the Set and
+ * Delete mixins share it, with the wrapper for the other method removed
+ * from the class dictionary of each once created. */
+
+static PyType_Spec WraptAutoObjectProxyMixin_specs[WRAPT_AUTO_MIXIN_COUNT] = {
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyCall",
+                          WraptAutoObjectProxyCall_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyIter",
+                          WraptAutoObjectProxyIter_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyNext",
+                          WraptAutoObjectProxyNext_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyAiter",
+                          WraptAutoObjectProxyAiter_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyAnext",
+                          WraptAutoObjectProxyAnext_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyLengthHint",
+                          WraptAutoObjectProxyLengthHint_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyFspath",
+                          WraptAutoObjectProxyFspath_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyAwait",
+                          WraptAutoObjectProxyAwait_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyGet",
+                          WraptAutoObjectProxyGet_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxySet",
+                          WraptAutoObjectProxySet_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxyDelete",
+                          WraptAutoObjectProxyDelete_slots),
+    WRAPT_AUTO_MIXIN_SPEC("_AutoObjectProxySetName",
+                          WraptAutoObjectProxySetName_slots),
+};
+
+#undef WRAPT_AUTO_MIXIN_SPEC
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptPartialCallableObjectProxy_new(PyTypeObject *type,
+                                                     PyObject *args,
+                                                     PyObject *kwds)
+{
+  WraptPartialCallableObjectProxyObject *self;
+
+  self = (WraptPartialCallableObjectProxyObject *)WraptObjectProxy_new(
+      type, args, kwds);
+
+  if (!self)
+    return NULL;
+
+  self->args = NULL;
+  self->kwargs = NULL;
+
+  return (PyObject *)self;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptPartialCallableObjectProxy_raw_init(
+    WraptPartialCallableObjectProxyObject *self, PyObject *wrapped,
+    PyObject *args, PyObject *kwargs)
+{
+  int result = 0;
+
+  result = WraptObjectProxy_raw_init((WraptObjectProxyObject *)self, wrapped);
+
+  if (result == 0)
+  {
+    /* Serialise the swaps for the same reason as in the __wrapped__
+     * setter. Initialisation normally happens before the proxy is shared,
+     * but __init__ can be re-invoked on an already published proxy, in
+     * which case concurrent callers on a free-threaded build could
+     * otherwise decref the same old args or kwargs twice. */
+
+    Py_INCREF(args);
+    Py_XINCREF(kwargs);
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    Py_XSETREF(self->args, args);
+    Py_XSETREF(self->kwargs, kwargs);
+    Py_END_CRITICAL_SECTION();
+  }
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptPartialCallableObjectProxy_init(
+    WraptPartialCallableObjectProxyObject *self, PyObject *args,
+    PyObject *kwds)
+{
+  PyObject *wrapped = NULL;
+  PyObject *fnargs = NULL;
+
+  int result = 0;
+
+  if (PyTuple_GET_SIZE(args) < 1)
+  {
+    PyErr_SetString(PyExc_TypeError, "__init__ of partial needs an argument");
+    return -1;
+  }
+
+  wrapped = PyTuple_GetItem(args, 0);
+
+  if (!PyCallable_Check(wrapped))
+  {
+    PyErr_SetString(PyExc_TypeError, "the first argument must be callable");
+    return -1;
+  }
+
+  fnargs = PyTuple_GetSlice(args, 1, PyTuple_GET_SIZE(args));
+
+  if (!fnargs)
+    return -1;
+
+  result =
+      WraptPartialCallableObjectProxy_raw_init(self, wrapped, fnargs, kwds);
+
+  Py_DECREF(fnargs);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptPartialCallableObjectProxy_traverse(
+    WraptPartialCallableObjectProxyObject *self, visitproc visit, void *arg)
+{
+  int err = WraptObjectProxy_traverse((WraptObjectProxyObject *)self, visit, arg);
+  if (err)
+    return err;
+
+  Py_VISIT(self->args);
+  Py_VISIT(self->kwargs);
+
+  return 0;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptPartialCallableObjectProxy_clear(
+    WraptPartialCallableObjectProxyObject *self)
+{
+  WraptObjectProxy_clear((WraptObjectProxyObject *)self);
+
+  Py_CLEAR(self->args);
+  Py_CLEAR(self->kwargs);
+
+  return 0;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static void WraptPartialCallableObjectProxy_dealloc(
+    WraptPartialCallableObjectProxyObject *self)
+{
+  PyTypeObject *tp = Py_TYPE(self);
+
+  PyObject_GC_UnTrack(self);
+
+  if (self->object_proxy.weakreflist != NULL)
+    PyObject_ClearWeakRefs((PyObject *)self);
+
+  WraptPartialCallableObjectProxy_clear(self);
+
+  tp->tp_free(self);
+
+#if PY_VERSION_HEX >= 0x030C0000
+  PyObject *exc = PyErr_GetRaisedException();
+  Py_DECREF(tp);
+  PyErr_SetRaisedException(exc);
+#else
+  PyObject *exc_type, *exc_value, *exc_tb;
+  PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+  Py_DECREF(tp);
+  PyErr_Restore(exc_type, exc_value, exc_tb);
+#endif
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptPartialCallableObjectProxy_call(
+    WraptPartialCallableObjectProxyObject *self, PyObject *args,
+    PyObject *kwds)
+{
+  PyObject *fnargs = NULL;
+  PyObject *fnkwargs = NULL;
+
+  PyObject *result = NULL;
+
+  long i;
+  long offset;
+
+  if (!self->object_proxy.wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(&self->object_proxy) == -1)
+      return NULL;
+  }
+
+  /* Hold strong references to the wrapped object and the captured
+   * arguments across the call so a concurrent re-initialization of the
+   * partial cannot release them while they are in use. */
+
+  PyObject *wrapped = wrapt_acquire_wrapped(&self->object_proxy);
+  PyObject *cargs = wrapt_acquire_field((PyObject *)self, &self->args);
+  PyObject *ckwargs = wrapt_acquire_field((PyObject *)self, &self->kwargs);
+
+  fnargs = PyTuple_New(PyTuple_GET_SIZE(cargs) + PyTuple_GET_SIZE(args));
+
+  if (!fnargs)
+    goto finally;
+
+  for (i = 0; i < PyTuple_GET_SIZE(cargs); i++)
+  {
+    PyObject *item;
+    item = PyTuple_GetItem(cargs, i);
+    Py_INCREF(item);
+    PyTuple_SetItem(fnargs, i, item);
+  }
+
+  offset = PyTuple_GET_SIZE(cargs);
+
+  for (i = 0; i < PyTuple_GET_SIZE(args); i++)
+  {
+    PyObject *item;
+    item = PyTuple_GetItem(args, i);
+    Py_INCREF(item);
+    PyTuple_SetItem(fnargs, offset + i, item);
+  }
+
+  fnkwargs = PyDict_New();
+
+  if (!fnkwargs)
+    goto finally;
+
+  if (ckwargs && PyDict_Update(fnkwargs, ckwargs) == -1)
+    goto finally;
+
+  if (kwds && PyDict_Update(fnkwargs, kwds) == -1)
+    goto finally;
+
+  result = PyObject_Call(wrapped, fnargs, fnkwargs);
+
+finally:
+  Py_XDECREF(fnargs);
+  Py_XDECREF(fnkwargs);
+
+  Py_DECREF(wrapped);
+  Py_DECREF(cargs);
+  Py_XDECREF(ckwargs);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */;
+
+static PyType_Slot WraptPartialCallableObjectProxy_slots[] = {
+    {Py_tp_dealloc, WraptPartialCallableObjectProxy_dealloc},
+    {Py_tp_call, WraptPartialCallableObjectProxy_call},
+    {Py_tp_traverse, WraptPartialCallableObjectProxy_traverse},
+    {Py_tp_clear, WraptPartialCallableObjectProxy_clear},
+    {Py_tp_init, WraptPartialCallableObjectProxy_init},
+    {Py_tp_new, WraptPartialCallableObjectProxy_new},
+    {0, NULL},
+};
+
+static PyType_Spec WraptPartialCallableObjectProxy_spec = {
+    .name = "_wrappers.PartialCallableObjectProxy",
+    .basicsize = sizeof(WraptPartialCallableObjectProxyObject),
+    .itemsize = 0,
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+    .slots = WraptPartialCallableObjectProxy_slots,
+};
+
+/* ------------------------------------------------------------------------- */
+
+/* Base type for WeakFunctionProxy, which is defined in Python and sets up
+ * the weak references. The wrapped object is a weakref.proxy() for the
+ * function, and where the function was a bound method, _self_instance is
+ * a weak reference to the instance it was bound to. Calls are implemented
+ * using vectorcall, and a plain Python function originally bound to an
+ * instance is called with the instance prepended to the arguments, rather
+ * than creating a new bound method object on every call. */
+
+static PyObject *WraptWeakFunctionProxy_vectorcall(PyObject *callable,
+                                                   PyObject *const *args,
+                                                   size_t nargsf,
+                                                   PyObject *kwnames);
+
+static PyObject *WraptWeakFunctionProxy_new(PyTypeObject *type, PyObject *args,
+                                            PyObject *kwds)
+{
+  WraptWeakFunctionProxyObject *self;
+
+  self = (WraptWeakFunctionProxyObject *)WraptObjectProxy_new(type, args, kwds);
+
+  if (!self)
+    return NULL;
+
+  self->instance = NULL;
+  self->vectorcall = WraptWeakFunctionProxy_vectorcall;
+
+  return (PyObject *)self;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptWeakFunctionProxy_traverse(WraptWeakFunctionProxyObject *self,
+                                           visitproc visit, void *arg)
+{
+  int err = WraptObjectProxy_traverse((WraptObjectProxyObject *)self, visit, arg);
+  if (err)
+    return err;
+
+  Py_VISIT(self->instance);
+
+  return 0;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptWeakFunctionProxy_clear(WraptWeakFunctionProxyObject *self)
+{
+  WraptObjectProxy_clear((WraptObjectProxyObject *)self);
+
+  Py_CLEAR(self->instance);
+
+  return 0;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static void WraptWeakFunctionProxy_dealloc(WraptWeakFunctionProxyObject *self)
+{
+  PyTypeObject *tp = Py_TYPE(self);
+
+  PyObject_GC_UnTrack(self);
+
+  if (self->object_proxy.weakreflist != NULL)
+    PyObject_ClearWeakRefs((PyObject *)self);
+
+  WraptWeakFunctionProxy_clear(self);
+
+  tp->tp_free(self);
+
+#if PY_VERSION_HEX >= 0x030C0000
+  PyObject *exc = PyErr_GetRaisedException();
+  Py_DECREF(tp);
+  PyErr_SetRaisedException(exc);
+#else
+  PyObject *exc_type, *exc_value, *exc_tb;
+  PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+  Py_DECREF(tp);
+  PyErr_Restore(exc_type, exc_value, exc_tb);
+#endif
+}
+
+/* ------------------------------------------------------------------------- */
+
+/* Get a new reference to the referent of a weak reference or proxy. Returns
+ * 1 if it is alive, 0 if it has expired, and -1 with an exception set on
+ * error. */
+
+static int wrapt_weakref_get(PyObject *ref, PyObject **pobj)
+{
+#if PY_VERSION_HEX >= 0x030D0000
+  return PyWeakref_GetRef(ref, pobj);
+#else
+  PyObject *obj = PyWeakref_GetObject(ref);
+
+  *pobj = NULL;
+
+  if (!obj)
+    return -1;
+
+  if (obj == Py_None)
+    return 0;
+
+  Py_INCREF(obj);
+  *pobj = obj;
+
+  return 1;
+#endif
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *wrapt_raise_expired(void)
+{
+  PyErr_SetString(PyExc_ReferenceError,
+                  "weakly-referenced object no longer exists");
+  return NULL;
+}
+
+/* Call function with instance prepended to the vectorcall arguments. */
+
+static PyObject *wrapt_vectorcall_prepend(PyObject *function,
+                                          PyObject *instance,
+                                          PyObject *const *args, size_t nargsf,
+                                          PyObject *kwnames)
+{
+  Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+  Py_ssize_t nkwargs = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+  Py_ssize_t total = nargs + nkwargs;
+  PyObject *result = NULL;
+
+  if (nargsf & PY_VECTORCALL_ARGUMENTS_OFFSET)
+  {
+    /* The caller allows args[-1] to be temporarily overwritten. */
+
+    PyObject **newargs = (PyObject **)args - 1;
+    PyObject *saved = newargs[0];
+
+    newargs[0] = instance;
+    result = PyObject_Vectorcall(function, newargs, nargs + 1, kwnames);
+    newargs[0] = saved;
+
+    return result;
+  }
+
+  PyObject *small_stack[8];
+  PyObject **stack = small_stack;
+
+  if (total + 1 > (Py_ssize_t)(sizeof(small_stack) / sizeof(small_stack[0])))
+  {
+    stack = PyMem_Malloc((total + 1) * sizeof(PyObject *));
+
+    if (!stack)
+      return PyErr_NoMemory();
+  }
+
+  stack[0] = instance;
+
+  if (total)
+    memcpy(stack + 1, args, total * sizeof(PyObject *));
+
+  result = PyObject_Vectorcall(function, stack, nargs + 1, kwnames);
+
+  if (stack != small_stack)
+    PyMem_Free(stack);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptWeakFunctionProxy_vectorcall(PyObject *callable,
+                                                   PyObject *const *args,
+                                                   size_t nargsf,
+                                                   PyObject *kwnames)
+{
+  WraptWeakFunctionProxyObject *self = (WraptWeakFunctionProxyObject *)callable;
+
+  PyObject *wrapped = NULL;
+  PyObject *function = NULL;
+  PyObject *instance_ref = NULL;
+  PyObject *instance = NULL;
+  PyObject *result = NULL;
+
+  if (!self->object_proxy.wrapped)
+  {
+    if (raise_uninitialized_wrapper_error(&self->object_proxy) == -1)
+      return NULL;
+  }
+
+  wrapped = wrapt_acquire_wrapped(&self->object_proxy);
+
+  /* Resolve the weak proxy for the function, raising ReferenceError if it
+   * has expired. As with the pure Python implementation, the truth value
+   * of the function is then checked, which is how the expiry of the weak
+   * proxy is detected there. */
+
+  if (PyWeakref_CheckProxy(wrapped))
+  {
+    int alive = wrapt_weakref_get(wrapped, &function);
+
+    if (alive < 0)
+      goto finally;
+
+    if (!alive)
+    {
+      wrapt_raise_expired();
+      goto finally;
+    }
+  }
+  else
+  {
+    function = wrapped;
+    Py_INCREF(function);
+  }
+
+  if (PyObject_IsTrue(function) < 0)
+    goto finally;
+
+  instance_ref = wrapt_acquire_field((PyObject *)self, &self->instance);
+
+  if (!instance_ref || instance_ref == Py_None)
+  {
+    result = PyObject_Vectorcall(function, args, nargsf, kwnames);
+    goto finally;
+  }
+
+  if (PyWeakref_CheckRef(instance_ref))
+  {
+    if (wrapt_weakref_get(instance_ref, &instance) < 0)
+      goto finally;
+  }
+  else
+  {
+    instance = PyObject_CallNoArgs(instance_ref);
+
+    if (!instance)
+      goto finally;
+
+    if (instance == Py_None)
+      Py_CLEAR(instance);
+  }
+
+  /* If the wrapped function was originally a bound method but the instance
+   * it was bound to has been garbage collected, raise a ReferenceError
+   * rather than silently calling it as unbound. */
+
+  if (!instance)
+  {
+    wrapt_raise_expired();
+    goto finally;
+  }
+
+  if (PyFunction_Check(function))
+  {
+    /* Binding a plain function to an instance yields a method which calls
+     * the function with the instance as first argument, so do that
+     * directly without creating the method object. */
+
+    result =
+        wrapt_vectorcall_prepend(function, instance, args, nargsf, kwnames);
+  }
+  else
+  {
+    wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+    PyObject *bound = NULL;
+
+    if (!state)
+      goto finally;
+
+    bound = PyObject_CallMethodObjArgs(function, state->str_get, instance,
+                                       (PyObject *)Py_TYPE(instance), NULL);
+
+    if (!bound)
+      goto finally;
+
+    result = PyObject_Vectorcall(bound, args, nargsf, kwnames);
+
+    Py_DECREF(bound);
+  }
+
+finally:
+  Py_XDECREF(instance);
+  Py_XDECREF(instance_ref);
+  Py_XDECREF(function);
+  Py_XDECREF(wrapped);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *
+WraptWeakFunctionProxy_get_self_instance(WraptWeakFunctionProxyObject *self,
+                                         void *closure)
+{
+  PyObject *instance = wrapt_acquire_field((PyObject *)self, &self->instance);
+
+  if (!instance)
+    Py_RETURN_NONE;
+
+  return instance;
+}
+
+static int
+WraptWeakFunctionProxy_set_self_instance(WraptWeakFunctionProxyObject *self,
+                                         PyObject *value, void *closure)
+{
+  if (!value)
+  {
+    PyErr_SetString(PyExc_TypeError, "can't delete _self_instance attribute");
+    return -1;
+  }
+
+  Py_INCREF(value);
+
+  Py_BEGIN_CRITICAL_SECTION(self);
+  Py_XSETREF(self->instance, value);
+  Py_END_CRITICAL_SECTION();
+
+  return 0;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyGetSetDef WraptWeakFunctionProxy_getset[] = {
+    {"_self_instance", (getter)WraptWeakFunctionProxy_get_self_instance,
+     (setter)WraptWeakFunctionProxy_set_self_instance, 0},
+    {NULL},
+};
+
+static PyMemberDef WraptWeakFunctionProxy_members[] = {
+    {"__vectorcalloffset__", T_PYSSIZET,
+     offsetof(WraptWeakFunctionProxyObject, vectorcall), READONLY, NULL},
+    {NULL},
+};
+
+static PyType_Slot WraptWeakFunctionProxy_slots[] = {
+    {Py_tp_dealloc, WraptWeakFunctionProxy_dealloc},
+    {Py_tp_call, PyVectorcall_Call},
+    {Py_tp_traverse, WraptWeakFunctionProxy_traverse},
+    {Py_tp_clear, WraptWeakFunctionProxy_clear},
+    {Py_tp_init, WraptObjectProxy_init},
+    {Py_tp_new, WraptWeakFunctionProxy_new},
+    {Py_tp_getset, WraptWeakFunctionProxy_getset},
+    {Py_tp_members, WraptWeakFunctionProxy_members},
+    {0, NULL},
+};
+
+static PyType_Spec WraptWeakFunctionProxy_spec = {
+    .name = "_wrappers._WeakFunctionProxyBase",
+    .basicsize = sizeof(WraptWeakFunctionProxyObject),
+    .itemsize = 0,
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC |
+             Py_TPFLAGS_HAVE_VECTORCALL,
+    .slots = WraptWeakFunctionProxy_slots,
+};
+
+/* ------------------------------------------------------------------------- */
+
+/* Base type for TrackingProxy, which is defined in Python. The keys and
+ * attributes of the wrapped object which are set or deleted through the
+ * proxy are recorded in the _self_dirty set, along with the key or
+ * attribute a nested proxy was got from in the proxy it was got from, so
+ * that recording a change on a hot path does not run any Python code.
+ * Where _self_nested is true, dictionaries, lists and sets got from the
+ * wrapped object are passed to __wrapped_track__(). Methods named in
+ * _self_mutating_methods are passed to __wrapped_method__(). Both of these
+ * are implemented by the derived class. */
+
+static PyObject *WraptTrackingProxy_new(PyTypeObject *type, PyObject *args,
+                                        PyObject *kwds)
+{
+  WraptTrackingProxyObject *self;
+
+  self = (WraptTrackingProxyObject *)WraptObjectProxy_new(type, args, kwds);
+
+  if (!self)
+    return NULL;
+
+  self->dirty = PySet_New(NULL);
+
+  if (!self->dirty)
+  {
+    Py_DECREF(self);
+    return NULL;
+  }
+
+  self->parent = NULL;
+  self->key = NULL;
+  self->nested = 0;
+
+  return (PyObject *)self;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptTrackingProxy_traverse(WraptTrackingProxyObject *self,
+                                       visitproc visit, void *arg)
+{
+  int err = WraptObjectProxy_traverse((WraptObjectProxyObject *)self, visit, arg);
+  if (err)
+    return err;
+
+  Py_VISIT(self->dirty);
+  Py_VISIT(self->parent);
+  Py_VISIT(self->key);
+
+  return 0;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptTrackingProxy_clear(WraptTrackingProxyObject *self)
+{
+  WraptObjectProxy_clear((WraptObjectProxyObject *)self);
+
+  Py_CLEAR(self->dirty);
+  Py_CLEAR(self->parent);
+  Py_CLEAR(self->key);
+
+  return 0;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static void WraptTrackingProxy_dealloc(WraptTrackingProxyObject *self)
+{
+  PyTypeObject *tp = Py_TYPE(self);
+
+  PyObject_GC_UnTrack(self);
+
+  if (self->object_proxy.weakreflist != NULL)
+    PyObject_ClearWeakRefs((PyObject *)self);
+
+  WraptTrackingProxy_clear(self);
+
+  tp->tp_free(self);
+
+#if PY_VERSION_HEX >= 0x030C0000
+  PyObject *exc = PyErr_GetRaisedException();
+  Py_DECREF(tp);
+  PyErr_SetRaisedException(exc);
+#else
+  PyObject *exc_type, *exc_value, *exc_tb;
+  PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+  Py_DECREF(tp);
+  PyErr_Restore(exc_type, exc_value, exc_tb);
+#endif
+}
+
+/* ------------------------------------------------------------------------- */
+
+/* Adds key to the set of changed keys and attributes. The set is added to
+ * in the same critical section used to replace it, so that a key cannot be
+ * added to a set which __wrapped_reset_dirty__() has already returned. The
+ * hash of the key is computed first so that in the common case of a key
+ * which caches its hash, no Python code runs in the critical section. */
+
+static int wrapt_tracking_add(WraptTrackingProxyObject *self, PyObject *key)
+{
   int result = 0;
 
-  if (PyTuple_GET_SIZE(args) < 1)
-  {
-    PyErr_SetString(PyExc_TypeError, "__init__ of partial needs an argument");
-    return -1;
-  }
+  if (PyObject_Hash(key) == -1)
+    return -1;
+
+  Py_BEGIN_CRITICAL_SECTION(self);
+
+  if (!self->dirty)
+  {
+    PyErr_SetString(PyExc_AttributeError, "_self_dirty");
+    result = -1;
+  }
+  else
+    result = PySet_Add(self->dirty, key);
+
+  Py_END_CRITICAL_SECTION();
+
+  return result;
+}
+
+/* Records the key or attribute this proxy was got from as changed in the
+ * proxy it was got from, and so on up to the outermost proxy. */
+
+static int wrapt_tracking_record_parent(WraptTrackingProxyObject *self,
+                                        wrapt_module_state *state)
+{
+  PyObject *current = (PyObject *)self;
+
+  Py_INCREF(current);
+
+  while (1)
+  {
+    WraptTrackingProxyObject *proxy = (WraptTrackingProxyObject *)current;
+
+    PyObject *parent = wrapt_acquire_field(current, &proxy->parent);
+
+    if (!parent || parent == Py_None)
+    {
+      Py_XDECREF(parent);
+      Py_DECREF(current);
+      return 0;
+    }
+
+    PyObject *key = wrapt_acquire_field(current, &proxy->key);
+
+    if (!key)
+    {
+      key = Py_None;
+      Py_INCREF(key);
+    }
+
+    Py_DECREF(current);
+
+    /* Where the parent is some other proxy its __wrapped_record__() method
+     * is called, which will also record the change in its own parent. */
+
+    if (!PyObject_TypeCheck(parent, state->TrackingProxyBase_Type))
+    {
+      PyObject *keys = PyTuple_Pack(1, key);
+
+      Py_DECREF(key);
+
+      PyObject *result = keys ? PyObject_CallMethodOneArg(
+                                    parent, state->str_wrapped_record, keys)
+                              : NULL;
+
+      Py_XDECREF(keys);
+      Py_DECREF(parent);
+
+      if (!result)
+        return -1;
+
+      Py_DECREF(result);
+
+      return 0;
+    }
+
+    int result = wrapt_tracking_add((WraptTrackingProxyObject *)parent, key);
+
+    Py_DECREF(key);
+
+    if (result < 0)
+    {
+      Py_DECREF(parent);
+      return -1;
+    }
+
+    current = parent;
+  }
+}
+
+static int wrapt_tracking_record(WraptTrackingProxyObject *self,
+                                 wrapt_module_state *state, PyObject *key)
+{
+  if (wrapt_tracking_add(self, key) < 0)
+    return -1;
+
+  return wrapt_tracking_record_parent(self, state);
+}
+
+/* Records the keys changed by setting or deleting the item key of the
+ * wrapped object. For a list or bytearray, where before is its length prior
+ * to the change, a change in length moves the items after those changed, so
+ * the indices from the first changed to the end of the longer of the old
+ * and new lengths are recorded as a single range object rather than
+ * individually, keeping the cost independent of the length. For other
+ * objects before is -1 and only key is recorded. */
+
+static int wrapt_tracking_record_item(WraptTrackingProxyObject *self,
+                                      wrapt_module_state *state,
+                                      PyObject *wrapped, PyObject *key,
+                                      Py_ssize_t before)
+{
+  Py_ssize_t start, stop, step, after, index;
+
+  if (before < 0)
+    return wrapt_tracking_record(self, state, key);
+
+  after = PyObject_Length(wrapped);
+
+  if (after < 0)
+    return -1;
+
+  if (PySlice_Check(key))
+  {
+    if (PySlice_Unpack(key, &start, &stop, &step) < 0)
+      return -1;
+
+    PySlice_AdjustIndices(before, &start, &stop, step);
+  }
+  else
+  {
+    start = PyNumber_AsSsize_t(key, PyExc_IndexError);
+
+    if (start == -1 && PyErr_Occurred())
+      return -1;
+
+    if (start < 0)
+      start += before;
+
+    stop = start + 1;
+    step = 1;
+  }
+
+  if (after != before)
+  {
+    PyObject *moved = NULL;
+    int result;
+
+    if (step < 0)
+      start = stop + 1;
+
+    stop = before > after ? before : after;
+
+    moved = PyObject_CallFunction((PyObject *)&PyRange_Type, "nn", start, stop);
+
+    if (!moved)
+      return -1;
+
+    result = wrapt_tracking_record(self, state, moved);
+
+    Py_DECREF(moved);
+
+    return result;
+  }
+
+  int recorded = 0;
+
+  for (index = start; step > 0 ? index < stop : index > stop; index += step)
+  {
+    PyObject *item = PyLong_FromSsize_t(index);
+
+    if (!item)
+      return -1;
+
+    int result = wrapt_tracking_add(self, item);
+
+    Py_DECREF(item);
+
+    if (result < 0)
+      return -1;
+
+    recorded = 1;
+  }
+
+  if (!recorded)
+    return 0;
+
+  return wrapt_tracking_record_parent(self, state);
+}
+
+/* Returns value got as key from the wrapped object, passing it to
+ * __wrapped_track__() if nested containers are being tracked. Steals the
+ * reference to value. */
+
+static PyObject *wrapt_tracking_nested(WraptTrackingProxyObject *self,
+                                       wrapt_module_state *state,
+                                       PyObject *key, PyObject *value)
+{
+  if (!self->nested)
+    return value;
+
+  if (!PyDict_Check(value) && !PyList_Check(value) && !PySet_Check(value))
+    return value;
+
+  PyObject *result = PyObject_CallMethodObjArgs(
+      (PyObject *)self, state->str_wrapped_track, key, value, NULL);
+
+  Py_DECREF(value);
+
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptTrackingProxy_getitem(WraptTrackingProxyObject *self,
+                                            PyObject *key)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  PyObject *value =
+      WraptObjectProxy_getitem((WraptObjectProxyObject *)self, key);
+
+  if (!value)
+    return NULL;
+
+  return wrapt_tracking_nested(self, state, key, value);
+}
+
+/* ------------------------------------------------------------------------- */
+
+static int WraptTrackingProxy_setitem(WraptTrackingProxyObject *self,
+                                      PyObject *key, PyObject *value)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return -1;
+
+  if (!self->object_proxy.wrapped)
+  {
+    if (raise_uninitialized_wrapper_error((WraptObjectProxyObject *)self) == -1)
+      return -1;
+  }
+
+  PyObject *wrapped = wrapt_acquire_wrapped((WraptObjectProxyObject *)self);
+
+  Py_ssize_t before = -1;
+
+  if (PyList_Check(wrapped) || PyByteArray_Check(wrapped))
+  {
+    before = PyObject_Length(wrapped);
+
+    if (before < 0)
+    {
+      Py_DECREF(wrapped);
+      return -1;
+    }
+  }
+
+  int result;
+
+  if (value == NULL)
+    result = PyObject_DelItem(wrapped, key);
+  else
+    result = PyObject_SetItem(wrapped, key, value);
+
+  if (result == 0)
+    result = wrapt_tracking_record_item(self, state, wrapped, key, before);
 
-  wrapped = PyTuple_GetItem(args, 0);
+  Py_DECREF(wrapped);
 
-  if (!PyCallable_Check(wrapped))
+  return result;
+}
+
+/* ------------------------------------------------------------------------- */
+
+static PyObject *WraptTrackingProxy_getattr(WraptTrackingProxyObject *self,
+                                            PyObject *args)
+{
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
+
+  PyObject *value =
+      WraptObjectProxy_getattr((WraptObjectProxyObject *)self, args);
+
+  if (!value)
+    return NULL;
+
+  PyObject *name = PyTuple_GET_ITEM(args, 0);
+
+  if (!PyCallable_Check(value))
+    return wrapt_tracking_nested(self, state, name, value);
+
+  PyObject *methods =
+      PyObject_GetAttr((PyObject *)Py_TYPE(self), state->str_mutating_methods);
+
+  if (!methods)
   {
-    PyErr_SetString(PyExc_TypeError, "the first argument must be callable");
-    return -1;
+    if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+    {
+      Py_DECREF(value);
+      return NULL;
+    }
+
+    PyErr_Clear();
+
+    return value;
   }
 
-  fnargs = PyTuple_GetSlice(args, 1, PyTuple_GET_SIZE(args));
+  int contains = PySequence_Contains(methods, name);
 
-  if (!fnargs)
-    return -1;
+  Py_DECREF(methods);
 
-  result =
-      WraptPartialCallableObjectProxy_raw_init(self, wrapped, fnargs, kwds);
+  if (contains <= 0)
+  {
+    if (contains < 0)
+      Py_CLEAR(value);
 
-  Py_DECREF(fnargs);
+    return value;
+  }
+
+  PyObject *result = PyObject_CallMethodObjArgs(
+      (PyObject *)self, state->str_wrapped_method, name, value, NULL);
+
+  Py_DECREF(value);
 
   return result;
 }
 
 /* ------------------------------------------------------------------------- */
 
-static int WraptPartialCallableObjectProxy_traverse(
-    WraptPartialCallableObjectProxyObject *self, visitproc visit, void *arg)
+static int WraptTrackingProxy_setattro(WraptTrackingProxyObject *self,
+                                       PyObject *name, PyObject *value)
 {
-  int err = WraptObjectProxy_traverse((WraptObjectProxyObject *)self, visit, arg);
-  if (err)
-    return err;
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return -1;
 
-  Py_VISIT(self->args);
-  Py_VISIT(self->kwargs);
+  if (WraptObjectProxy_setattro((WraptObjectProxyObject *)self, name, value) < 0)
+    return -1;
 
-  return 0;
+  /* Attributes stored on the proxy itself are not recorded, being those
+   * with the _self_ prefix and those defined by the proxy type, which
+   * include __module__ and __doc__ even though they are forwarded. */
+
+  int match = PyUnicode_Tailmatch(name, state->str_self_, 0, PY_SSIZE_T_MAX, -1);
+
+  if (match < 0)
+    return -1;
+
+  if (match || wrapt_type_has_attr(Py_TYPE(self), name))
+    return 0;
+
+  return wrapt_tracking_record(self, state, name);
 }
 
 /* ------------------------------------------------------------------------- */
 
-static int WraptPartialCallableObjectProxy_clear(
-    WraptPartialCallableObjectProxyObject *self)
+static PyObject *WraptTrackingProxy_record(WraptTrackingProxyObject *self,
+                                           PyObject *keys)
 {
-  WraptObjectProxy_clear((WraptObjectProxyObject *)self);
+  wrapt_module_state *state = wrapt_state_from_type(Py_TYPE(self));
+  if (!state)
+    return NULL;
 
-  Py_CLEAR(self->args);
-  Py_CLEAR(self->kwargs);
+  PyObject *iterator = PyObject_GetIter(keys);
 
-  return 0;
+  if (!iterator)
+    return NULL;
+
+  PyObject *key = NULL;
+  int recorded = 0;
+
+  while ((key = PyIter_Next(iterator)))
+  {
+    int result = wrapt_tracking_add(self, key);
+
+    Py_DECREF(key);
+
+    if (result < 0)
+    {
+      Py_DECREF(iterator);
+      return NULL;
+    }
+
+    recorded = 1;
+  }
+
+  Py_DECREF(iterator);
+
+  if (PyErr_Occurred())
+    return NULL;
+
+  if (recorded && wrapt_tracking_record_parent(self, state) < 0)
+    return NULL;
+
+  Py_RETURN_NONE;
 }
 
 /* ------------------------------------------------------------------------- */
 
-static void WraptPartialCallableObjectProxy_dealloc(
-    WraptPartialCallableObjectProxyObject *self)
+static PyObject *WraptTrackingProxy_reset_dirty(WraptTrackingProxyObject *self,
+                                                PyObject *args)
 {
-  PyTypeObject *tp = Py_TYPE(self);
+  PyObject *dirty = PySet_New(NULL);
 
-  PyObject_GC_UnTrack(self);
+  if (!dirty)
+    return NULL;
 
-  if (self->object_proxy.weakreflist != NULL)
-    PyObject_ClearWeakRefs((PyObject *)self);
+  Py_BEGIN_CRITICAL_SECTION(self);
 
-  WraptPartialCallableObjectProxy_clear(self);
+  PyObject *previous = self->dirty;
 
-  tp->tp_free(self);
+  self->dirty = dirty;
+  dirty = previous;
 
-#if PY_VERSION_HEX >= 0x030C0000
-  PyObject *exc = PyErr_GetRaisedException();
-  Py_DECREF(tp);
-  PyErr_SetRaisedException(exc);
-#else
-  PyObject *exc_type, *exc_value, *exc_tb;
-  PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
-  Py_DECREF(tp);
-  PyErr_Restore(exc_type, exc_value, exc_tb);
-#endif
+  Py_END_CRITICAL_SECTION();
+
+  if (!dirty)
+    return PySet_New(NULL);
+
+  return dirty;
+}
+
+/* Returns a copy of the set of changed keys and attributes, taken in the
+ * same critical section as keys are added in, so that a key being added
+ * concurrently cannot be seen part way through. */
+
+static PyObject *WraptTrackingProxy_dirty(WraptTrackingProxyObject *self,
+                                          PyObject *args)
+{
+  PyObject *dirty = NULL;
+
+  Py_BEGIN_CRITICAL_SECTION(self);
+
+  if (self->dirty)
+    dirty = PySet_New(self->dirty);
+  else
+    dirty = PySet_New(NULL);
+
+  Py_END_CRITICAL_SECTION();
+
+  return dirty;
 }
 
 /* ------------------------------------------------------------------------- */
 
-static PyObject *WraptPartialCallableObjectProxy_call(
-    WraptPartialCallableObjectProxyObject *self, PyObject *args,
-    PyObject *kwds)
+static PyObject *
+WraptTrackingProxy_get_self_dirty(WraptTrackingProxyObject *self,
+                                  void *closure)
 {
-  PyObject *fnargs = NULL;
-  PyObject *fnkwargs = NULL;
+  PyObject *dirty = wrapt_acquire_field((PyObject *)self, &self->dirty);
 
-  PyObject *result = NULL;
+  if (!dirty)
+  {
+    PyErr_SetString(PyExc_AttributeError, "_self_dirty");
+    return NULL;
+  }
 
-  long i;
-  long offset;
+  return dirty;
+}
 
-  if (!self->object_proxy.wrapped)
+static int WraptTrackingProxy_set_self_dirty(WraptTrackingProxyObject *self,
+                                             PyObject *value, void *closure)
+{
+  if (!value)
   {
-    if (raise_uninitialized_wrapper_error(&self->object_proxy) == -1)
-      return NULL;
+    PyErr_SetString(PyExc_TypeError, "can't delete _self_dirty attribute");
+    return -1;
   }
 
-  /* Hold strong references to the wrapped object and the captured
-   * arguments across the call so a concurrent re-initialization of the
-   * partial cannot release them while they are in use. */
+  if (!PySet_Check(value))
+  {
+    PyErr_SetString(PyExc_TypeError, "_self_dirty must be a set");
+    return -1;
+  }
 
-  PyObject *wrapped = wrapt_acquire_wrapped(&self->object_proxy);
-  PyObject *cargs = wrapt_acquire_field((PyObject *)self, &self->args);
-  PyObject *ckwargs = wrapt_acquire_field((PyObject *)self, &self->kwargs);
+  Py_INCREF(value);
 
-  fnargs = PyTuple_New(PyTuple_GET_SIZE(cargs) + PyTuple_GET_SIZE(args));
+  Py_BEGIN_CRITICAL_SECTION(self);
+  Py_XSETREF(self->dirty, value);
+  Py_END_CRITICAL_SECTION();
 
-  if (!fnargs)
-    goto finally;
+  return 0;
+}
 
-  for (i = 0; i < PyTuple_GET_SIZE(cargs); i++)
+static PyObject *
+WraptTrackingProxy_get_self_nested(WraptTrackingProxyObject *self,
+                                   void *closure)
+{
+  return PyBool_FromLong(self->nested);
+}
+
+static int WraptTrackingProxy_set_self_nested(WraptTrackingProxyObject *self,
+                                              PyObject *value, void *closure)
+{
+  if (!value)
   {
-    PyObject *item;
-    item = PyTuple_GetItem(cargs, i);
-    Py_INCREF(item);
-    PyTuple_SetItem(fnargs, i, item);
+    PyErr_SetString(PyExc_TypeError, "can't delete _self_nested attribute");
+    return -1;
   }
 
-  offset = PyTuple_GET_SIZE(cargs);
+  int nested = PyObject_IsTrue(value);
 
-  for (i = 0; i < PyTuple_GET_SIZE(args); i++)
+  if (nested < 0)
+    return -1;
+
+  self->nested = nested;
+
+  return 0;
+}
+
+static PyObject *
+WraptTrackingProxy_get_self_parent(WraptTrackingProxyObject *self,
+                                   void *closure)
+{
+  PyObject *parent = wrapt_acquire_field((PyObject *)self, &self->parent);
+
+  if (!parent)
+    Py_RETURN_NONE;
+
+  return parent;
+}
+
+static int WraptTrackingProxy_set_self_parent(WraptTrackingProxyObject *self,
+                                              PyObject *value, void *closure)
+{
+  if (!value)
   {
-    PyObject *item;
-    item = PyTuple_GetItem(args, i);
-    Py_INCREF(item);
-    PyTuple_SetItem(fnargs, offset + i, item);
+    PyErr_SetString(PyExc_TypeError, "can't delete _self_parent attribute");
+    return -1;
   }
 
-  fnkwargs = PyDict_New();
+  Py_INCREF(value);
 
-  if (!fnkwargs)
-    goto finally;
+  Py_BEGIN_CRITICAL_SECTION(self);
+  Py_XSETREF(self->parent, value);
+  Py_END_CRITICAL_SECTION();
 
-  if (ckwargs && PyDict_Update(fnkwargs, ckwargs) == -1)
-    goto finally;
+  return 0;
+}
 
-  if (kwds && PyDict_Update(fnkwargs, kwds) == -1)
-    goto finally;
+static PyObject *WraptTrackingProxy_get_self_key(WraptTrackingProxyObject *self,
+                                                 void *closure)
+{
+  PyObject *key = wrapt_acquire_field((PyObject *)self, &self->key);
 
-  result = PyObject_Call(wrapped, fnargs, fnkwargs);
+  if (!key)
+    Py_RETURN_NONE;
 
-finally:
-  Py_XDECREF(fnargs);
-  Py_XDECREF(fnkwargs);
+  return key;
+}
 
-  Py_DECREF(wrapped);
-  Py_DECREF(cargs);
-  Py_XDECREF(ckwargs);
+static int WraptTrackingProxy_set_self_key(WraptTrackingProxyObject *self,
+                                           PyObject *value, void *closure)
+{
+  if (!value)
+  {
+    PyErr_SetString(PyExc_TypeError, "can't delete _self_key attribute");
+    return -1;
+  }
 
-  return result;
+  Py_INCREF(value);
+
+  Py_BEGIN_CRITICAL_SECTION(self);
+  Py_XSETREF(self->key, value);
+  Py_END_CRITICAL_SECTION();
+
+  return 0;
 }
 
-/* ------------------------------------------------------------------------- */;
+/* ------------------------------------------------------------------------- */
 
-static PyType_Slot WraptPartialCallableObjectProxy_slots[] = {
-    {Py_tp_dealloc, WraptPartialCallableObjectProxy_dealloc},
-    {Py_tp_call, WraptPartialCallableObjectProxy_call},
-    {Py_tp_traverse, WraptPartialCallableObjectProxy_traverse},
-    {Py_tp_clear, WraptPartialCallableObjectProxy_clear},
-    {Py_tp_init, WraptPartialCallableObjectProxy_init},
-    {Py_tp_new, WraptPartialCallableObjectProxy_new},
-    {0, NULL},
+static PyMethodDef WraptTrackingProxy_methods[] = {
+    {"__getattr__", (PyCFunction)WraptTrackingProxy_getattr, METH_VARARGS, 0},
+    {"__wrapped_record__", (PyCFunction)WraptTrackingProxy_record, METH_O, 0},
+    {"__wrapped_dirty__", (PyCFunction)WraptTrackingProxy_dirty, METH_NOARGS,
+     0},
+    {"__wrapped_reset_dirty__", (PyCFunction)WraptTrackingProxy_reset_dirty,
+     METH_NOARGS, 0},
+    {NULL, NULL},
 };
 
-static PyType_Spec WraptPartialCallableObjectProxy_spec = {
-    .name = "_wrappers.PartialCallableObjectProxy",
-    .basicsize = sizeof(WraptPartialCallableObjectProxyObject),
+static PyGetSetDef WraptTrackingProxy_getset[] = {
+    {"_self_dirty", (getter)WraptTrackingProxy_get_self_dirty,
+     (setter)WraptTrackingProxy_set_self_dirty, 0},
+    {"_self_nested", (getter)WraptTrackingProxy_get_self_nested,
+     (setter)WraptTrackingProxy_set_self_nested, 0},
+    {"_self_parent", (getter)WraptTrackingProxy_get_self_parent,
+     (setter)WraptTrackingProxy_set_self_parent, 0},
+    {"_self_key", (getter)WraptTrackingProxy_get_self_key,
+     (setter)WraptTrackingProxy_set_self_key, 0},
+    {NULL},
+};
+
+static PyType_Slot WraptTrackingProxy_slots[] = {
+    {Py_tp_dealloc, WraptTrackingProxy_dealloc},
+    {Py_tp_traverse, WraptTrackingProxy_traverse},
+    {Py_tp_clear, WraptTrackingProxy_clear},
+    {Py_tp_init, WraptObjectProxy_init},
+    {Py_tp_new, WraptTrackingProxy_new},
+    {Py_tp_setattro, WraptTrackingProxy_setattro},
+    {Py_tp_methods, WraptTrackingProxy_methods},
+    {Py_tp_getset, WraptTrackingProxy_getset},
+    {Py_mp_subscript, WraptTrackingProxy_getitem},
+    {Py_mp_ass_subscript, WraptTrackingProxy_setitem},
+    {0, NULL},
+};
+
+static PyType_Spec WraptTrackingProxy_spec = {
+    .name = "_wrappers._TrackingProxyBase",
+    .basicsize = sizeof(WraptTrackingProxyObject),
     .itemsize = 0,
     .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
-    .slots = WraptPartialCallableObjectProxy_slots,
+    .slots = WraptTrackingProxy_slots,
 };
 
 /* ------------------------------------------------------------------------- */
@@ -5108,6 +6955,341 @@ static PyType_Spec WraptFunctionWrapper_spec = {
 
 /* ------------------------------------------------------------------------- */
 
+/* Swap the wrapped objects of a group of proxies such that a snapshot
+ * taken using snapshot_wrapped() sees either all of the old or all of the
+ * new wrapped objects. This is a sequence lock, where the swaps are made
+ * while the sequence counter is odd, and a snapshot which observes the
+ * counter change while it reads retries. Individual reads of the proxies
+ * are unaffected and never wait. */
+
+#ifdef WRAPT_HAVE_RCU
+#define WRAPT_SEQUENCE_LOAD(p) _Py_atomic_load_ssize(p)
+#define WRAPT_SEQUENCE_INCREMENT(p) _Py_atomic_add_ssize(p, 1)
+#else
+#define WRAPT_SEQUENCE_LOAD(p) (*(p))
+#define WRAPT_SEQUENCE_INCREMENT(p) ((*(p))++)
+#endif
+
+/* The state of a proxy before it was swapped, kept so the group can be
+ * restored if a fixup hook fails after the swap. The references to the
+ * previous wrapped objects are owned by the result list. */
+
+typedef struct
+{
+  PyObject *wrapped;
+  PyObject *replaced;
+  int init_called;
+} wrapt_swap_saved;
+
+static int wrapt_swap_fixups(wrapt_module_state *state, PyObject *proxy)
+{
+  PyObject *fixups = PyObject_GetAttr(proxy, state->str_setattr_fixups);
+  PyObject *value = NULL;
+
+  if (!fixups)
+  {
+    if (!PyErr_ExceptionMatches(PyExc_AttributeError))
+      return -1;
+
+    PyErr_Clear();
+
+    return 0;
+  }
+
+  value = PyObject_CallObject(fixups, NULL);
+
+  Py_DECREF(fixups);
+
+  if (!value)
+    return -1;
+
+  Py_DECREF(value);
+
+  return 0;
+}
+
+/* Restore the wrapped objects of a group of proxies after a fixup hook
+ * failed, as a single swap so a snapshot never sees a mix. The fixup hooks
+ * which had been called, including the one which failed, are called again
+ * for the restored objects, with any failures ignored so the original
+ * exception is the one raised. This matches the pure Python version. */
+
+static void wrapt_swap_restore(wrapt_module_state *state, PyObject *entries,
+                               wrapt_swap_saved *saved, Py_ssize_t called)
+{
+  Py_ssize_t i, n = PyList_GET_SIZE(entries);
+
+#if PY_VERSION_HEX >= 0x030C0000
+  PyObject *exc = PyErr_GetRaisedException();
+#else
+  PyObject *exc_type, *exc_value, *exc_tb;
+  PyErr_Fetch(&exc_type, &exc_value, &exc_tb);
+#endif
+
+#if PY_VERSION_HEX >= 0x030D0000
+  PyMutex_Lock(&state->swap_mutex);
+#endif
+
+  WRAPT_SEQUENCE_INCREMENT(&state->swap_sequence);
+
+  for (i = n - 1; i >= 0; i--)
+  {
+    WraptObjectProxyObject *proxy = (WraptObjectProxyObject *)PyTuple_GET_ITEM(
+        PyList_GET_ITEM(entries, i), 0);
+
+    Py_XINCREF(saved[i].wrapped);
+
+    Py_BEGIN_CRITICAL_SECTION(proxy);
+    saved[i].replaced = wrapt_exchange_wrapped_locked(proxy, saved[i].wrapped);
+    proxy->init_called = saved[i].init_called;
+    Py_END_CRITICAL_SECTION();
+  }
+
+  WRAPT_SEQUENCE_INCREMENT(&state->swap_sequence);
+
+#if PY_VERSION_HEX >= 0x030D0000
+  PyMutex_Unlock(&state->swap_mutex);
+#endif
+
+  for (i = 0; i < n; i++)
+  {
+    WraptObjectProxyObject *proxy = (WraptObjectProxyObject *)PyTuple_GET_ITEM(
+        PyList_GET_ITEM(entries, i), 0);
+
+    wrapt_release_wrapped(proxy, saved[i].replaced);
+    saved[i].replaced = NULL;
+  }
+
+  for (i = called - 1; i >= 0; i--)
+  {
+    if (wrapt_swap_fixups(state, PyTuple_GET_ITEM(PyList_GET_ITEM(entries, i),
+                                                  0)) < 0)
+      PyErr_Clear();
+  }
+
+#if PY_VERSION_HEX >= 0x030C0000
+  PyErr_SetRaisedException(exc);
+#else
+  PyErr_Restore(exc_type, exc_value, exc_tb);
+#endif
+}
+
+static PyObject *wrapt_swap_wrapped(PyObject *module, PyObject *pairs)
+{
+  wrapt_module_state *state = wrapt_get_state(module);
+
+  PyObject *entries = NULL;
+  PyObject *result = NULL;
+
+  wrapt_swap_saved *saved = NULL;
+
+  Py_ssize_t i, n;
+
+  entries = PySequence_List(pairs);
+
+  if (!entries)
+    return NULL;
+
+  n = PyList_GET_SIZE(entries);
+
+  /* Validate everything and allocate the result before anything is
+   * swapped, so the group is either swapped in full or not at all. */
+
+  for (i = 0; i < n; i++)
+  {
+    PyObject *entry = PySequence_Tuple(PyList_GET_ITEM(entries, i));
+
+    if (!entry)
+      goto error;
+
+    PyList_SetItem(entries, i, entry);
+
+    if (PyTuple_GET_SIZE(entry) != 2)
+    {
+      PyErr_SetString(PyExc_ValueError,
+                      "swap_wrapped() expects (proxy, value) pairs");
+      goto error;
+    }
+
+    if (!PyObject_TypeCheck(PyTuple_GET_ITEM(entry, 0),
+                            state->ObjectProxy_Type))
+    {
+      PyErr_Format(PyExc_TypeError,
+                   "swap_wrapped() expects object proxies, not '%.100s'",
+                   Py_TYPE(PyTuple_GET_ITEM(entry, 0))->tp_name);
+      goto error;
+    }
+  }
+
+  result = PyList_New(n);
+
+  if (!result)
+    goto error;
+
+  saved = PyMem_New(wrapt_swap_saved, n ? n : 1);
+
+  if (!saved)
+  {
+    PyErr_NoMemory();
+    goto error;
+  }
+
+#if PY_VERSION_HEX >= 0x030D0000
+  PyMutex_Lock(&state->swap_mutex);
+#endif
+
+  WRAPT_SEQUENCE_INCREMENT(&state->swap_sequence);
+
+  for (i = 0; i < n; i++)
+  {
+    PyObject *entry = PyList_GET_ITEM(entries, i);
+    WraptObjectProxyObject *proxy =
+        (WraptObjectProxyObject *)PyTuple_GET_ITEM(entry, 0);
+    PyObject *value = PyTuple_GET_ITEM(entry, 1);
+    PyObject *old = NULL;
+
+    Py_INCREF(value);
+
+    Py_BEGIN_CRITICAL_SECTION(proxy);
+    old = wrapt_exchange_wrapped_locked(proxy, value);
+    saved[i].init_called = proxy->init_called;
+    proxy->init_called = 1;
+    Py_END_CRITICAL_SECTION();
+
+    saved[i].wrapped = old;
+    saved[i].replaced = NULL;
+
+    /* Stash the old reference in the result for now. Releasing it could
+     * run arbitrary code, which must not happen while swapping. */
+
+    if (!old)
+    {
+      Py_INCREF(Py_None);
+      old = Py_None;
+    }
+
+    PyList_SET_ITEM(result, i, old);
+  }
+
+  WRAPT_SEQUENCE_INCREMENT(&state->swap_sequence);
+
+#if PY_VERSION_HEX >= 0x030D0000
+  PyMutex_Unlock(&state->swap_mutex);
+#endif
+
+  /* The result now owns the references which the proxies held. Give each
+   * proxy back its own reference to release, deferred for an atomic proxy
+   * until no reader can still be using it, so the caller is left holding
+   * independent references to the replaced objects. */
+
+  for (i = 0; i < n; i++)
+  {
+    PyObject *entry = PyList_GET_ITEM(entries, i);
+    WraptObjectProxyObject *proxy =
+        (WraptObjectProxyObject *)PyTuple_GET_ITEM(entry, 0);
+    PyObject *old = PyList_GET_ITEM(result, i);
+
+    Py_INCREF(old);
+    wrapt_release_wrapped(proxy, old);
+  }
+
+  for (i = 0; i < n; i++)
+  {
+    if (wrapt_swap_fixups(state,
+                          PyTuple_GET_ITEM(PyList_GET_ITEM(entries, i), 0)) < 0)
+    {
+      /* The references in the result keep the previous wrapped objects
+       * alive while they are restored. */
+
+      wrapt_swap_restore(state, entries, saved, i + 1);
+      goto error;
+    }
+  }
+
+  PyMem_Free(saved);
+  Py_DECREF(entries);
+
+  return result;
+
+error:
+  PyMem_Free(saved);
+  Py_XDECREF(result);
+  Py_DECREF(entries);
+
+  return NULL;
+}
+
+static PyObject *wrapt_snapshot_wrapped(PyObject *module, PyObject *proxies)
+{
+  wrapt_module_state *state = wrapt_get_state(module);
+
+  Py_ssize_t i, n;
+
+  n = PyTuple_GET_SIZE(proxies);
+
+  for (i = 0; i < n; i++)
+  {
+    if (!PyObject_TypeCheck(PyTuple_GET_ITEM(proxies, i),
+                            state->ObjectProxy_Type))
+    {
+      PyErr_Format(PyExc_TypeError,
+                   "snapshot_wrapped() expects object proxies, not '%.100s'",
+                   Py_TYPE(PyTuple_GET_ITEM(proxies, i))->tp_name);
+      return NULL;
+    }
+  }
+
+  for (;;)
+  {
+    Py_ssize_t sequence = WRAPT_SEQUENCE_LOAD(&state->swap_sequence);
+    PyObject *result = NULL;
+
+    /* A swap is in progress. Briefly release the thread state so as not
+     * to hold up the swapping thread, nor a stop the world pause on a
+     * free-threaded build, while waiting for it to complete. */
+
+    if (sequence & 1)
+    {
+      Py_BEGIN_ALLOW_THREADS;
+      Py_END_ALLOW_THREADS;
+      continue;
+    }
+
+    result = PyTuple_New(n);
+
+    if (!result)
+      return NULL;
+
+    for (i = 0; i < n; i++)
+    {
+      PyObject *value = WraptObjectProxy_get_wrapped(
+          (WraptObjectProxyObject *)PyTuple_GET_ITEM(proxies, i));
+
+      if (!value)
+      {
+        Py_DECREF(result);
+        return NULL;
+      }
+
+      PyTuple_SET_ITEM(result, i, value);
+    }
+
+    if (WRAPT_SEQUENCE_LOAD(&state->swap_sequence) == sequence)
+      return result;
+
+    Py_DECREF(result);
+  }
+}
+
+static PyMethodDef wrapt_methods[] = {
+    {"swap_wrapped", (PyCFunction)wrapt_swap_wrapped, METH_O, 0},
+    {"snapshot_wrapped", (PyCFunction)wrapt_snapshot_wrapped, METH_VARARGS,
+     0},
+    {NULL, NULL},
+};
+
+/* ------------------------------------------------------------------------- */
+
 /* PyModule_AddObjectRef polyfill for Python 3.9. */
 #if PY_VERSION_HEX >= 0x030A0000
 #define WRAPT_ADD_TYPE(mod, name, type)                               \
@@ -5232,6 +7414,33 @@ static int wrapt_init_strings(wrapt_module_state *state)
     return -1;
   if (wrapt_intern_string(&state->str_dict, "__dict__") < 0)
     return -1;
+  if (wrapt_intern_string(&state->str_next, "__next__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_aiter, "__aiter__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_anext, "__anext__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_await, "__await__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_get, "__get__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_set, "__set__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_delete, "__delete__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_length_hint, "__length_hint__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_fspath, "__fspath__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_mutating_methods,
+                          "_self_mutating_methods") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_wrapped_method, "__wrapped_method__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_wrapped_track, "__wrapped_track__") < 0)
+    return -1;
+  if (wrapt_intern_string(&state->str_wrapped_record, "__wrapped_record__") < 0)
+    return -1;
   return 0;
 }
 
@@ -5263,6 +7472,32 @@ static int wrapt_exec(PyObject *module)
   }
   Py_DECREF(bases);
 
+  /* BufferObjectProxy: base = ObjectProxy. */
+  bases = PyTuple_Pack(1, (PyObject *)state->ObjectProxy_Type);
+  if (!bases)
+    return -1;
+  if (wrapt_create_type(module, &state->BufferObjectProxy_Type,
+                        &WraptBufferObjectProxy_spec, bases,
+                        "BufferObjectProxy") < 0)
+  {
+    Py_DECREF(bases);
+    return -1;
+  }
+  Py_DECREF(bases);
+
+  /* AtomicObjectProxy: base = ObjectProxy. */
+  bases = PyTuple_Pack(1, (PyObject *)state->ObjectProxy_Type);
+  if (!bases)
+    return -1;
+  if (wrapt_create_type(module, &state->AtomicObjectProxy_Type,
+                        &WraptAtomicObjectProxy_spec, bases,
+                        "AtomicObjectProxy") < 0)
+  {
+    Py_DECREF(bases);
+    return -1;
+  }
+  Py_DECREF(bases);
+
   /* PartialCallableObjectProxy: base = ObjectProxy. */
   bases = PyTuple_Pack(1, (PyObject *)state->ObjectProxy_Type);
   if (!bases)
@@ -5276,6 +7511,32 @@ static int wrapt_exec(PyObject *module)
   }
   Py_DECREF(bases);
 
+  /* _WeakFunctionProxyBase: base = ObjectProxy. */
+  bases = PyTuple_Pack(1, (PyObject *)state->ObjectProxy_Type);
+  if (!bases)
+    return -1;
+  if (wrapt_create_type(module, &state->WeakFunctionProxyBase_Type,
+                        &WraptWeakFunctionProxy_spec, bases,
+                        "_WeakFunctionProxyBase") < 0)
+  {
+    Py_DECREF(bases);
+    return -1;
+  }
+  Py_DECREF(bases);
+
+  /* _TrackingProxyBase: base = ObjectProxy. */
+  bases = PyTuple_Pack(1, (PyObject *)state->ObjectProxy_Type);
+  if (!bases)
+    return -1;
+  if (wrapt_create_type(module, &state->TrackingProxyBase_Type,
+                        &WraptTrackingProxy_spec, bases,
+                        "_TrackingProxyBase") < 0)
+  {
+    Py_DECREF(bases);
+    return -1;
+  }
+  Py_DECREF(bases);
+
   /* _FunctionWrapperBase: base = ObjectProxy. */
   bases = PyTuple_Pack(1, (PyObject *)state->ObjectProxy_Type);
   if (!bases)
@@ -5315,6 +7576,35 @@ static int wrapt_exec(PyObject *module)
   }
   Py_DECREF(bases);
 
+  /* AutoObjectProxy mixins: base = ObjectProxy. */
+  bases = PyTuple_Pack(1, (PyObject *)state->ObjectProxy_Type);
+  if (!bases)
+    return -1;
+  for (int i = 0; i < WRAPT_AUTO_MIXIN_COUNT; i++)
+  {
+    PyType_Spec *spec = &WraptAutoObjectProxyMixin_specs[i];
+
+    if (wrapt_create_type(module, &state->AutoObjectProxyMixin_Types[i],
+                          spec, bases, strrchr(spec->name, '.') + 1) < 0)
+    {
+      Py_DECREF(bases);
+      return -1;
+    }
+  }
+  Py_DECREF(bases);
+
+  if (PyDict_DelItem(
+          state->AutoObjectProxyMixin_Types[WRAPT_AUTO_MIXIN_SET]->tp_dict,
+          state->str_delete) < 0)
+    return -1;
+  PyType_Modified(state->AutoObjectProxyMixin_Types[WRAPT_AUTO_MIXIN_SET]);
+
+  if (PyDict_DelItem(
+          state->AutoObjectProxyMixin_Types[WRAPT_AUTO_MIXIN_DELETE]->tp_dict,
+          state->str_set) < 0)
+    return -1;
+  PyType_Modified(state->AutoObjectProxyMixin_Types[WRAPT_AUTO_MIXIN_DELETE]);
+
   /* Cache WrapperNotInitializedError from wrapt.wrappers. The module is
    * already in sys.modules because __wrapt__.py imports it before us. */
 
@@ -5341,11 +7631,17 @@ static int wrapt_traverse(PyObject *module, visitproc visit, void *arg)
   if (state == NULL)
     return 0;
   Py_VISIT(state->ObjectProxy_Type);
+  Py_VISIT(state->AtomicObjectProxy_Type);
   Py_VISIT(state->CallableObjectProxy_Type);
+  Py_VISIT(state->BufferObjectProxy_Type);
   Py_VISIT(state->PartialCallableObjectProxy_Type);
+  Py_VISIT(state->WeakFunctionProxyBase_Type);
+  Py_VISIT(state->TrackingProxyBase_Type);
   Py_VISIT(state->FunctionWrapperBase_Type);
   Py_VISIT(state->BoundFunctionWrapper_Type);
   Py_VISIT(state->FunctionWrapper_Type);
+  for (int i = 0; i < WRAPT_AUTO_MIXIN_COUNT; i++)
+    Py_VISIT(state->AutoObjectProxyMixin_Types[i]);
   Py_VISIT(state->str_wrapped);
   Py_VISIT(state->str_wrapped_factory);
   Py_VISIT(state->str_wrapped_get);
@@ -5376,6 +7672,19 @@ static int wrapt_traverse(PyObject *module, visitproc visit, void *arg)
   Py_VISIT(state->str_set_name);
   Py_VISIT(state->str_self_binding);
   Py_VISIT(state->str_dict);
+  Py_VISIT(state->str_next);
+  Py_VISIT(state->str_aiter);
+  Py_VISIT(state->str_anext);
+  Py_VISIT(state->str_await);
+  Py_VISIT(state->str_get);
+  Py_VISIT(state->str_set);
+  Py_VISIT(state->str_delete);
+  Py_VISIT(state->str_length_hint);
+  Py_VISIT(state->str_fspath);
+  Py_VISIT(state->str_mutating_methods);
+  Py_VISIT(state->str_wrapped_method);
+  Py_VISIT(state->str_wrapped_track);
+  Py_VISIT(state->str_wrapped_record);
   Py_VISIT(state->WrapperNotInitializedError);
   return 0;
 }
@@ -5386,11 +7695,17 @@ static int wrapt_clear(PyObject *module)
   if (state == NULL)
     return 0;
   Py_CLEAR(state->ObjectProxy_Type);
+  Py_CLEAR(state->AtomicObjectProxy_Type);
   Py_CLEAR(state->CallableObjectProxy_Type);
+  Py_CLEAR(state->BufferObjectProxy_Type);
   Py_CLEAR(state->PartialCallableObjectProxy_Type);
+  Py_CLEAR(state->WeakFunctionProxyBase_Type);
+  Py_CLEAR(state->TrackingProxyBase_Type);
   Py_CLEAR(state->FunctionWrapperBase_Type);
   Py_CLEAR(state->BoundFunctionWrapper_Type);
   Py_CLEAR(state->FunctionWrapper_Type);
+  for (int i = 0; i < WRAPT_AUTO_MIXIN_COUNT; i++)
+    Py_CLEAR(state->AutoObjectProxyMixin_Types[i]);
   Py_CLEAR(state->str_wrapped);
   Py_CLEAR(state->str_wrapped_factory);
   Py_CLEAR(state->str_wrapped_get);
@@ -5421,6 +7736,19 @@ static int wrapt_clear(PyObject *module)
   Py_CLEAR(state->str_set_name);
   Py_CLEAR(state->str_self_binding);
   Py_CLEAR(state->str_dict);
+  Py_CLEAR(state->str_next);
+  Py_CLEAR(state->str_aiter);
+  Py_CLEAR(state->str_anext);
+  Py_CLEAR(state->str_await);
+  Py_CLEAR(state->str_get);
+  Py_CLEAR(state->str_set);
+  Py_CLEAR(state->str_delete);
+  Py_CLEAR(state->str_length_hint);
+  Py_CLEAR(state->str_fspath);
+  Py_CLEAR(state->str_mutating_methods);
+  Py_CLEAR(state->str_wrapped_method);
+  Py_CLEAR(state->str_wrapped_track);
+  Py_CLEAR(state->str_wrapped_record);
   Py_CLEAR(state->WrapperNotInitializedError);
   return 0;
 }
@@ -5456,7 +7784,7 @@ static struct PyModuleDef moduledef = {
     .m_name = "_wrappers",
     .m_doc = NULL,
     .m_size = sizeof(wrapt_module_state),
-    .m_methods = NULL,
+    .m_methods = wrapt_methods,
     .m_slots = wrapt_slots,
     .m_traverse = wrapt_traverse,
     .m_clear = wrapt_clear,
@@ -0,0 +1,189 @@
+"""Call batching decorators. Currently provides ``batched_async``, which
+collects individual awaited calls made close together in time and
+dispatches them as a single call to a batch implementation, in the style
+of the DataLoader pattern. This avoids the N+1 lookup problem where each
+of many concurrent tasks performs its own round trip to a backend.
+"""
+
+import asyncio
+from collections.abc import Mapping
+from functools import partial
+
+from .decorators import decorator
+
+# A batch of pending keys for one batch implementation. The wrapped batch
+# function is captured from the first call so that for instance methods
+# the batch is bound to the instance the keys were requested against.
+# Each distinct key maps to a single future which is shared by all
+# callers requesting that key, so duplicate keys within a batch are only
+# passed once to the batch implementation.
+
+
+class _Batch:
+
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+        self.futures = {}
+        self.handle = None
+
+
+async def _batched_async_dispatch(batch):
+    try:
+        await _batched_async_resolve(batch)
+
+    finally:
+        # Callers must never be left waiting, so if the batch function or
+        # the dispatch itself was cancelled, or raised an exception other
+        # than an Exception, any results still pending are cancelled.
+
+        for future in batch.futures.values():
+            if not future.done():
+                future.cancel()
+
+
+def _batched_async_fail(batch, exc):
+    for future in batch.futures.values():
+        if not future.done():
+            future.set_exception(exc)
+
+
+async def _batched_async_resolve(batch):
+    keys = list(batch.futures)
+
+    try:
+        results = await batch.wrapped(keys)
+
+    except Exception as exc:
+        _batched_async_fail(batch, exc)
+        return
+
+    # The batch implementation can return either a sequence of results in
+    # the same order as the keys, or a mapping from key to result, in
+    # which case a key missing from the mapping results in a KeyError for
+    # that key only. An exception instance returned in place of a result
+    # is raised for that key only. Anything else, such as a result which
+    # is not iterable or has the wrong number of results, fails the whole
+    # batch the same as if the batch implementation had raised.
+
+    try:
+        if isinstance(results, Mapping):
+            values = [results.get(key, KeyError(key)) for key in keys]
+        else:
+            values = list(results)
+
+            if len(values) != len(keys):
+                raise ValueError(
+                    "batch function returned {} results for {} keys".format(
+                        len(values), len(keys)
+                    )
+                )
+
+    except Exception as exc:
+        _batched_async_fail(batch, exc)
+        return
+
+    for key, value in zip(keys, values):
+        future = batch.futures[key]
+
+        if future.done():
+            continue
+
+        if isinstance(value, Exception):
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+
+
+def batched_async(batch_fn=None, /, *, max_batch=None, max_delay=0.0):
+    """A decorator for an async batch function, which accepts a list of
+    keys and returns the corresponding results, such that the decorated
+    function is instead called with a single key and returns the result
+    for that key. Individual calls made within the same event loop
+    iteration, or within `max_delay` seconds of the first call if it is
+    greater than zero, are collected and dispatched as one call to the
+    batch function. If `max_batch` is given, a batch is dispatched as soon
+    as it contains that many distinct keys.
+
+    Keys must be hashable. Duplicate keys within a batch are passed to the
+    batch function only once and all callers for that key receive the same
+    result. The batch function may return a sequence of results in the
+    same order as the keys, or a mapping from key to result. An exception
+    instance returned in place of a result is raised only for that key. If
+    the batch function raises an exception it is raised for all keys in
+    the batch, and if it is cancelled all callers waiting on the batch are
+    cancelled.
+
+    When applied to an instance method, batches are collected separately
+    for each instance. Batches are also kept separate per event loop.
+    """
+
+    if batch_fn is None:
+        return partial(batched_async, max_batch=max_batch, max_delay=max_delay)
+
+    if max_batch is not None and max_batch < 1:
+        raise ValueError("max_batch must be at least 1")
+
+    # Pending batches, keyed by event loop and the identity of the
+    # instance a method is bound to. A batch holds a strong reference to
+    # the bound batch function, and so to the instance, until dispatched,
+    # so the identity cannot be reused while the batch is pending.
+
+    pending = {}
+
+    # The event loop only holds weak references to tasks, so a strong
+    # reference to each dispatch task is kept until it has completed.
+
+    dispatching = set()
+
+    def _dispatch(loop, batch_key, batch):
+        if pending.get(batch_key) is batch:
+            del pending[batch_key]
+
+        if batch.handle is not None:
+            batch.handle.cancel()
+
+        task = loop.create_task(_batched_async_dispatch(batch))
+
+        dispatching.add(task)
+        task.add_done_callback(dispatching.discard)
+
+    async def _wrapper(wrapped, instance, args, kwargs):
+        if len(args) != 1 or kwargs:
+            raise TypeError("batched function takes exactly one key argument")
+
+        (key,) = args
+
+        # Check the key is hashable before any batch is created or scheduled
+        # for it, so the batch function is never called with no keys.
+
+        hash(key)
+
+        loop = asyncio.get_running_loop()
+        batch_key = (loop, id(instance))
+
+        batch = pending.get(batch_key)
+
+        if batch is None:
+            batch = pending[batch_key] = _Batch(wrapped)
+
+            if max_delay > 0:
+                batch.handle = loop.call_later(
+                    max_delay, _dispatch, loop, batch_key, batch
+                )
+            else:
+                batch.handle = loop.call_soon(_dispatch, loop, batch_key, batch)
+
+        future = batch.futures.get(key)
+
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+
+            if max_batch is not None and len(batch.futures) >= max_batch:
+                _dispatch(loop, batch_key, batch)
+
+        # Shield the shared future so that cancellation of one caller does
+        # not cancel the result for other callers waiting on the same key.
+
+        return await asyncio.shield(future)
+
+    return decorator(_wrapper)(batch_fn)
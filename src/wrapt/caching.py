@@ -6,12 +6,167 @@ by the garbage collector. For plain functions, class methods, and static
 methods a single shared cache is used, matching ``functools.lru_cache``.
 """
 
+import os
+from collections import namedtuple
 from functools import lru_cache as _functools_lru_cache
 from functools import partial
+from threading import Lock, local
+from weakref import WeakSet, ref
 
 from .__wrapt__ import BaseObjectProxy, BoundFunctionWrapper, FunctionWrapper
 from .decorators import decorator
-from .synchronization import synchronized
+from .synchronization import _fork_reinit_objects, synchronized
+
+# Count of forks which have occurred in the ancestry of this process.
+# Caches created with clear_at_fork=True record the value at the time
+# they were created or last cleared, and are cleared on next use if it
+# has since changed, so nothing needs to be done for each cache at the
+# time of the fork itself.
+
+_lru_cache_fork_generation = 0
+
+
+def _lru_cache_after_fork_in_child():
+    global _lru_cache_fork_generation
+    _lru_cache_fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_lru_cache_after_fork_in_child)
+
+
+def _lru_cache_check_fork(cache):
+    if getattr(cache, "_wrapt_fork_generation", 0) != _lru_cache_fork_generation:
+        cache.cache_clear()
+        cache._wrapt_fork_generation = _lru_cache_fork_generation
+
+    return cache
+
+
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Cache used when scope="thread" is supplied. A separate functools cache
+# is kept for each thread in thread local storage, so that threads never
+# contend on the same cache. The per-thread caches are also tracked in a
+# weak set so statistics can be rolled up across threads and all caches
+# cleared together. The cache is held in thread local storage through a
+# holder object, so that when a thread exits and its thread local storage
+# is released, the hits and misses of its cache can be added to running
+# totals before the cache itself is discarded. This ensures the totals
+# reported by cache_info() never go backwards as threads come and go.
+#
+# The holder does this when it is itself torn down, referring back to its
+# owner only weakly. Nothing else may hold the cache strongly, such as a
+# weakref.finalize() callback would, since for an instance method the
+# cache refers to the instance through the bound method, and the instance
+# would then be kept alive for as long as the thread is.
+
+
+class _ThreadLocalLRUCacheHolder:
+
+    __slots__ = ("cache", "owner")
+
+    def __init__(self, cache, owner):
+        self.cache = cache
+        self.owner = ref(owner)
+
+    def __del__(self):
+        owner = self.owner()
+
+        if owner is not None:
+            owner._retire(self.cache)
+
+
+class _ThreadLocalLRUCache:
+
+    def __init__(self, kwargs, wrapped):
+        self._kwargs = kwargs
+        self._wrapped = wrapped
+        self._local = local()
+        self._caches = WeakSet()
+        self._lock = Lock()
+
+        self._retired_hits = 0
+        self._retired_misses = 0
+
+        # Mirror the normalisation of maxsize done by functools.lru_cache.
+
+        maxsize = kwargs.get("maxsize", 128)
+
+        if isinstance(maxsize, int) and maxsize < 0:
+            maxsize = 0
+
+        self._parameters = {"maxsize": maxsize, "typed": kwargs.get("typed", False)}
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        self._lock = Lock()
+
+    def _cache(self):
+        holder = getattr(self._local, "holder", None)
+
+        if holder is None:
+            cache = _functools_lru_cache(**self._kwargs)(self._wrapped)
+            holder = _ThreadLocalLRUCacheHolder(cache, self)
+
+            with self._lock:
+                self._caches.add(cache)
+
+            self._local.holder = holder
+
+        return holder.cache
+
+    def _retire(self, cache):
+        with self._lock:
+            info = cache.cache_info()
+
+            self._retired_hits += info.hits
+            self._retired_misses += info.misses
+
+            self._caches.discard(cache)
+
+    def __call__(self, *args, **kwargs):
+        return self._cache()(*args, **kwargs)
+
+    def cache_info(self):
+        with self._lock:
+            hits = self._retired_hits
+            misses = self._retired_misses
+            currsize = 0
+
+            for cache in self._caches:
+                info = cache.cache_info()
+                hits += info.hits
+                misses += info.misses
+                currsize += info.currsize
+
+        return _CacheInfo(hits, misses, self._parameters["maxsize"], currsize)
+
+    def cache_clear(self):
+        with self._lock:
+            self._retired_hits = 0
+            self._retired_misses = 0
+
+            caches = list(self._caches)
+
+        for cache in caches:
+            cache.cache_clear()
+
+    def cache_parameters(self):
+        return dict(self._parameters)
+
+
+def _lru_cache_create(kwargs, scope, wrapped):
+    if scope == "thread":
+        cache = _ThreadLocalLRUCache(kwargs, wrapped)
+    else:
+        cache = _functools_lru_cache(**kwargs)(wrapped)
+
+    cache._wrapt_fork_generation = _lru_cache_fork_generation
+
+    return cache
+
 
 # Decorator that applies functools.lru_cache to the wrapped function.
 # Unlike using functools.lru_cache directly, this works correctly with
@@ -47,11 +202,18 @@ class _BoundLRUCacheFunctionWrapper(BoundFunctionWrapper):
             if parent._self_cache is None:
                 with synchronized(parent):
                     if parent._self_cache is None:
-                        parent._self_cache = _functools_lru_cache(
-                            **parent._self_lru_kwargs
-                        )(self.__wrapped__)
+                        parent._self_cache = _lru_cache_create(
+                            parent._self_lru_kwargs,
+                            parent._self_lru_scope,
+                            self.__wrapped__,
+                        )
+
+            cache = parent._self_cache
 
-            return parent._self_cache(*args, **kwargs)
+            if parent._self_clear_at_fork:
+                _lru_cache_check_fork(cache)
+
+            return cache(*args, **kwargs)
 
         # Instance method — per-instance cache stored as an attribute
         # on the instance so it is cleaned up with the instance by the
@@ -67,8 +229,10 @@ class _BoundLRUCacheFunctionWrapper(BoundFunctionWrapper):
                 cache = getattr(instance, cache_attr, None)
 
                 if cache is None:
-                    cache = _functools_lru_cache(**parent._self_lru_kwargs)(
-                        self.__wrapped__
+                    cache = _lru_cache_create(
+                        parent._self_lru_kwargs,
+                        parent._self_lru_scope,
+                        self.__wrapped__,
                     )
 
                     # If the instance the method is bound to is a wrapt
@@ -85,6 +249,9 @@ class _BoundLRUCacheFunctionWrapper(BoundFunctionWrapper):
                     else:
                         setattr(instance, cache_attr, cache)
 
+        if parent._self_clear_at_fork:
+            _lru_cache_check_fork(cache)
+
         return cache(*args, **kwargs)
 
     def cache_info(self):
@@ -130,6 +297,14 @@ class _BoundLRUCacheFunctionWrapper(BoundFunctionWrapper):
 
 class _LRUCacheFunctionWrapper(FunctionWrapper):
 
+    __slots__ = (
+        "_self_lru_kwargs",
+        "_self_lru_scope",
+        "_self_clear_at_fork",
+        "_self_cache",
+        "_self_cache_attr",
+    )
+
     __bound_function_wrapper__ = _BoundLRUCacheFunctionWrapper
 
     def __init__(self, wrapped, wrapper, **kwargs):
@@ -139,6 +314,8 @@ class _LRUCacheFunctionWrapper(FunctionWrapper):
         # wrapper function before it was passed to the decorator.
 
         self._self_lru_kwargs = wrapper._self_lru_kwargs
+        self._self_lru_scope = wrapper._self_lru_scope
+        self._self_clear_at_fork = wrapper._self_clear_at_fork
         self._self_cache = None
 
         # Use __func__ to get the name for classmethod/staticmethod
@@ -168,11 +345,16 @@ class _LRUCacheFunctionWrapper(FunctionWrapper):
         if self._self_cache is None:
             with synchronized(self):
                 if self._self_cache is None:
-                    self._self_cache = _functools_lru_cache(**self._self_lru_kwargs)(
-                        self.__wrapped__
+                    self._self_cache = _lru_cache_create(
+                        self._self_lru_kwargs, self._self_lru_scope, self.__wrapped__
                     )
 
-        return self._self_cache(*args, **kwargs)
+        cache = self._self_cache
+
+        if self._self_clear_at_fork:
+            _lru_cache_check_fork(cache)
+
+        return cache(*args, **kwargs)
 
     def cache_info(self):
         """Return the cache statistics, or ``None`` if the cache has
@@ -201,7 +383,7 @@ class _LRUCacheFunctionWrapper(FunctionWrapper):
         return None
 
 
-def lru_cache(func=None, /, **kwargs):
+def lru_cache(func=None, /, *, scope=None, clear_at_fork=False, **kwargs):
     """A decorator that applies ``functools.lru_cache`` to the wrapped
     function, with correct handling for instance methods, class methods,
     and static methods.
@@ -216,7 +398,18 @@ def lru_cache(func=None, /, **kwargs):
     For plain functions, class methods, and static methods, a single
     shared cache is used.
 
-    All keyword arguments are passed through to ``functools.lru_cache``.
+    If ``scope`` is ``"thread"``, a separate cache is additionally kept
+    for each thread, so that threads calling the decorated function do not
+    contend on a shared cache. Each thread's cache is released when the
+    thread exits. ``cache_info()`` then reports the hits and misses summed
+    over all threads, including those which have exited, with the current
+    size being that of the caches of live threads. ``cache_clear()`` clears
+    the caches of all threads and resets the statistics.
+
+    If ``clear_at_fork`` is true, cached results inherited by a child
+    process created using ``os.fork()`` are discarded on first use of the
+    cache in the child. All other keyword arguments are passed through to
+    ``functools.lru_cache``.
 
     Cache management methods ``cache_info()`` and ``cache_clear()`` are
     available directly on the decorated function. For bound methods,
@@ -224,11 +417,16 @@ def lru_cache(func=None, /, **kwargs):
     """
 
     if func is None:
-        return partial(lru_cache, **kwargs)
+        return partial(lru_cache, scope=scope, clear_at_fork=clear_at_fork, **kwargs)
+
+    if scope not in (None, "thread"):
+        raise ValueError("scope must be None or 'thread'")
 
     def _wrapper(wrapped, instance, args, _kwargs):
         return wrapped(*args, **_kwargs)
 
     _wrapper._self_lru_kwargs = kwargs
+    _wrapper._self_lru_scope = scope
+    _wrapper._self_clear_at_fork = clear_at_fork
 
     return decorator(_wrapper, proxy=_LRUCacheFunctionWrapper)(func)
@@ -22,6 +22,8 @@ from .arguments import formatargspec
 
 class _AdapterFunctionCode(CallableObjectProxy):
 
+    __slots__ = ("_self_adapter_code",)
+
     def __init__(self, wrapped_code, adapter_code):
         # Explicit class in super() is used because the proxy overrides
         # __class__ and MRO-related methods to delegate to the wrapped
@@ -52,6 +54,8 @@ class _AdapterFunctionCode(CallableObjectProxy):
 
 class _AdapterFunctionSurrogate(CallableObjectProxy):
 
+    __slots__ = ("_self_adapter",)
+
     def __init__(self, wrapped, adapter):
         # Explicit class in super() is used because the proxy overrides
         # __class__ and MRO-related methods to delegate to the wrapped
@@ -93,6 +97,8 @@ class _BoundAdapterFunctionWrapper(BoundFunctionWrapper):
 
 class _AdapterFunctionWrapper(FunctionWrapper):
 
+    __slots__ = ("_self_surrogate", "_self_adapter")
+
     __bound_function_wrapper__ = _BoundAdapterFunctionWrapper
 
     def __init__(self, *args, **kwargs):
@@ -433,6 +439,8 @@ class _StateBindingWrapper(BaseObjectProxy):
     the owner instance is stored on the wrapper (default ``"state"``).
     """
 
+    __slots__ = ("_self_name",)
+
     def __init__(self, *, name="state"):
         # Initialise the proxy with a placeholder. The actual wrapper
         # factory is set later when __call__ is invoked as a decorator.
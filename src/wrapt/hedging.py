@@ -0,0 +1,262 @@
+"""Hedged request decorators. Currently provides ``hedged``, which reduces
+tail latency of idempotent async calls by starting a second attempt when
+the first has not completed within a latency threshold, taking whichever
+attempt completes first and cancelling the rest.
+"""
+
+import asyncio
+from bisect import bisect_left, insort
+from collections import deque, namedtuple
+from functools import partial
+from threading import Lock
+
+from .__wrapt__ import BoundFunctionWrapper, FunctionWrapper
+from .decorators import decorator
+from .synchronization import _fork_reinit_objects, _synchronized_is_async_callable
+
+_HedgeInfo = namedtuple("HedgeInfo", ["calls", "hedged", "wins", "delay"])
+
+# Number of latency samples which must have been recorded before an
+# adaptive delay derived from the latency histogram is used in place of
+# the initial delay.
+
+_ADAPTIVE_MIN_SAMPLES = 10
+
+# State shared by all calls of a hedged function, whether called as a
+# plain function or via any instance it is bound to. The counters and
+# the rolling window of latencies are updated under a lock since calls
+# can be made from event loops running in different threads. A sorted copy
+# of the window is maintained as latencies are recorded, so that getting
+# the adaptive delay for each call does not require sorting the window.
+
+
+class _HedgeState:
+
+    def __init__(self, delay, max_attempts, percentile, window):
+        self.delay = delay
+        self.max_attempts = max_attempts
+        self.percentile = percentile
+        self.latencies = deque(maxlen=window)
+        self.ordered = []
+        self.lock = Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.wins = 0
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        self.lock = Lock()
+
+    def current_delay(self):
+        if self.percentile is None:
+            return self.delay
+
+        with self.lock:
+            samples = self.ordered
+
+            if len(samples) < _ADAPTIVE_MIN_SAMPLES:
+                return self.delay
+
+            index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+
+            return samples[index]
+
+    def record(self, latency, hedged, won):
+        with self.lock:
+            self.calls += 1
+
+            if len(self.latencies) == self.latencies.maxlen:
+                del self.ordered[bisect_left(self.ordered, self.latencies[0])]
+
+            self.latencies.append(latency)
+            insort(self.ordered, latency)
+
+            if hedged:
+                self.hedged += 1
+
+            if won:
+                self.wins += 1
+
+    def info(self):
+        delay = self.current_delay()
+
+        with self.lock:
+            return _HedgeInfo(self.calls, self.hedged, self.wins, delay)
+
+    def clear(self):
+        with self.lock:
+            self.latencies.clear()
+            self.ordered.clear()
+            self.calls = 0
+            self.hedged = 0
+            self.wins = 0
+
+
+class _BoundHedgedFunctionWrapper(BoundFunctionWrapper):
+
+    def hedge_info(self):
+        """Return the hedging statistics for the decorated function."""
+
+        return self._self_parent.hedge_info()
+
+    def hedge_clear(self):
+        """Reset the hedging statistics and latency history."""
+
+        self._self_parent.hedge_clear()
+
+
+class _HedgedFunctionWrapper(FunctionWrapper):
+
+    __slots__ = ("_self_hedge_state",)
+
+    __bound_function_wrapper__ = _BoundHedgedFunctionWrapper
+
+    def __init__(self, wrapped, wrapper, **kwargs):
+        super().__init__(wrapped, wrapper, **kwargs)
+
+        # Extract the hedging state that was attached to the wrapper
+        # function before it was passed to the decorator.
+
+        self._self_hedge_state = wrapper._self_hedge_state
+
+    def hedge_info(self):
+        """Return the hedging statistics as a named tuple of the number of
+        completed calls, the number of those for which a hedged attempt
+        was started, the number which were won by a hedged attempt, and
+        the delay which would currently be used before hedging.
+        """
+
+        return self._self_hedge_state.info()
+
+    def hedge_clear(self):
+        """Reset the hedging statistics and latency history."""
+
+        self._self_hedge_state.clear()
+
+
+def hedged(wrapped=None, /, *, delay=None, max_attempts=2, percentile=None, window=100):
+    """A decorator for async callables which starts another attempt of the
+    call if the attempts made so far have not completed within `delay`
+    seconds, up to `max_attempts` attempts in total. The result of the
+    first attempt to complete successfully is returned and all other
+    attempts are cancelled. If an attempt fails while others are still
+    outstanding, the remaining attempts are waited on, with the exception
+    only raised if no attempt succeeds. Only use this on idempotent calls.
+
+    If `percentile` is given, the delay is adapted to the observed latency
+    of the decorated function, being that percentile of the latencies of
+    the last `window` successful calls. Until enough calls have been made
+    the fixed `delay` is used, with no hedging if it is `None`.
+
+    Statistics on how often hedging occurred and how often a hedged
+    attempt won are available from `hedge_info()` on the decorated
+    function, and can be reset using `hedge_clear()`.
+    """
+
+    if wrapped is None:
+        return partial(
+            hedged,
+            delay=delay,
+            max_attempts=max_attempts,
+            percentile=percentile,
+            window=window,
+        )
+
+    if delay is None and percentile is None:
+        raise TypeError("hedged requires at least one of delay= or percentile=")
+
+    if not _synchronized_is_async_callable(wrapped):
+        raise TypeError("hedged can only be applied to an async callable")
+
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+
+    if percentile is not None and not 0 < percentile <= 100:
+        raise ValueError("percentile must be greater than 0 and at most 100")
+
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+    state = _HedgeState(delay, max_attempts, percentile, window)
+
+    async def _wrapper(wrapped, instance, args, kwargs):
+        loop = asyncio.get_running_loop()
+        delay = state.current_delay()
+
+        # Latency is measured from the start of the call rather than of the
+        # winning attempt, so that it includes any time spent waiting before
+        # a hedged attempt was started and reflects what the caller saw.
+
+        start = loop.time()
+        attempts = []
+
+        def _launch():
+            task = asyncio.ensure_future(wrapped(*args, **kwargs))
+            attempts.append(task)
+            return task
+
+        pending = {_launch()}
+        error = None
+
+        try:
+            while True:
+                if delay is not None and len(attempts) < state.max_attempts:
+                    timeout = delay
+                else:
+                    timeout = None
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    pending.add(_launch())
+                    continue
+
+                # Retrieve the outcome of every completed attempt, in the
+                # order they were started, so that no exception is left
+                # unretrieved and ties go to the earliest attempt.
+
+                winner = None
+
+                for task in attempts:
+                    if task not in done:
+                        continue
+
+                    try:
+                        result = task.result()
+
+                    except Exception as exc:
+                        error = exc
+
+                    else:
+                        if winner is None:
+                            winner = task
+                            value = result
+
+                if winner is not None:
+                    state.record(
+                        loop.time() - start,
+                        hedged=len(attempts) > 1,
+                        won=winner is not attempts[0],
+                    )
+                    return value
+
+                if not pending:
+                    raise error
+
+        finally:
+            # Attempts which are still running are cancelled and then waited
+            # on, so that their cleanup completes and any exception they
+            # raise is retrieved rather than being reported as unhandled.
+
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    _wrapper._self_hedge_state = state
+
+    return decorator(_wrapper, proxy=_HedgedFunctionWrapper)(wrapped)
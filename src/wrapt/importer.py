@@ -4,6 +4,7 @@ described in PEP-369. Note that it doesn't cope with modules being reloaded.
 """
 
 import importlib.metadata
+import os
 import sys
 import threading
 from collections.abc import Callable
@@ -21,6 +22,19 @@ _post_import_hooks: dict[str, list[Callable]] = {}
 _post_import_hooks_init = False
 _post_import_hooks_lock = threading.RLock()
 
+# The lock could be held by another thread at the point the process forks,
+# in which case it would remain held forever in the child. Replace it with
+# a fresh lock in the child.
+
+
+def _post_import_hooks_after_fork_in_child():
+    global _post_import_hooks_lock
+    _post_import_hooks_lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_post_import_hooks_after_fork_in_child)
+
 # Register a new post import hook for the target module name. This
 # differs from the PEP-369 implementation in that it also allows the
 # hook function to be specified as a string consisting of the name of
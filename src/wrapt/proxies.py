@@ -1,10 +1,45 @@
 """Variants of ObjectProxy for different use cases."""
 
-from collections.abc import Callable
+import asyncio
+import copy
+import inspect
+import mmap
+import operator
+import os
+import pickle
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, update_wrapper
+from time import monotonic
 from types import ModuleType
-
-from .__wrapt__ import BaseObjectProxy
-from .synchronization import synchronized
+from weakref import WeakKeyDictionary, ref
+
+from .__wrapt__ import (
+    BaseObjectProxy,
+    _AutoObjectProxyAiter,
+    _AutoObjectProxyAnext,
+    _AutoObjectProxyAwait,
+    _AutoObjectProxyCall,
+    _AutoObjectProxyDelete,
+    _AutoObjectProxyFspath,
+    _AutoObjectProxyGet,
+    _AutoObjectProxyIter,
+    _AutoObjectProxyLengthHint,
+    _AutoObjectProxyNext,
+    _AutoObjectProxySet,
+    _AutoObjectProxySetName,
+    _TrackingProxyBase,
+)
+from .synchronization import (
+    _fork_reinit_objects,
+    _register_thread_atexit,
+    _start_background_thread,
+    synchronized,
+)
+from .wrappers import WrapperNotInitializedError
 
 # Define ObjectProxy which for compatibility adds `__iter__()` support which
 # has been removed from `BaseObjectProxy`.
@@ -29,61 +64,123 @@ class ObjectProxy(BaseObjectProxy):
         return iter(self.__wrapped__)
 
 
-# Define variant of ObjectProxy which can automatically adjust to the wrapped
-# object and add special dunder methods.
-
+# Define mixins forwarding the NumPy dispatch protocols. NumPy looks these
+# up on the type of an argument, so unlike `__array__()` and
+# `__array_interface__` they are not found via attribute lookup on a proxy.
+# Being ordinary methods rather than type slots, they have no separate C
+# implementation.
 
-def __wrapper_call__(*args, **kwargs):
-    def _unpack_self(self, *args):
-        return self, args
 
-    self, args = _unpack_self(*args)
+def _unwrap_array_arguments(value):
+    """Returns `value` with any object proxies replaced by the objects they
+    wrap, descending into lists, tuples and dictionaries as used for the
+    arguments of NumPy functions, so that NumPy dispatches on the wrapped
+    objects instead.
+    """
 
-    return self.__wrapped__(*args, **kwargs)
+    if isinstance(value, BaseObjectProxy):
+        return value.__wrapped__
 
+    if type(value) in (list, tuple):
+        return type(value)(_unwrap_array_arguments(item) for item in value)
 
-def __wrapper_iter__(self):
-    return iter(self.__wrapped__)
+    if type(value) is dict:
+        return {key: _unwrap_array_arguments(item) for key, item in value.items()}
 
+    return value
 
-def __wrapper_next__(self):
-    return self.__wrapped__.__next__()
 
+class _AutoObjectProxyArrayUfunc(BaseObjectProxy):
 
-def __wrapper_aiter__(self):
-    return self.__wrapped__.__aiter__()
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = _unwrap_array_arguments(inputs)
+        kwargs = _unwrap_array_arguments(kwargs)
 
+        result = getattr(ufunc, method)(*inputs, **kwargs)
 
-async def __wrapper_anext__(self):
-    return await self.__wrapped__.__anext__()
+        return self.__wrapped_array_result__(result)
 
 
-def __wrapper_length_hint__(self):
-    return self.__wrapped__.__length_hint__()
+class _AutoObjectProxyArrayFunction(BaseObjectProxy):
 
+    def __array_function__(self, func, types, args, kwargs):
+        args = _unwrap_array_arguments(args)
+        kwargs = _unwrap_array_arguments(kwargs)
 
-def __wrapper_fspath__(self):
-    return self.__wrapped__.__fspath__()
+        result = func(*args, **kwargs)
 
+        return self.__wrapped_array_result__(result)
 
-def __wrapper_await__(self):
-    return (yield from self.__wrapped__.__await__())
 
+# Define variant of ObjectProxy which can automatically adjust to the wrapped
+# object and add special dunder methods. Each special method is provided by a
+# mixin class which is added as a base class of a class created for each
+# instance, so that with the C extension the corresponding type slots are
+# inherited directly.
+
+_auto_proxy_mixins = (
+    ("__call__", _AutoObjectProxyCall),
+    ("__iter__", _AutoObjectProxyIter),
+    ("__next__", _AutoObjectProxyNext),
+    ("__aiter__", _AutoObjectProxyAiter),
+    ("__anext__", _AutoObjectProxyAnext),
+    ("__length_hint__", _AutoObjectProxyLengthHint),
+    ("__fspath__", _AutoObjectProxyFspath),
+    # Note that not providing compatibility with generator-based coroutines
+    # (PEP 342) here as they are removed in Python 3.11+ and were deprecated
+    # in 3.8.
+    ("__await__", _AutoObjectProxyAwait),
+    ("__get__", _AutoObjectProxyGet),
+    ("__set__", _AutoObjectProxySet),
+    ("__delete__", _AutoObjectProxyDelete),
+    ("__set_name__", _AutoObjectProxySetName),
+    ("__array_ufunc__", _AutoObjectProxyArrayUfunc),
+    ("__array_function__", _AutoObjectProxyArrayFunction),
+)
+
+_auto_proxy_capabilities_cache = WeakKeyDictionary()
+
+
+def _auto_proxy_class_defines(cls, name):
+    return any(name in vars(base) for base in cls.__mro__)
+
+
+def _auto_proxy_capabilities(wrapped_type):
+    """Returns the names of the special methods provided by instances of
+    `wrapped_type`, as looked up by Python on the type. The result is
+    cached for each type.
+    """
 
-def __wrapper_get__(self, instance, owner):
-    return self.__wrapped__.__get__(instance, owner)
+    try:
+        return _auto_proxy_capabilities_cache[wrapped_type]
+    except (KeyError, TypeError):
+        pass
 
+    names = frozenset(
+        name
+        for name, _ in _auto_proxy_mixins
+        if _auto_proxy_class_defines(wrapped_type, name)
+    )
 
-def __wrapper_set__(self, instance, value):
-    return self.__wrapped__.__set__(instance, value)
+    try:
+        _auto_proxy_capabilities_cache[wrapped_type] = names
+    except TypeError:
+        # Type is not hashable due to a custom metaclass.
+        pass
 
+    return names
 
-def __wrapper_delete__(self, instance):
-    return self.__wrapped__.__delete__(instance)
 
+def _auto_proxy_bases(cls, capabilities):
+    """Returns the base classes for the class of an instance of `cls`,
+    adding the mixins for those capabilities not already provided by `cls`.
+    """
 
-def __wrapper_set_name__(self, owner, name):
-    return self.__wrapped__.__set_name__(owner, name)
+    return (cls,) + tuple(
+        mixin
+        for name, mixin in _auto_proxy_mixins
+        if name in capabilities and not _auto_proxy_class_defines(cls, name)
+    )
 
 
 class AutoObjectProxy(BaseObjectProxy):
@@ -98,53 +195,10 @@ class AutoObjectProxy(BaseObjectProxy):
 
     def __new__(cls, wrapped):
         """Injects special dunder methods into a dynamically created subclass
-        as needed based on the wrapped object.
+        as needed based on the type of the wrapped object.
         """
 
-        namespace = {}
-
-        wrapped_attrs = dir(wrapped)
-        class_attrs = set(dir(cls))
-
-        if callable(wrapped) and "__call__" not in class_attrs:
-            namespace["__call__"] = __wrapper_call__
-
-        if "__iter__" in wrapped_attrs and "__iter__" not in class_attrs:
-            namespace["__iter__"] = __wrapper_iter__
-
-        if "__next__" in wrapped_attrs and "__next__" not in class_attrs:
-            namespace["__next__"] = __wrapper_next__
-
-        if "__aiter__" in wrapped_attrs and "__aiter__" not in class_attrs:
-            namespace["__aiter__"] = __wrapper_aiter__
-
-        if "__anext__" in wrapped_attrs and "__anext__" not in class_attrs:
-            namespace["__anext__"] = __wrapper_anext__
-
-        if "__length_hint__" in wrapped_attrs and "__length_hint__" not in class_attrs:
-            namespace["__length_hint__"] = __wrapper_length_hint__
-
-        if "__fspath__" in wrapped_attrs and "__fspath__" not in class_attrs:
-            namespace["__fspath__"] = __wrapper_fspath__
-
-        # Note that not providing compatibility with generator-based coroutines
-        # (PEP 342) here as they are removed in Python 3.11+ and were deprecated
-        # in 3.8.
-
-        if "__await__" in wrapped_attrs and "__await__" not in class_attrs:
-            namespace["__await__"] = __wrapper_await__
-
-        if "__get__" in wrapped_attrs and "__get__" not in class_attrs:
-            namespace["__get__"] = __wrapper_get__
-
-        if "__set__" in wrapped_attrs and "__set__" not in class_attrs:
-            namespace["__set__"] = __wrapper_set__
-
-        if "__delete__" in wrapped_attrs and "__delete__" not in class_attrs:
-            namespace["__delete__"] = __wrapper_delete__
-
-        if "__set_name__" in wrapped_attrs and "__set_name__" not in class_attrs:
-            namespace["__set_name__"] = __wrapper_set_name__
+        bases = _auto_proxy_bases(cls, _auto_proxy_capabilities(type(wrapped)))
 
         name = cls.__name__
 
@@ -154,153 +208,63 @@ class AutoObjectProxy(BaseObjectProxy):
         # Explicit class in super() is required here to ensure __new__
         # is called on the parent of AutoObjectProxy, not the dynamically
         # created subclass.
-        return super(AutoObjectProxy, cls).__new__(type(name, (cls,), namespace))
+        return super(AutoObjectProxy, cls).__new__(type(name, bases, {}))
+
+    def __wrapped_array_result__(self, result):
+        """Returns the result of a NumPy ufunc or function which was
+        dispatched to the wrapped object. Override this in a derived class to
+        wrap the result, such as in a proxy of the same type.
+        """
+
+        return result
 
     def __wrapped_setattr_fixups__(self):
         """Adjusts special dunder methods on the class as needed based on the
         wrapped object, when `__wrapped__` is changed.
         """
 
+        # The first base of the class created for this instance is the
+        # class the instance was created from.
+
         cls = type(self)
-        class_attrs = set(dir(cls))
-
-        if callable(self.__wrapped__):
-            if "__call__" not in class_attrs:
-                cls.__call__ = __wrapper_call__
-        elif getattr(cls, "__call__", None) is __wrapper_call__:
-            delattr(cls, "__call__")
-
-        if hasattr(self.__wrapped__, "__iter__"):
-            if "__iter__" not in class_attrs:
-                cls.__iter__ = __wrapper_iter__
-        elif getattr(cls, "__iter__", None) is __wrapper_iter__:
-            delattr(cls, "__iter__")
-
-        if hasattr(self.__wrapped__, "__next__"):
-            if "__next__" not in class_attrs:
-                cls.__next__ = __wrapper_next__
-        elif getattr(cls, "__next__", None) is __wrapper_next__:
-            delattr(cls, "__next__")
-
-        if hasattr(self.__wrapped__, "__aiter__"):
-            if "__aiter__" not in class_attrs:
-                cls.__aiter__ = __wrapper_aiter__
-        elif getattr(cls, "__aiter__", None) is __wrapper_aiter__:
-            delattr(cls, "__aiter__")
-
-        if hasattr(self.__wrapped__, "__anext__"):
-            if "__anext__" not in class_attrs:
-                cls.__anext__ = __wrapper_anext__
-        elif getattr(cls, "__anext__", None) is __wrapper_anext__:
-            delattr(cls, "__anext__")
-
-        if hasattr(self.__wrapped__, "__length_hint__"):
-            if "__length_hint__" not in class_attrs:
-                cls.__length_hint__ = __wrapper_length_hint__
-        elif getattr(cls, "__length_hint__", None) is __wrapper_length_hint__:
-            delattr(cls, "__length_hint__")
-
-        if hasattr(self.__wrapped__, "__fspath__"):
-            if "__fspath__" not in class_attrs:
-                cls.__fspath__ = __wrapper_fspath__
-        elif getattr(cls, "__fspath__", None) is __wrapper_fspath__:
-            delattr(cls, "__fspath__")
-
-        if hasattr(self.__wrapped__, "__await__"):
-            if "__await__" not in class_attrs:
-                cls.__await__ = __wrapper_await__
-        elif getattr(cls, "__await__", None) is __wrapper_await__:
-            delattr(cls, "__await__")
-
-        if hasattr(self.__wrapped__, "__get__"):
-            if "__get__" not in class_attrs:
-                cls.__get__ = __wrapper_get__
-        elif getattr(cls, "__get__", None) is __wrapper_get__:
-            delattr(cls, "__get__")
-
-        if hasattr(self.__wrapped__, "__set__"):
-            if "__set__" not in class_attrs:
-                cls.__set__ = __wrapper_set__
-        elif getattr(cls, "__set__", None) is __wrapper_set__:
-            delattr(cls, "__set__")
-
-        if hasattr(self.__wrapped__, "__delete__"):
-            if "__delete__" not in class_attrs:
-                cls.__delete__ = __wrapper_delete__
-        elif getattr(cls, "__delete__", None) is __wrapper_delete__:
-            delattr(cls, "__delete__")
-
-        if hasattr(self.__wrapped__, "__set_name__"):
-            if "__set_name__" not in class_attrs:
-                cls.__set_name__ = __wrapper_set_name__
-        elif getattr(cls, "__set_name__", None) is __wrapper_set_name__:
-            delattr(cls, "__set_name__")
+
+        bases = _auto_proxy_bases(
+            cls.__bases__[0], _auto_proxy_capabilities(type(self.__wrapped__))
+        )
+
+        if cls.__bases__ != bases:
+            cls.__bases__ = bases
 
 
 class LazyObjectProxy(AutoObjectProxy):
     """An object proxy which can generate/create the wrapped object on demand
-    when it is first needed.
+    when it is first needed. Where the callback is an async function, the
+    proxy must instead be awaited to create the wrapped object.
     """
 
     def __new__(cls, callback=None, *, interface=...):
         """Injects special dunder methods into a dynamically created subclass
-        as needed based on the wrapped object.
+        as needed based on the interface of the wrapped object.
         """
 
         if interface is ...:
             interface = type(None)
 
-        namespace = {}
-
-        interface_attrs = dir(interface)
-        class_attrs = set(dir(cls))
-
-        if "__call__" in interface_attrs and "__call__" not in class_attrs:
-            namespace["__call__"] = __wrapper_call__
-
-        if "__iter__" in interface_attrs and "__iter__" not in class_attrs:
-            namespace["__iter__"] = __wrapper_iter__
-
-        if "__next__" in interface_attrs and "__next__" not in class_attrs:
-            namespace["__next__"] = __wrapper_next__
-
-        if "__aiter__" in interface_attrs and "__aiter__" not in class_attrs:
-            namespace["__aiter__"] = __wrapper_aiter__
-
-        if "__anext__" in interface_attrs and "__anext__" not in class_attrs:
-            namespace["__anext__"] = __wrapper_anext__
-
-        if (
-            "__length_hint__" in interface_attrs
-            and "__length_hint__" not in class_attrs
-        ):
-            namespace["__length_hint__"] = __wrapper_length_hint__
-
-        # Note that not providing compatibility with generator-based coroutines
-        # (PEP 342) here as they are removed in Python 3.11+ and were deprecated
-        # in 3.8.
-
-        if "__await__" in interface_attrs and "__await__" not in class_attrs:
-            namespace["__await__"] = __wrapper_await__
-
-        if "__get__" in interface_attrs and "__get__" not in class_attrs:
-            namespace["__get__"] = __wrapper_get__
-
-        if "__set__" in interface_attrs and "__set__" not in class_attrs:
-            namespace["__set__"] = __wrapper_set__
+        name = cls.__name__
 
-        if "__delete__" in interface_attrs and "__delete__" not in class_attrs:
-            namespace["__delete__"] = __wrapper_delete__
+        # An async factory is instead handled by a subclass which creates the
+        # wrapped object when the proxy is awaited. This must be the first
+        # base as dunder methods are later adjusted relative to it.
 
-        if "__set_name__" in interface_attrs and "__set_name__" not in class_attrs:
-            namespace["__set_name__"] = __wrapper_set_name__
+        if inspect.iscoroutinefunction(callback):
+            cls = _lazy_async_class(cls)
 
-        name = cls.__name__
+        bases = _auto_proxy_bases(cls, _auto_proxy_capabilities(interface))
 
         # Explicit class in super() is required here to ensure __new__
         # is called on the parent of AutoObjectProxy, not the dynamically
         # created subclass.
-        return super(AutoObjectProxy, cls).__new__(type(name, (cls,), namespace))
+        return super(AutoObjectProxy, cls).__new__(type(name, bases, {}))
 
     def __init__(self, callback=None, *, interface=...):
         """Initialize the object proxy with wrapped object as `None` but due
@@ -344,12 +308,145 @@ class LazyObjectProxy(AutoObjectProxy):
             return self.__wrapped__
 
 
-def lazy_import(name, attribute=None, *, interface=...):
+class _LazyObjectProxyAsync(LazyObjectProxy):
+    """Variant of `LazyObjectProxy` for an async factory, where the wrapped
+    object is created by awaiting the proxy. Concurrent awaiters share the
+    one call of the factory.
+    """
+
+    __wrapped_task__ = None
+
+    def __wrapped_get__(self):
+        with synchronized(type(self)):
+            if self.__wrapped_get_called__:
+                return self.__wrapped__
+
+        raise WrapperNotInitializedError(
+            f"{type(self).__name__} with an async factory must be awaited "
+            "before it is used"
+        )
+
+    def __await__(self):
+        return self.__wrapped_get_async__().__await__()
+
+    async def __wrapped_get_async__(self):
+        """Gets the wrapped object, awaiting the factory if necessary."""
+
+        with synchronized(type(self)):
+            if self.__wrapped_get_called__:
+                return self.__wrapped__
+
+            task = self.__wrapped_task__
+
+            if task is None:
+                task = asyncio.ensure_future(self.__wrapped_create_async__())
+                self.__wrapped_task__ = task
+
+        # The factory runs as a separate task so that an awaiter being
+        # cancelled does not cancel creation for any others.
+
+        return await asyncio.shield(task)
+
+    async def __wrapped_create_async__(self):
+        try:
+            wrapped = await self.__wrapped_factory__()
+
+        finally:
+            # If the factory failed it is called again on the next await.
+
+            with synchronized(type(self)):
+                self.__wrapped_task__ = None
+
+        with synchronized(type(self)):
+            self.__wrapped__ = wrapped
+
+            self.__wrapped_get_called__ = True
+
+        return wrapped
+
+
+_lazy_async_classes = WeakKeyDictionary()
+
+
+def _lazy_async_class(cls):
+    """Returns the subclass of `cls` used for an async factory."""
+
+    try:
+        return _lazy_async_classes[cls]
+    except KeyError:
+        pass
+
+    if issubclass(cls, _LazyObjectProxyAsync):
+        klass = cls
+    else:
+        klass = type(cls.__name__, (_LazyObjectProxyAsync, cls), {})
+
+    _lazy_async_classes[cls] = klass
+
+    return klass
+
+
+def _lazy_warm_up(proxy):
+    return proxy.__wrapped__
+
+
+def warm_up(*proxies, max_workers=None):
+    """Creates the wrapped objects of the lazy object proxies `proxies`
+    concurrently using a pool of threads, so that the time taken is that of
+    the slowest rather than the sum. Returns the wrapped objects in the same
+    order. Proxies with an async factory must instead be passed to
+    `warm_up_async()`.
+    """
+
+    for proxy in proxies:
+        if issubclass(type(proxy), _LazyObjectProxyAsync):
+            raise TypeError(
+                "proxies with an async factory must be passed to warm_up_async()"
+            )
+
+    if not proxies:
+        return []
+
+    if max_workers is None:
+        max_workers = len(proxies)
+
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="wrapt-warm-up") as pool:
+        return list(pool.map(_lazy_warm_up, proxies))
+
+
+async def warm_up_async(*proxies):
+    """Creates the wrapped objects of the lazy object proxies `proxies`
+    concurrently, awaiting those with an async factory together using
+    `asyncio.gather()` and creating the others in threads. Returns the
+    wrapped objects in the same order.
+    """
+
+    def _warm_up(proxy):
+        if issubclass(type(proxy), _LazyObjectProxyAsync):
+            return proxy.__wrapped_get_async__()
+
+        return asyncio.to_thread(_lazy_warm_up, proxy)
+
+    return list(await asyncio.gather(*map(_warm_up, proxies)))
+
+
+def _lazy_import_rebind(namespace, proxy, target):
+    # Only names still bound to the proxy are replaced, so that a name which
+    # has since been bound to something else is left alone.
+
+    for key, value in list(namespace.items()):
+        if value is proxy:
+            namespace[key] = target
+
+
+def lazy_import(name, attribute=None, *, interface=..., rebind=False):
     """Lazily imports the module `name`, returning a `LazyObjectProxy` which
     will import the module when it is first needed. When `name is a dotted name,
     then the full dotted name is imported and the last module is taken as the
     target. If `attribute` is provided then it is used to retrieve an attribute
-    from the module.
+    from the module. If `rebind` is true, any global variables of the calling
+    module bound to the proxy are replaced with the module or attribute once it
+    has been imported, so later uses of them do not go through the proxy.
     """
 
     if attribute is not None:
@@ -359,12 +456,1373 @@ def lazy_import(name, attribute=None, *, interface=...):
         if interface is ...:
             interface = ModuleType
 
+    namespace = sys._getframe(1).f_globals if rebind else None
+
     def _import():
         module = __import__(name, fromlist=[""])
 
         if attribute is not None:
-            return getattr(module, attribute)
+            target = getattr(module, attribute)
+        else:
+            target = module
+
+        if namespace is not None:
+            _lazy_import_rebind(namespace, proxy, target)
+
+        return target
+
+    proxy = LazyObjectProxy(_import, interface=interface)
+
+    return proxy
+
+
+# Lazily loading serialised data. The file is memory mapped rather than read
+# when the data is first needed, so the loader works from the page cache
+# without the whole file being copied into the process first, and only the
+# pages for the sections actually loaded are ever touched.
+
+
+def _lazy_load_map(path):
+    with open(path, "rb") as file:
+        try:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        except ValueError:
+            # An empty file cannot be memory mapped.
+
+            return b""
+
+
+def _lazy_load_close(data):
+    # The loaded object may hold on to the memory, such as an array created
+    # over it, in which case the mapping cannot be closed and is left to be
+    # released when unused.
+
+    try:
+        if isinstance(data, memoryview):
+            data.release()
+
+        elif isinstance(data, mmap.mmap):
+            data.close()
+
+    except BufferError:
+        pass
+
+
+class _LazyFileMap:
+    """Memory map of a file, created when first needed and shared by the
+    `count` sections of the file loaded separately by `lazy_load()`. The
+    memory map is closed once every section has been loaded.
+    """
+
+    def __init__(self, path, count):
+        self._path = path
+        self._count = count
+        self._lock = threading.Lock()
+        self._mapping = None
+        self._data = None
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._data is None:
+                self._mapping = _lazy_load_map(self._path)
+                self._data = memoryview(self._mapping)
+
+            return self._data
+
+    def loaded(self):
+        with self._lock:
+            self._count -= 1
+
+            if self._count:
+                return
+
+            data, self._data = self._data, None
+            mapping, self._mapping = self._mapping, None
+
+        _lazy_load_close(data)
+        _lazy_load_close(mapping)
+
+
+def lazy_load(path, loader=pickle.loads, *, segments=None, interface=...):
+    """Lazily loads the serialised data in the file at `path`, returning a
+    `LazyObjectProxy` which memory maps the file and passes its contents to
+    `loader` as a bytes-like object when the data is first needed. The
+    default loader unpickles the data. Where `segments` is supplied as a
+    mapping of names to `(offset, length)` pairs, a dictionary of proxies is
+    returned instead, each loading only its own section of the file, with
+    the file remaining mapped until every section has been loaded.
+
+    The `interface` argument defaults to `Mapping`, as for `lazy_import()`,
+    so the proxy supports the operations of a mapping before the data is
+    loaded, even if the loaded data turns out to be a list or other type.
+    Pass the type of the data as `interface` where it is known in advance.
+    """
+
+    if interface is ...:
+        interface = Mapping
+
+    path = os.fspath(path)
+
+    if segments is None:
+
+        def _load():
+            data = _lazy_load_map(path)
+
+            try:
+                return loader(data)
+
+            finally:
+                _lazy_load_close(data)
+
+        return LazyObjectProxy(_load, interface=interface)
+
+    file_map = _LazyFileMap(path, len(segments))
+
+    def _segment(offset, length):
+        def _load():
+            data = file_map.get()
+
+            if offset < 0 or length < 0 or offset + length > len(data):
+                raise ValueError(
+                    f"segment at offset {offset} of length {length} is outside "
+                    f"of file {path!r} of size {len(data)}"
+                )
+
+            view = data[offset : offset + length]
+
+            try:
+                value = loader(view)
+
+            finally:
+                _lazy_load_close(view)
+
+            file_map.loaded()
+
+            return value
+
+        return LazyObjectProxy(_load, interface=interface)
+
+    return {
+        name: _segment(offset, length) for name, (offset, length) in segments.items()
+    }
+
+
+# Names of the methods of the builtin container types which mutate the
+# container, used to detect mutations made through a proxy.
+
+_mutating_methods = frozenset(
+    (
+        # list, bytearray and collections.deque.
+        "append",
+        "appendleft",
+        "extend",
+        "extendleft",
+        "insert",
+        "remove",
+        "reverse",
+        "rotate",
+        "sort",
+        "pop",
+        "popleft",
+        "clear",
+        # dict.
+        "popitem",
+        "setdefault",
+        "update",
+        # set.
+        "add",
+        "discard",
+        "difference_update",
+        "intersection_update",
+        "symmetric_difference_update",
+    )
+)
+
+# Define variant of ObjectProxy which shares the wrapped object until it is
+# first mutated through the proxy, at which point the proxy makes a private
+# copy of the wrapped object.
+
+
+class _CopyOnWriteLock:
+    """Lock guarding making the private copy of the wrapped object of a
+    single `CopyOnWriteProxy`. It is held in a separate object, rather than
+    the proxy registering itself, since the proxy forwards hashing to the
+    wrapped object.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._lock.acquire()
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+def _copy_to_depth(value, depth):
+    """Returns a copy of `value`, also copying any dictionaries and lists
+    nested within it, either as items or as attributes of an object, down
+    to `depth` levels in total. A `depth` of `None` makes a deep copy.
+    """
+
+    if depth is None:
+        return copy.deepcopy(value)
+
+    copied = copy.copy(value)
+
+    if depth > 1:
+        if isinstance(copied, dict):
+            for key, item in copied.items():
+                copied[key] = _copy_to_depth(item, depth - 1)
+
+        elif isinstance(copied, list):
+            copied[:] = [_copy_to_depth(item, depth - 1) for item in copied]
+
+        elif copied is not value and isinstance(
+            getattr(copied, "__dict__", None), dict
+        ):
+            # Objects which copy.copy() returns unchanged, such as functions,
+            # are skipped, since changing them would change the original.
+
+            attributes = copied.__dict__
+
+            for name, item in attributes.items():
+                if isinstance(item, (dict, list)):
+                    attributes[name] = _copy_to_depth(item, depth - 1)
+
+    return copied
+
+
+def _copy_on_write_attribute(proxy, name):
+    """Returns whether setting or deleting the attribute `name` on `proxy`
+    would be forwarded to the wrapped object.
+    """
+
+    if name == "__wrapped__" or name.startswith("_self_"):
+        return False
+
+    return not hasattr(type(proxy), name)
+
+
+def _copy_on_write_inplace(name):
+    """Returns the in-place operator method `name` for `CopyOnWriteProxy`,
+    which makes the private copy before applying the operator if the
+    wrapped object would be changed in place.
+    """
+
+    def method(self, other):
+        if hasattr(self.__wrapped__, name):
+            self.__wrapped_copy_on_write__()
+
+        return getattr(super(CopyOnWriteProxy, self), name)(other)
+
+    method.__name__ = name
+    method.__qualname__ = f"CopyOnWriteProxy.{name}"
+
+    return method
+
+
+class CopyOnWriteProxy(BaseObjectProxy):
+    """An object proxy which shares the wrapped object until the first
+    mutation through the proxy, at which point the proxy replaces the wrapped
+    object with a private copy before applying the change. Setting or deleting
+    items or attributes, in-place operators and calling the methods named in
+    `_self_mutating_methods` are treated as mutations. By default the copy is
+    shallow, with `depth` giving the number of levels of nested dictionaries
+    and lists to copy, or `None` for a deep copy. When nested dictionaries and
+    lists are to be copied, getting one as an item of the wrapped object is
+    also treated as a mutation, as is getting one as an attribute.
+    """
+
+    __slots__ = ("_self_depth", "_self_copy", "_self_copy_lock")
+
+    _self_mutating_methods = _mutating_methods
+
+    def __init__(self, wrapped, *, depth=1):
+        if depth is not None and depth < 1:
+            raise ValueError("depth must be at least 1 or None")
+
+        super().__init__(wrapped)
+
+        self._self_depth = depth
+        self._self_copy = None
+        self._self_copy_lock = _CopyOnWriteLock()
+
+    def __wrapped_is_copy__(self):
+        """Returns whether the wrapped object is a private copy."""
+
+        return self._self_copy is not None and self._self_copy is self.__wrapped__
+
+    def __wrapped_copy_on_write__(self):
+        """Replaces the wrapped object with a private copy if this has not
+        already been done.
+        """
+
+        if self.__wrapped_is_copy__():
+            return
+
+        with self._self_copy_lock:
+            if self.__wrapped_is_copy__():
+                return
+
+            self.__wrapped__ = _copy_to_depth(self.__wrapped__, self._self_depth)
+            self._self_copy = self.__wrapped__
+
+    def __getattr__(self, name):
+        if name in self._self_mutating_methods and hasattr(self.__wrapped__, name):
+            self.__wrapped_copy_on_write__()
+
+        value = super().__getattr__(name)
+
+        # As for items, where nested dictionaries and lists are to be copied,
+        # reading one as an attribute is treated as a mutation.
+
+        if self._self_depth != 1 and isinstance(value, (dict, list)):
+            if not self.__wrapped_is_copy__():
+                self.__wrapped_copy_on_write__()
+                value = super().__getattr__(name)
+
+        return value
+
+    def __setattr__(self, name, value):
+        if _copy_on_write_attribute(self, name):
+            self.__wrapped_copy_on_write__()
+
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if _copy_on_write_attribute(self, name):
+            self.__wrapped_copy_on_write__()
+
+        super().__delattr__(name)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+
+        # Where nested dictionaries and lists are to be copied, reading one
+        # is treated as a mutation, as it could be modified once returned.
+
+        if self._self_depth != 1 and isinstance(value, (dict, list)):
+            if not self.__wrapped_is_copy__():
+                self.__wrapped_copy_on_write__()
+                value = super().__getitem__(key)
+
+        return value
+
+    def __setitem__(self, key, value):
+        self.__wrapped_copy_on_write__()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.__wrapped_copy_on_write__()
+        super().__delitem__(key)
+
+    __iadd__ = _copy_on_write_inplace("__iadd__")
+    __isub__ = _copy_on_write_inplace("__isub__")
+    __imul__ = _copy_on_write_inplace("__imul__")
+    __imatmul__ = _copy_on_write_inplace("__imatmul__")
+    __itruediv__ = _copy_on_write_inplace("__itruediv__")
+    __ifloordiv__ = _copy_on_write_inplace("__ifloordiv__")
+    __imod__ = _copy_on_write_inplace("__imod__")
+    __ipow__ = _copy_on_write_inplace("__ipow__")
+    __ilshift__ = _copy_on_write_inplace("__ilshift__")
+    __irshift__ = _copy_on_write_inplace("__irshift__")
+    __iand__ = _copy_on_write_inplace("__iand__")
+    __ixor__ = _copy_on_write_inplace("__ixor__")
+    __ior__ = _copy_on_write_inplace("__ior__")
+
+
+# Define variant of ObjectProxy which records the keys and attributes of the
+# wrapped object which are changed through the proxy, so that only those
+# need to be persisted.
+
+
+def _tracking_keys(value):
+    """Returns all the keys of `value`, being the keys of a mapping, the
+    indices of a sequence or the members of a set.
+    """
+
+    if isinstance(value, Mapping):
+        return set(value)
+
+    if isinstance(value, Sequence):
+        return set(range(len(value)))
+
+    if isinstance(value, Set):
+        return set(value)
+
+    return set()
+
+
+def _tracking_index(index, length):
+    """Returns the position `index` of a sequence of `length` items, given
+    as an argument to `insert()` or `pop()`, as a non-negative index.
+    """
+
+    index = operator.index(index)
+
+    return max(0, index + length) if index < 0 else min(index, length)
+
+
+def _tracking_call(proxy, name, method, *args, **kwargs):
+    """Calls the mutating method `name` of the object wrapped by `proxy`,
+    recording the keys it changed. Where this cannot be determined cheaply,
+    all keys present before or after the call are recorded.
+    """
+
+    wrapped = proxy.__wrapped__
+
+    if isinstance(wrapped, dict):
+        if name == "update":
+            items = dict(*args, **kwargs)
+            result = method(items)
+            proxy.__wrapped_record__(items)
+            return result
+
+        if name in ("pop", "setdefault") and args:
+            changed = (args[0] in wrapped) == (name == "pop")
+            result = method(*args, **kwargs)
+            if changed:
+                proxy.__wrapped_record__((args[0],))
+            return result
+
+        if name == "popitem":
+            result = method(*args, **kwargs)
+            proxy.__wrapped_record__((result[0],))
+            return result
+
+    elif isinstance(wrapped, list):
+        before = len(wrapped)
+
+        if name in ("append", "extend"):
+            result = method(*args, **kwargs)
+            proxy.__wrapped_record__(range(before, len(wrapped)))
+            return result
+
+        # Removing or inserting an item moves the items after it, so the
+        # indices from the position of the item to the end are recorded, as
+        # a single range so the cost does not depend on the length.
+
+        if name == "insert" and len(args) == 2:
+            index = _tracking_index(args[0], before)
+            result = method(*args)
+            proxy.__wrapped_record__((range(index, len(wrapped)),))
+            return result
+
+        if name == "pop" and len(args) <= 1:
+            result = method(*args)
+            index = _tracking_index(args[0] if args else -1, before)
+            proxy.__wrapped_record__((range(index, before),))
+            return result
+
+        if name == "remove" and len(args) == 1:
+            index = wrapped.index(args[0])
+            result = method(*args)
+            proxy.__wrapped_record__((range(index, before),))
+            return result
+
+        # Any other method, such as sort() or clear(), could change every
+        # item, so all indices are recorded as a single range.
+
+        result = method(*args, **kwargs)
+        after = len(wrapped)
+        if before or after:
+            proxy.__wrapped_record__((range(max(before, after)),))
+        return result
+
+    elif isinstance(wrapped, set):
+        if name in ("add", "discard", "remove") and args:
+            result = method(*args, **kwargs)
+            proxy.__wrapped_record__((args[0],))
+            return result
+
+        if name == "pop":
+            result = method(*args, **kwargs)
+            proxy.__wrapped_record__((result,))
+            return result
+
+        if name == "update":
+            others = [list(other) for other in args]
+            result = method(*others)
+            for other in others:
+                proxy.__wrapped_record__(other)
+            return result
+
+    before = _tracking_keys(wrapped)
+    result = method(*args, **kwargs)
+    proxy.__wrapped_record__(before | _tracking_keys(wrapped))
+    return result
+
+
+def _tracking_inplace_keys(wrapped, name, other):
+    """Returns the keys which will be changed by applying the in-place
+    operator `name` with `other` to `wrapped`, along with the possibly
+    converted `other` to apply, or `None` for the keys if they can only be
+    determined after the operator has been applied. Only the changed keys
+    are determined, except where every key could be changed.
+    """
+
+    if isinstance(wrapped, dict) and name == "__ior__":
+        other = dict(other)
+        return list(other), other
+
+    if isinstance(wrapped, set) and isinstance(other, (set, frozenset)):
+        if name in ("__ior__", "__ixor__"):
+            return list(other), other
+
+        if name == "__isub__":
+            return [key for key in other if key in wrapped], other
+
+        if name == "__iand__":
+            return list(wrapped - other), other
+
+    return None, other
+
+
+def _tracking_inplace(name):
+    """Returns the in-place operator method `name` for `TrackingProxy`,
+    which records the keys changed by applying the operator.
+    """
+
+    def method(self, other):
+        wrapped = self.__wrapped__
+
+        if not hasattr(wrapped, name):
+            return getattr(super(TrackingProxy, self), name)(other)
+
+        keys, other = _tracking_inplace_keys(wrapped, name, other)
+
+        if keys is not None:
+            result = getattr(super(TrackingProxy, self), name)(other)
+            self.__wrapped_record__(keys)
+            return result
+
+        if isinstance(wrapped, list) and name in ("__iadd__", "__imul__"):
+            # Only items past the shorter of the old and new lengths change.
+            # Items added are recorded individually, as for extend(), while
+            # items removed are recorded as a single range.
+
+            before = len(wrapped)
+            result = getattr(super(TrackingProxy, self), name)(other)
+            after = len(wrapped)
+
+            if after < before:
+                self.__wrapped_record__((range(after, before),))
+            else:
+                self.__wrapped_record__(range(before, after))
+
+            return result
+
+        before = _tracking_keys(wrapped)
+        result = getattr(super(TrackingProxy, self), name)(other)
+        self.__wrapped_record__(before | _tracking_keys(self.__wrapped__))
+        return result
+
+    method.__name__ = name
+    method.__qualname__ = f"TrackingProxy.{name}"
+
+    return method
+
+
+class TrackingProxy(_TrackingProxyBase):
+    """An object proxy which records the keys and attributes of the wrapped
+    object which are set or deleted through the proxy, so that only the
+    changes need be persisted. Calling the methods named in
+    `_self_mutating_methods` and in-place operators are also recorded. When
+    `nested` is true, dictionaries, lists and sets got from the wrapped object
+    are returned wrapped by a tracking proxy, with any change to them recorded
+    against the key or attribute they were got from.
+    """
+
+    __slots__ = ()
+
+    _self_mutating_methods = _mutating_methods
+
+    def __init__(self, wrapped, *, nested=False):
+        super().__init__(wrapped)
+
+        self._self_nested = nested
+
+    def dirty(self):
+        """Returns the keys and attributes changed since the proxy was
+        created or `reset_dirty()` was last called. Where the items of a
+        list were moved, such as by an insertion or deletion, the indices of
+        those items are given by a single `range` rather than individually.
+        """
+
+        return frozenset(self.__wrapped_dirty__())
+
+    def reset_dirty(self):
+        """Clears the record of changed keys and attributes, returning those
+        which had been recorded.
+        """
+
+        return frozenset(self.__wrapped_reset_dirty__())
+
+    def __wrapped_track__(self, key, value):
+        """Returns the container `value` got as `key` from the wrapped object
+        wrapped by a tracking proxy recording changes against `key`.
+        """
+
+        proxy = type(self)(value, nested=True)
+
+        proxy._self_parent = self
+        proxy._self_key = key
+
+        return proxy
+
+    def __wrapped_method__(self, name, method):
+        """Returns the mutating method `method` got as `name` from the
+        wrapped object wrapped so that calling it records the changed keys.
+        """
+
+        return update_wrapper(partial(_tracking_call, self, name, method), method)
+
+    __iadd__ = _tracking_inplace("__iadd__")
+    __isub__ = _tracking_inplace("__isub__")
+    __imul__ = _tracking_inplace("__imul__")
+    __imatmul__ = _tracking_inplace("__imatmul__")
+    __itruediv__ = _tracking_inplace("__itruediv__")
+    __ifloordiv__ = _tracking_inplace("__ifloordiv__")
+    __imod__ = _tracking_inplace("__imod__")
+    __ipow__ = _tracking_inplace("__ipow__")
+    __ilshift__ = _tracking_inplace("__ilshift__")
+    __irshift__ = _tracking_inplace("__irshift__")
+    __iand__ = _tracking_inplace("__iand__")
+    __ixor__ = _tracking_inplace("__ixor__")
+    __ior__ = _tracking_inplace("__ior__")
+
+
+# Define variant of ObjectProxy which holds a bounded pool of wrapped objects,
+# such as clients which are not thread safe, and checks one out of the pool
+# for the duration of each method call made through the proxy, so that many
+# threads or tasks can share a single proxy. An object returned to the pool
+# is handed directly to the longest waiting thread or task if there is one,
+# rather than being put back, so it cannot be taken by a later caller first.
+# A waiting task is handed the object via its event loop, with the object
+# given back to the pool if the task has since been cancelled.
+
+_POOL_CAPACITY = object()
+
+
+class _PoolThreadWaiter:
+    __slots__ = ("event", "item")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.item = None
+
+    def deliver(self, pool, item):
+        self.item = item
+        self.event.set()
+
+        return True
+
+    def wait(self, pool, timeout):
+        if not self.event.wait(timeout):
+            with pool._lock:
+                if self in pool._waiters:
+                    pool._waiters.remove(self)
+
+                    raise TimeoutError("timed out waiting for pooled object")
+
+        return self.item
+
+
+class _PoolTaskWaiter:
+    __slots__ = ("loop", "future")
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.future = self.loop.create_future()
+
+    def deliver(self, pool, item):
+        try:
+            self.loop.call_soon_threadsafe(self.resolve, pool, item)
+        except RuntimeError:
+            # The event loop has been closed.
+
+            return False
+
+        return True
+
+    def resolve(self, pool, item):
+        if self.future.done():
+            pool.release(item)
+        else:
+            self.future.set_result(item)
+
+    async def wait(self, pool, timeout):
+        try:
+            return await asyncio.wait_for(self.future, timeout)
+
+        except BaseException:
+            with pool._lock:
+                if self in pool._waiters:
+                    pool._waiters.remove(self)
+
+                    raise
+
+            if self.future.done() and not self.future.cancelled():
+                pool.release(self.future.result())
+
+            raise
+
+
+class _ObjectPool:
+    """A bounded pool of objects created using `factory`. The count includes
+    objects checked out, and capacity reserved for an object being created.
+    """
+
+    def __init__(self, factory, size, check, discard):
+        self._factory = factory
+        self._size = size
+        self._check = check
+        self._discard = discard
+        self._lock = threading.Lock()
+        self._idle = deque()
+        self._waiters = deque()
+
+        self._idle.append(factory())
+        self._count = 1
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        # Threads and tasks waiting in the parent do not exist in the child,
+        # and objects checked out by them will never be returned.
+
+        self._lock = threading.Lock()
+        self._waiters.clear()
+        self._count = len(self._idle)
+
+    def _reserve(self):
+        # Must be called with the lock held.
+
+        if self._idle:
+            return self._idle.pop()
+
+        if self._count < self._size:
+            self._count += 1
+
+            return _POOL_CAPACITY
+
+        return None
+
+    def _prepare(self, item):
+        # Objects which were idle are checked before being handed out. An
+        # unhealthy object is discarded and replaced using the capacity it
+        # held.
+
+        if item is not _POOL_CAPACITY:
+            if self._healthy(item):
+                return item
+
+            self._dispose(item)
+
+        try:
+            return self._factory()
+
+        except BaseException:
+            self.release(_POOL_CAPACITY)
+            raise
+
+    def _healthy(self, item):
+        if self._check is None:
+            return True
+
+        try:
+            return bool(self._check(item))
+        except Exception:
+            return False
+
+    def _dispose(self, item):
+        if self._discard is None:
+            return
+
+        # The object is already being thrown away, so a failure to clean it
+        # up is not allowed to stop a replacement being created.
+
+        try:
+            self._discard(item)
+        except Exception:
+            pass
+
+    def acquire(self, timeout=None):
+        with self._lock:
+            item = self._reserve()
+
+            if item is None:
+                waiter = _PoolThreadWaiter()
+                self._waiters.append(waiter)
+
+        if item is None:
+            item = waiter.wait(self, timeout)
+
+        return self._prepare(item)
+
+    async def acquire_async(self, timeout=None):
+        with self._lock:
+            item = self._reserve()
+
+            if item is None:
+                waiter = _PoolTaskWaiter()
+                self._waiters.append(waiter)
+
+        if item is None:
+            item = await waiter.wait(self, timeout)
+
+        return self._prepare(item)
+
+    def release(self, item):
+        with self._lock:
+            while self._waiters:
+                if self._waiters.popleft().deliver(self, item):
+                    return
+
+            if item is _POOL_CAPACITY:
+                self._count -= 1
+            else:
+                self._idle.append(item)
+
+
+class _PooledCheckout:
+    """Context manager checking an object out of a pool, usable with either
+    `with` or `async with`.
+    """
+
+    __slots__ = ("_pool", "_timeout", "_item")
+
+    def __init__(self, pool, timeout):
+        self._pool = pool
+        self._timeout = timeout
+        self._item = None
+
+    def __enter__(self):
+        self._item = self._pool.acquire(self._timeout)
+
+        return self._item
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        item, self._item = self._item, None
+
+        self._pool.release(item)
+
+    async def __aenter__(self):
+        self._item = await self._pool.acquire_async(self._timeout)
+
+        return self._item
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.__exit__(exc_type, exc_value, traceback)
+
+
+class _PooledAwaitable:
+    """Awaitable returned by a method which is not a coroutine function, but
+    which returned an awaitable, holding the object checked out for the call
+    until the awaitable completes. The object is returned to the pool if the
+    awaitable is discarded without being awaited.
+    """
+
+    __slots__ = ("_checkout", "_awaitable")
+
+    def __init__(self, checkout, awaitable):
+        self._checkout = checkout
+        self._awaitable = awaitable
+
+    def __await__(self):
+        checkout, self._checkout = self._checkout, None
+
+        if checkout is None:
+            raise RuntimeError("cannot reuse already awaited pooled call")
+
+        try:
+            return (yield from self._awaitable.__await__())
+
+        finally:
+            checkout.__exit__(None, None, None)
+
+    def __del__(self):
+        if self._checkout is not None:
+            self._checkout.__exit__(None, None, None)
+
+
+class _PooledMethod:
+    """Calls the method `name` of an object checked out of a pool. Where the
+    method returns an awaitable, the object is held until it completes.
+    """
+
+    __slots__ = ("_pool", "_timeout", "_name")
+
+    def __init__(self, pool, timeout, name):
+        self._pool = pool
+        self._timeout = timeout
+        self._name = name
+
+    def __call__(self, *args, **kwargs):
+        checkout = _PooledCheckout(self._pool, self._timeout)
+        instance = checkout.__enter__()
+
+        try:
+            result = getattr(instance, self._name)(*args, **kwargs)
+
+        except BaseException:
+            checkout.__exit__(None, None, None)
+            raise
+
+        if inspect.isawaitable(result):
+            return _PooledAwaitable(checkout, result)
+
+        checkout.__exit__(None, None, None)
+
+        return result
+
+
+class _PooledAsyncMethod(_PooledMethod):
+    """Calls the coroutine method `name` of an object checked out of a pool,
+    holding it until the coroutine completes.
+    """
+
+    __slots__ = ()
+
+    async def __call__(self, *args, **kwargs):
+        async with _PooledCheckout(self._pool, self._timeout) as instance:
+            return await getattr(instance, self._name)(*args, **kwargs)
+
+
+def _pooled_operator(name):
+    """Returns the special method `name` for `PooledObjectProxy`, applying it
+    to an object checked out of the pool for the duration of the call.
+    """
+
+    def method(self, *args):
+        with self.checkout() as instance:
+            return getattr(BaseObjectProxy, name)(BaseObjectProxy(instance), *args)
+
+    method.__name__ = name
+    method.__qualname__ = f"PooledObjectProxy.{name}"
+
+    return method
+
+
+def _pooled_unsupported(name):
+    """Returns the special method `name` for `PooledObjectProxy`, which is not
+    supported as it would use the object after the call returned, or change
+    which object the proxy wraps.
+    """
+
+    def method(self, *args):
+        raise TypeError(
+            f"{name} of objects in a pool is not supported through the proxy, "
+            "use checkout() instead"
+        )
+
+    method.__name__ = name
+    method.__qualname__ = f"PooledObjectProxy.{name}"
+
+    return method
+
+
+class PooledObjectProxy(BaseObjectProxy):
+    """An object proxy for objects which are not thread safe, holding a pool of
+    up to `size` of them created by calling `factory`. Calling a method
+    through the proxy checks an object out of the pool for the duration of
+    the call, waiting up to `timeout` seconds if all are in use, and creating
+    a new object if the pool is not yet full. A coroutine method holds the
+    object until the coroutine completes, waiting for it without blocking the
+    event loop. Where `check` is supplied it is called with an idle object
+    before it is handed out, and if it returns false, the object is passed to
+    `discard`, if supplied, and replaced. The first object created is the
+    wrapped object, which is only used for introspection, such as of its type.
+    Operators are applied to an object checked out for the duration of the
+    operation, except for those which would use the object after returning,
+    such as iteration, or would change it in place, which raise `TypeError`.
+    When waiting for an object without blocking the event loop, `factory`,
+    `check` and `discard` are still called in the event loop thread.
+    """
+
+    __slots__ = ("_self_pool", "_self_timeout")
+
+    def __init__(self, factory, *, size=8, check=None, discard=None, timeout=None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        pool = _ObjectPool(factory, size, check, discard)
+
+        super().__init__(pool._idle[0])
+
+        self._self_pool = pool
+        self._self_timeout = timeout
+
+    def checkout(self, timeout=...):
+        """Returns a context manager which checks an object out of the pool,
+        for use with `with` or `async with`, so that several operations can
+        be made using the same object.
+        """
+
+        if timeout is ...:
+            timeout = self._self_timeout
+
+        return _PooledCheckout(self._self_pool, timeout)
+
+    def __getattr__(self, name):
+        if name == "__wrapped__":
+            return super().__getattr__(name)
+
+        attribute = getattr(type(self.__wrapped__), name, None)
+
+        if callable(attribute):
+            if inspect.iscoroutinefunction(attribute):
+                return _PooledAsyncMethod(self._self_pool, self._self_timeout, name)
+
+            return _PooledMethod(self._self_pool, self._self_timeout, name)
+
+        with self.checkout() as instance:
+            return getattr(instance, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_self_") or name == "__wrapped__":
+            return super().__setattr__(name, value)
+
+        if hasattr(type(self), name):
+            return super().__setattr__(name, value)
+
+        raise AttributeError(
+            f"can't set attribute {name!r} of objects in a pool through the proxy"
+        )
+
+    def __delattr__(self, name):
+        if name.startswith("_self_") or hasattr(type(self), name):
+            return super().__delattr__(name)
+
+        raise AttributeError(
+            f"can't delete attribute {name!r} of objects in a pool through the proxy"
+        )
+
+    __abs__ = _pooled_operator("__abs__")
+    __add__ = _pooled_operator("__add__")
+    __and__ = _pooled_operator("__and__")
+    __bool__ = _pooled_operator("__bool__")
+    __bytes__ = _pooled_operator("__bytes__")
+    __ceil__ = _pooled_operator("__ceil__")
+    __complex__ = _pooled_operator("__complex__")
+    __contains__ = _pooled_operator("__contains__")
+    __delitem__ = _pooled_operator("__delitem__")
+    __divmod__ = _pooled_operator("__divmod__")
+    __eq__ = _pooled_operator("__eq__")
+    __float__ = _pooled_operator("__float__")
+    __floor__ = _pooled_operator("__floor__")
+    __floordiv__ = _pooled_operator("__floordiv__")
+    __format__ = _pooled_operator("__format__")
+    __ge__ = _pooled_operator("__ge__")
+    __getitem__ = _pooled_operator("__getitem__")
+    __gt__ = _pooled_operator("__gt__")
+    __index__ = _pooled_operator("__index__")
+    __int__ = _pooled_operator("__int__")
+    __invert__ = _pooled_operator("__invert__")
+    __le__ = _pooled_operator("__le__")
+    __len__ = _pooled_operator("__len__")
+    __lshift__ = _pooled_operator("__lshift__")
+    __lt__ = _pooled_operator("__lt__")
+    __matmul__ = _pooled_operator("__matmul__")
+    __mod__ = _pooled_operator("__mod__")
+    __mul__ = _pooled_operator("__mul__")
+    __ne__ = _pooled_operator("__ne__")
+    __neg__ = _pooled_operator("__neg__")
+    __or__ = _pooled_operator("__or__")
+    __pos__ = _pooled_operator("__pos__")
+    __pow__ = _pooled_operator("__pow__")
+    __radd__ = _pooled_operator("__radd__")
+    __rand__ = _pooled_operator("__rand__")
+    __rdivmod__ = _pooled_operator("__rdivmod__")
+    __rfloordiv__ = _pooled_operator("__rfloordiv__")
+    __rlshift__ = _pooled_operator("__rlshift__")
+    __rmatmul__ = _pooled_operator("__rmatmul__")
+    __rmod__ = _pooled_operator("__rmod__")
+    __rmul__ = _pooled_operator("__rmul__")
+    __ror__ = _pooled_operator("__ror__")
+    __round__ = _pooled_operator("__round__")
+    __rpow__ = _pooled_operator("__rpow__")
+    __rrshift__ = _pooled_operator("__rrshift__")
+    __rshift__ = _pooled_operator("__rshift__")
+    __rsub__ = _pooled_operator("__rsub__")
+    __rtruediv__ = _pooled_operator("__rtruediv__")
+    __rxor__ = _pooled_operator("__rxor__")
+    __setitem__ = _pooled_operator("__setitem__")
+    __str__ = _pooled_operator("__str__")
+    __sub__ = _pooled_operator("__sub__")
+    __truediv__ = _pooled_operator("__truediv__")
+    __trunc__ = _pooled_operator("__trunc__")
+    __xor__ = _pooled_operator("__xor__")
+
+    __aenter__ = _pooled_unsupported("__aenter__")
+    __aexit__ = _pooled_unsupported("__aexit__")
+    __enter__ = _pooled_unsupported("__enter__")
+    __exit__ = _pooled_unsupported("__exit__")
+    __hash__ = _pooled_unsupported("__hash__")
+    __iter__ = _pooled_unsupported("__iter__")
+    __reversed__ = _pooled_unsupported("__reversed__")
+    __iadd__ = _pooled_unsupported("__iadd__")
+    __iand__ = _pooled_unsupported("__iand__")
+    __ifloordiv__ = _pooled_unsupported("__ifloordiv__")
+    __ilshift__ = _pooled_unsupported("__ilshift__")
+    __imatmul__ = _pooled_unsupported("__imatmul__")
+    __imod__ = _pooled_unsupported("__imod__")
+    __imul__ = _pooled_unsupported("__imul__")
+    __ior__ = _pooled_unsupported("__ior__")
+    __ipow__ = _pooled_unsupported("__ipow__")
+    __irshift__ = _pooled_unsupported("__irshift__")
+    __isub__ = _pooled_unsupported("__isub__")
+    __itruediv__ = _pooled_unsupported("__itruediv__")
+    __ixor__ = _pooled_unsupported("__ixor__")
+
+
+# Refreshing the wrapped object of a lazy object proxy. The wrapped object is
+# replaced from a background thread when due rather than being checked for
+# expiry when read, so that reads through the proxy remain plain forwarded
+# attribute access, with readers carrying on using the previous object while
+# a refresh is made.
+
+
+class _RefreshSchedule:
+    """Background thread refreshing a `RefreshingObjectProxy` when due. Only
+    a weak reference to the proxy is held, with the thread exiting when the
+    proxy is garbage collected.
+    """
+
+    def __init__(self, proxy, background):
+        self._proxy = ref(proxy, self._collected)
+        self._background = background
+        self._condition = threading.Condition(threading.Lock())
+        self._thread = None
+        self._due = None
+        self._stopped = False
+
+        self.expires = None
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        # The thread does not exist in the child, so is started again if a
+        # refresh was pending.
+
+        self._condition = threading.Condition(threading.Lock())
+
+        if self._thread is not None:
+            self._thread = None
+
+            if self._due is not None:
+                self.start(max(self._due - monotonic(), 0))
+
+    def _collected(self, _):
+        self.stop()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._due is None:
+                        self._condition.wait()
+                    elif self._due > monotonic():
+                        self._condition.wait(self._due - monotonic())
+                    else:
+                        break
+
+                if self._stopped:
+                    return
+
+                self._due = None
+
+            proxy = self._proxy()
+
+            if proxy is None:
+                return
+
+            self._refresh(proxy)
+
+            del proxy
+
+    @staticmethod
+    def _report(exception):
+        # Reports the exception in the same way as one raised by the target
+        # of a thread, without it stopping the thread.
+
+        threading.excepthook(
+            threading.ExceptHookArgs(
+                (
+                    type(exception),
+                    exception,
+                    exception.__traceback__,
+                    threading.current_thread(),
+                )
+            )
+        )
+
+    def _refresh(self, proxy):
+        try:
+            proxy.refresh()
+
+        except Exception as exception:
+            on_error = proxy._self_on_error
+
+            if on_error is None:
+                self._report(exception)
+                return
+
+            # The error handler failing must not stop further refreshes.
+
+            try:
+                on_error(exception)
+
+            except Exception as handler_exception:
+                self._report(handler_exception)
+
+    def start(self, delay):
+        if not self._background:
+            return
+
+        with self._condition:
+            if self._stopped:
+                return
+
+            self._due = monotonic() + delay
+
+            if self._thread is None:
+                self._thread = _start_background_thread(self._run, name="wrapt-refresh")
+
+                if not self._thread.daemon:
+                    _register_thread_atexit(self._thread, self.stop)
+
+            else:
+                self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+
+class RefreshingObjectProxy(LazyObjectProxy):
+    """A lazy object proxy which creates the wrapped object by calling
+    `callback` when it is first needed, and then replaces it with the result
+    of calling `callback` again once `ttl` seconds have passed. Refreshes are
+    made on a background thread, with readers using the previous object until
+    the new one is ready. If a refresh fails the previous object is kept, the
+    exception is passed to `on_error`, if supplied, and the refresh is retried
+    after `retry` seconds, which defaults to `ttl`. Where
+    `refresh_in_background` is false, no thread is used and `refresh()` must
+    instead be called once `stale()` returns true.
+    """
+
+    __slots__ = (
+        "_self_callback",
+        "_self_ttl",
+        "_self_retry",
+        "_self_on_error",
+        "_self_schedule",
+    )
+
+    def __new__(
+        cls,
+        callback,
+        *,
+        ttl,
+        refresh_in_background=True,
+        retry=None,
+        on_error=None,
+        interface=...,
+    ):
+        if inspect.iscoroutinefunction(callback):
+            raise TypeError(f"{cls.__name__} does not support an async callback")
+
+        return super().__new__(cls, callback, interface=interface)
+
+    def __init__(
+        self,
+        callback,
+        *,
+        ttl,
+        refresh_in_background=True,
+        retry=None,
+        on_error=None,
+        interface=...,
+    ):
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than zero")
+
+        if retry is not None and retry <= 0:
+            raise ValueError("retry must be greater than zero")
+
+        super().__init__(interface=interface)
+
+        self._self_callback = callback
+        self._self_ttl = ttl
+        self._self_retry = ttl if retry is None else retry
+        self._self_on_error = on_error
+        self._self_schedule = _RefreshSchedule(self, refresh_in_background)
+
+    def __wrapped_factory__(self):
+        # Called via `__wrapped_get__()` when the wrapped object is first
+        # needed, with a failure left to be retried on the next access.
+
+        wrapped = self._self_callback()
+
+        schedule = self._self_schedule
+
+        schedule.expires = monotonic() + self._self_ttl
+        schedule.start(self._self_ttl)
+
+        return wrapped
+
+    def refresh(self):
+        """Replaces the wrapped object with the result of calling the callback.
+        If the callback raises an exception, the current wrapped object is
+        kept and the exception re-raised, with a background refresh being
+        retried later.
+        """
+
+        schedule = self._self_schedule
+
+        # The same lock is used as when the wrapped object is first created,
+        # so that a refresh cannot race with that and be overwritten by an
+        # older object.
+
+        with synchronized(type(self)):
+            try:
+                wrapped = self._self_callback()
+
+            except Exception:
+                schedule.start(self._self_retry)
+                raise
+
+            self.__wrapped__ = wrapped
+            self.__wrapped_get_called__ = True
+
+            schedule.expires = monotonic() + self._self_ttl
+            schedule.start(self._self_ttl)
+
+    def stale(self):
+        """Returns whether `ttl` seconds have passed since the wrapped object
+        was last created.
+        """
+
+        expires = self._self_schedule.expires
+
+        return expires is not None and monotonic() >= expires
 
-        return module
+    def stop(self):
+        """Stops any further background refreshes of the wrapped object."""
 
-    return LazyObjectProxy(_import, interface=interface)
+        self._self_schedule.stop()
@@ -21,6 +21,30 @@ from .__wrapt__ import (
 _MISSING = object()
 
 
+def _cached_slot(attr):
+    return f"_self_cached_{attr.lstrip('_')}"
+
+
+# Slots of the proxy classes below, holding the signature and the values of
+# the attributes derived from it which have been cached by _cached().
+
+_SIGNATURE_CODE_SLOTS = ("_self_signature",) + tuple(
+    _cached_slot(attr)
+    for attr in (
+        "co_argcount",
+        "co_posonlyargcount",
+        "co_kwonlyargcount",
+        "co_varnames",
+        "co_flags",
+    )
+)
+
+_SIGNATURE_FUNCTION_SLOTS = ("_self_signature",) + tuple(
+    _cached_slot(attr)
+    for attr in ("__annotations__", "__defaults__", "__kwdefaults__", "__code__")
+)
+
+
 def _cached(attr):
     """Read-only property that memoizes its derivation in a `_self_*` slot.
 
@@ -32,7 +56,7 @@ def _cached(attr):
     a `@property` (data descriptor) also ensures we win over any value
     copied into the instance dict by `FunctionWrapper.__init__`.
     """
-    slot = f"_self_cached_{attr.lstrip('_')}"
+    slot = _cached_slot(attr)
 
     def getter(self):
         value = getattr(self, slot, _MISSING)
@@ -103,6 +127,8 @@ class _SignatureCode(BaseObjectProxy):
     fall through to the wrapped function's real __code__.
     """
 
+    __slots__ = _SIGNATURE_CODE_SLOTS
+
     def __init__(self, wrapped, signature):
         super().__init__(wrapped)
         self._self_signature = signature
@@ -172,6 +198,8 @@ class _SignatureFunctionSurrogate(_SignatureMixin, CallableObjectProxy):
     our override and strips self/cls correctly.
     """
 
+    __slots__ = _SIGNATURE_FUNCTION_SLOTS
+
     def __init__(self, wrapped, signature):
         super().__init__(wrapped)
         self._self_signature = signature
@@ -190,6 +218,8 @@ class _BoundSignatureFunctionWrapper(BoundFunctionWrapper):
 
 
 class _SignatureFunctionWrapper(_SignatureMixin, FunctionWrapper):
+    __slots__ = _SIGNATURE_FUNCTION_SLOTS
+
     __bound_function_wrapper__ = _BoundSignatureFunctionWrapper
 
     def __init__(self, wrapped, wrapper, signature):
@@ -7,20 +7,128 @@ wrapped callable (without converting it), and ``async_to_sync`` /
 """
 
 import asyncio
+import atexit
+import os
+import selectors
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import copy_context
 from functools import partial
+from importlib import import_module
 from inspect import (
     CO_ASYNC_GENERATOR,
     CO_COROUTINE,
     CO_GENERATOR,
     CO_ITERABLE_COROUTINE,
+    isasyncgenfunction,
     iscoroutinefunction,
+    isgeneratorfunction,
+    ismethod,
 )
-from threading import Lock, RLock
+from threading import Event, Lock, RLock, Semaphore, Thread, current_thread
+from weakref import WeakSet, ref
 
 from .__wrapt__ import BoundFunctionWrapper, CallableObjectProxy, FunctionWrapper
 from .decorators import decorator
 
+# Fork safety. A process which forks while another thread holds one of
+# the locks owned by wrapt, for example an application preloaded in a
+# pre-fork server master process, would leave that lock permanently held
+# in the child, deadlocking the first use of it. Background threads used
+# by wrapt also do not exist in the child. Locks and threads are therefore
+# reinitialised in the child after a fork. Contexts to which synchronized
+# has attached a lock are tracked in a registry as they are created, so
+# the work done is proportional to the number of such locks rather than
+# requiring a walk of the heap. Other objects owning locks or threads
+# register themselves and implement _after_fork_in_child(), which is
+# called in the child to discard any inherited state.
+
+_synchronized_contexts = {}
+
+_fork_reinit_objects = WeakSet()
+
+
+def _synchronized_register_context(context):
+    # Contexts are keyed by identity rather than held in a WeakSet since
+    # they can be object proxies or other objects whose hashing and
+    # equality do not reflect identity. The entry is discarded when the
+    # context is garbage collected.
+
+    key = id(context)
+
+    def _discard(context_ref):
+        if _synchronized_contexts.get(key) is context_ref:
+            del _synchronized_contexts[key]
+
+    try:
+        _synchronized_contexts[key] = ref(context, _discard)
+    except TypeError:
+        # Context does not support weak references. Its locks cannot be
+        # reinitialised after a fork.
+        pass
+
+
+def _synchronized_after_fork_in_child():
+    synchronized._synchronized_meta_lock = Lock()
+
+    for context_ref in list(_synchronized_contexts.values()):
+        context = context_ref()
+
+        if context is None:
+            continue
+
+        attrs = vars(context)
+
+        if attrs.get("_synchronized_lock", None) is not None:
+            setattr(context, "_synchronized_lock", RLock())
+
+        if attrs.get("_synchronized_async_lock", None) is not None:
+            setattr(context, "_synchronized_async_lock", asyncio.Lock())
+
+    for obj in list(_fork_reinit_objects):
+        obj._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_synchronized_after_fork_in_child)
+
+
+# Subinterpreters. Module level state such as the registries above and
+# the synchronized meta lock is per interpreter, since each interpreter
+# imports its own copy of the module. Isolated subinterpreters (PEP 684)
+# do not however permit daemon threads, so background threads fall back
+# to being ordinary threads there. Such a thread is waited on before
+# atexit callbacks are run, so anything needing to stop it at exit must
+# be registered with _register_thread_atexit() instead.
+
+
+def _start_background_thread(target, args=(), name=None):
+    try:
+        thread = Thread(target=target, args=args, name=name, daemon=True)
+    except RuntimeError:
+        thread = Thread(target=target, args=args, name=name, daemon=False)
+
+    thread.start()
+
+    return thread
+
+
+def _register_thread_atexit(thread, func):
+    # For a non-daemon thread, the function needs to be called before
+    # non-daemon threads are joined at exit. This uses the same private
+    # hook concurrent.futures uses to stop its worker threads. Should it
+    # not exist, fall back to atexit, in which case the thread must finish
+    # of its own accord before the interpreter can exit.
+
+    register = atexit.register
+
+    if not thread.daemon:
+        register = getattr(threading, "_register_atexit", register)
+
+    register(func)
+
+
 # Calling-convention marker wrappers. These manipulate __code__.co_flags
 # so that inspect.iscoroutinefunction() reports the intended calling
 # convention, which lets stdlib code and the synchronized() decorator
@@ -31,6 +139,8 @@ from .decorators import decorator
 
 class _SyncCodeProxy(CallableObjectProxy):
 
+    __slots__ = ("_self_generator",)
+
     def __init__(self, wrapped, generator=None):
         super().__init__(wrapped)
         self._self_generator = generator
@@ -56,6 +166,8 @@ class _SyncCodeProxy(CallableObjectProxy):
 
 class _SyncFunctionSurrogate(CallableObjectProxy):
 
+    __slots__ = ("_self_generator",)
+
     def __init__(self, wrapped, generator=None):
         super().__init__(wrapped)
         self._self_generator = generator
@@ -67,6 +179,8 @@ class _SyncFunctionSurrogate(CallableObjectProxy):
 
 class _BoundSyncFunctionWrapper(BoundFunctionWrapper):
 
+    __slots__ = ("_self_is_not_coroutine",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._self_is_not_coroutine = True
@@ -80,6 +194,8 @@ class _BoundSyncFunctionWrapper(BoundFunctionWrapper):
 
 class _SyncFunctionWrapper(FunctionWrapper):
 
+    __slots__ = ("_self_is_not_coroutine", "_self_generator")
+
     __bound_function_wrapper__ = _BoundSyncFunctionWrapper
 
     def __init__(self, wrapped, wrapper, generator=None):
@@ -94,6 +210,8 @@ class _SyncFunctionWrapper(FunctionWrapper):
 
 class _AsyncCodeProxy(CallableObjectProxy):
 
+    __slots__ = ("_self_generator",)
+
     def __init__(self, wrapped, generator=None):
         super().__init__(wrapped)
         self._self_generator = generator
@@ -121,6 +239,8 @@ class _AsyncCodeProxy(CallableObjectProxy):
 
 class _AsyncFunctionSurrogate(CallableObjectProxy):
 
+    __slots__ = ("_self_generator",)
+
     def __init__(self, wrapped, generator=None):
         super().__init__(wrapped)
         self._self_generator = generator
@@ -141,6 +261,8 @@ class _BoundAsyncFunctionWrapper(BoundFunctionWrapper):
 
 class _AsyncFunctionWrapper(FunctionWrapper):
 
+    __slots__ = ("_self_generator",)
+
     __bound_function_wrapper__ = _BoundAsyncFunctionWrapper
 
     def __init__(self, wrapped, wrapper, generator=None):
@@ -220,31 +342,649 @@ def mark_as_async(wrapped=None, /, *, generator=None):
     return _decorator(wrapped)
 
 
-def async_to_sync(wrapped):
-    """Adapt an async callable so it can be called synchronously. Each
-    call runs the coroutine to completion via `asyncio.run()`. The
-    returned wrapper reports as synchronous under
+# Event loop run forever on a dedicated daemon thread, used by
+# async_to_sync(persistent_loop=True). Creating and tearing down an event
+# loop via asyncio.run() on every call is expensive and breaks resources
+# such as connection pools which are bound to the loop they were created
+# on. Instead coroutines are handed across to the long-lived loop using
+# asyncio.run_coroutine_threadsafe() and the calling thread blocks on the
+# resulting concurrent future. The loop and thread are created lazily on
+# first use and shut down cleanly at interpreter exit.
+
+
+class _BackgroundEventLoop:
+
+    def __init__(self, name):
+        self._name = name
+        self._lock = Lock()
+        self._loop = None
+        self._thread = None
+        self._atexit_registered = False
+        self._shut_down = False
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        # The loop thread does not exist in the child, so discard the loop
+        # inherited from the parent. A new one is started on next use.
+
+        self._lock = Lock()
+
+        loop, self._loop = self._loop, None
+        self._thread = None
+
+        if loop is not None:
+            self._close_inherited(loop)
+
+    @staticmethod
+    def _close_inherited(loop):
+        # Close the copies of the selector and self-pipe file descriptors
+        # held by the loop inherited from the parent. The loop still records
+        # the thread of the parent which was running it, which does not exist
+        # in the child, and that has to be cleared for close() to proceed.
+        #
+        # An epoll instance is shared with the parent across fork, so close()
+        # must not unregister the self-pipe from it, else the loop still
+        # running in the parent could no longer be woken up. The selector is
+        # therefore closed directly, which only closes the child's copy of
+        # its descriptor, and an empty selector substituted for close() to
+        # then unregister from.
+
+        selector = getattr(loop, "_selector", None)
+
+        if selector is not None:
+            try:
+                selector.close()
+            except Exception:
+                pass
+
+            loop._selector = selectors.DefaultSelector()
+
+        if hasattr(loop, "_thread_id"):
+            loop._thread_id = None
+
+        try:
+            loop.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _run_forever(loop, ready):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+
+        try:
+            loop.run_forever()
+
+        finally:
+            # Cancel anything still outstanding so that coroutines get a
+            # chance to run their cleanup, then finalise any async
+            # generators before closing the loop.
+
+            try:
+                tasks = asyncio.all_tasks(loop)
+
+                for task in tasks:
+                    task.cancel()
+
+                if tasks:
+                    loop.run_until_complete(
+                        asyncio.gather(*tasks, return_exceptions=True)
+                    )
+
+                loop.run_until_complete(loop.shutdown_asyncgens())
+
+            finally:
+                asyncio.set_event_loop(None)
+                loop.close()
+
+    def loop(self):
+        """Return the background event loop, starting it if necessary."""
+
+        loop = self._loop
+
+        if loop is None:
+            with self._lock:
+                loop = self._loop
+
+                if loop is None:
+                    # Once shut down at exit a new loop would never be shut
+                    # down, so it is not started again.
+
+                    if self._shut_down:
+                        raise RuntimeError(
+                            "cannot call an async_to_sync() wrapper using a "
+                            "persistent event loop after it has been shut down"
+                        )
+
+                    loop = asyncio.new_event_loop()
+                    ready = Event()
+
+                    thread = _start_background_thread(
+                        self._run_forever, (loop, ready), self._name
+                    )
+                    ready.wait()
+
+                    self._thread = thread
+                    self._loop = loop
+
+                    if not self._atexit_registered:
+                        _register_thread_atexit(thread, self.shutdown)
+                        self._atexit_registered = True
+
+        return loop
+
+    def run(self, coroutine):
+        """Run the coroutine to completion on the background event loop,
+        blocking the calling thread until the result is available.
+        """
+
+        loop = self.loop()
+
+        if current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError(
+                "cannot call an async_to_sync() wrapper using a persistent "
+                "event loop from within that event loop"
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+        try:
+            return future.result()
+
+        except BaseException:
+            # Includes KeyboardInterrupt in the calling thread, in which
+            # case the coroutine should not be left running unattended.
+
+            future.cancel()
+            raise
+
+    def shutdown(self):
+        """Stop the background event loop and wait for its thread to exit."""
+
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            self._shut_down = True
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+
+        if thread is not current_thread():
+            thread.join()
+
+
+_async_to_sync_loop = _BackgroundEventLoop("wrapt-async-to-sync")
+
+
+# Bridging of async generators to sync generators. The async generator
+# must stay bound to a single event loop for its whole lifetime, so each
+# step is always run on the shared background event loop, even when the
+# persistent_loop option was not requested for plain coroutines. With a
+# prefetch buffer a producer task on the background loop runs ahead of
+# the consumer, filling a bounded asyncio.Queue, so that the I/O done by
+# the async generator overlaps with processing of items by the consumer.
+
+_ITEM, _ERROR, _DONE = range(3)
+
+_EXHAUSTED = object()
+
+
+async def _async_generator_next(generator):
+    try:
+        return await generator.__anext__()
+    except StopAsyncIteration:
+        return _EXHAUSTED
+
+
+async def _async_generator_close(generator):
+    await generator.aclose()
+
+
+async def _async_generator_produce(generator, queue):
+    try:
+        async for item in generator:
+            await queue.put((_ITEM, item))
+    except Exception as exc:
+        await queue.put((_ERROR, exc))
+    else:
+        await queue.put((_DONE, None))
+    finally:
+        await generator.aclose()
+
+
+async def _async_generator_start(generator, prefetch):
+    queue = asyncio.Queue(maxsize=prefetch)
+    task = asyncio.ensure_future(_async_generator_produce(generator, queue))
+    return queue, task
+
+
+async def _async_generator_stop(task):
+    task.cancel()
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def _async_to_sync_generator(generator, prefetch):
+    background = _async_to_sync_loop
+
+    if not prefetch:
+        try:
+            while True:
+                item = background.run(_async_generator_next(generator))
+
+                if item is _EXHAUSTED:
+                    return
+
+                yield item
+
+        finally:
+            background.run(_async_generator_close(generator))
+
+    queue, task = background.run(_async_generator_start(generator, prefetch))
+
+    try:
+        while True:
+            kind, value = background.run(queue.get())
+
+            if kind is _DONE:
+                return
+
+            if kind is _ERROR:
+                raise value
+
+            yield value
+
+    finally:
+        background.run(_async_generator_stop(task))
+
+
+def async_to_sync(wrapped=None, /, *, persistent_loop=False, prefetch=0):
+    """Adapt an async callable so it can be called synchronously. By
+    default each call runs the coroutine to completion via
+    `asyncio.run()`. The returned wrapper reports as synchronous under
     `inspect.iscoroutinefunction()`. Naming follows the asgiref
-    convention."""
+    convention.
+
+    When `persistent_loop` is true, coroutines are instead submitted to a
+    single long-lived event loop running on a dedicated daemon thread,
+    shared by all such wrappers, and the calling thread blocks waiting on
+    the result. This avoids the cost of creating an event loop per call,
+    allows loop-bound resources to be reused across calls, and permits
+    calls from a thread which already has a running event loop. The
+    background loop is started on first use and shut down at exit.
+
+    If the wrapped callable is an async generator function, calling the
+    wrapper returns a sync generator which steps the async generator on
+    the background event loop. When `prefetch` is greater than zero, up
+    to that many items are fetched ahead of the consumer. Supplying
+    `prefetch` for any other callable raises `TypeError`.
+    """
+
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+    if persistent_loop:
+
+        def wrapper(wrapped, instance, args, kwargs):
+            return _async_to_sync_loop.run(wrapped(*args, **kwargs))
+
+    else:
+
+        def wrapper(wrapped, instance, args, kwargs):
+            return asyncio.run(wrapped(*args, **kwargs))
+
+    def generator_wrapper(wrapped, instance, args, kwargs):
+        return _async_to_sync_generator(wrapped(*args, **kwargs), prefetch)
+
+    def _decorator(wrapped):
+        if isasyncgenfunction(getattr(wrapped, "__func__", wrapped)):
+            return _SyncFunctionWrapper(wrapped, generator_wrapper)
+
+        if prefetch:
+            raise TypeError(
+                "async_to_sync can only prefetch= when wrapping an async "
+                "generator function"
+            )
+
+        return _SyncFunctionWrapper(wrapped, wrapper)
+
+    if wrapped is None:
+        return _decorator
+    return _decorator(wrapped)
+
+
+# Executors used by sync_to_async() when a specific executor is not
+# supplied by the caller. A dedicated executor is created lazily on first
+# use so that merely decorating a function does not start any threads.
+# All callables decorated with thread_sensitive=True share the single
+# worker thread of one such executor, so that code which must always run
+# on the same thread (for example because it uses thread bound database
+# connections) is kept there.
+
+
+class _DedicatedExecutor:
+
+    def __init__(self, max_workers, thread_name_prefix):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._lock = Lock()
+        self._executor = None
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        # Worker threads do not exist in the child and the executor would
+        # believe they do, so discard it. A new one is created on next use.
+
+        self._lock = Lock()
+        self._executor = None
+
+    def executor(self):
+        """Return the thread pool executor, creating it if necessary."""
+
+        executor = self._executor
+
+        if executor is None:
+            with self._lock:
+                executor = self._executor
+
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix=self._thread_name_prefix,
+                    )
+                    self._executor = executor
+
+        return executor
+
+
+_thread_sensitive_executor = _DedicatedExecutor(1, "wrapt-thread-sensitive")
+
+
+# When a process pool executor is used, the wrapped function cannot be
+# pickled directly. Functions are pickled by reference to their module
+# and qualified name, but that name now resolves to the wrapper created
+# by sync_to_async() rather than the original function, so pickle
+# rejects it. Instead the reference is passed explicitly and resolved in
+# the worker process, where the wrapper is unwrapped to get back to the
+# original function.
+
+
+def _sync_to_async_reference(wrapped):
+    function = getattr(wrapped, "__func__", wrapped)
+
+    module = getattr(function, "__module__", None)
+    qualname = getattr(function, "__qualname__", None)
+
+    if module is None or qualname is None or "<locals>" in qualname:
+        raise TypeError(
+            "sync_to_async with a process pool executor requires a module "
+            "level function or method, not {!r}".format(wrapped)
+        )
+
+    return module, qualname
+
+
+def _sync_to_async_process_call(module, qualname, args, kwargs):
+    target = import_module(module)
+
+    for name in qualname.split("."):
+        target = vars(target)[name]
+
+    while not isinstance(target, _AsyncFunctionWrapper):
+        target = target.__wrapped__
+
+    function = target.__wrapped__
+
+    if isinstance(function, (classmethod, staticmethod)):
+        function = function.__func__
+
+    return function(*args, **kwargs)
+
+
+# Bridging of sync generators to async generators. Each blocking step of
+# the sync generator is run in the executor so the event loop is never
+# blocked. Without a prefetch buffer the generator is only advanced when
+# the consumer asks for the next item. With a prefetch buffer a producer
+# runs on its own thread for the life of the iteration, running up to the
+# given number of items ahead of the consumer and handing them across to
+# the event loop, so blocking I/O done by the generator overlaps with
+# processing of items by the consumer. The producer is not run in the
+# executor, as holding one of its workers for the whole iteration would
+# deadlock a single worker executor against any other calls the consumer
+# awaited on it.
 
-    def wrapper(wrapped, instance, args, kwargs):
-        return asyncio.run(wrapped(*args, **kwargs))
 
-    return _SyncFunctionWrapper(wrapped, wrapper)
+def _sync_generator_post(loop, queue, message):
+    try:
+        loop.call_soon_threadsafe(queue.put_nowait, message)
+    except RuntimeError:
+        # The event loop has been closed so the consumer is gone.
+        return False
+    return True
 
 
-def sync_to_async(wrapped):
+def _sync_generator_produce(generator, loop, queue, slots, stopped, finished):
+    try:
+        while True:
+            slots.acquire()
+
+            if stopped.is_set():
+                return
+
+            item = next(generator, _EXHAUSTED)
+
+            if item is _EXHAUSTED:
+                _sync_generator_post(loop, queue, (_DONE, None))
+                return
+
+            if not _sync_generator_post(loop, queue, (_ITEM, item)):
+                return
+
+    except Exception as exc:
+        _sync_generator_post(loop, queue, (_ERROR, exc))
+
+    finally:
+        try:
+            generator.close()
+        finally:
+            _sync_generator_post(loop, finished, None)
+
+
+async def _sync_to_async_generator(generator, executor, prefetch):
+    loop = asyncio.get_running_loop()
+    context = copy_context()
+
+    if not prefetch:
+        try:
+            while True:
+                item = await loop.run_in_executor(
+                    executor, context.run, next, generator, _EXHAUSTED
+                )
+
+                if item is _EXHAUSTED:
+                    return
+
+                yield item
+
+        finally:
+            await loop.run_in_executor(executor, context.run, generator.close)
+
+    queue = asyncio.Queue()
+    slots = Semaphore(prefetch)
+    stopped = Event()
+    finished = asyncio.Queue()
+
+    def _stop():
+        stopped.set()
+        slots.release()
+
+    producer = _start_background_thread(
+        context.run,
+        (_sync_generator_produce, generator, loop, queue, slots, stopped, finished),
+        "wrapt-prefetch",
+    )
+
+    if not producer.daemon:
+        # Ensure an iteration which is never finished cannot stop the
+        # interpreter exiting.
+
+        _register_thread_atexit(producer, _stop)
+
+    try:
+        while True:
+            kind, value = await queue.get()
+
+            if kind is _DONE:
+                return
+
+            if kind is _ERROR:
+                raise value
+
+            slots.release()
+
+            yield value
+
+    finally:
+        _stop()
+
+        await finished.get()
+
+
+def sync_to_async(
+    wrapped=None,
+    /,
+    *,
+    executor=None,
+    thread_sensitive=False,
+    max_workers=None,
+    prefetch=0,
+):
     """Adapt a sync callable so it can be awaited. Each call dispatches
-    the synchronous work to the default executor via
-    `loop.run_in_executor()`. The returned wrapper reports as
-    asynchronous under `inspect.iscoroutinefunction()`. Naming follows
-    the asgiref convention."""
+    the synchronous work to an executor via `loop.run_in_executor()`.
+    The returned wrapper reports as asynchronous under
+    `inspect.iscoroutinefunction()`. Naming follows the asgiref
+    convention.
+
+    At most one of the following may be supplied to select the executor,
+    with the default executor of the running event loop used otherwise:
+
+    - `executor`: an existing `concurrent.futures.Executor`. If this is a
+      `ProcessPoolExecutor`, the wrapped function is passed to the worker
+      process by module and qualified name, so it must be defined at
+      module level (or as a method of a module level class).
+    - `thread_sensitive`: if true, the call is run on a single worker
+      thread shared by all callables decorated with this option.
+    - `max_workers`: a dedicated bounded thread pool of this size is
+      created for the decorated callable on first use.
+
+    The `contextvars` context of the caller is propagated to the worker
+    thread when a thread based executor is used.
+
+    If the wrapped callable is a generator function, calling the wrapper
+    returns an async generator which runs each blocking step of the sync
+    generator in the executor. When `prefetch` is greater than zero, up
+    to that many items are fetched ahead of the consumer by a producer
+    running on its own thread, which cannot be combined with
+    `thread_sensitive`. Supplying `prefetch` for any other callable
+    raises `TypeError`.
+    """
+
+    specified = sum(
+        (executor is not None, bool(thread_sensitive), max_workers is not None)
+    )
+    if specified > 1:
+        raise TypeError(
+            "sync_to_async accepts only one of executor=, thread_sensitive=, "
+            "or max_workers="
+        )
+
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+    if prefetch and thread_sensitive:
+        raise ValueError(
+            "sync_to_async cannot prefetch with thread_sensitive=, as the "
+            "producer would not run on the shared thread"
+        )
+
+    def _decorator(wrapped):
+        generator = isgeneratorfunction(getattr(wrapped, "__func__", wrapped))
+
+        if prefetch and not generator:
+            raise TypeError(
+                "sync_to_async can only prefetch= when wrapping a generator " "function"
+            )
+
+        if isinstance(executor, ProcessPoolExecutor):
+            if generator:
+                raise TypeError(
+                    "sync_to_async cannot bridge a generator function using a "
+                    "process pool executor"
+                )
+
+            module, qualname = _sync_to_async_reference(wrapped)
+
+            async def wrapper(wrapped, instance, args, kwargs):
+                if ismethod(wrapped):
+                    args = (wrapped.__self__,) + args
+
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    executor,
+                    partial(
+                        _sync_to_async_process_call, module, qualname, args, kwargs
+                    ),
+                )
 
-    async def wrapper(wrapped, instance, args, kwargs):
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial(wrapped, *args, **kwargs))
+            return _AsyncFunctionWrapper(wrapped, wrapper)
 
-    return _AsyncFunctionWrapper(wrapped, wrapper)
+        if thread_sensitive:
+            dedicated = _thread_sensitive_executor
+        elif max_workers is not None:
+            # Use __func__ to get the name for classmethod/staticmethod
+            # descriptors which lack __name__ on Python < 3.10.
+
+            name = getattr(wrapped, "__name__", None)
+
+            if name is None:
+                name = wrapped.__func__.__name__
+
+            dedicated = _DedicatedExecutor(max_workers, "wrapt-" + name)
+        else:
+            dedicated = None
+
+        if generator:
+
+            def wrapper(wrapped, instance, args, kwargs):
+                return _sync_to_async_generator(
+                    wrapped(*args, **kwargs),
+                    dedicated.executor() if dedicated is not None else executor,
+                    prefetch,
+                )
+
+            return _AsyncFunctionWrapper(wrapped, wrapper)
+
+        async def wrapper(wrapped, instance, args, kwargs):
+            loop = asyncio.get_running_loop()
+            context = copy_context()
+            return await loop.run_in_executor(
+                dedicated.executor() if dedicated is not None else executor,
+                partial(context.run, wrapped, *args, **kwargs),
+            )
+
+        return _AsyncFunctionWrapper(wrapped, wrapper)
+
+    if wrapped is None:
+        return _decorator
+    return _decorator(wrapped)
 
 
 def _synchronized_is_async_lock(obj):
@@ -411,6 +1151,7 @@ def synchronized(wrapped):
                 if lock is None:
                     lock = RLock()
                     setattr(context, "_synchronized_lock", lock)
+                    _synchronized_register_context(context)
 
         return lock
 
@@ -429,6 +1170,7 @@ def synchronized(wrapped):
                 if lock is None:
                     lock = asyncio.Lock()
                     setattr(context, "_synchronized_async_lock", lock)
+                    _synchronized_register_context(context)
 
         return lock
 
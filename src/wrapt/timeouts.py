@@ -0,0 +1,227 @@
+"""Timeout decorators. Currently provides ``timeout``, which places a
+deadline on calls of sync or async callables. The deadline is propagated
+through a context variable so nested calls share the remaining budget of
+the outermost call rather than each having its own fixed timeout.
+"""
+
+import asyncio
+import sys
+from contextvars import ContextVar, copy_context
+from threading import Lock
+from time import monotonic
+
+from .decorators import decorator
+from .synchronization import (
+    _fork_reinit_objects,
+    _start_background_thread,
+    _synchronized_is_async_callable,
+)
+
+# The absolute deadline, as given by time.monotonic(), which applies to
+# the current context. A decorated call which is nested inside another
+# uses whichever is the earlier of its own deadline and the one it
+# inherited, so the inner call cannot run past the outer deadline.
+
+_timeout_deadline = ContextVar("wrapt_timeout_deadline", default=None)
+
+
+def _timeout_effective_deadline(seconds):
+    deadline = _timeout_deadline.get()
+
+    if seconds is not None:
+        own = monotonic() + seconds
+
+        if deadline is None or own < deadline:
+            deadline = own
+
+    return deadline
+
+
+def _timeout_error():
+    return TimeoutError("deadline for call has expired")
+
+
+# Book keeping for the worker threads of a callable decorated with
+# thread=True. A worker is abandoned when the deadline of its call passes
+# but it keeps running until the call returns. Abandoned workers are
+# counted, and once the limit is reached further calls fail straight away
+# rather than starting yet another thread, so a dependency which has hung
+# cannot exhaust the process of threads. Calls are admitted again as the
+# abandoned workers finish.
+
+
+class _TimeoutWorkers:
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.lock = Lock()
+        self.abandoned = 0
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        # Worker threads do not exist in the child, so none are abandoned.
+
+        self.lock = Lock()
+        self.abandoned = 0
+
+    def admit(self):
+        with self.lock:
+            if self.limit is not None and self.abandoned >= self.limit:
+                raise TimeoutError(
+                    "too many abandoned calls are still running after their "
+                    "deadline expired"
+                )
+
+
+def timeout(seconds, /, *, thread=False, max_abandoned=8):
+    """A decorator which places a deadline of `seconds` on each call of the
+    wrapped callable, raising `TimeoutError` if the deadline passes. If
+    `seconds` is `None` the call has no deadline of its own, but still
+    honours any deadline inherited from an enclosing decorated call.
+
+    The deadline is propagated through a context variable, so calls of
+    other decorated callables made within the call use whichever is the
+    earlier of their own deadline and the remaining time of the enclosing
+    call.
+
+    For async callables the awaited call is cancelled when the deadline
+    passes. A sync callable cannot be interrupted, so by default it is run
+    directly, with `TimeoutError` raised immediately only if the inherited
+    deadline has already expired. If `thread` is true, the sync call is
+    instead run on a separate daemon worker thread. When the deadline
+    passes, `TimeoutError` is raised in the caller and the worker thread is
+    abandoned, left to run to completion with its result discarded. In an
+    isolated subinterpreter, where daemon threads are not permitted, an
+    ordinary thread is used instead.
+
+    At most `max_abandoned` worker threads of the decorated callable can be
+    left running after their deadline. Once that many are, calls raise
+    `TimeoutError` immediately without starting a thread, until abandoned
+    workers finish. If `max_abandoned` is `None` there is no limit.
+    """
+
+    if seconds is not None and seconds <= 0:
+        raise ValueError("seconds must be greater than zero")
+
+    if max_abandoned is not None and max_abandoned < 1:
+        raise ValueError("max_abandoned must be at least 1")
+
+    async def _async_wrapper(wrapped, instance, args, kwargs):
+        deadline = _timeout_effective_deadline(seconds)
+
+        if deadline is None:
+            return await wrapped(*args, **kwargs)
+
+        remaining = deadline - monotonic()
+
+        if remaining <= 0:
+            raise _timeout_error()
+
+        token = _timeout_deadline.set(deadline)
+
+        try:
+            if sys.version_info >= (3, 11):
+                async with asyncio.timeout(remaining):
+                    return await wrapped(*args, **kwargs)
+
+            try:
+                return await asyncio.wait_for(wrapped(*args, **kwargs), remaining)
+            except asyncio.TimeoutError:
+                raise _timeout_error() from None
+
+        finally:
+            _timeout_deadline.reset(token)
+
+    def _sync_wrapper(wrapped, instance, args, kwargs):
+        deadline = _timeout_effective_deadline(seconds)
+
+        if deadline is None:
+            return wrapped(*args, **kwargs)
+
+        if deadline <= monotonic():
+            raise _timeout_error()
+
+        token = _timeout_deadline.set(deadline)
+
+        try:
+            return wrapped(*args, **kwargs)
+
+        finally:
+            _timeout_deadline.reset(token)
+
+    def _thread_call(workers, wrapped, args, kwargs):
+        deadline = _timeout_effective_deadline(seconds)
+
+        if deadline is None:
+            return wrapped(*args, **kwargs)
+
+        remaining = deadline - monotonic()
+
+        if remaining <= 0:
+            raise _timeout_error()
+
+        # Run the call in a copy of the current context with the deadline
+        # set, so nested decorated calls made on the worker thread see it.
+
+        context = copy_context()
+        context.run(_timeout_deadline.set, deadline)
+
+        workers.admit()
+
+        # The outcome is recorded, or the worker marked as abandoned, under
+        # the lock so that a worker finishing just as the deadline passes is
+        # either seen as having completed or is counted as abandoned and
+        # then discounted again when it does finish.
+
+        outcome = []
+        abandoned = []
+
+        def _target():
+            try:
+                result = (True, context.run(wrapped, *args, **kwargs))
+            except BaseException as exc:
+                result = (False, exc)
+
+            with workers.lock:
+                if abandoned:
+                    workers.abandoned -= 1
+                else:
+                    outcome.append(result)
+
+        worker = _start_background_thread(_target, name="wrapt-timeout")
+        worker.join(remaining)
+
+        with workers.lock:
+            if not outcome:
+                abandoned.append(True)
+                workers.abandoned += 1
+
+        if not outcome:
+            raise _timeout_error()
+
+        succeeded, value = outcome[0]
+
+        if not succeeded:
+            raise value
+
+        return value
+
+    def _decorator(wrapped):
+        if _synchronized_is_async_callable(wrapped):
+            return decorator(_async_wrapper)(wrapped)
+
+        if thread:
+            # Abandoned workers are limited separately for each decorated
+            # callable, even where the decorator is applied to several.
+
+            workers = _TimeoutWorkers(max_abandoned)
+
+            def _thread_wrapper(wrapped, instance, args, kwargs):
+                return _thread_call(workers, wrapped, args, kwargs)
+
+            return decorator(_thread_wrapper)(wrapped)
+
+        return decorator(_sync_wrapper)(wrapped)
+
+    return _decorator
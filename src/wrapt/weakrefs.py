@@ -1,9 +1,17 @@
-"""Weak reference proxy for functions and bound methods."""
+"""Weak reference proxy for functions and bound methods, a signal dispatcher
+which holds its listeners using weak function proxies, and a registry of
+proxies keyed by the identity of the object they wrap.
+"""
 
+import asyncio
 import functools
+import inspect
+import os
 import weakref
+from threading import Lock, RLock
 
-from .__wrapt__ import BaseObjectProxy, _FunctionWrapperBase
+from .__wrapt__ import _FunctionWrapperBase, _WeakFunctionProxyBase
+from .synchronization import _fork_reinit_objects
 
 # A weak function proxy. This will work on instance methods, class
 # methods, static methods and regular functions. Special treatment is
@@ -29,9 +37,11 @@ def _weak_function_proxy_callback(ref, proxy, callback):
         callback(proxy)
 
 
-class WeakFunctionProxy(BaseObjectProxy):
+class WeakFunctionProxy(_WeakFunctionProxyBase):
     """A weak function proxy."""
 
+    __slots__ = ("_self_expired",)
+
     def __init__(self, wrapped, callback=None):
         """Create a proxy to object which uses a weak reference. This is
         similar to the `weakref.proxy` but is designed to work with functions
@@ -94,32 +104,330 @@ class WeakFunctionProxy(BaseObjectProxy):
 
             super(WeakFunctionProxy, self).__init__(weakref.proxy(wrapped, _callback))
 
-    def __call__(*args, **kwargs):
+
+# A signal dispatcher holding its listeners using weak function proxies,
+# so that connecting a listener does not keep it, or the instance it is
+# bound to, alive. Listeners are held in a tuple which is replaced as a
+# whole whenever a listener is connected or disconnected, so a dispatch
+# only needs to read the current tuple and loop over it, without taking
+# a lock, and is unaffected by listeners being connected or disconnected
+# while it is in progress.
+
+
+def _weak_signal_callback(signal_ref, proxy):
+    # Called via the expiry callback of the weak function proxy for a
+    # listener. This can be triggered by garbage collection at any point,
+    # including in the same thread while the signal lock is held, so the
+    # dead listener is only pruned immediately if the lock can be acquired
+    # without blocking. Otherwise it is left to the next operation on the
+    # signal, and is skipped if encountered by a dispatch in the meantime.
+
+    signal = signal_ref()
+
+    if signal is None:
+        return
+
+    signal._expired = True
+
+    if signal._lock.acquire(blocking=False):
+        try:
+            signal._prune()
+        finally:
+            signal._lock.release()
+
+
+def _weak_signal_key(listener):
+    # Bound methods are transient objects, so they are identified by the
+    # instance and the function they bind together.
+
+    try:
+        return (id(listener.__self__), id(listener.__func__))
+    except AttributeError:
+        return id(listener)
+
+
+class WeakSignal:
+    """A signal dispatcher which holds its listeners using weak references."""
+
+    def __init__(self, on_error=None):
+        """Create a signal to which listeners can be connected. Listeners are
+        held using `WeakFunctionProxy`, and are disconnected automatically
+        when the function, or the instance a bound method is bound to, is
+        garbage collected. An exception raised by a listener does not stop
+        the remaining listeners being called. Instead it is returned as the
+        result for that listener and, if `on_error` is supplied, passed to
+        it along with the listener.
+        """
+
+        self._on_error = on_error
+        self._lock = Lock()
+        self._expired = False
+        self._registry = {}
+        self._listeners = ()
+
+        _fork_reinit_objects.add(self)
+
+    def _after_fork_in_child(self):
+        self._lock = Lock()
+
+    def _prune(self):
+        # Must be called with the lock held.
+
+        self._expired = False
+
+        registry = {
+            key: proxy
+            for key, proxy in self._registry.items()
+            if not proxy._self_expired
+        }
+
+        if len(registry) != len(self._registry):
+            self._registry = registry
+            self._listeners = tuple(registry.values())
+
+    def _snapshot(self):
+        if self._expired and self._lock.acquire(blocking=False):
+            try:
+                self._prune()
+            finally:
+                self._lock.release()
+
+        return self._listeners
+
+    def connect(self, listener):
+        """Connect a listener to the signal, returning the listener so this
+        can be used as a decorator. Connecting a listener which is already
+        connected has no effect.
+        """
+
+        key = _weak_signal_key(listener)
+
+        callback = functools.partial(_weak_signal_callback, weakref.ref(self))
+
+        with self._lock:
+            if self._expired:
+                self._prune()
+
+            if key not in self._registry:
+                registry = dict(self._registry)
+                registry[key] = WeakFunctionProxy(listener, callback)
+
+                self._registry = registry
+                self._listeners = tuple(registry.values())
+
+        return listener
+
+    def disconnect(self, listener):
+        """Disconnect a listener from the signal, returning whether it was
+        connected.
+        """
+
+        key = _weak_signal_key(listener)
+
+        with self._lock:
+            if self._expired:
+                self._prune()
+
+            if key not in self._registry:
+                return False
+
+            registry = dict(self._registry)
+            del registry[key]
+
+            self._registry = registry
+            self._listeners = tuple(registry.values())
+
+        return True
+
+    def is_connected(self, listener):
+        """Return whether the listener is connected to the signal."""
+
+        proxy = self._registry.get(_weak_signal_key(listener))
+
+        return proxy is not None and not proxy._self_expired
+
+    def clear(self):
+        """Disconnect all listeners from the signal."""
+
+        with self._lock:
+            self._expired = False
+            self._registry = {}
+            self._listeners = ()
+
+    def __len__(self):
+        return sum(1 for proxy in self._snapshot() if not proxy._self_expired)
+
+    def _handle_error(self, proxy, exc):
+        if self._on_error is not None:
+            self._on_error(proxy, exc)
+
+    def send(*args, **kwargs):
+        """Call each listener in turn with the supplied arguments, returning a
+        list of `(listener, result)` pairs in the order the listeners were
+        connected. The listener in each pair is the `WeakFunctionProxy` for
+        it. Where a listener raised an exception, the result is the exception.
+        """
+
         def _unpack_self(self, *args):
             return self, args
 
         self, args = _unpack_self(*args)
 
-        # We perform a boolean check here on the instance and wrapped
-        # function as that will trigger the reference error prior to
-        # calling if the reference had expired.
+        results = []
+
+        for proxy in self._snapshot():
+            try:
+                result = proxy(*args, **kwargs)
+
+            except ReferenceError:
+                # The listener expired after the snapshot was taken.
+
+                if proxy._self_expired:
+                    continue
+
+                raise
+
+            except Exception as exc:
+                self._handle_error(proxy, exc)
+                result = exc
+
+            results.append((proxy, result))
+
+        return results
+
+    async def send_async(*args, **kwargs):
+        """Call each listener with the supplied arguments, running those which
+        return an awaitable concurrently, and return a list of `(listener,
+        result)` pairs in the order the listeners were connected. Where a
+        listener raised an exception, the result is the exception.
+        """
+
+        def _unpack_self(self, *args):
+            return self, args
+
+        self, args = _unpack_self(*args)
+
+        results = []
+        pending = []
+
+        for proxy in self._snapshot():
+            try:
+                result = proxy(*args, **kwargs)
+
+            except ReferenceError:
+                if proxy._self_expired:
+                    continue
+
+                raise
+
+            except Exception as exc:
+                self._handle_error(proxy, exc)
+                result = exc
+
+            else:
+                if inspect.isawaitable(result):
+                    pending.append(len(results))
+
+            results.append((proxy, result))
+
+        if pending:
+            outcomes = await asyncio.gather(
+                *(results[index][1] for index in pending), return_exceptions=True
+            )
+
+            for index, outcome in zip(pending, outcomes):
+                proxy = results[index][0]
+
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+
+                    self._handle_error(proxy, outcome)
+
+                results[index] = (proxy, outcome)
+
+        return results
+
+
+# A registry of proxies keyed by the type of proxy and the identity of the
+# object it wraps, so that proxy_for() returns the same proxy for an object
+# while that proxy is alive. Keying by identity means the object need not be
+# hashable, and that objects which compare equal still get distinct proxies.
+# The registry holds only weak references to the proxies, and to the object
+# where it supports them, with the entry discarded when either is garbage
+# collected. An object which does not support weak references is instead
+# held by the entry, which stops its id() being reused for another object
+# while the entry remains, but as the proxy normally holds a reference to the
+# object anyway this does not extend its lifetime. Lookups do not take the
+# lock. It is a reentrant lock since garbage collection can trigger the
+# discard of an entry from the same thread while the lock is held.
+
+_proxy_registry = {}
+
+_proxy_registry_lock = RLock()
+
+
+def _proxy_registry_after_fork_in_child():
+    global _proxy_registry_lock
+
+    _proxy_registry_lock = RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_proxy_registry_after_fork_in_child)
+
+
+def _proxy_registry_discard(key, expired_ref):
+    with _proxy_registry_lock:
+        entry = _proxy_registry.get(key)
+
+        # Compared by identity since where the object does not support weak
+        # references it is held directly, and its __eq__() is not safe to
+        # call from here.
+
+        if entry is not None and (expired_ref is entry[0] or expired_ref is entry[1]):
+            del _proxy_registry[key]
+
+
+def proxy_for(obj, proxy_type):
+    """Return the proxy of type `proxy_type` for `obj`, creating it by calling
+    `proxy_type(obj)` if no such proxy for the object is currently alive. The
+    registry only holds weak references to the proxies it returns, so the
+    proxy for an object is only reused while something else holds it. Where
+    two threads race to create the proxy for the same object, both are given
+    the proxy created first.
+    """
+
+    key = (proxy_type, id(obj))
+
+    entry = _proxy_registry.get(key)
+
+    if entry is not None:
+        proxy = entry[0]()
+
+        if proxy is not None:
+            return proxy
+
+    proxy = proxy_type(obj)
+
+    discard = functools.partial(_proxy_registry_discard, key)
+
+    proxy_ref = weakref.ref(proxy, discard)
 
-        instance = self._self_instance and self._self_instance()
-        function = self.__wrapped__ and self.__wrapped__
+    try:
+        obj_ref = weakref.ref(obj, discard)
+    except TypeError:
+        obj_ref = obj
 
-        # If the wrapped function was originally a bound method but the
-        # instance it was bound to has been garbage collected, raise a
-        # ReferenceError rather than silently calling it as unbound.
+    with _proxy_registry_lock:
+        entry = _proxy_registry.get(key)
 
-        if self._self_instance is not None and instance is None:
-            raise ReferenceError("weakly-referenced object no longer exists")
+        if entry is not None:
+            existing = entry[0]()
 
-        # If the wrapped function was originally a bound function, for
-        # which we retained a reference to the instance and the unbound
-        # function we need to rebind the function and then call it. If
-        # not just called the wrapped function.
+            if existing is not None:
+                return existing
 
-        if instance is None:
-            return self.__wrapped__(*args, **kwargs)
+        _proxy_registry[key] = (proxy_ref, obj_ref)
 
-        return function.__get__(instance, type(instance))(*args, **kwargs)
+    return proxy
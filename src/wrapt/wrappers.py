@@ -4,6 +4,8 @@ import inspect
 import math
 import operator
 import sys
+import threading
+import time
 import types
 
 
@@ -151,6 +153,24 @@ class _ObjectProxyMetaType(type):
 
         dictionary.setdefault("__self_dict__", _SELF_DICT_PROPERTY)
 
+        # Attributes of a derived class whose names start with "_self_" can
+        # be declared in __slots__ so that, with the C extension, instances
+        # need not have an instance dictionary. The pure Python
+        # implementation always keeps __wrapped__ in the instance
+        # dictionary, and adding slots would only stop attribute values
+        # being stored inline in the object, increasing memory use, so such
+        # names are dropped and the attributes stored in the dictionary.
+
+        slots = dictionary.get("__slots__")
+
+        if slots is not None:
+            if isinstance(slots, str):
+                slots = (slots,)
+
+            dictionary["__slots__"] = tuple(
+                name for name in slots if not name.startswith("_self_")
+            )
+
         klass = type.__new__(cls, name, bases, dictionary)
 
         if real_module is not None:
@@ -689,6 +709,220 @@ class CallableObjectProxy(ObjectProxy):
         return self.__wrapped__(*args, **kwargs)
 
 
+class BufferObjectProxy(ObjectProxy):
+    """An object proxy for bytes-like objects that also forwards the buffer
+    protocol, so consumers such as `memoryview()` access the memory of the
+    wrapped object directly without a copy being made. The pure Python
+    implementation can only do this on Python 3.12 and later.
+    """
+
+    if sys.version_info >= (3, 12):
+
+        def __buffer__(self, flags):
+            # The flags are applied by Python when it obtains the buffer
+            # from the returned view, raising an error if not satisfied.
+
+            return memoryview(self.__wrapped__)
+
+        def __release_buffer__(self, view):
+            view.release()
+
+
+class AtomicObjectProxy(ObjectProxy):
+    """An object proxy intended for a wrapped object which is replaced while
+    the proxy is in use by other threads, such as configuration or clients
+    which are reloaded. With the C extension on Python 3.13 and later,
+    reading the wrapped object never takes a lock, with replaced objects
+    only released once no thread can still be reading them. Replace the
+    wrapped object by assigning `__wrapped__`, or use `swap_wrapped()` to
+    replace the wrapped objects of several proxies as a group.
+    """
+
+
+# Sequence lock used to make a group of swaps made by swap_wrapped() appear
+# atomic to snapshot_wrapped(). The counter is odd while a swap is being
+# made, and a snapshot retries if the counter changed while it was reading.
+
+_swap_lock = threading.Lock()
+_swap_sequence = 0
+_swap_missing = object()
+
+
+def swap_wrapped(pairs):
+    """Replace the wrapped objects of a group of object proxies, given as
+    an iterable of `(proxy, value)` pairs, returning a list of the objects
+    which were replaced. A snapshot of the same proxies taken using
+    `snapshot_wrapped()` sees either all of the old or all of the new
+    wrapped objects, never a mix of the two.
+    """
+
+    global _swap_sequence
+
+    pairs = [tuple(pair) for pair in pairs]
+
+    for pair in pairs:
+        if len(pair) != 2:
+            raise ValueError("swap_wrapped() expects (proxy, value) pairs")
+
+        if not isinstance(pair[0], ObjectProxy):
+            raise TypeError(
+                "swap_wrapped() expects object proxies, not %r" % type(pair[0]).__name__
+            )
+
+    replaced = []
+    attempted = []
+
+    with _swap_lock:
+        _swap_sequence += 1
+
+        try:
+            for proxy, value in pairs:
+                try:
+                    old = object.__getattribute__(proxy, "__wrapped__")
+                except AttributeError:
+                    old = _swap_missing
+
+                attempted.append((proxy, old))
+                replaced.append(None if old is _swap_missing else old)
+
+                proxy.__wrapped__ = value
+
+        except BaseException:
+            # Restore the proxies already swapped, including the one which
+            # failed, in reverse order so the group is swapped in full or
+            # not at all. Failures while restoring are ignored so that the
+            # original exception is the one raised.
+
+            for proxy, old in reversed(attempted):
+                try:
+                    if old is _swap_missing:
+                        object.__delattr__(proxy, "__wrapped__")
+                    else:
+                        proxy.__wrapped__ = old
+                except Exception:
+                    pass
+
+            raise
+
+        finally:
+            _swap_sequence += 1
+
+    return replaced
+
+
+def snapshot_wrapped(*proxies):
+    """Return a tuple of the wrapped objects of the given object proxies,
+    consistent with respect to any group of swaps made by `swap_wrapped()`.
+    """
+
+    for proxy in proxies:
+        if not isinstance(proxy, ObjectProxy):
+            raise TypeError(
+                "snapshot_wrapped() expects object proxies, not %r"
+                % type(proxy).__name__
+            )
+
+    while True:
+        sequence = _swap_sequence
+
+        if sequence & 1:
+            time.sleep(0)
+            continue
+
+        result = tuple(proxy.__wrapped__ for proxy in proxies)
+
+        if _swap_sequence == sequence:
+            return result
+
+
+# Mixin classes used by AutoObjectProxy and LazyObjectProxy. Each adds a
+# single special method which forwards to the wrapped object. The class
+# created for each instance of AutoObjectProxy lists those it needs for the
+# wrapped object as additional base classes. The C extension implements
+# the same mixins using the corresponding type slots.
+
+
+class _AutoObjectProxyCall(ObjectProxy):
+
+    def __call__(*args, **kwargs):
+        def _unpack_self(self, *args):
+            return self, args
+
+        self, args = _unpack_self(*args)
+
+        return self.__wrapped__(*args, **kwargs)
+
+
+class _AutoObjectProxyIter(ObjectProxy):
+
+    def __iter__(self):
+        return iter(self.__wrapped__)
+
+
+class _AutoObjectProxyNext(ObjectProxy):
+
+    def __next__(self):
+        return self.__wrapped__.__next__()
+
+
+class _AutoObjectProxyAiter(ObjectProxy):
+
+    def __aiter__(self):
+        return self.__wrapped__.__aiter__()
+
+
+class _AutoObjectProxyAnext(ObjectProxy):
+
+    async def __anext__(self):
+        return await self.__wrapped__.__anext__()
+
+
+class _AutoObjectProxyLengthHint(ObjectProxy):
+
+    def __length_hint__(self):
+        return self.__wrapped__.__length_hint__()
+
+
+class _AutoObjectProxyFspath(ObjectProxy):
+
+    def __fspath__(self):
+        return self.__wrapped__.__fspath__()
+
+
+class _AutoObjectProxyAwait(ObjectProxy):
+
+    # Note that not providing compatibility with generator-based coroutines
+    # (PEP 342) here as they are removed in Python 3.11+ and were deprecated
+    # in 3.8.
+
+    def __await__(self):
+        return (yield from self.__wrapped__.__await__())
+
+
+class _AutoObjectProxyGet(ObjectProxy):
+
+    def __get__(self, instance, owner):
+        return self.__wrapped__.__get__(instance, owner)
+
+
+class _AutoObjectProxySet(ObjectProxy):
+
+    def __set__(self, instance, value):
+        return self.__wrapped__.__set__(instance, value)
+
+
+class _AutoObjectProxyDelete(ObjectProxy):
+
+    def __delete__(self, instance):
+        return self.__wrapped__.__delete__(instance)
+
+
+class _AutoObjectProxySetName(ObjectProxy):
+
+    def __set_name__(self, owner, name):
+        return self.__wrapped__.__set_name__(owner, name)
+
+
 class PartialCallableObjectProxy(ObjectProxy):
     """A callable object proxy that supports partial application of arguments
     and keywords.
@@ -736,6 +970,185 @@ class PartialCallableObjectProxy(ObjectProxy):
         return self.__wrapped__(*_args, **_kwargs)
 
 
+class _WeakFunctionProxyBase(ObjectProxy):
+    """Base class for `WeakFunctionProxy` implementing the call. The weak
+    references are set up by the derived class, with the wrapped object being
+    a weak proxy for the function, and `_self_instance` a weak reference to
+    the instance if the function was originally a bound method.
+    """
+
+    _self_instance = None
+
+    def __call__(*args, **kwargs):
+        def _unpack_self(self, *args):
+            return self, args
+
+        self, args = _unpack_self(*args)
+
+        # We perform a boolean check here on the instance and wrapped
+        # function as that will trigger the reference error prior to
+        # calling if the reference had expired.
+
+        instance = self._self_instance and self._self_instance()
+        function = self.__wrapped__ and self.__wrapped__
+
+        # If the wrapped function was originally a bound method but the
+        # instance it was bound to has been garbage collected, raise a
+        # ReferenceError rather than silently calling it as unbound.
+
+        if self._self_instance is not None and instance is None:
+            raise ReferenceError("weakly-referenced object no longer exists")
+
+        # If the wrapped function was originally a bound function, for
+        # which we retained a reference to the instance and the unbound
+        # function we need to rebind the function and then call it. If
+        # not just called the wrapped function.
+
+        if instance is None:
+            return self.__wrapped__(*args, **kwargs)
+
+        return function.__get__(instance, type(instance))(*args, **kwargs)
+
+
+# Lock under which keys are added to the set of changed keys of a tracking
+# proxy and the set is replaced, so that a key cannot be added to a set
+# which has already been returned by __wrapped_reset_dirty__().
+
+_tracking_lock = threading.Lock()
+
+
+def _tracking_item_keys(wrapped, key, before):
+    """Returns the keys changed by setting or deleting the item `key` of
+    `wrapped`. For a list or bytearray, where `before` is its length prior to
+    the change, a change in length moves the items after those changed, which
+    are returned as a single `range` key rather than individually.
+    """
+
+    if before is None:
+        return (key,)
+
+    after = len(wrapped)
+
+    if isinstance(key, slice):
+        start, stop, step = key.indices(before)
+    else:
+        start = operator.index(key)
+        start = start + before if start < 0 else start
+        stop, step = start + 1, 1
+
+    if after != before:
+        return (range(stop + 1 if step < 0 else start, max(before, after)),)
+
+    return range(start, stop, step)
+
+
+def _tracking_nested(proxy, key, value):
+    """Returns `value` got as `key` from the object wrapped by `proxy`, passed
+    to `__wrapped_track__()` if it is a container and nested containers are
+    being tracked.
+    """
+
+    if not proxy._self_nested or isinstance(value, ObjectProxy):
+        return value
+
+    if not isinstance(value, (dict, list, set)):
+        return value
+
+    return proxy.__wrapped_track__(key, value)
+
+
+class _TrackingProxyBase(ObjectProxy):
+    """Base class for `TrackingProxy` recording the keys and attributes of the
+    wrapped object which are set or deleted through the proxy in
+    `_self_dirty`, along with the key or attribute a nested proxy was got from
+    in the proxy it was got from. `__wrapped_dirty__()` returns a copy of the
+    set and `__wrapped_reset_dirty__()` replaces the set with an empty one,
+    returning the set it replaced. Where `_self_nested` is true, dictionaries,
+    lists and sets got from the wrapped object are passed to
+    `__wrapped_track__()`, and methods named in `_self_mutating_methods` are
+    passed to `__wrapped_method__()`, both implemented by the derived class.
+    """
+
+    __slots__ = ("_self_dirty", "_self_nested", "_self_parent", "_self_key")
+
+    def __init__(self, wrapped):
+        super().__init__(wrapped)
+
+        self._self_dirty = set()
+        self._self_nested = False
+        self._self_parent = None
+        self._self_key = None
+
+    def __wrapped_record__(self, keys):
+        recorded = False
+
+        for key in keys:
+            with _tracking_lock:
+                self._self_dirty.add(key)
+
+            recorded = True
+
+        if recorded and self._self_parent is not None:
+            self._self_parent.__wrapped_record__((self._self_key,))
+
+    def __wrapped_dirty__(self):
+        with _tracking_lock:
+            return set(self._self_dirty)
+
+    def __wrapped_reset_dirty__(self):
+        with _tracking_lock:
+            dirty, self._self_dirty = self._self_dirty, set()
+
+        return dirty
+
+    def __getattr__(self, name):
+        value = super().__getattr__(name)
+
+        if not callable(value):
+            return _tracking_nested(self, name, value)
+
+        if name in getattr(type(self), "_self_mutating_methods", ()):
+            return self.__wrapped_method__(name, value)
+
+        return value
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        if name.startswith("_self_") or name == "__wrapped__":
+            return
+
+        if not hasattr(type(self), name):
+            self.__wrapped_record__((name,))
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+
+        if name.startswith("_self_") or hasattr(type(self), name):
+            return
+
+        self.__wrapped_record__((name,))
+
+    def __getitem__(self, key):
+        return _tracking_nested(self, key, self.__wrapped__[key])
+
+    def __setitem__(self, key, value):
+        wrapped = self.__wrapped__
+        before = len(wrapped) if isinstance(wrapped, (list, bytearray)) else None
+
+        wrapped[key] = value
+
+        self.__wrapped_record__(_tracking_item_keys(wrapped, key, before))
+
+    def __delitem__(self, key):
+        wrapped = self.__wrapped__
+        before = len(wrapped) if isinstance(wrapped, (list, bytearray)) else None
+
+        del wrapped[key]
+
+        self.__wrapped_record__(_tracking_item_keys(wrapped, key, before))
+
+
 class _FunctionWrapperBase(ObjectProxy):
 
     def __init__(
@@ -0,0 +1,269 @@
+import gc
+import threading
+import unittest
+import weakref
+
+import wrapt
+
+
+class Value:
+    def __init__(self, name):
+        self.name = name
+
+    def method(self):
+        return self.name
+
+
+class TestAtomicObjectProxy(unittest.TestCase):
+
+    def test_proxies_wrapped_object(self):
+        proxy = wrapt.AtomicObjectProxy(Value("one"))
+
+        self.assertIsInstance(proxy, wrapt.BaseObjectProxy)
+        self.assertIsInstance(proxy, Value)
+        self.assertEqual(proxy.name, "one")
+        self.assertEqual(proxy.method(), "one")
+
+    def test_assign_wrapped(self):
+        proxy = wrapt.AtomicObjectProxy(Value("one"))
+        proxy.__wrapped__ = Value("two")
+
+        self.assertEqual(proxy.name, "two")
+
+    def test_replaced_object_released(self):
+        value = Value("one")
+        ref = weakref.ref(value)
+
+        proxy = wrapt.AtomicObjectProxy(value)
+        del value
+
+        proxy.__wrapped__ = Value("two")
+        proxy.name
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_released_with_proxy(self):
+        value = Value("one")
+        ref = weakref.ref(value)
+
+        proxy = wrapt.AtomicObjectProxy(value)
+        del value
+        del proxy
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_inplace_operator(self):
+        proxy = wrapt.AtomicObjectProxy([1])
+        proxy += [2]
+
+        self.assertEqual(proxy, [1, 2])
+        self.assertIsInstance(proxy, wrapt.AtomicObjectProxy)
+
+    def test_concurrent_assign_and_read(self):
+        proxy = wrapt.AtomicObjectProxy(Value(0))
+        stop = threading.Event()
+        errors = []
+
+        def writer():
+            count = 0
+            while not stop.is_set():
+                count += 1
+                proxy.__wrapped__ = Value(count)
+
+        def reader():
+            try:
+                for _ in range(10000):
+                    self.assertIsInstance(proxy.__wrapped__, Value)
+                    proxy.method()
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        write = threading.Thread(target=writer)
+
+        write.start()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        stop.set()
+        write.join()
+
+        self.assertEqual(errors, [])
+
+
+class TestSwapWrapped(unittest.TestCase):
+
+    def test_swap_group(self):
+        first = wrapt.AtomicObjectProxy(Value("a1"))
+        second = wrapt.ObjectProxy(Value("b1"))
+
+        replaced = wrapt.swap_wrapped([(first, Value("a2")), (second, Value("b2"))])
+
+        self.assertEqual([value.name for value in replaced], ["a1", "b1"])
+        self.assertEqual(first.name, "a2")
+        self.assertEqual(second.name, "b2")
+
+    def test_snapshot(self):
+        first = wrapt.AtomicObjectProxy(Value("a"))
+        second = wrapt.AtomicObjectProxy(Value("b"))
+
+        a, b = wrapt.snapshot_wrapped(first, second)
+
+        self.assertIs(a, first.__wrapped__)
+        self.assertIs(b, second.__wrapped__)
+
+    def test_snapshot_consistent_with_swaps(self):
+        first = wrapt.AtomicObjectProxy(0)
+        second = wrapt.AtomicObjectProxy(0)
+        stop = threading.Event()
+
+        def writer():
+            count = 0
+            while not stop.is_set():
+                count += 1
+                wrapt.swap_wrapped([(first, count), (second, count)])
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+
+        try:
+            for _ in range(10000):
+                a, b = wrapt.snapshot_wrapped(first, second)
+                self.assertEqual(a, b)
+
+        finally:
+            stop.set()
+            thread.join()
+
+    def test_swap_calls_fixups(self):
+        calls = []
+
+        class Proxy(wrapt.AtomicObjectProxy):
+            def __wrapped_setattr_fixups__(self):
+                calls.append(self.__wrapped__)
+
+        proxy = Proxy(1)
+        wrapt.swap_wrapped([(proxy, 2)])
+
+        self.assertEqual(calls, [2])
+
+    def test_swap_rejects_non_proxy(self):
+        proxy = wrapt.AtomicObjectProxy(1)
+
+        with self.assertRaises(TypeError):
+            wrapt.swap_wrapped([(proxy, 2), (object(), 3)])
+
+        # Nothing is swapped if any entry is invalid.
+
+        self.assertEqual(proxy, 1)
+
+    def test_swap_rolled_back_on_failure(self):
+        # The pure Python implementation assigns through __setattr__, which
+        # can fail part way through a group.
+
+        class Proxy(wrapt.wrappers.AtomicObjectProxy):
+            def __setattr__(self, name, value):
+                if name == "__wrapped__" and value == "bad":
+                    object.__setattr__(self, name, value)
+                    raise RuntimeError("failed")
+
+                super().__setattr__(name, value)
+
+        first = Proxy("a1")
+        second = Proxy("b1")
+        third = Proxy("c1")
+
+        with self.assertRaises(RuntimeError):
+            wrapt.wrappers.swap_wrapped([(first, "a2"), (second, "bad"), (third, "c2")])
+
+        self.assertEqual(
+            wrapt.wrappers.snapshot_wrapped(first, second, third), ("a1", "b1", "c1")
+        )
+
+    def _check_swap_rolled_back_on_fixup_failure(self, module):
+        fixed = []
+
+        class Proxy(module.AtomicObjectProxy):
+            def __wrapped_setattr_fixups__(self):
+                if self.__wrapped__ == "bad":
+                    raise RuntimeError("failed")
+
+                fixed.append(self.__wrapped__)
+
+        first = Proxy("a1")
+        second = Proxy("b1")
+        third = Proxy("c1")
+
+        del fixed[:]
+
+        with self.assertRaises(RuntimeError):
+            module.swap_wrapped([(first, "a2"), (second, "bad"), (third, "c2")])
+
+        self.assertEqual(
+            module.snapshot_wrapped(first, second, third), ("a1", "b1", "c1")
+        )
+
+        # The fixup hooks which were called for the new wrapped objects are
+        # called again for the restored ones.
+
+        self.assertEqual(fixed[0], "a2")
+        self.assertEqual(sorted(fixed[1:]), ["a1", "b1"])
+
+    def test_swap_rolled_back_on_fixup_failure(self):
+        self._check_swap_rolled_back_on_fixup_failure(wrapt)
+
+    def test_swap_rolled_back_on_fixup_failure_python(self):
+        self._check_swap_rolled_back_on_fixup_failure(wrapt.wrappers)
+
+    def test_retired_objects_released_during_reads(self):
+        proxy = wrapt.AtomicObjectProxy(Value("initial"))
+        references = []
+
+        stop = threading.Event()
+
+        def _reader():
+            while not stop.is_set():
+                proxy.name
+
+        threads = [threading.Thread(target=_reader) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            for i in range(1000):
+                value = Value(i)
+                references.append(weakref.ref(value))
+                proxy.__wrapped__ = value
+                del value
+
+        finally:
+            stop.set()
+
+            for thread in threads:
+                thread.join()
+
+        # Replaced objects are released even though reads overlapped the
+        # whole time, rather than accumulating until reads stop.
+
+        alive = sum(1 for reference in references[:-1] if reference() is not None)
+
+        self.assertLess(alive, 100)
+
+    def test_swap_rejects_bad_pair(self):
+        with self.assertRaises(ValueError):
+            wrapt.swap_wrapped([(wrapt.AtomicObjectProxy(1),)])
+
+    def test_snapshot_rejects_non_proxy(self):
+        with self.assertRaises(TypeError):
+            wrapt.snapshot_wrapped(object())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -461,3 +461,92 @@ class TestAutoObjectProxyReassignment(unittest.TestCase):
         self.assertTrue(hasattr(proxy, "__set_name__"))
         proxy.__wrapped__ = object()
         self.assertFalse(hasattr(proxy, "__set_name__"))
+
+
+class TestAutoObjectProxyCapabilities(unittest.TestCase):
+
+    def test_capabilities_cached_per_type(self):
+        from wrapt.proxies import _auto_proxy_capabilities
+
+        class Callable:
+            def __call__(self):
+                pass
+
+        first = _auto_proxy_capabilities(Callable)
+
+        self.assertEqual(first, {"__call__"})
+        self.assertIs(_auto_proxy_capabilities(Callable), first)
+
+    def test_capabilities_from_type_not_instance(self):
+        # A class defining __get__ for its instances is not itself a
+        # descriptor, so a proxy wrapping the class must not be one either.
+
+        class Descriptor:
+            def __get__(self, instance, owner):
+                return 42
+
+        class Owner:
+            attr = wrapt.AutoObjectProxy(Descriptor)
+
+        self.assertIs(Owner.attr.__wrapped__, Descriptor)
+        self.assertIs(Owner().attr.__wrapped__, Descriptor)
+
+    def test_set_without_delete(self):
+        class Descriptor:
+            def __get__(self, instance, owner):
+                return 1
+
+            def __set__(self, instance, value):
+                pass
+
+        proxy = wrapt.AutoObjectProxy(Descriptor())
+
+        self.assertTrue(hasattr(type(proxy), "__set__"))
+        self.assertFalse(hasattr(type(proxy), "__delete__"))
+
+    def test_delete_without_set(self):
+        class Descriptor:
+            def __get__(self, instance, owner):
+                return 1
+
+            def __delete__(self, instance):
+                pass
+
+        proxy = wrapt.AutoObjectProxy(Descriptor())
+
+        self.assertFalse(hasattr(type(proxy), "__set__"))
+        self.assertTrue(hasattr(type(proxy), "__delete__"))
+
+    def test_generator_exhausted(self):
+        def generator():
+            yield 1
+            yield 2
+
+        proxy = wrapt.AutoObjectProxy(generator())
+
+        self.assertEqual(list(proxy), [1, 2])
+        self.assertRaises(StopIteration, next, proxy)
+
+    def test_subclass_method_not_replaced(self):
+        class Proxy(wrapt.AutoObjectProxy):
+            def __call__(self, *args):
+                return "proxy"
+
+        proxy = Proxy(lambda: "wrapped")
+
+        self.assertEqual(proxy(), "proxy")
+
+        proxy.__wrapped__ = lambda: "replaced"
+
+        self.assertEqual(proxy(), "proxy")
+
+    def test_instances_do_not_share_class(self):
+        first = wrapt.AutoObjectProxy(len)
+        second = wrapt.AutoObjectProxy(len)
+
+        self.assertIsNot(type(first), type(second))
+
+        first.__wrapped__ = object()
+
+        self.assertFalse(callable(first))
+        self.assertTrue(callable(second))
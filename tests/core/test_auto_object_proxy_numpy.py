@@ -0,0 +1,203 @@
+import unittest
+
+import wrapt
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DuckArray:
+    # Implements the NumPy dispatch protocols without supporting conversion
+    # to an array, so results are only correct if dispatch reaches it.
+
+    def __init__(self, values):
+        self.values = values
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = [i.values if isinstance(i, DuckArray) else i for i in inputs]
+        return DuckArray(getattr(ufunc, method)(*inputs, **kwargs))
+
+    def __array_function__(self, func, types, args, kwargs):
+        return ("dispatched", func.__name__, types)
+
+
+class Ufunc:
+    # Stands in for a NumPy ufunc, returning the arguments it was called
+    # with so that the unwrapping of proxies can be checked.
+
+    def __call__(self, *inputs, **kwargs):
+        return ("__call__", inputs, kwargs)
+
+    def reduce(self, *inputs, **kwargs):
+        return ("reduce", inputs, kwargs)
+
+
+class TestAutoObjectProxyArrayProtocols(unittest.TestCase):
+
+    def test_not_added_for_other_objects(self):
+        proxy = wrapt.AutoObjectProxy([1, 2, 3])
+
+        self.assertFalse(hasattr(type(proxy), "__array_ufunc__"))
+        self.assertFalse(hasattr(type(proxy), "__array_function__"))
+
+        base = wrapt.BaseObjectProxy(DuckArray([1, 2, 3]))
+
+        self.assertFalse(hasattr(type(base), "__array_ufunc__"))
+        self.assertFalse(hasattr(type(base), "__array_function__"))
+
+    def test_added_for_duck_array(self):
+        proxy = wrapt.AutoObjectProxy(DuckArray([1, 2, 3]))
+
+        self.assertTrue(hasattr(type(proxy), "__array_ufunc__"))
+        self.assertTrue(hasattr(type(proxy), "__array_function__"))
+
+    def test_array_ufunc_unwraps_arguments(self):
+        instance = DuckArray([1, 2, 3])
+        other = DuckArray([4, 5, 6])
+
+        proxy = wrapt.AutoObjectProxy(instance)
+
+        result = proxy.__array_ufunc__(
+            Ufunc(), "__call__", proxy, wrapt.ObjectProxy(other), 1
+        )
+
+        self.assertEqual(result, ("__call__", (instance, other, 1), {}))
+
+        result = proxy.__array_ufunc__(Ufunc(), "reduce", proxy, out=(proxy,))
+
+        self.assertEqual(result, ("reduce", (instance,), {"out": (instance,)}))
+
+    def test_array_function_unwraps_arguments(self):
+        instance = DuckArray([1, 2, 3])
+
+        proxy = wrapt.AutoObjectProxy(instance)
+
+        def function(*args, **kwargs):
+            return args, kwargs
+
+        result = proxy.__array_function__(
+            function, (type(proxy),), ([proxy, proxy], 0), {"out": proxy}
+        )
+
+        self.assertEqual(result, (([instance, instance], 0), {"out": instance}))
+
+    def test_array_result(self):
+        class ResultProxy(wrapt.AutoObjectProxy):
+            def __wrapped_array_result__(self, result):
+                return ResultProxy(result)
+
+        proxy = ResultProxy(DuckArray([1, 2, 3]))
+
+        result = proxy.__array_ufunc__(Ufunc(), "__call__", proxy)
+
+        self.assertIsInstance(result, ResultProxy)
+        self.assertEqual(result.__wrapped__[0], "__call__")
+
+    def test_wrapped_replaced(self):
+        proxy = wrapt.AutoObjectProxy([1, 2, 3])
+
+        self.assertFalse(hasattr(type(proxy), "__array_ufunc__"))
+
+        proxy.__wrapped__ = DuckArray([1, 2, 3])
+
+        self.assertTrue(hasattr(type(proxy), "__array_ufunc__"))
+
+    def test_lazy_interface(self):
+        proxy = wrapt.LazyObjectProxy(lambda: DuckArray([1, 2, 3]), interface=DuckArray)
+
+        self.assertTrue(hasattr(type(proxy), "__array_ufunc__"))
+        self.assertTrue(hasattr(type(proxy), "__array_function__"))
+
+
+@unittest.skipIf(numpy is None, "requires numpy")
+class TestAutoObjectProxyNumpy(unittest.TestCase):
+
+    def test_ufunc(self):
+        instance = numpy.arange(5)
+
+        proxy = wrapt.AutoObjectProxy(instance)
+
+        result = numpy.add(proxy, 1)
+
+        self.assertIs(type(result), numpy.ndarray)
+        self.assertEqual(result.tolist(), [1, 2, 3, 4, 5])
+
+        result = instance + proxy
+
+        self.assertIs(type(result), numpy.ndarray)
+        self.assertEqual(result.tolist(), [0, 2, 4, 6, 8])
+
+    def test_ufunc_methods(self):
+        proxy = wrapt.AutoObjectProxy(numpy.arange(5))
+
+        self.assertEqual(numpy.add.reduce(proxy), 10)
+        self.assertEqual(numpy.add.accumulate(proxy).tolist(), [0, 1, 3, 6, 10])
+
+    def test_ufunc_out(self):
+        instance = numpy.zeros(5)
+
+        numpy.add(numpy.arange(5), 1, out=wrapt.AutoObjectProxy(instance))
+
+        self.assertEqual(instance.tolist(), [1, 2, 3, 4, 5])
+
+    def test_array_function(self):
+        proxy = wrapt.AutoObjectProxy(numpy.arange(3))
+
+        result = numpy.concatenate([proxy, proxy])
+
+        self.assertIs(type(result), numpy.ndarray)
+        self.assertEqual(result.tolist(), [0, 1, 2, 0, 1, 2])
+
+        self.assertEqual(numpy.sum(proxy), 3)
+
+    def test_asarray_shares_memory(self):
+        # Conversion uses __array_interface__ or __array__(), which NumPy
+        # looks up on the instance, so this works for any proxy.
+
+        instance = numpy.arange(5)
+
+        for proxy in (wrapt.ObjectProxy(instance), wrapt.AutoObjectProxy(instance)):
+            self.assertTrue(numpy.shares_memory(numpy.asarray(proxy), instance))
+
+    def test_duck_array(self):
+        proxy = wrapt.AutoObjectProxy(DuckArray(numpy.arange(3)))
+
+        result = numpy.add(proxy, 1)
+
+        self.assertIsInstance(result, DuckArray)
+        self.assertEqual(result.values.tolist(), [1, 2, 3])
+
+        result = numpy.concatenate([proxy, proxy])
+
+        self.assertEqual(result, ("dispatched", "concatenate", (DuckArray,)))
+
+    def test_masked_array(self):
+        instance = numpy.ma.masked_array([1, 2, 3], mask=[False, True, False])
+
+        result = numpy.add(wrapt.AutoObjectProxy(instance), 1)
+
+        self.assertIsInstance(result, numpy.ma.MaskedArray)
+        self.assertEqual(result.mask.tolist(), [False, True, False])
+
+    def test_array_result(self):
+        class ArrayProxy(wrapt.AutoObjectProxy):
+            def __wrapped_array_result__(self, result):
+                if isinstance(result, numpy.ndarray):
+                    return ArrayProxy(result)
+                return result
+
+        proxy = ArrayProxy(numpy.arange(3))
+
+        result = numpy.multiply(proxy, 2)
+
+        self.assertIsInstance(result, ArrayProxy)
+        self.assertEqual(result.tolist(), [0, 2, 4])
+
+        self.assertIsInstance(numpy.concatenate([proxy, proxy]), ArrayProxy)
+        self.assertNotIsInstance(numpy.sum(proxy), ArrayProxy)
+
+
+if __name__ == "__main__":
+    unittest.main()
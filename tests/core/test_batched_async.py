@@ -0,0 +1,249 @@
+import asyncio
+import inspect
+import unittest
+
+import wrapt
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestBatchedAsync(unittest.TestCase):
+
+    def test_calls_in_same_tick_are_batched(self):
+        calls = []
+
+        @wrapt.batched_async
+        async def load(keys):
+            calls.append(keys)
+            return [key * 10 for key in keys]
+
+        self.assertTrue(inspect.iscoroutinefunction(load))
+
+        async def main():
+            return await asyncio.gather(load(1), load(2), load(3))
+
+        self.assertEqual(_run(main()), [10, 20, 30])
+        self.assertEqual(calls, [[1, 2, 3]])
+
+    def test_separate_ticks_are_separate_batches(self):
+        calls = []
+
+        @wrapt.batched_async
+        async def load(keys):
+            calls.append(keys)
+            return keys
+
+        async def main():
+            first = await load(1)
+            second = await load(2)
+            return first, second
+
+        self.assertEqual(_run(main()), (1, 2))
+        self.assertEqual(calls, [[1], [2]])
+
+    def test_max_delay_collects_across_ticks(self):
+        calls = []
+
+        @wrapt.batched_async(max_delay=0.05)
+        async def load(keys):
+            calls.append(keys)
+            return keys
+
+        async def delayed(key, delay):
+            await asyncio.sleep(delay)
+            return await load(key)
+
+        async def main():
+            return await asyncio.gather(delayed(1, 0), delayed(2, 0.01))
+
+        self.assertEqual(_run(main()), [1, 2])
+        self.assertEqual(calls, [[1, 2]])
+
+    def test_max_batch_splits_batches(self):
+        calls = []
+
+        @wrapt.batched_async(max_batch=2)
+        async def load(keys):
+            calls.append(keys)
+            return keys
+
+        async def main():
+            return await asyncio.gather(*(load(i) for i in range(5)))
+
+        self.assertEqual(_run(main()), [0, 1, 2, 3, 4])
+        self.assertEqual(calls, [[0, 1], [2, 3], [4]])
+
+    def test_duplicate_keys_deduplicated(self):
+        calls = []
+
+        @wrapt.batched_async
+        async def load(keys):
+            calls.append(keys)
+            return [key.upper() for key in keys]
+
+        async def main():
+            return await asyncio.gather(load("a"), load("b"), load("a"))
+
+        self.assertEqual(_run(main()), ["A", "B", "A"])
+        self.assertEqual(calls, [["a", "b"]])
+
+    def test_mapping_result(self):
+        @wrapt.batched_async
+        async def load(keys):
+            return {key: key + 1 for key in keys if key != 2}
+
+        async def main():
+            return await asyncio.gather(
+                load(1), load(2), load(3), return_exceptions=True
+            )
+
+        one, two, three = _run(main())
+        self.assertEqual(one, 2)
+        self.assertIsInstance(two, KeyError)
+        self.assertEqual(three, 4)
+
+    def test_per_key_errors(self):
+        @wrapt.batched_async
+        async def load(keys):
+            return [ValueError(key) if key < 0 else key for key in keys]
+
+        async def main():
+            return await asyncio.gather(load(1), load(-1), return_exceptions=True)
+
+        good, bad = _run(main())
+        self.assertEqual(good, 1)
+        self.assertIsInstance(bad, ValueError)
+
+    def test_batch_error_raised_for_all_keys(self):
+        @wrapt.batched_async
+        async def load(keys):
+            raise RuntimeError("backend down")
+
+        async def main():
+            return await asyncio.gather(load(1), load(2), return_exceptions=True)
+
+        results = _run(main())
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_result_length_mismatch(self):
+        @wrapt.batched_async
+        async def load(keys):
+            return []
+
+        with self.assertRaises(ValueError):
+            _run(load(1))
+
+    def test_result_not_iterable(self):
+        @wrapt.batched_async
+        async def load(keys):
+            return None
+
+        async def main():
+            return await asyncio.gather(load(1), load(2), return_exceptions=True)
+
+        results = _run(main())
+        self.assertTrue(all(isinstance(r, TypeError) for r in results))
+
+    def test_batches_per_instance(self):
+        calls = []
+
+        class Repository:
+            def __init__(self, name):
+                self.name = name
+
+            @wrapt.batched_async
+            async def load(self, keys):
+                calls.append((self.name, keys))
+                return [(self.name, key) for key in keys]
+
+        r1 = Repository("r1")
+        r2 = Repository("r2")
+
+        async def main():
+            return await asyncio.gather(r1.load(1), r2.load(2), r1.load(3))
+
+        self.assertEqual(_run(main()), [("r1", 1), ("r2", 2), ("r1", 3)])
+        self.assertEqual(sorted(calls), [("r1", [1, 3]), ("r2", [2])])
+
+    def test_requires_single_key(self):
+        @wrapt.batched_async
+        async def load(keys):
+            return keys
+
+        with self.assertRaises(TypeError):
+            _run(load(1, 2))
+
+    def test_cancelled_caller_does_not_affect_others(self):
+        @wrapt.batched_async(max_delay=0.02)
+        async def load(keys):
+            return keys
+
+        async def main():
+            first = asyncio.ensure_future(load(1))
+            second = asyncio.ensure_future(load(1))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(_run(main()), 1)
+
+    def test_batch_cancelled_resolves_callers(self):
+        @wrapt.batched_async
+        async def load(keys):
+            raise asyncio.CancelledError()
+
+        async def main():
+            return await asyncio.wait_for(
+                asyncio.gather(load(1), load(2), return_exceptions=True), 5
+            )
+
+        results = _run(main())
+        self.assertTrue(
+            all(isinstance(r, asyncio.CancelledError) for r in results), results
+        )
+
+    def test_dispatch_cancelled_resolves_callers(self):
+        started = []
+
+        @wrapt.batched_async
+        async def load(keys):
+            started.append(asyncio.current_task())
+            await asyncio.sleep(10)
+
+        async def main():
+            waiter = asyncio.ensure_future(load(1))
+
+            while not started:
+                await asyncio.sleep(0)
+
+            started[0].cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(waiter, 5)
+
+        _run(main())
+
+    def test_unhashable_key(self):
+        calls = []
+
+        @wrapt.batched_async
+        async def load(keys):
+            calls.append(keys)
+            return keys
+
+        async def main():
+            with self.assertRaises(TypeError):
+                await load([1])
+
+            await asyncio.sleep(0.01)
+
+            return await load(1)
+
+        self.assertEqual(_run(main()), 1)
+        self.assertEqual(calls, [[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
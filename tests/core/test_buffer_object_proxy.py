@@ -0,0 +1,182 @@
+import array
+import hashlib
+import io
+import mmap
+import socket
+import sys
+import unittest
+
+import wrapt
+import wrapt.__wrapt__
+
+# The pure Python implementation can only participate in the buffer
+# protocol on Python 3.12+, using __buffer__() and __release_buffer__().
+
+USING_C_EXTENSION = wrapt.__wrapt__._using_c_extension
+
+BUFFER_PROTOCOL_SUPPORTED = USING_C_EXTENSION or sys.version_info >= (3, 12)
+
+
+@unittest.skipUnless(BUFFER_PROTOCOL_SUPPORTED, "requires buffer protocol support")
+class TestBufferObjectProxy(unittest.TestCase):
+
+    def test_memoryview_bytes(self):
+        instance = b"data"
+
+        proxy = wrapt.BufferObjectProxy(instance)
+
+        view = memoryview(proxy)
+
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.tobytes(), instance)
+
+        if USING_C_EXTENSION:
+            # The view is exported directly by the wrapped object.
+
+            self.assertIs(view.obj, instance)
+
+    def test_memoryview_bytearray_writable(self):
+        instance = bytearray(b"data")
+
+        proxy = wrapt.BufferObjectProxy(instance)
+
+        with memoryview(proxy) as view:
+            self.assertFalse(view.readonly)
+
+            view[0] = ord("D")
+
+        self.assertEqual(instance, bytearray(b"Data"))
+
+    def test_memoryview_array(self):
+        instance = array.array("i", [1, 2, 3])
+
+        proxy = wrapt.BufferObjectProxy(instance)
+
+        with memoryview(proxy) as view:
+            self.assertEqual(view.format, "i")
+            self.assertEqual(view.tolist(), [1, 2, 3])
+
+    def test_memoryview_mmap(self):
+        instance = mmap.mmap(-1, 16)
+
+        try:
+            proxy = wrapt.BufferObjectProxy(instance)
+
+            with memoryview(proxy) as view:
+                view[:4] = b"data"
+
+            self.assertEqual(instance[:4], b"data")
+
+        finally:
+            instance.close()
+
+    def test_view_locks_exporter(self):
+        # While a view is outstanding the bytearray cannot be resized,
+        # and once it is released through the proxy it can be again.
+
+        instance = bytearray(b"data")
+
+        proxy = wrapt.BufferObjectProxy(instance)
+
+        view = memoryview(proxy)
+
+        self.assertRaises(BufferError, instance.append, ord("!"))
+
+        view.release()
+
+        instance.append(ord("!"))
+
+        self.assertEqual(instance, bytearray(b"data!"))
+
+    def test_readonly_writable_request(self):
+        proxy = wrapt.BufferObjectProxy(b"data")
+
+        # Reading into a buffer requires a writable buffer.
+
+        self.assertRaises(TypeError, io.BytesIO(b"next").readinto, proxy)
+
+    def test_buffer_consumers(self):
+        instance = bytearray(b"data")
+
+        proxy = wrapt.BufferObjectProxy(instance)
+
+        self.assertEqual(bytes(proxy), b"data")
+        self.assertEqual(bytearray(proxy), instance)
+        self.assertEqual(b"".join([proxy, proxy]), b"datadata")
+        self.assertEqual(
+            hashlib.sha256(proxy).hexdigest(),
+            hashlib.sha256(instance).hexdigest(),
+        )
+
+    def test_socket_sendall(self):
+        instance = bytearray(b"x" * 100000)
+
+        proxy = wrapt.BufferObjectProxy(instance)
+
+        reader, writer = socket.socketpair()
+
+        try:
+            received = bytearray()
+
+            writer.setblocking(False)
+
+            remaining = memoryview(proxy)
+
+            while remaining or len(received) < len(instance):
+                if remaining:
+                    try:
+                        sent = writer.send(remaining)
+                        remaining = remaining[sent:]
+                    except BlockingIOError:
+                        pass
+
+                received += reader.recv(65536)
+
+            self.assertEqual(received, instance)
+
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_wrapped_non_buffer(self):
+        proxy = wrapt.BufferObjectProxy([1, 2, 3])
+
+        self.assertRaises(TypeError, memoryview, proxy)
+
+    def test_wrapped_replaced(self):
+        proxy = wrapt.BufferObjectProxy(b"first")
+
+        proxy.__wrapped__ = b"second"
+
+        self.assertEqual(memoryview(proxy).tobytes(), b"second")
+
+    def test_uninitialized(self):
+        proxy = wrapt.BufferObjectProxy.__new__(wrapt.BufferObjectProxy, None)
+
+        self.assertRaises(AttributeError, memoryview, proxy)
+
+    def test_subclass(self):
+        class Proxy(wrapt.BufferObjectProxy):
+            pass
+
+        proxy = Proxy(b"data")
+
+        self.assertEqual(memoryview(proxy).tobytes(), b"data")
+
+    @unittest.skipIf(sys.version_info < (3, 12), "requires Python 3.12+")
+    def test_isinstance_buffer(self):
+        import collections.abc
+
+        proxy = wrapt.BufferObjectProxy(b"data")
+
+        self.assertTrue(isinstance(proxy, collections.abc.Buffer))
+        self.assertTrue(issubclass(wrapt.BufferObjectProxy, collections.abc.Buffer))
+
+    def test_base_proxy_not_buffer(self):
+        # The buffer protocol is only provided by the dedicated proxy.
+
+        self.assertRaises(TypeError, memoryview, wrapt.ObjectProxy(b"data"))
+
+
+if __name__ == "__main__":
+    unittest.main()
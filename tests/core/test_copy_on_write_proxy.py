@@ -0,0 +1,374 @@
+import collections
+import threading
+import unittest
+
+import wrapt
+
+
+class Object:
+    pass
+
+
+class TestCopyOnWriteProxy(unittest.TestCase):
+
+    def test_reads_are_shared(self):
+        shared = {"a": 1, "b": [1, 2]}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        self.assertEqual(proxy["a"], 1)
+        self.assertEqual(proxy.get("a"), 1)
+        self.assertEqual(list(proxy.keys()), ["a", "b"])
+        self.assertEqual(len(proxy), 2)
+        self.assertIn("b", proxy)
+        self.assertEqual(proxy, shared)
+
+        self.assertIs(proxy.__wrapped__, shared)
+
+    def test_setitem(self):
+        shared = {"a": 1}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        proxy["a"] = 2
+
+        self.assertEqual(proxy["a"], 2)
+        self.assertEqual(shared, {"a": 1})
+        self.assertIsNot(proxy.__wrapped__, shared)
+
+    def test_delitem(self):
+        shared = {"a": 1, "b": 2}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        del proxy["a"]
+
+        self.assertEqual(proxy, {"b": 2})
+        self.assertEqual(shared, {"a": 1, "b": 2})
+
+    def test_copied_once(self):
+        shared = {"a": 1}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        proxy["b"] = 2
+
+        private = proxy.__wrapped__
+
+        proxy["c"] = 3
+        proxy.update(d=4)
+        del proxy["a"]
+
+        self.assertIs(proxy.__wrapped__, private)
+        self.assertEqual(proxy, {"b": 2, "c": 3, "d": 4})
+
+    def test_other_proxies_unaffected(self):
+        shared = {"a": 1}
+
+        first = wrapt.CopyOnWriteProxy(shared)
+        second = wrapt.CopyOnWriteProxy(shared)
+
+        first["a"] = 2
+
+        self.assertEqual(second["a"], 1)
+        self.assertIs(second.__wrapped__, shared)
+
+    def test_mutating_methods(self):
+        values = [3, 1, 2]
+
+        proxy = wrapt.CopyOnWriteProxy(values)
+
+        proxy.append(4)
+        proxy.sort()
+
+        self.assertEqual(proxy, [1, 2, 3, 4])
+        self.assertEqual(values, [3, 1, 2])
+
+        members = {1}
+
+        proxy = wrapt.CopyOnWriteProxy(members)
+
+        proxy.add(2)
+
+        self.assertEqual(proxy, {1, 2})
+        self.assertEqual(members, {1})
+
+        items = collections.deque([1, 2])
+
+        proxy = wrapt.CopyOnWriteProxy(items)
+
+        proxy.appendleft(0)
+
+        self.assertEqual(list(proxy), [0, 1, 2])
+        self.assertEqual(list(items), [1, 2])
+
+    def test_non_mutating_methods(self):
+        values = [1, 2, 3]
+
+        proxy = wrapt.CopyOnWriteProxy(values)
+
+        self.assertEqual(proxy.index(2), 1)
+        self.assertEqual(proxy.count(2), 1)
+        self.assertEqual(proxy.copy(), values)
+
+        self.assertIs(proxy.__wrapped__, values)
+
+    def test_missing_mutating_method(self):
+        shared = {"a": 1}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        self.assertRaises(AttributeError, getattr, proxy, "append")
+
+        self.assertIs(proxy.__wrapped__, shared)
+
+    def test_custom_mutating_methods(self):
+        class Counter:
+            def __init__(self):
+                self.count = 0
+
+            def increment(self):
+                self.count += 1
+
+        class CounterProxy(wrapt.CopyOnWriteProxy):
+            _self_mutating_methods = wrapt.CopyOnWriteProxy._self_mutating_methods | {
+                "increment"
+            }
+
+        counter = Counter()
+
+        proxy = CounterProxy(counter)
+
+        proxy.increment()
+
+        self.assertEqual(proxy.count, 1)
+        self.assertEqual(counter.count, 0)
+
+    def test_inplace_operators(self):
+        values = [1]
+
+        proxy = wrapt.CopyOnWriteProxy(values)
+
+        proxy += [2]
+
+        self.assertIsInstance(proxy, wrapt.CopyOnWriteProxy)
+        self.assertEqual(proxy, [1, 2])
+        self.assertEqual(values, [1])
+
+        private = proxy.__wrapped__
+
+        proxy *= 2
+
+        self.assertIs(proxy.__wrapped__, private)
+        self.assertEqual(proxy, [1, 2, 1, 2])
+
+        shared = {"a": 1}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        proxy |= {"b": 2}
+
+        self.assertEqual(proxy, {"a": 1, "b": 2})
+        self.assertEqual(shared, {"a": 1})
+
+    def test_inplace_operators_immutable(self):
+        proxy = wrapt.CopyOnWriteProxy(1)
+
+        proxy += 1
+
+        self.assertEqual(proxy, 2)
+
+    def test_setattr(self):
+        shared = Object()
+        shared.value = 1
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        proxy.value = 2
+
+        self.assertEqual(proxy.value, 2)
+        self.assertEqual(shared.value, 1)
+
+    def test_delattr(self):
+        shared = Object()
+        shared.value = 1
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        del proxy.value
+
+        self.assertFalse(hasattr(proxy, "value"))
+        self.assertEqual(shared.value, 1)
+
+    def test_self_attributes_not_mutation(self):
+        class Proxy(wrapt.CopyOnWriteProxy):
+            pass
+
+        shared = Object()
+
+        proxy = Proxy(shared)
+
+        proxy._self_value = 1
+
+        self.assertIs(proxy.__wrapped__, shared)
+        self.assertFalse(hasattr(shared, "_self_value"))
+
+    def test_shallow_copy(self):
+        shared = {"nested": {"a": 1}}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        proxy["other"] = 1
+
+        self.assertIs(proxy["nested"], shared["nested"])
+
+    def test_depth(self):
+        shared = {"nested": {"inner": {"a": 1}}, "values": [[1]]}
+
+        proxy = wrapt.CopyOnWriteProxy(shared, depth=2)
+
+        # Getting a nested dictionary is treated as a mutation.
+
+        proxy["nested"]["b"] = 2
+
+        self.assertEqual(shared["nested"], {"inner": {"a": 1}})
+        self.assertEqual(proxy["nested"], {"inner": {"a": 1}, "b": 2})
+
+        self.assertIsNot(proxy["values"], shared["values"])
+        self.assertIs(proxy["values"][0], shared["values"][0])
+        self.assertIs(proxy["nested"]["inner"], shared["nested"]["inner"])
+
+    def test_depth_attribute(self):
+        shared = Object()
+        shared.settings = {"a": 1}
+        shared.name = "shared"
+
+        proxy = wrapt.CopyOnWriteProxy(shared, depth=2)
+
+        self.assertEqual(proxy.name, "shared")
+        self.assertIs(proxy.__wrapped__, shared)
+
+        # Getting a nested dictionary as an attribute is also a mutation.
+
+        proxy.settings["b"] = 2
+
+        self.assertEqual(shared.settings, {"a": 1})
+        self.assertEqual(proxy.settings, {"a": 1, "b": 2})
+
+    def test_depth_attribute_of_function(self):
+        def shared():
+            pass
+
+        shared.settings = {"a": 1}
+
+        proxy = wrapt.CopyOnWriteProxy(shared, depth=2)
+
+        # Functions are not copied by copy.copy(), so the attributes of the
+        # original must not be replaced.
+
+        proxy.__wrapped_copy_on_write__()
+
+        self.assertEqual(shared.settings, {"a": 1})
+
+    def test_depth_scalar_read(self):
+        shared = {"a": 1, "nested": {}}
+
+        proxy = wrapt.CopyOnWriteProxy(shared, depth=2)
+
+        self.assertEqual(proxy["a"], 1)
+
+        self.assertIs(proxy.__wrapped__, shared)
+
+    def test_deep_copy(self):
+        shared = {"nested": {"inner": {"a": [1]}}}
+
+        proxy = wrapt.CopyOnWriteProxy(shared, depth=None)
+
+        proxy["nested"]["inner"]["a"].append(2)
+
+        self.assertEqual(shared, {"nested": {"inner": {"a": [1]}}})
+        self.assertEqual(proxy["nested"]["inner"]["a"], [1, 2])
+
+    def test_invalid_depth(self):
+        self.assertRaises(ValueError, wrapt.CopyOnWriteProxy, {}, depth=0)
+
+    def test_wrapped_replaced(self):
+        proxy = wrapt.CopyOnWriteProxy({"a": 1})
+
+        proxy["a"] = 2
+
+        replacement = {"a": 3}
+
+        proxy.__wrapped__ = replacement
+
+        proxy["a"] = 4
+
+        self.assertEqual(replacement, {"a": 3})
+        self.assertEqual(proxy["a"], 4)
+
+    def test_isinstance(self):
+        proxy = wrapt.CopyOnWriteProxy({})
+
+        self.assertIsInstance(proxy, dict)
+        self.assertIsInstance(proxy, wrapt.CopyOnWriteProxy)
+
+    def test_concurrent_mutation(self):
+        shared = {}
+
+        proxy = wrapt.CopyOnWriteProxy(shared)
+
+        barrier = threading.Barrier(8)
+
+        def worker(index):
+            barrier.wait()
+            proxy[index] = index
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(proxy, {i: i for i in range(8)})
+        self.assertEqual(shared, {})
+
+    def test_copy_lock_per_proxy(self):
+        # Making the private copy for one proxy does not block doing the
+        # same for another proxy.
+
+        copying = threading.Event()
+        release = threading.Event()
+
+        class Slow(dict):
+            def __copy__(self):
+                copying.set()
+                release.wait(5)
+                return Slow(self)
+
+        slow = wrapt.CopyOnWriteProxy(Slow())
+        other = wrapt.CopyOnWriteProxy({})
+
+        thread = threading.Thread(target=slow.__setitem__, args=("a", 1))
+        thread.start()
+
+        try:
+            self.assertTrue(copying.wait(5))
+
+            other["a"] = 1
+
+            self.assertFalse(release.is_set())
+
+        finally:
+            release.set()
+            thread.join()
+
+        self.assertEqual(slow, {"a": 1})
+        self.assertEqual(other, {"a": 1})
+
+    def test_inplace_operator_name(self):
+        self.assertEqual(wrapt.CopyOnWriteProxy.__ior__.__name__, "__ior__")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+import os
+import sys
+import threading
+import unittest
+
+import wrapt
+import wrapt.importer
+import wrapt.synchronization
+
+_has_fork = hasattr(os, "fork") and hasattr(os, "register_at_fork")
+
+
+def _run_in_child(func):
+    # Run func in a forked child process, returning the exit status. The
+    # child exits with 0 if func returns true, 1 if it returns false and 2
+    # if it raises an exception. An alarm guards against a deadlock in the
+    # child hanging the test suite.
+
+    pid = os.fork()
+
+    if pid == 0:
+        code = 2
+
+        try:
+            if hasattr(os, "alarm"):
+                os.alarm(10)
+            code = 0 if func() else 1
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+
+    return os.waitstatus_to_exitcode(status)
+
+
+def _hold_while_forking(lock, func):
+    # Acquire the lock in a separate thread and fork while it is held, so
+    # the child inherits the lock in an acquired state.
+
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def _holder():
+        with lock:
+            acquired.set()
+            release.wait()
+
+    thread = threading.Thread(target=_holder)
+    thread.start()
+    acquired.wait()
+
+    try:
+        return _run_in_child(func)
+
+    finally:
+        release.set()
+        thread.join()
+
+
+@unittest.skipUnless(_has_fork, "requires os.fork")
+class TestForkSafety(unittest.TestCase):
+
+    def setUp(self):
+        if sys.version_info >= (3, 12):
+            import warnings
+
+            # Forking a process with multiple threads raises a deprecation
+            # warning on newer Python versions, which is the very situation
+            # being tested.
+
+            warnings.filterwarnings(
+                "ignore", category=DeprecationWarning, message=".*fork.*"
+            )
+
+    def test_synchronized_context_lock(self):
+        class Object:
+            pass
+
+        obj = Object()
+
+        with wrapt.synchronized(obj):
+            pass
+
+        def _child():
+            lock = obj._synchronized_lock
+
+            if not lock.acquire(timeout=1):
+                return False
+
+            lock.release()
+
+            with wrapt.synchronized(obj):
+                return True
+
+        self.assertEqual(_hold_while_forking(obj._synchronized_lock, _child), 0)
+
+    def test_synchronized_function_lock(self):
+        @wrapt.synchronized
+        def function():
+            return True
+
+        function()
+
+        lock = function._synchronized_lock
+
+        self.assertEqual(_hold_while_forking(lock, function), 0)
+
+    def test_synchronized_meta_lock(self):
+        def _child():
+            with wrapt.synchronized(type("Object", (), {})()):
+                return True
+
+        lock = wrapt.synchronized._synchronized_meta_lock
+
+        self.assertEqual(_hold_while_forking(lock, _child), 0)
+
+    def test_registry_discards_dead_contexts(self):
+        class Object:
+            pass
+
+        obj = Object()
+
+        with wrapt.synchronized(obj):
+            pass
+
+        registry = wrapt.synchronization._synchronized_contexts
+
+        self.assertIn(id(obj), registry)
+
+        key = id(obj)
+        del obj
+
+        self.assertNotIn(key, registry)
+
+    def test_post_import_hooks_lock(self):
+        def _child():
+            wrapt.register_post_import_hook(lambda module: None, "colorsys")
+            return True
+
+        lock = wrapt.importer._post_import_hooks_lock
+
+        self.assertEqual(_hold_while_forking(lock, _child), 0)
+
+    def test_async_to_sync_persistent_loop(self):
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def function():
+            return threading.current_thread().name
+
+        function()
+
+        def _child():
+            return function() is not None
+
+        self.assertEqual(_run_in_child(_child), 0)
+
+    def test_async_to_sync_persistent_loop_closed_in_child(self):
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def function():
+            return True
+
+        function()
+
+        loop = wrapt.synchronization._async_to_sync_loop.loop()
+
+        def _child():
+            # The loop inherited from the parent has had its file
+            # descriptors closed, and a new loop is used instead.
+
+            return loop.is_closed() and function()
+
+        self.assertEqual(_run_in_child(_child), 0)
+
+    def test_sync_to_async_thread_sensitive(self):
+        import asyncio
+
+        @wrapt.sync_to_async(thread_sensitive=True)
+        def function():
+            return True
+
+        asyncio.run(function())
+
+        def _child():
+            return asyncio.run(function())
+
+        self.assertEqual(_run_in_child(_child), 0)
+
+    def test_lru_cache_clear_at_fork(self):
+        calls = []
+
+        @wrapt.lru_cache(clear_at_fork=True)
+        def function(value):
+            calls.append(value)
+            return value
+
+        function(1)
+
+        def _child():
+            function(1)
+            return len(calls) == 2
+
+        self.assertEqual(_run_in_child(_child), 0)
+
+        function(1)
+
+        self.assertEqual(calls, [1])
+
+    def test_lru_cache_kept_at_fork_by_default(self):
+        calls = []
+
+        @wrapt.lru_cache
+        def function(value):
+            calls.append(value)
+            return value
+
+        function(1)
+
+        def _child():
+            function(1)
+            return len(calls) == 1
+
+        self.assertEqual(_run_in_child(_child), 0)
+
+    def test_lru_cache_clear_at_fork_instance_method(self):
+        calls = []
+
+        class Object:
+            @wrapt.lru_cache(clear_at_fork=True)
+            def method(self, value):
+                calls.append(value)
+                return value
+
+        obj = Object()
+        obj.method(1)
+
+        def _child():
+            obj.method(1)
+            return len(calls) == 2 and obj.method.cache_info().currsize == 1
+
+        self.assertEqual(_run_in_child(_child), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
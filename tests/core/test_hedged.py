@@ -0,0 +1,213 @@
+import asyncio
+import inspect
+import unittest
+
+import wrapt
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestHedged(unittest.TestCase):
+
+    def test_fast_call_not_hedged(self):
+        calls = []
+
+        @wrapt.hedged(delay=0.5)
+        async def fetch(key):
+            calls.append(key)
+            return key * 2
+
+        self.assertTrue(inspect.iscoroutinefunction(fetch))
+        self.assertEqual(_run(fetch(4)), 8)
+        self.assertEqual(calls, [4])
+
+        info = fetch.hedge_info()
+        self.assertEqual((info.calls, info.hedged, info.wins), (1, 0, 0))
+
+    def test_slow_call_hedged_and_hedge_wins(self):
+        delays = [0.5, 0.0]
+        cancelled = []
+
+        @wrapt.hedged(delay=0.02)
+        async def fetch():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        self.assertEqual(_run(fetch()), 0.0)
+        self.assertEqual(cancelled, [0.5])
+
+        info = fetch.hedge_info()
+        self.assertEqual((info.calls, info.hedged, info.wins), (1, 1, 1))
+
+    def test_first_attempt_can_still_win(self):
+        delays = [0.05, 0.5]
+
+        @wrapt.hedged(delay=0.01)
+        async def fetch():
+            delay = delays.pop(0)
+            await asyncio.sleep(delay)
+            return delay
+
+        self.assertEqual(_run(fetch()), 0.05)
+
+        info = fetch.hedge_info()
+        self.assertEqual((info.calls, info.hedged, info.wins), (1, 1, 0))
+
+    def test_max_attempts(self):
+        started = []
+
+        @wrapt.hedged(delay=0.01, max_attempts=3)
+        async def fetch():
+            started.append(True)
+            await asyncio.sleep(0.1 if len(started) < 3 else 0)
+            return len(started)
+
+        self.assertEqual(_run(fetch()), 3)
+        self.assertEqual(len(started), 3)
+
+    def test_failure_waits_for_other_attempts(self):
+        attempts = []
+
+        @wrapt.hedged(delay=0.01)
+        async def fetch():
+            attempts.append(True)
+            if len(attempts) == 1:
+                await asyncio.sleep(0.03)
+                raise RuntimeError("first failed")
+            await asyncio.sleep(0.05)
+            return "second"
+
+        self.assertEqual(_run(fetch()), "second")
+
+    def test_failure_raised_when_all_attempts_fail(self):
+        @wrapt.hedged(delay=0.01)
+        async def fetch():
+            raise RuntimeError("failed")
+
+        with self.assertRaises(RuntimeError):
+            _run(fetch())
+
+    def test_adaptive_delay(self):
+        @wrapt.hedged(percentile=50, window=20)
+        async def fetch(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        self.assertIsNone(fetch.hedge_info().delay)
+
+        async def main():
+            for _ in range(10):
+                await fetch(0.001)
+
+        _run(main())
+
+        info = fetch.hedge_info()
+        self.assertEqual(info.calls, 10)
+        self.assertEqual(info.hedged, 0)
+        self.assertIsNotNone(info.delay)
+        self.assertGreater(info.delay, 0)
+
+        fetch.hedge_clear()
+        self.assertEqual(fetch.hedge_info().calls, 0)
+        self.assertIsNone(fetch.hedge_info().delay)
+
+    def test_instance_method_stats_shared(self):
+        class Client:
+            @wrapt.hedged(delay=0.5)
+            async def get(self, key):
+                return key
+
+        c1 = Client()
+        c2 = Client()
+
+        async def main():
+            return await c1.get(1), await c2.get(2)
+
+        self.assertEqual(_run(main()), (1, 2))
+        self.assertEqual(c1.get.hedge_info().calls, 2)
+        self.assertEqual(Client.get.hedge_info().calls, 2)
+
+    def test_requires_delay_or_percentile(self):
+        with self.assertRaises(TypeError):
+
+            @wrapt.hedged
+            async def fetch():
+                pass
+
+    def test_requires_positive_window(self):
+        with self.assertRaises(ValueError):
+
+            @wrapt.hedged(percentile=50, window=0)
+            async def fetch():
+                pass
+
+    def test_latency_measured_from_call_start(self):
+        delays = [0.5, 0.0]
+
+        @wrapt.hedged(delay=0.05)
+        async def fetch():
+            await asyncio.sleep(delays.pop(0))
+
+        _run(fetch())
+
+        # The hedged attempt which won completed immediately, but the
+        # caller waited for the hedging delay before it was started.
+
+        (latency,) = fetch._self_hedge_state.latencies
+        self.assertGreaterEqual(latency, 0.05)
+
+    def test_requires_async_callable(self):
+        with self.assertRaises(TypeError):
+
+            @wrapt.hedged(delay=0.1)
+            def fetch():
+                pass
+
+    def test_losing_attempts_awaited(self):
+        delays = [0.5, 0.0]
+        cleaned = []
+
+        @wrapt.hedged(delay=0.01)
+        async def fetch():
+            try:
+                await asyncio.sleep(delays.pop(0))
+            except asyncio.CancelledError:
+                await asyncio.sleep(0)
+                cleaned.append(True)
+                raise
+            return "done"
+
+        async def main():
+            result = await fetch()
+
+            # The cancelled attempt has finished its cleanup by the time
+            # the hedged call returns.
+
+            return result, list(cleaned)
+
+        self.assertEqual(_run(main()), ("done", [True]))
+
+    def test_adaptive_window_evicts_old_latencies(self):
+        state = wrapt.hedging._HedgeState(None, 2, 50, 20)
+
+        for _ in range(20):
+            state.record(1.0, hedged=False, won=False)
+
+        self.assertEqual(state.current_delay(), 1.0)
+
+        for _ in range(20):
+            state.record(0.1, hedged=False, won=False)
+
+        self.assertEqual(state.current_delay(), 0.1)
+        self.assertEqual(state.ordered, sorted(state.latencies))
+
+
+if __name__ == "__main__":
+    unittest.main()
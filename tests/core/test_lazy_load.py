@@ -0,0 +1,193 @@
+import json
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+import wrapt
+
+
+class TestLazyLoad(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.directory = directory.name
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+
+        with open(path, "wb") as file:
+            file.write(data)
+
+        return path
+
+    def test_pickle(self):
+        path = self.write("data.pickle", pickle.dumps({"a": 1, "b": [1, 2]}))
+
+        proxy = wrapt.lazy_load(path)
+
+        self.assertIsInstance(proxy, wrapt.LazyObjectProxy)
+        self.assertEqual(proxy["a"], 1)
+        self.assertEqual(sorted(proxy), ["a", "b"])
+        self.assertEqual(proxy, {"a": 1, "b": [1, 2]})
+
+    def test_deferred(self):
+        calls = []
+
+        def loader(data):
+            calls.append(bytes(data))
+            return {"loaded": True}
+
+        path = self.write("data", b"content")
+
+        proxy = wrapt.lazy_load(path, loader)
+
+        self.assertEqual(calls, [])
+
+        self.assertTrue(proxy["loaded"])
+        self.assertTrue(proxy.get("loaded"))
+
+        self.assertEqual(calls, [b"content"])
+
+    def test_file_not_opened_until_needed(self):
+        path = os.path.join(self.directory, "missing")
+
+        proxy = wrapt.lazy_load(path)
+
+        self.assertRaises(FileNotFoundError, len, proxy)
+
+    def test_json(self):
+        path = self.write("data.json", json.dumps([1, 2, 3]).encode())
+
+        proxy = wrapt.lazy_load(path, lambda data: json.loads(bytes(data)))
+
+        self.assertEqual(list(proxy), [1, 2, 3])
+
+    def test_path_like(self):
+        import pathlib
+
+        path = self.write("data.pickle", pickle.dumps([1]))
+
+        self.assertEqual(wrapt.lazy_load(pathlib.Path(path)), [1])
+
+    def test_empty_file(self):
+        path = self.write("empty", b"")
+
+        proxy = wrapt.lazy_load(path, lambda data: bytes(data))
+
+        self.assertEqual(proxy, b"")
+
+    def test_loader_keeps_buffer(self):
+        path = self.write("data", b"content")
+
+        proxy = wrapt.lazy_load(path, memoryview, interface=memoryview)
+
+        self.assertEqual(proxy.tobytes(), b"content")
+
+    def test_interface(self):
+        path = self.write("data.pickle", pickle.dumps(len))
+
+        proxy = wrapt.lazy_load(path, interface=type(len))
+
+        self.assertEqual(proxy([1, 2]), 2)
+
+    def test_loaded_once(self):
+        calls = []
+
+        def loader(data):
+            calls.append(None)
+            return pickle.loads(data)
+
+        path = self.write("data.pickle", pickle.dumps({"a": 1}))
+
+        proxy = wrapt.lazy_load(path, loader)
+
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            proxy["a"]
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+
+    def test_segments(self):
+        sections = {"first": {"a": 1}, "second": [1, 2, 3]}
+
+        content = b""
+        segments = {}
+
+        for name, value in sections.items():
+            data = pickle.dumps(value)
+            segments[name] = (len(content), len(data))
+            content += data
+
+        path = self.write("data.pickle", content)
+
+        loaded = []
+
+        def loader(data):
+            loaded.append(len(data))
+            return pickle.loads(data)
+
+        proxies = wrapt.lazy_load(path, loader, segments=segments)
+
+        self.assertEqual(sorted(proxies), ["first", "second"])
+        self.assertEqual(loaded, [])
+
+        self.assertEqual(proxies["second"], [1, 2, 3])
+        self.assertEqual(loaded, [segments["second"][1]])
+
+        self.assertEqual(proxies["first"]["a"], 1)
+        self.assertEqual(len(loaded), 2)
+
+    def mapped(self, path):
+        with open("/proc/self/maps") as maps:
+            return os.path.realpath(path) in maps.read()
+
+    @unittest.skipUnless(os.path.exists("/proc/self/maps"), "requires /proc")
+    def test_segments_unmapped_when_loaded(self):
+        first = pickle.dumps([1])
+        second = pickle.dumps([2])
+
+        path = self.write("data.pickle", first + second)
+
+        proxies = wrapt.lazy_load(
+            path,
+            segments={"first": (0, len(first)), "second": (len(first), len(second))},
+        )
+
+        self.assertEqual(proxies["first"], [1])
+        self.assertTrue(self.mapped(path))
+
+        self.assertEqual(proxies["second"], [2])
+        self.assertFalse(self.mapped(path))
+
+    def test_segments_loader_keeps_buffer(self):
+        path = self.write("data", b"content")
+
+        proxies = wrapt.lazy_load(
+            path, memoryview, segments={"a": (0, 4)}, interface=memoryview
+        )
+
+        self.assertEqual(proxies["a"].tobytes(), b"cont")
+
+    def test_segment_out_of_range(self):
+        path = self.write("data", b"content")
+
+        proxies = wrapt.lazy_load(path, bytes, segments={"a": (4, 10)})
+
+        self.assertRaises(ValueError, len, proxies["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
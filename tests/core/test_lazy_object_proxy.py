@@ -109,3 +109,76 @@ class TestLazyObjectProxy(unittest.TestCase):
             self.assertIn(char, "0123456789")
 
         self.assertEqual("".join(digits2), "0123456789")
+
+    def test_lazy_import_rebind(self):
+        if "sched" in sys.modules:
+            del sys.modules["sched"]
+
+        namespace = {}
+
+        exec(
+            "import wrapt\n"
+            "sched = wrapt.lazy_import('sched', rebind=True)\n"
+            "alias = sched\n"
+            "def scheduler():\n"
+            "    return sched.scheduler\n",
+            namespace,
+        )
+
+        proxy = namespace["sched"]
+
+        self.assertIsInstance(proxy, wrapt.LazyObjectProxy)
+        self.assertFalse("sched" in sys.modules)
+
+        self.assertIsNotNone(namespace["scheduler"]())
+
+        # All global names bound to the proxy now refer to the module.
+
+        self.assertIs(namespace["sched"], sys.modules["sched"])
+        self.assertIs(namespace["alias"], sys.modules["sched"])
+
+        self.assertIs(proxy.__wrapped__, sys.modules["sched"])
+
+    def test_lazy_import_rebind_attribute(self):
+        namespace = {}
+
+        exec(
+            "import wrapt\n"
+            "dumps = wrapt.lazy_import('json', 'dumps', rebind=True)\n",
+            namespace,
+        )
+
+        self.assertEqual(namespace["dumps"]([1]), "[1]")
+
+        import json
+
+        self.assertIs(namespace["dumps"], json.dumps)
+
+    def test_lazy_import_rebind_name_replaced(self):
+        namespace = {}
+
+        exec(
+            "import wrapt\n"
+            "json = wrapt.lazy_import('json', rebind=True)\n"
+            "proxy = json\n"
+            "json = None\n",
+            namespace,
+        )
+
+        proxy = namespace["proxy"]
+
+        self.assertEqual(proxy.dumps([1]), "[1]")
+
+        self.assertIsNone(namespace["json"])
+        self.assertIsNot(namespace["proxy"], proxy)
+
+    def test_lazy_import_no_rebind(self):
+        namespace = {}
+
+        exec("import wrapt\njson = wrapt.lazy_import('json')\n", namespace)
+
+        proxy = namespace["json"]
+
+        self.assertEqual(proxy.dumps([1]), "[1]")
+
+        self.assertIs(namespace["json"], proxy)
@@ -0,0 +1,242 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import wrapt
+
+
+class Resource:
+    def __init__(self, name):
+        self.name = name
+
+    def query(self):
+        return self.name
+
+
+class TestLazyObjectProxyAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.created = []
+
+    async def factory(self):
+        await asyncio.sleep(0.01)
+
+        self.created.append(None)
+
+        return Resource("pool")
+
+    def test_await(self):
+        proxy = wrapt.LazyObjectProxy(self.factory)
+
+        self.assertEqual(self.created, [])
+
+        async def run():
+            return await proxy
+
+        resource = asyncio.run(run())
+
+        self.assertIsInstance(resource, Resource)
+        self.assertIs(proxy.__wrapped__, resource)
+        self.assertEqual(proxy.query(), "pool")
+        self.assertIsInstance(proxy, Resource)
+
+    def test_await_again(self):
+        proxy = wrapt.LazyObjectProxy(self.factory)
+
+        async def run():
+            first = await proxy
+            second = await proxy
+
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.created), 1)
+
+    def test_use_before_await(self):
+        proxy = wrapt.LazyObjectProxy(self.factory)
+
+        with self.assertRaises(wrapt.wrappers.WrapperNotInitializedError):
+            proxy.query()
+
+        self.assertEqual(self.created, [])
+
+    def test_concurrent_awaiters(self):
+        proxy = wrapt.LazyObjectProxy(self.factory)
+
+        async def use():
+            return await proxy
+
+        async def run():
+            return await asyncio.gather(*(use() for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(self.created), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_awaiter_cancelled(self):
+        proxy = wrapt.LazyObjectProxy(self.factory)
+
+        async def use():
+            return await proxy
+
+        async def run():
+            first = asyncio.ensure_future(use())
+            second = asyncio.ensure_future(use())
+
+            await asyncio.sleep(0)
+
+            first.cancel()
+
+            return await second
+
+        self.assertEqual(asyncio.run(run()).name, "pool")
+        self.assertEqual(len(self.created), 1)
+
+    def test_failure_retried(self):
+        calls = []
+
+        async def factory():
+            calls.append(None)
+
+            if len(calls) == 1:
+                raise RuntimeError("unavailable")
+
+            return Resource("pool")
+
+        proxy = wrapt.LazyObjectProxy(factory)
+
+        async def run():
+            with self.assertRaises(RuntimeError):
+                await proxy
+
+            return await proxy
+
+        self.assertEqual(asyncio.run(run()).name, "pool")
+        self.assertEqual(len(calls), 2)
+
+    def test_interface(self):
+        async def factory():
+            return [1, 2, 3]
+
+        proxy = wrapt.LazyObjectProxy(factory, interface=list)
+
+        async def run():
+            await proxy
+
+            return list(proxy)
+
+        self.assertEqual(asyncio.run(run()), [1, 2, 3])
+
+    def test_subclass(self):
+        class Proxy(wrapt.LazyObjectProxy):
+            def describe(self):
+                return f"proxy of {self.__wrapped__.name}"
+
+        proxy = Proxy(self.factory)
+
+        async def run():
+            await proxy
+
+        asyncio.run(run())
+
+        self.assertIsInstance(proxy, Proxy)
+        self.assertEqual(proxy.describe(), "proxy of pool")
+
+    def test_sync_factory_not_awaitable(self):
+        proxy = wrapt.LazyObjectProxy(lambda: Resource("sync"))
+
+        self.assertFalse(hasattr(type(proxy), "__await__"))
+
+    def test_refreshing_rejects_async(self):
+        self.assertRaises(TypeError, wrapt.RefreshingObjectProxy, self.factory, ttl=60)
+
+
+class TestWarmUp(unittest.TestCase):
+
+    def test_warm_up(self):
+        def factory(name):
+            time.sleep(0.05)
+            return Resource(name)
+
+        proxies = [
+            wrapt.LazyObjectProxy(lambda name=name: factory(name)) for name in "abcd"
+        ]
+
+        start = time.monotonic()
+
+        resources = wrapt.warm_up(*proxies)
+
+        # Created concurrently, taking the time of one rather than the sum.
+
+        self.assertLess(time.monotonic() - start, 0.15)
+
+        self.assertEqual([resource.name for resource in resources], list("abcd"))
+        self.assertEqual([proxy.query() for proxy in proxies], list("abcd"))
+
+    def test_warm_up_max_workers(self):
+        threads = set()
+
+        def factory():
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return 1
+
+        proxies = [wrapt.LazyObjectProxy(factory) for _ in range(6)]
+
+        self.assertEqual(wrapt.warm_up(*proxies, max_workers=1), [1] * 6)
+        self.assertEqual(len(threads), 1)
+
+    def test_warm_up_empty(self):
+        self.assertEqual(wrapt.warm_up(), [])
+
+    def test_warm_up_error(self):
+        def factory():
+            raise RuntimeError("failed")
+
+        proxies = [wrapt.LazyObjectProxy(factory), wrapt.LazyObjectProxy(lambda: 1)]
+
+        self.assertRaises(RuntimeError, wrapt.warm_up, *proxies)
+
+        self.assertEqual(proxies[1].__wrapped__, 1)
+
+    def test_warm_up_rejects_async(self):
+        async def factory():
+            return 1
+
+        self.assertRaises(TypeError, wrapt.warm_up, wrapt.LazyObjectProxy(factory))
+
+    def test_warm_up_async(self):
+        async def first():
+            await asyncio.sleep(0.05)
+            return Resource("a")
+
+        def second():
+            time.sleep(0.05)
+            return Resource("b")
+
+        async def third():
+            await asyncio.sleep(0.05)
+            return Resource("c")
+
+        proxies = [wrapt.LazyObjectProxy(factory) for factory in (first, second, third)]
+
+        async def run():
+            start = time.monotonic()
+
+            resources = await wrapt.warm_up_async(*proxies)
+
+            return resources, time.monotonic() - start
+
+        resources, elapsed = asyncio.run(run())
+
+        self.assertLess(elapsed, 0.15)
+        self.assertEqual([resource.name for resource in resources], list("abc"))
+        self.assertEqual([proxy.query() for proxy in proxies], list("abc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import gc
 import inspect
+import threading
 import unittest
 import weakref
 
@@ -445,5 +446,147 @@ class TestIntrospection(unittest.TestCase):
         self.assertEqual(list(sig.parameters), ["x"])
 
 
+class TestThreadScope(unittest.TestCase):
+    def _run_in_thread(self, func):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(func()))
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def test_separate_cache_per_thread(self):
+        calls = []
+
+        @wrapt.lru_cache(scope="thread")
+        def function(x):
+            calls.append(threading.get_ident())
+            return x * 2
+
+        self.assertEqual(function(1), 2)
+        self.assertEqual(function(1), 2)
+        self.assertEqual(self._run_in_thread(lambda: function(1)), 2)
+        self.assertEqual(len(calls), 2)
+        self.assertNotEqual(calls[0], calls[1])
+
+    def test_cache_info_rolls_up_live_threads(self):
+        @wrapt.lru_cache(scope="thread", maxsize=8)
+        def function(x):
+            return x
+
+        function(1)
+        function(1)
+
+        started = threading.Event()
+        finish = threading.Event()
+
+        def _worker():
+            function(1)
+            function(2)
+            started.set()
+            finish.wait()
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        started.wait()
+
+        info = function.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.maxsize, 8)
+        self.assertEqual(info.currsize, 3)
+
+        finish.set()
+        thread.join()
+        gc.collect()
+
+        # The cache of the exited thread is released with the thread, but
+        # its statistics are retained in the totals.
+
+        info = function.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.currsize, 1)
+
+        function.cache_clear()
+
+        info = function.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_cache_clear_clears_all_threads(self):
+        @wrapt.lru_cache(scope="thread")
+        def function(x):
+            return x
+
+        function(1)
+        function.cache_clear()
+        self.assertEqual(function.cache_info().currsize, 0)
+
+    def test_cache_parameters(self):
+        @wrapt.lru_cache(scope="thread", maxsize=4, typed=True)
+        def function(x):
+            return x
+
+        function(1)
+        self.assertEqual(function.cache_parameters(), {"maxsize": 4, "typed": True})
+
+    def test_cache_parameters_defaults(self):
+        @wrapt.lru_cache(scope="thread")
+        def function(x):
+            return x
+
+        function(1)
+        self.assertEqual(function.cache_parameters(), {"maxsize": 128, "typed": False})
+
+        @wrapt.lru_cache(scope="thread", maxsize=-1)
+        def negative(x):
+            return x
+
+        negative(1)
+        self.assertEqual(negative.cache_parameters()["maxsize"], 0)
+
+    def test_instance_method(self):
+        calls = []
+
+        class Object:
+            @wrapt.lru_cache(scope="thread")
+            def method(self, x):
+                calls.append((self, x))
+                return x
+
+        first = Object()
+        second = Object()
+
+        first.method(1)
+        first.method(1)
+        second.method(1)
+        self._run_in_thread(lambda: first.method(1))
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(first.method.cache_info().hits, 1)
+        self.assertEqual(second.method.cache_info().misses, 1)
+
+    def test_instance_collected(self):
+        class Object:
+            @wrapt.lru_cache(scope="thread")
+            def method(self, x):
+                return x
+
+        obj = Object()
+        obj.method(1)
+
+        # The cache of the calling thread refers back to the instance, but
+        # must not keep it alive while the thread is still running.
+
+        ref = weakref.ref(obj)
+        del obj
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+    def test_invalid_scope(self):
+        with self.assertRaises(ValueError):
+            wrapt.lru_cache(scope="process")(lambda: None)
+
+
 if __name__ == "__main__":
     unittest.main()
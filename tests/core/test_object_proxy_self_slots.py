@@ -0,0 +1,134 @@
+import unittest
+
+import wrapt
+import wrapt.__wrapt__
+
+USING_C_EXTENSION = wrapt.__wrapt__._using_c_extension
+
+
+def function():
+    """Function docstring."""
+
+
+class SlotsProxy(wrapt.ObjectProxy):
+
+    __slots__ = ("_self_first", "_self_second")
+
+    def __init__(self, wrapped):
+        super().__init__(wrapped)
+        self._self_first = 1
+
+
+class TestObjectProxySelfSlots(unittest.TestCase):
+
+    def test_slot_attributes(self):
+        proxy = SlotsProxy(function)
+
+        self.assertEqual(proxy._self_first, 1)
+
+        proxy._self_second = 2
+
+        self.assertEqual(proxy._self_second, 2)
+
+        del proxy._self_second
+
+        self.assertFalse(hasattr(proxy, "_self_second"))
+
+    def test_slot_attributes_not_in_self_dict(self):
+        proxy = SlotsProxy(function)
+
+        proxy._self_second = 2
+
+        if USING_C_EXTENSION:
+            self.assertNotIn("_self_first", proxy.__self_dict__)
+            self.assertNotIn("_self_second", proxy.__self_dict__)
+        else:
+            # The pure Python implementation keeps the attributes in the
+            # instance dictionary rather than in slots.
+
+            self.assertEqual(proxy.__self_dict__["_self_first"], 1)
+            self.assertEqual(proxy.__self_dict__["_self_second"], 2)
+
+    def test_unset_slot_falls_through(self):
+        function._self_second = "function"
+
+        try:
+            proxy = SlotsProxy(function)
+            self.assertEqual(proxy._self_second, "function")
+
+        finally:
+            del function._self_second
+
+    def test_undeclared_attribute(self):
+        proxy = SlotsProxy(function)
+
+        proxy._self_other = 3
+
+        self.assertEqual(proxy._self_other, 3)
+        self.assertEqual(proxy.__self_dict__["_self_other"], 3)
+        self.assertFalse(hasattr(function, "_self_other"))
+
+    def test_other_slots_retained(self):
+        class Proxy(wrapt.ObjectProxy):
+            __slots__ = ("_self_value", "value")
+
+        proxy = Proxy(function)
+
+        proxy.value = 1
+
+        self.assertEqual(proxy.value, 1)
+        self.assertFalse(hasattr(function, "value"))
+
+    def test_proxied_dunders(self):
+        proxy = SlotsProxy(function)
+
+        self.assertEqual(proxy.__module__, __name__)
+        self.assertEqual(proxy.__doc__, "Function docstring.")
+
+        # A name constructed at runtime is not interned.
+
+        self.assertEqual(getattr(proxy, "".join(["__mod", "ule__"])), __name__)
+        self.assertEqual(getattr(proxy, "".join(["__d", "oc__"])), function.__doc__)
+
+    def test_proxied_dunders_updated(self):
+        def target():
+            """Original."""
+
+        proxy = wrapt.ObjectProxy(target)
+
+        proxy.__doc__ = "Updated."
+
+        self.assertEqual(target.__doc__, "Updated.")
+        self.assertEqual(proxy.__doc__, "Updated.")
+
+        target.__module__ = "updated"
+
+        self.assertEqual(proxy.__module__, "updated")
+
+    @unittest.skipUnless(USING_C_EXTENSION, "requires C extension")
+    def test_no_instance_dict(self):
+        proxy = wrapt.ObjectProxy(function)
+
+        self.assertEqual(proxy.__self_dict__, {})
+
+    def test_bundled_wrappers(self):
+        @wrapt.lru_cache
+        def cached(value):
+            return value
+
+        @wrapt.with_signature(prototype=lambda value: None)
+        def signature(*args):
+            return args
+
+        self.assertEqual(cached(1), 1)
+        self.assertEqual(signature(1), (1,))
+
+        self.assertEqual(signature.__code__.co_argcount, 1)
+
+        if USING_C_EXTENSION:
+            self.assertEqual(cached.__self_dict__, {})
+            self.assertEqual(signature.__self_dict__, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,398 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import wrapt
+
+
+class Client:
+    # Not thread safe, failing if used by more than one caller at a time.
+
+    def __init__(self, created):
+        created.append(self)
+
+        self.busy = False
+        self.healthy = True
+        self.closed = False
+        self.value = len(created)
+
+    def query(self, value):
+        if self.busy:
+            raise RuntimeError("client in use")
+
+        self.busy = True
+        try:
+            time.sleep(0.005)
+            return self, value
+        finally:
+            self.busy = False
+
+    async def query_async(self, value):
+        if self.busy:
+            raise RuntimeError("client in use")
+
+        self.busy = True
+        try:
+            await asyncio.sleep(0.005)
+            return self, value
+        finally:
+            self.busy = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestPooledObjectProxy(unittest.TestCase):
+
+    def setUp(self):
+        self.created = []
+
+    def factory(self):
+        return Client(self.created)
+
+    def test_wrapped_is_first_object(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=2)
+
+        self.assertEqual(len(self.created), 1)
+        self.assertIs(proxy.__wrapped__, self.created[0])
+        self.assertIsInstance(proxy, Client)
+
+    def test_method_call(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=2)
+
+        instance, value = proxy.query(1)
+
+        self.assertIs(instance, self.created[0])
+        self.assertEqual(value, 1)
+
+        # The idle object is reused rather than a new one being created.
+
+        proxy.query(2)
+
+        self.assertEqual(len(self.created), 1)
+
+    def test_attribute(self):
+        proxy = wrapt.PooledObjectProxy(self.factory)
+
+        self.assertEqual(proxy.value, 1)
+
+        self.assertRaises(AttributeError, getattr, proxy, "missing")
+
+    def test_setattr_not_permitted(self):
+        proxy = wrapt.PooledObjectProxy(self.factory)
+
+        with self.assertRaises(AttributeError):
+            proxy.value = 2
+
+        with self.assertRaises(AttributeError):
+            del proxy.value
+
+        self.assertEqual(self.created[0].value, 1)
+
+    def test_self_attributes(self):
+        class Proxy(wrapt.PooledObjectProxy):
+            pass
+
+        proxy = Proxy(self.factory)
+
+        proxy._self_value = 1
+
+        self.assertEqual(proxy._self_value, 1)
+
+    def test_threads(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=3)
+
+        results = []
+        errors = []
+
+        def worker(value):
+            try:
+                results.append(proxy.query(value))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(value for _, value in results), list(range(20)))
+        self.assertLessEqual(len(self.created), 3)
+
+    def test_timeout(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=1, timeout=0.01)
+
+        with proxy.checkout():
+            self.assertRaises(TimeoutError, proxy.query, 1)
+
+        # The timed out waiter does not hold on to the object.
+
+        self.assertEqual(proxy.query(2)[1], 2)
+
+    def test_checkout(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=2)
+
+        with proxy.checkout() as first:
+            with proxy.checkout() as second:
+                self.assertIsNot(first, second)
+
+            self.assertIs(proxy.query(1)[0], second)
+
+        self.assertEqual(len(self.created), 2)
+
+    def test_checkout_released_on_error(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=1, timeout=0.01)
+
+        with self.assertRaises(ValueError):
+            with proxy.checkout():
+                raise ValueError()
+
+        self.assertEqual(proxy.query(1)[1], 1)
+
+    def test_waiter_handed_object(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=1)
+
+        results = []
+
+        with proxy.checkout() as instance:
+            thread = threading.Thread(target=lambda: results.append(proxy.query(1)))
+            thread.start()
+
+            time.sleep(0.01)
+
+            self.assertEqual(results, [])
+
+        thread.join()
+
+        self.assertIs(results[0][0], instance)
+
+    def test_check_and_discard(self):
+        proxy = wrapt.PooledObjectProxy(
+            self.factory,
+            size=1,
+            check=lambda client: client.healthy,
+            discard=Client.close,
+        )
+
+        first = self.created[0]
+        first.healthy = False
+
+        instance, _ = proxy.query(1)
+
+        self.assertIsNot(instance, first)
+        self.assertTrue(first.closed)
+        self.assertEqual(len(self.created), 2)
+
+    def test_check_raises(self):
+        def check(client):
+            raise RuntimeError()
+
+        proxy = wrapt.PooledObjectProxy(self.factory, check=check)
+
+        self.assertIsNot(proxy.query(1)[0], self.created[0])
+
+    def test_factory_failure_releases_capacity(self):
+        calls = []
+
+        def factory():
+            calls.append(None)
+            if len(calls) == 2:
+                raise RuntimeError("connect failed")
+            return Client(self.created)
+
+        proxy = wrapt.PooledObjectProxy(factory, size=2, timeout=0.01)
+
+        with proxy.checkout():
+            self.assertRaises(RuntimeError, proxy.query, 1)
+            self.assertEqual(proxy.query(2)[1], 2)
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, wrapt.PooledObjectProxy, self.factory, size=0)
+
+    def test_async_method(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=3)
+
+        async def run():
+            return await asyncio.gather(*(proxy.query_async(i) for i in range(20)))
+
+        results = asyncio.run(run())
+
+        self.assertEqual([value for _, value in results], list(range(20)))
+        self.assertLessEqual(len(self.created), 3)
+
+    def test_async_checkout(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=1)
+
+        async def run():
+            async with proxy.checkout() as instance:
+                return instance
+
+        self.assertIs(asyncio.run(run()), self.created[0])
+
+    def test_async_timeout(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=1, timeout=0.01)
+
+        async def run():
+            async with proxy.checkout():
+                with self.assertRaises(asyncio.TimeoutError):
+                    await proxy.query_async(1)
+
+            return await proxy.query_async(2)
+
+        self.assertEqual(asyncio.run(run())[1], 2)
+
+    def test_async_cancelled(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=1)
+
+        async def run():
+            async with proxy.checkout():
+                task = asyncio.ensure_future(proxy.query_async(1))
+
+                await asyncio.sleep(0.01)
+
+                task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            return await asyncio.wait_for(proxy.query_async(2), 1)
+
+        self.assertEqual(asyncio.run(run())[1], 2)
+
+    def test_threads_and_tasks(self):
+        proxy = wrapt.PooledObjectProxy(self.factory, size=2)
+
+        errors = []
+
+        def worker():
+            try:
+                for i in range(10):
+                    proxy.query(i)
+            except Exception as exc:
+                errors.append(exc)
+
+        async def run():
+            return await asyncio.gather(*(proxy.query_async(i) for i in range(20)))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        results = asyncio.run(run())
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(len(self.created), 2)
+
+    def test_operators_use_checked_out_object(self):
+        made = []
+
+        def factory():
+            made.append([])
+            return made[-1]
+
+        proxy = wrapt.PooledObjectProxy(factory, size=2)
+
+        with proxy.checkout() as first:
+            self.assertIs(first, made[0])
+
+            proxy.append(1)
+
+            # Operators are applied to the object checked out for them, and
+            # so see the change made through the method call.
+
+            self.assertEqual(len(proxy), 1)
+            self.assertEqual(proxy[0], 1)
+            self.assertEqual(proxy, [1])
+            self.assertTrue(proxy)
+            self.assertIn(1, proxy)
+
+        self.assertEqual(made, [[], [1]])
+
+    def test_dunder_attribute(self):
+        class Resource(Client):
+            def __custom__(self):
+                if self.busy:
+                    raise RuntimeError("client in use")
+                return self
+
+        proxy = wrapt.PooledObjectProxy(lambda: Resource(self.created), size=2)
+
+        with proxy.checkout() as instance:
+            self.assertIsNot(proxy.__custom__(), instance)
+
+    def test_unsupported_operators(self):
+        proxy = wrapt.PooledObjectProxy(lambda: [1, 2])
+
+        self.assertRaises(TypeError, iter, proxy)
+        self.assertRaises(TypeError, reversed, proxy)
+        self.assertRaises(TypeError, hash, proxy)
+
+        with self.assertRaises(TypeError):
+            proxy += [3]
+
+        with self.assertRaises(TypeError):
+            with proxy:
+                pass
+
+        self.assertIsInstance(proxy, wrapt.PooledObjectProxy)
+        self.assertEqual(proxy.__wrapped__, [1, 2])
+
+    def test_sync_method_returning_awaitable(self):
+        class Resource(Client):
+            def query_later(self, value):
+                return self.query_async(value)
+
+        proxy = wrapt.PooledObjectProxy(lambda: Resource(self.created), size=2)
+
+        async def run():
+            awaitable = proxy.query_later(1)
+
+            # The object is held until the awaitable completes, so another
+            # call is given a different object.
+
+            other, _ = await proxy.query_async(2)
+            instance, value = await awaitable
+
+            return instance, other, value
+
+        instance, other, value = asyncio.run(run())
+
+        self.assertIsNot(instance, other)
+        self.assertEqual(value, 1)
+
+        # Both objects are back in the pool.
+
+        with proxy.checkout(), proxy.checkout():
+            pass
+
+        self.assertEqual(len(self.created), 2)
+
+    def test_awaitable_not_awaited_released(self):
+        class Resource(Client):
+            def query_later(self, value):
+                return asyncio.sleep(0, value)
+
+        proxy = wrapt.PooledObjectProxy(
+            lambda: Resource(self.created), size=1, timeout=0.1
+        )
+
+        awaitable = proxy.query_later(1)
+
+        awaitable._awaitable.close()
+
+        del awaitable
+
+        self.assertEqual(proxy.query(2)[1], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
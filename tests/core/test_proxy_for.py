@@ -0,0 +1,148 @@
+import gc
+import threading
+import unittest
+import weakref
+
+import wrapt
+from wrapt.weakrefs import _proxy_registry
+
+
+class Object:
+    pass
+
+
+class TestProxyFor(unittest.TestCase):
+
+    def test_same_proxy(self):
+        instance = Object()
+
+        proxy = wrapt.proxy_for(instance, wrapt.ObjectProxy)
+
+        self.assertIsInstance(proxy, wrapt.ObjectProxy)
+        self.assertIs(proxy.__wrapped__, instance)
+
+        self.assertIs(wrapt.proxy_for(instance, wrapt.ObjectProxy), proxy)
+
+    def test_state_shared(self):
+        class Proxy(wrapt.ObjectProxy):
+            def __init__(self, wrapped):
+                super().__init__(wrapped)
+                self._self_count = 0
+
+        instance = Object()
+
+        proxy = wrapt.proxy_for(instance, Proxy)
+        proxy._self_count += 1
+
+        wrapt.proxy_for(instance, Proxy)._self_count += 1
+
+        self.assertEqual(proxy._self_count, 2)
+
+    def test_distinct_objects(self):
+        first = {"a": 1}
+        second = {"a": 1}
+
+        proxy = wrapt.proxy_for(first, wrapt.ObjectProxy)
+
+        self.assertIsNot(wrapt.proxy_for(second, wrapt.ObjectProxy), proxy)
+
+    def test_distinct_types(self):
+        instance = Object()
+
+        proxy = wrapt.proxy_for(instance, wrapt.ObjectProxy)
+        other = wrapt.proxy_for(instance, wrapt.CallableObjectProxy)
+
+        self.assertIsNot(other, proxy)
+        self.assertIsInstance(other, wrapt.CallableObjectProxy)
+
+    def test_unhashable(self):
+        instance = [1, 2, 3]
+
+        proxy = wrapt.proxy_for(instance, wrapt.ObjectProxy)
+
+        self.assertIs(wrapt.proxy_for(instance, wrapt.ObjectProxy), proxy)
+        self.assertEqual(proxy, [1, 2, 3])
+
+    def test_proxy_not_kept_alive(self):
+        class Proxy(wrapt.ObjectProxy):
+            pass
+
+        instance = Object()
+
+        proxy = wrapt.proxy_for(instance, Proxy)
+
+        ref = weakref.ref(proxy)
+
+        del proxy
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+        key = (Proxy, id(instance))
+
+        self.assertNotIn(key, _proxy_registry)
+
+        proxy = wrapt.proxy_for(instance, Proxy)
+
+        self.assertIs(proxy.__wrapped__, instance)
+        self.assertIn(key, _proxy_registry)
+
+    def test_unhashable_entry_discarded(self):
+        instance = {}
+
+        key = (wrapt.ObjectProxy, id(instance))
+
+        proxy = wrapt.proxy_for(instance, wrapt.ObjectProxy)
+
+        self.assertIn(key, _proxy_registry)
+
+        del proxy
+        gc.collect()
+
+        self.assertNotIn(key, _proxy_registry)
+
+    def test_object_expired(self):
+        # A proxy which does not hold a reference to the object.
+
+        class Proxy(wrapt.ObjectProxy):
+            def __init__(self, wrapped):
+                super().__init__(weakref.proxy(wrapped))
+
+        instance = Object()
+
+        key = (Proxy, id(instance))
+
+        proxy = wrapt.proxy_for(instance, Proxy)
+
+        self.assertIn(key, _proxy_registry)
+
+        del instance
+        gc.collect()
+
+        self.assertNotIn(key, _proxy_registry)
+
+        del proxy
+
+    def test_concurrent(self):
+        instance = Object()
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(wrapt.proxy_for(instance, wrapt.ObjectProxy))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(len({id(proxy) for proxy in results}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,25 +11,12 @@ that should be allowed to propagate non-``AttributeError`` exceptions.
 The pure-Python implementation in ``src/wrapt/wrappers.py`` uses Python-level
 ``try/except AttributeError`` (or ``getattr(..., default)`` / ``hasattr(...)``,
 both of which only suppress ``AttributeError`` on Python 3.2+), so the same
-tests pass against the pure-Python implementation. A handful of sites have
-no equivalent attribute lookup in the pure-Python code path at all (notably
-the eager ``__module__`` / ``__doc__`` caching done by the C ``raw_init``);
-those tests are skipped on the pure-Python implementation since there is
-nothing there to exercise.
+tests pass against the pure-Python implementation.
 """
 
 import unittest
 
 import wrapt
-import wrapt.__wrapt__
-
-USING_C_EXTENSION = wrapt.__wrapt__._using_c_extension
-
-c_extension_only = unittest.skipUnless(
-    USING_C_EXTENSION,
-    "exercises a code path that only exists in the C extension",
-)
-
 
 CANARY_MESSAGE = "pyerr_clear_canary"
 
@@ -69,23 +56,25 @@ def _make_raising_attr_class(target):
 
 class TestRawInitAttributeLookups(unittest.TestCase):
 
-    @c_extension_only
-    def test_raw_init_module_propagates(self):
-        """C: ``WraptObjectProxy_raw_init`` looking up ``__module__`` on the
-        wrapped object during eager attribute caching."""
+    def test_get_module_propagates(self):
+        """C: ``WraptObjectProxy_get_module`` looking up ``__module__`` on the
+        wrapped object. This is no longer looked up eagerly by
+        ``WraptObjectProxy_raw_init``."""
 
         cls = _make_raising_attr_class("__module__")
+        proxy = wrapt.ObjectProxy(cls())
         with self.assertRaises(_Canary):
-            wrapt.ObjectProxy(cls())
+            proxy.__module__
 
-    @c_extension_only
-    def test_raw_init_doc_propagates(self):
-        """C: ``WraptObjectProxy_raw_init`` looking up ``__doc__`` on the
-        wrapped object during eager attribute caching."""
+    def test_get_doc_propagates(self):
+        """C: ``WraptObjectProxy_get_doc`` looking up ``__doc__`` on the
+        wrapped object. This is no longer looked up eagerly by
+        ``WraptObjectProxy_raw_init``."""
 
         cls = _make_raising_attr_class("__doc__")
+        proxy = wrapt.ObjectProxy(cls())
         with self.assertRaises(_Canary):
-            wrapt.ObjectProxy(cls())
+            proxy.__doc__
 
     def test_raw_init_wrapped_factory_propagates(self):
         """C: ``WraptObjectProxy_raw_init`` looking up ``__wrapped_factory__``
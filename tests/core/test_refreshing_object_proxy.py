@@ -0,0 +1,285 @@
+import gc
+import threading
+import time
+import unittest
+
+import wrapt
+
+
+class Source:
+    # Returns a new snapshot on each call, optionally failing or blocking.
+
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.gate = None
+
+    def __call__(self):
+        if self.gate is not None:
+            self.gate.wait()
+
+        if self.fail:
+            raise RuntimeError("refresh failed")
+
+        self.calls += 1
+
+        return {"version": self.calls}
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+
+        time.sleep(0.005)
+
+    return True
+
+
+class TestRefreshingObjectProxy(unittest.TestCase):
+
+    def setUp(self):
+        self.source = Source()
+
+    def test_created_lazily(self):
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=60)
+
+        self.assertEqual(self.source.calls, 0)
+
+        self.assertEqual(proxy["version"], 1)
+        self.assertEqual(proxy["version"], 1)
+
+        self.assertEqual(self.source.calls, 1)
+
+        proxy.stop()
+
+    def test_isinstance(self):
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=60)
+
+        self.assertIsInstance(proxy, wrapt.RefreshingObjectProxy)
+        self.assertIsInstance(proxy, wrapt.LazyObjectProxy)
+
+        proxy.stop()
+
+    def test_background_refresh(self):
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=0.02)
+
+        self.assertEqual(proxy["version"], 1)
+
+        self.assertTrue(wait_for(lambda: proxy["version"] >= 3))
+
+        proxy.stop()
+
+    def test_no_refresh_until_used(self):
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=0.01)
+
+        time.sleep(0.05)
+
+        self.assertEqual(self.source.calls, 0)
+
+        proxy.stop()
+
+    def test_readers_not_blocked(self):
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=0.01)
+
+        self.assertEqual(proxy["version"], 1)
+
+        self.source.gate = threading.Event()
+
+        try:
+            # The refresh is now blocked on the gate, but reads see the
+            # previous object without waiting for it.
+
+            time.sleep(0.05)
+
+            self.assertEqual(proxy["version"], 1)
+
+        finally:
+            proxy.stop()
+            self.source.gate.set()
+
+    def test_error_keeps_last_good(self):
+        errors = []
+
+        proxy = wrapt.RefreshingObjectProxy(
+            self.source, ttl=0.02, retry=0.01, on_error=errors.append
+        )
+
+        self.assertEqual(proxy["version"], 1)
+
+        self.source.fail = True
+
+        self.assertTrue(wait_for(lambda: len(errors) >= 2))
+
+        self.assertIsInstance(errors[0], RuntimeError)
+        self.assertEqual(proxy["version"], 1)
+        self.assertTrue(proxy.stale())
+
+        # Retries continue until the callback succeeds again.
+
+        self.source.fail = False
+
+        self.assertTrue(wait_for(lambda: proxy["version"] == 2))
+        self.assertFalse(proxy.stale())
+
+        proxy.stop()
+
+    def test_error_handler_failure(self):
+        reported = []
+        errors = []
+
+        def on_error(exception):
+            errors.append(exception)
+            raise ValueError("handler failed")
+
+        proxy = wrapt.RefreshingObjectProxy(
+            self.source, ttl=0.02, retry=0.01, on_error=on_error
+        )
+
+        self.assertEqual(proxy["version"], 1)
+
+        excepthook = threading.excepthook
+        threading.excepthook = lambda args: reported.append(args.exc_value)
+
+        try:
+            self.source.fail = True
+
+            # Refreshes continue after the handler fails, with its failure
+            # reported through threading.excepthook.
+
+            self.assertTrue(wait_for(lambda: len(errors) >= 2))
+
+            self.source.fail = False
+
+            self.assertTrue(wait_for(lambda: proxy["version"] == 2))
+
+        finally:
+            proxy.stop()
+            threading.excepthook = excepthook
+
+        self.assertIsInstance(reported[0], ValueError)
+
+    def test_refresh_during_creation(self):
+        proxy = wrapt.RefreshingObjectProxy(
+            self.source, ttl=60, refresh_in_background=False
+        )
+
+        self.source.gate = threading.Event()
+
+        results = []
+
+        thread = threading.Thread(target=lambda: results.append(proxy["version"]))
+        thread.start()
+
+        refresher = threading.Thread(target=proxy.refresh)
+        refresher.start()
+
+        time.sleep(0.02)
+
+        self.source.gate.set()
+
+        thread.join()
+        refresher.join()
+
+        # The refresh waits for the first creation, and so is not replaced
+        # by the older object.
+
+        self.assertEqual(results, [1])
+        self.assertEqual(proxy["version"], 2)
+
+    def test_first_creation_failure(self):
+        self.source.fail = True
+
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=60)
+
+        self.assertRaises(RuntimeError, proxy.__getitem__, "version")
+
+        self.source.fail = False
+
+        self.assertEqual(proxy["version"], 1)
+
+        proxy.stop()
+
+    def test_foreground(self):
+        proxy = wrapt.RefreshingObjectProxy(
+            self.source, ttl=0.02, refresh_in_background=False
+        )
+
+        self.assertFalse(proxy.stale())
+
+        self.assertEqual(proxy["version"], 1)
+        self.assertFalse(proxy.stale())
+
+        time.sleep(0.05)
+
+        self.assertTrue(proxy.stale())
+        self.assertEqual(proxy["version"], 1)
+
+        proxy.refresh()
+
+        self.assertFalse(proxy.stale())
+        self.assertEqual(proxy["version"], 2)
+
+    def test_refresh_failure_raises(self):
+        proxy = wrapt.RefreshingObjectProxy(
+            self.source, ttl=60, refresh_in_background=False
+        )
+
+        self.assertEqual(proxy["version"], 1)
+
+        self.source.fail = True
+
+        self.assertRaises(RuntimeError, proxy.refresh)
+
+        self.assertEqual(proxy["version"], 1)
+
+    def test_stop(self):
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=0.01)
+
+        self.assertEqual(proxy["version"], 1)
+
+        proxy.stop()
+
+        time.sleep(0.05)
+
+        self.assertEqual(self.source.calls, 1)
+
+    def test_collected(self):
+        proxy = wrapt.RefreshingObjectProxy(self.source, ttl=0.01)
+
+        self.assertEqual(proxy["version"], 1)
+
+        del proxy
+        gc.collect()
+
+        calls = self.source.calls
+
+        time.sleep(0.05)
+
+        self.assertEqual(self.source.calls, calls)
+
+    def test_wrapped_type_changes(self):
+        values = iter([[1, 2], "text"])
+
+        proxy = wrapt.RefreshingObjectProxy(
+            lambda: next(values), ttl=60, refresh_in_background=False
+        )
+
+        self.assertEqual(len(proxy), 2)
+
+        proxy.refresh()
+
+        self.assertEqual(proxy.upper(), "TEXT")
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, wrapt.RefreshingObjectProxy, self.source, ttl=0)
+
+        self.assertRaises(
+            ValueError, wrapt.RefreshingObjectProxy, self.source, ttl=1, retry=0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
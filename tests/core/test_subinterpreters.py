@@ -0,0 +1,266 @@
+import os
+import textwrap
+import threading
+import unittest
+from unittest.mock import patch
+
+import wrapt
+import wrapt.__wrapt__
+from wrapt.synchronization import _register_thread_atexit
+
+# The public concurrent.interpreters module was added in Python 3.14. The
+# private _interpreters module it is built on is usable in Python 3.13.
+
+try:
+    from concurrent import interpreters
+except ImportError:
+    interpreters = None
+
+    try:
+        import _interpreters
+    except ImportError:
+        _interpreters = None
+
+_has_interpreters = interpreters is not None or _interpreters is not None
+
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _run_in_interpreter(source):
+    # Run the source code in a new isolated subinterpreter with its own
+    # GIL, raising AssertionError with the formatted traceback if it fails.
+    # The subinterpreter is always closed explicitly, since one which is
+    # left to be cleaned up at exit can hang if it started any threads.
+
+    source = textwrap.dedent(source)
+
+    if interpreters is not None:
+        interp = interpreters.create()
+
+        try:
+            interp.exec(source)
+
+        except interpreters.ExecutionFailed as exc:
+            raise AssertionError(str(exc)) from None
+
+        finally:
+            interp.close()
+
+    else:
+        interp = _interpreters.create("isolated")
+
+        try:
+            excinfo = _interpreters.run_string(interp, source)
+
+        finally:
+            _interpreters.destroy(interp)
+
+        if excinfo is not None:
+            raise AssertionError(excinfo.formatted)
+
+
+# Test modules which cannot run in an isolated subinterpreter. Forking is
+# not permitted there, and neither is starting a process pool, since the
+# worker processes cannot import the __main__ module of the subinterpreter.
+
+_EXCLUDED_MODULES = {
+    "test_fork_safety",
+    "test_subinterpreters",
+}
+
+_EXCLUDED_TESTS = {
+    "test_synchronized_markers.TestSyncToAsyncExecutors.test_process_pool_function",
+    "test_synchronized_markers.TestSyncToAsyncExecutors.test_process_pool_method",
+}
+
+
+@unittest.skipUnless(_has_interpreters, "requires subinterpreters")
+class TestSubinterpreters(unittest.TestCase):
+
+    def test_uses_same_implementation(self):
+        _run_in_interpreter("""
+            import wrapt.__wrapt__
+            assert wrapt.__wrapt__._using_c_extension is %r
+            """ % wrapt.__wrapt__._using_c_extension)
+
+    def test_decorator(self):
+        _run_in_interpreter("""
+            import wrapt
+
+            @wrapt.decorator
+            def passthrough(wrapped, instance, args, kwargs):
+                return wrapped(*args, **kwargs) + 1
+
+            @passthrough
+            def function(value):
+                return value
+
+            class Class:
+                @passthrough
+                def method(self, value):
+                    return value
+
+            assert function(1) == 2
+            assert Class().method(1) == 2
+            """)
+
+    def test_object_proxies(self):
+        _run_in_interpreter("""
+            import wrapt
+
+            proxy = wrapt.ObjectProxy([1])
+            proxy.append(2)
+            assert proxy == [1, 2]
+
+            atomic = wrapt.AtomicObjectProxy(1)
+            replaced = wrapt.swap_wrapped([(atomic, 2)])
+            assert replaced == [1]
+            assert wrapt.snapshot_wrapped(atomic) == (2,)
+            """)
+
+    def test_synchronized_meta_lock_per_interpreter(self):
+        # Hold the meta lock in this interpreter. The subinterpreter has
+        # its own copy and so must not block on it.
+
+        with wrapt.synchronized._synchronized_meta_lock:
+            _run_in_interpreter("""
+                import wrapt
+
+                class Object:
+                    pass
+
+                with wrapt.synchronized(Object()):
+                    pass
+                """)
+
+    def test_post_import_hooks_per_interpreter(self):
+        called = []
+
+        wrapt.register_post_import_hook(called.append, "wrapt_subinterpreter_test")
+
+        try:
+            _run_in_interpreter("""
+                import wrapt
+                import wrapt.importer
+
+                assert "wrapt_subinterpreter_test" not in wrapt.importer._post_import_hooks
+
+                called = []
+                wrapt.register_post_import_hook(called.append, "colorsys")
+
+                import colorsys
+
+                assert called == [colorsys]
+                """)
+
+        finally:
+            wrapt.importer._post_import_hooks.pop("wrapt_subinterpreter_test", None)
+
+        self.assertEqual(called, [])
+
+    def test_async_to_sync_persistent_loop(self):
+        # Daemon threads are not permitted in an isolated subinterpreter,
+        # so the background event loop must fall back to an ordinary
+        # thread and still be stopped when the subinterpreter is closed.
+
+        _run_in_interpreter("""
+            import wrapt
+
+            @wrapt.async_to_sync(persistent_loop=True)
+            async def function():
+                return 1
+
+            assert function() == 1
+            """)
+
+    def test_timeout_thread(self):
+        _run_in_interpreter("""
+            import wrapt
+
+            @wrapt.timeout(10.0, thread=True)
+            def function():
+                return 1
+
+            assert function() == 1
+            """)
+
+    def test_core_tests(self):
+        # Run the remainder of the core test suite in a subinterpreter.
+
+        _run_in_interpreter("""
+            import io
+            import os
+            import sys
+            import unittest
+
+            sys.path.insert(0, %r)
+
+            excluded_modules = %r
+            excluded_tests = %r
+
+            def _filter(suite):
+                tests = []
+                for test in suite:
+                    if isinstance(test, unittest.TestSuite):
+                        tests.append(_filter(test))
+                    elif test.id() not in excluded_tests:
+                        tests.append(test)
+                return unittest.TestSuite(tests)
+
+            loader = unittest.TestLoader()
+            suite = unittest.TestSuite()
+
+            for name in sorted(os.listdir(%r)):
+                module, ext = os.path.splitext(name)
+                if not module.startswith("test_") or ext != ".py":
+                    continue
+                if module in excluded_modules:
+                    continue
+                suite.addTest(_filter(loader.loadTestsFromName(module)))
+
+            stream = io.StringIO()
+            result = unittest.TextTestRunner(stream=stream).run(suite)
+
+            assert result.testsRun > 0
+            assert result.wasSuccessful(), stream.getvalue()
+            """ % (_tests_dir, _EXCLUDED_MODULES, _EXCLUDED_TESTS, _tests_dir))
+
+
+class TestRegisterThreadAtexit(unittest.TestCase):
+    # Background threads fall back to being non-daemon threads in isolated
+    # subinterpreters, which are stopped at exit using a private hook of
+    # the threading module. Registration must still work without it.
+
+    def _stop(self):
+        pass
+
+    def test_daemon_thread(self):
+        thread = threading.Thread(target=self._stop, daemon=True)
+
+        with patch("atexit.register") as register:
+            _register_thread_atexit(thread, self._stop)
+
+        register.assert_called_once_with(self._stop)
+
+    def test_non_daemon_thread(self):
+        thread = threading.Thread(target=self._stop, daemon=False)
+
+        with patch("threading._register_atexit", create=True) as register:
+            _register_thread_atexit(thread, self._stop)
+
+        register.assert_called_once_with(self._stop)
+
+    def test_non_daemon_thread_without_hook(self):
+        thread = threading.Thread(target=self._stop, daemon=False)
+
+        with patch("atexit.register") as register:
+            with patch.dict(threading.__dict__):
+                threading.__dict__.pop("_register_atexit", None)
+
+                _register_thread_atexit(thread, self._stop)
+
+        register.assert_called_once_with(self._stop)
+
+
+if __name__ == "__main__":
+    unittest.main()
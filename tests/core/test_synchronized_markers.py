@@ -1,6 +1,10 @@
 import asyncio
+import contextvars
 import inspect
+import multiprocessing
+import threading
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import wrapt
 
@@ -9,6 +13,30 @@ def _run(coro):
     return asyncio.run(coro)
 
 
+# Process pool executors resolve the wrapped function by module and
+# qualified name in the worker process, so these must be module level. The
+# spawn start method is used as the test process may have running threads.
+
+_process_executor = ProcessPoolExecutor(
+    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+)
+
+
+@wrapt.sync_to_async(executor=_process_executor)
+def _process_square(x):
+    return x * x
+
+
+class _ProcessHolder:
+
+    def __init__(self, value):
+        self.value = value
+
+    @wrapt.sync_to_async(executor=_process_executor)
+    def scaled(self, factor):
+        return self.value * factor
+
+
 class TestMarkAsSync(unittest.TestCase):
 
     def test_async_def_reports_not_coroutine(self):
@@ -133,6 +161,85 @@ class TestAsyncToSync(unittest.TestCase):
         self.assertEqual(sub(10, 3), 7)
 
 
+class TestAsyncToSyncPersistentLoop(unittest.TestCase):
+
+    def test_runs_async_synchronously(self):
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def add(a, b):
+            return a + b
+
+        self.assertFalse(inspect.iscoroutinefunction(add))
+        self.assertEqual(add(2, 3), 5)
+
+    def test_loop_reused_across_calls(self):
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        self.assertIs(current_loop(), current_loop())
+
+    def test_exception_propagates(self):
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            fail()
+
+    def test_callable_from_running_loop(self):
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def add(a, b):
+            return a + b
+
+        async def main():
+            return add(3, 4)
+
+        self.assertEqual(_run(main()), 7)
+
+    def test_reentrant_call_from_loop_thread_raises(self):
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def inner():
+            return 1
+
+        @wrapt.async_to_sync(persistent_loop=True)
+        async def outer():
+            return inner()
+
+        with self.assertRaises(RuntimeError):
+            outer()
+
+    def test_instance_method(self):
+        class C:
+            def __init__(self, value):
+                self.value = value
+
+            @wrapt.async_to_sync(persistent_loop=True)
+            async def get(self):
+                return self.value
+
+        self.assertEqual(C(9).get(), 9)
+
+    def test_not_restarted_after_shutdown(self):
+        background = wrapt.synchronization._BackgroundEventLoop("wrapt-test")
+
+        async def value():
+            return 1
+
+        self.assertEqual(background.run(value()), 1)
+
+        background.shutdown()
+
+        # A loop started after the one shut down at exit would never itself
+        # be shut down, so further calls are refused.
+
+        coroutine = value()
+
+        with self.assertRaises(RuntimeError):
+            background.run(coroutine)
+
+        coroutine.close()
+
+
 class TestSyncToAsync(unittest.TestCase):
 
     def test_runs_sync_in_executor(self):
@@ -164,6 +271,281 @@ class TestSyncToAsync(unittest.TestCase):
         self.assertEqual(_run(add(1, 2)), 3)
 
 
+class TestSyncToAsyncExecutors(unittest.TestCase):
+
+    def test_explicit_executor(self):
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="explicit-executor"
+        )
+
+        @wrapt.sync_to_async(executor=executor)
+        def thread_name():
+            return threading.current_thread().name
+
+        try:
+            self.assertTrue(_run(thread_name()).startswith("explicit-executor"))
+        finally:
+            executor.shutdown()
+
+    def test_max_workers_dedicated_pool(self):
+        state = {"in_flight": 0, "max_concurrent": 0}
+        lock = threading.Lock()
+
+        @wrapt.sync_to_async(max_workers=2)
+        def work():
+            with lock:
+                state["in_flight"] += 1
+                state["max_concurrent"] = max(
+                    state["max_concurrent"], state["in_flight"]
+                )
+            threading.Event().wait(0.02)
+            with lock:
+                state["in_flight"] -= 1
+            return threading.current_thread().name
+
+        async def main():
+            return await asyncio.gather(*(work() for _ in range(6)))
+
+        names = _run(main())
+        self.assertEqual(state["max_concurrent"], 2)
+        self.assertTrue(all(name.startswith("wrapt-work") for name in names))
+
+    def test_thread_sensitive_shares_one_thread(self):
+        @wrapt.sync_to_async(thread_sensitive=True)
+        def first():
+            return threading.get_ident()
+
+        @wrapt.sync_to_async(thread_sensitive=True)
+        def second():
+            return threading.get_ident()
+
+        async def main():
+            return await asyncio.gather(first(), second(), first())
+
+        self.assertEqual(len(set(_run(main()))), 1)
+
+    def test_conflicting_options_rejected(self):
+        with self.assertRaises(TypeError):
+            wrapt.sync_to_async(thread_sensitive=True, max_workers=2)
+
+    def test_contextvars_propagated(self):
+        var = contextvars.ContextVar("var", default="unset")
+
+        @wrapt.sync_to_async(max_workers=1)
+        def read():
+            return var.get()
+
+        async def main():
+            var.set("set")
+            return await read()
+
+        self.assertEqual(_run(main()), "set")
+
+    def test_process_pool_function(self):
+        self.assertTrue(inspect.iscoroutinefunction(_process_square))
+        self.assertEqual(_run(_process_square(7)), 49)
+
+    def test_process_pool_method(self):
+        self.assertEqual(_run(_ProcessHolder(3).scaled(4)), 12)
+
+    def test_process_pool_rejects_nested_function(self):
+        with self.assertRaises(TypeError):
+
+            @wrapt.sync_to_async(executor=_process_executor)
+            def nested():
+                pass
+
+
+class TestGeneratorBridging(unittest.TestCase):
+
+    def test_sync_generator_to_async_generator(self):
+        @wrapt.sync_to_async
+        def numbers(n):
+            for i in range(n):
+                yield i
+
+        self.assertTrue(inspect.isasyncgenfunction(numbers))
+
+        async def main():
+            return [item async for item in numbers(5)]
+
+        self.assertEqual(_run(main()), [0, 1, 2, 3, 4])
+
+    def test_sync_generator_steps_run_off_loop_thread(self):
+        @wrapt.sync_to_async
+        def threads():
+            for _ in range(3):
+                yield threading.get_ident()
+
+        async def main():
+            return [item async for item in threads()]
+
+        self.assertNotIn(threading.get_ident(), _run(main()))
+
+    def test_sync_generator_prefetch(self):
+        produced = []
+
+        @wrapt.sync_to_async(prefetch=2)
+        def numbers(n):
+            for i in range(n):
+                produced.append(i)
+                yield i
+
+        async def main():
+            return [item async for item in numbers(10)]
+
+        self.assertEqual(_run(main()), list(range(10)))
+        self.assertEqual(produced, list(range(10)))
+
+    def test_sync_generator_prefetch_is_bounded(self):
+        produced = []
+
+        @wrapt.sync_to_async(prefetch=2)
+        def numbers():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        async def main():
+            agen = numbers()
+            first = await agen.__anext__()
+            await asyncio.sleep(0.05)
+            await agen.aclose()
+            return first
+
+        self.assertEqual(_run(main()), 0)
+        self.assertLessEqual(len(produced), 4)
+
+    def test_sync_generator_closed_on_early_exit(self):
+        closed = []
+
+        @wrapt.sync_to_async(prefetch=1)
+        def numbers():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.append(True)
+
+        async def main():
+            async for item in numbers():
+                if item == 2:
+                    break
+
+        _run(main())
+        self.assertEqual(closed, [True])
+
+    def test_sync_generator_error_propagates(self):
+        for prefetch in (0, 2):
+
+            @wrapt.sync_to_async(prefetch=prefetch)
+            def failing():
+                yield 1
+                raise ValueError("boom")
+
+            async def main():
+                return [item async for item in failing()]
+
+            with self.assertRaises(ValueError):
+                _run(main())
+
+    def test_async_generator_to_sync_generator(self):
+        @wrapt.async_to_sync
+        async def numbers(n):
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+
+        self.assertTrue(inspect.isgeneratorfunction(numbers))
+        self.assertEqual(list(numbers(5)), [0, 1, 2, 3, 4])
+
+    def test_async_generator_prefetch(self):
+        @wrapt.async_to_sync(prefetch=3)
+        async def numbers(n):
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+
+        self.assertEqual(list(numbers(10)), list(range(10)))
+
+    def test_async_generator_closed_on_early_exit(self):
+        for prefetch in (0, 2):
+            closed = []
+
+            @wrapt.async_to_sync(prefetch=prefetch)
+            async def numbers():
+                try:
+                    for i in range(100):
+                        yield i
+                finally:
+                    closed.append(True)
+
+            for item in numbers():
+                if item == 2:
+                    break
+
+            self.assertEqual(closed, [True])
+
+    def test_async_generator_error_propagates(self):
+        for prefetch in (0, 2):
+
+            @wrapt.async_to_sync(prefetch=prefetch)
+            async def failing():
+                yield 1
+                raise ValueError("boom")
+
+            with self.assertRaises(ValueError):
+                list(failing())
+
+    def test_negative_prefetch_rejected(self):
+        with self.assertRaises(ValueError):
+            wrapt.sync_to_async(prefetch=-1)
+
+        with self.assertRaises(ValueError):
+            wrapt.async_to_sync(prefetch=-1)
+
+    def test_prefetch_rejected_for_non_generator(self):
+        def sync_function():
+            return 1
+
+        async def async_function():
+            return 1
+
+        with self.assertRaises(TypeError):
+            wrapt.sync_to_async(prefetch=2)(sync_function)
+
+        with self.assertRaises(TypeError):
+            wrapt.async_to_sync(prefetch=2)(async_function)
+
+    def test_sync_generator_prefetch_single_worker(self):
+        # The producer must not hold the only worker of the executor, or
+        # other calls awaited by the consumer on it would never run.
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        @wrapt.sync_to_async(executor=executor, prefetch=2)
+        def numbers():
+            for i in range(5):
+                yield i
+
+        @wrapt.sync_to_async(executor=executor)
+        def double(value):
+            return value * 2
+
+        async def main():
+            return [await double(item) async for item in numbers()]
+
+        async def bounded():
+            return await asyncio.wait_for(main(), 5)
+
+        self.assertEqual(_run(bounded()), [0, 2, 4, 6, 8])
+
+    def test_sync_generator_prefetch_thread_sensitive_rejected(self):
+        with self.assertRaises(ValueError):
+            wrapt.sync_to_async(thread_sensitive=True, prefetch=2)
+
+
 class TestSynchronizedWithMarkers(unittest.TestCase):
 
     def test_synchronized_over_async_to_sync_async_def(self):
@@ -0,0 +1,205 @@
+import asyncio
+import inspect
+import threading
+import time
+import unittest
+
+import wrapt
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncTimeout(unittest.TestCase):
+
+    def test_completes_within_deadline(self):
+        @wrapt.timeout(1.0)
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        self.assertTrue(inspect.iscoroutinefunction(fetch))
+        self.assertEqual(_run(fetch(3)), 3)
+
+    def test_deadline_exceeded(self):
+        cancelled = []
+
+        @wrapt.timeout(0.02)
+        async def fetch():
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with self.assertRaises(TimeoutError):
+            _run(fetch())
+
+        self.assertEqual(cancelled, [True])
+
+    def test_nested_calls_share_budget(self):
+        @wrapt.timeout(1.0)
+        async def inner():
+            await asyncio.sleep(0.2)
+
+        @wrapt.timeout(0.05)
+        async def outer():
+            await inner()
+
+        start = time.monotonic()
+
+        with self.assertRaises(TimeoutError):
+            _run(outer())
+
+        self.assertLess(time.monotonic() - start, 0.2)
+
+    def test_none_inherits_deadline_only(self):
+        @wrapt.timeout(None)
+        async def inner():
+            await asyncio.sleep(0.2)
+            return "done"
+
+        @wrapt.timeout(0.05)
+        async def outer():
+            return await inner()
+
+        self.assertEqual(_run(inner()), "done")
+
+        with self.assertRaises(TimeoutError):
+            _run(outer())
+
+    def test_instance_method(self):
+        class Client:
+            @wrapt.timeout(0.02)
+            async def slow(self):
+                await asyncio.sleep(1.0)
+
+        with self.assertRaises(TimeoutError):
+            _run(Client().slow())
+
+
+class TestSyncTimeout(unittest.TestCase):
+
+    def test_inline_call_not_interrupted(self):
+        @wrapt.timeout(0.01)
+        def work():
+            time.sleep(0.03)
+            return "done"
+
+        self.assertFalse(inspect.iscoroutinefunction(work))
+        self.assertEqual(work(), "done")
+
+    def test_inline_call_fails_fast_when_budget_exhausted(self):
+        calls = []
+
+        @wrapt.timeout(1.0)
+        def inner():
+            calls.append(True)
+
+        @wrapt.timeout(0.01)
+        def outer():
+            time.sleep(0.03)
+            inner()
+
+        with self.assertRaises(TimeoutError):
+            outer()
+
+        self.assertEqual(calls, [])
+
+    def test_thread_mode_completes(self):
+        @wrapt.timeout(1.0, thread=True)
+        def work(value):
+            return threading.current_thread().name, value
+
+        name, value = work(5)
+        self.assertEqual(value, 5)
+        self.assertEqual(name, "wrapt-timeout")
+
+    def test_thread_mode_abandons_slow_call(self):
+        finished = threading.Event()
+
+        @wrapt.timeout(0.02, thread=True)
+        def work():
+            time.sleep(0.1)
+            finished.set()
+
+        start = time.monotonic()
+
+        with self.assertRaises(TimeoutError):
+            work()
+
+        self.assertLess(time.monotonic() - start, 0.09)
+        self.assertFalse(finished.is_set())
+        self.assertTrue(finished.wait(1.0))
+
+    def test_thread_mode_propagates_exception(self):
+        @wrapt.timeout(1.0, thread=True)
+        def work():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            work()
+
+    def test_thread_mode_nested_calls_share_budget(self):
+        @wrapt.timeout(1.0, thread=True)
+        def inner():
+            time.sleep(0.2)
+
+        @wrapt.timeout(0.05, thread=True)
+        def outer():
+            inner()
+
+        start = time.monotonic()
+
+        with self.assertRaises(TimeoutError):
+            outer()
+
+        self.assertLess(time.monotonic() - start, 0.2)
+
+    def test_thread_mode_limits_abandoned_calls(self):
+        release = threading.Event()
+        started = []
+
+        @wrapt.timeout(0.01, thread=True, max_abandoned=2)
+        def work():
+            started.append(True)
+            release.wait(5.0)
+
+        for _ in range(2):
+            with self.assertRaises(TimeoutError):
+                work()
+
+        # With the limit of abandoned calls reached, further calls fail
+        # straight away without starting another worker thread.
+
+        with self.assertRaises(TimeoutError):
+            work()
+
+        self.assertEqual(len(started), 2)
+
+        # Calls are admitted again once the abandoned workers finish.
+
+        release.set()
+
+        deadline = time.monotonic() + 5.0
+
+        while len(started) < 3 and time.monotonic() < deadline:
+            try:
+                work()
+            except TimeoutError:
+                time.sleep(0.01)
+
+        self.assertEqual(len(started), 3)
+
+    def test_invalid_max_abandoned(self):
+        with self.assertRaises(ValueError):
+            wrapt.timeout(1.0, thread=True, max_abandoned=0)
+
+    def test_invalid_seconds(self):
+        with self.assertRaises(ValueError):
+            wrapt.timeout(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
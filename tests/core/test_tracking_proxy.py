@@ -0,0 +1,465 @@
+import threading
+import unittest
+
+import wrapt
+
+
+class Object:
+    pass
+
+
+class TestTrackingProxy(unittest.TestCase):
+
+    def test_reads_not_recorded(self):
+        proxy = wrapt.TrackingProxy({"a": 1, "b": [1, 2]})
+
+        self.assertEqual(proxy["a"], 1)
+        self.assertEqual(proxy.get("b"), [1, 2])
+        self.assertEqual(list(proxy.keys()), ["a", "b"])
+        self.assertEqual(len(proxy), 2)
+
+        self.assertEqual(proxy.dirty(), frozenset())
+
+    def test_setitem(self):
+        instance = {"a": 1}
+
+        proxy = wrapt.TrackingProxy(instance)
+
+        proxy["a"] = 2
+        proxy["b"] = 3
+
+        self.assertEqual(instance, {"a": 2, "b": 3})
+        self.assertEqual(proxy.dirty(), {"a", "b"})
+
+    def test_delitem(self):
+        proxy = wrapt.TrackingProxy({"a": 1, "b": 2})
+
+        del proxy["a"]
+
+        self.assertEqual(proxy.dirty(), {"a"})
+
+    def test_failed_setitem_not_recorded(self):
+        proxy = wrapt.TrackingProxy({"a": 1})
+
+        with self.assertRaises(KeyError):
+            del proxy["b"]
+
+        self.assertEqual(proxy.dirty(), frozenset())
+
+    def test_reset_dirty(self):
+        proxy = wrapt.TrackingProxy({})
+
+        proxy["a"] = 1
+
+        self.assertEqual(proxy.reset_dirty(), {"a"})
+        self.assertEqual(proxy.dirty(), frozenset())
+
+        proxy["b"] = 2
+
+        self.assertEqual(proxy.reset_dirty(), {"b"})
+
+    def test_dirty_is_snapshot(self):
+        proxy = wrapt.TrackingProxy({})
+
+        proxy["a"] = 1
+
+        dirty = proxy.dirty()
+
+        proxy["b"] = 2
+
+        self.assertIsInstance(dirty, frozenset)
+        self.assertEqual(dirty, {"a"})
+
+    def test_dict_methods(self):
+        proxy = wrapt.TrackingProxy({"a": 1, "b": 2})
+
+        proxy.update({"c": 3}, d=4)
+
+        self.assertEqual(proxy.reset_dirty(), {"c", "d"})
+
+        proxy.pop("a")
+        proxy.pop("missing", None)
+
+        self.assertEqual(proxy.reset_dirty(), {"a"})
+
+        proxy.setdefault("b", 5)
+        proxy.setdefault("e", 5)
+
+        self.assertEqual(proxy.reset_dirty(), {"e"})
+
+        key, _ = proxy.popitem()
+
+        self.assertEqual(proxy.reset_dirty(), {key})
+
+        proxy.clear()
+
+        self.assertEqual(proxy.reset_dirty(), {"b", "c", "d"})
+
+    def test_list_methods(self):
+        proxy = wrapt.TrackingProxy([1, 2])
+
+        proxy.append(3)
+        proxy.extend([4, 5])
+
+        self.assertEqual(proxy.reset_dirty(), {2, 3, 4})
+
+        # The inserted or removed item and those after it which moved are
+        # recorded as a single range.
+
+        proxy.insert(0, 0)
+
+        self.assertEqual(proxy.reset_dirty(), {range(0, 6)})
+
+        self.assertEqual(proxy.pop(), 5)
+        self.assertEqual(proxy.reset_dirty(), {range(5, 6)})
+
+        self.assertEqual(proxy.pop(-2), 3)
+        self.assertEqual(proxy.reset_dirty(), {range(3, 5)})
+
+        proxy.remove(1)
+
+        self.assertEqual(proxy, [0, 2, 4])
+        self.assertEqual(proxy.reset_dirty(), {range(1, 4)})
+
+        proxy.insert(-1, 3)
+
+        self.assertEqual(proxy, [0, 2, 3, 4])
+        self.assertEqual(proxy.reset_dirty(), {range(2, 4)})
+
+        proxy.sort(reverse=True)
+
+        self.assertEqual(proxy.reset_dirty(), {range(0, 4)})
+
+    def test_failed_list_method_not_recorded(self):
+        proxy = wrapt.TrackingProxy([1])
+
+        self.assertRaises(ValueError, proxy.remove, 2)
+
+        self.assertEqual(proxy.dirty(), frozenset())
+
+    def test_method_metadata(self):
+        proxy = wrapt.TrackingProxy([])
+
+        self.assertEqual(proxy.append.__name__, "append")
+        self.assertEqual(proxy.append.__doc__, [].append.__doc__)
+
+    def test_set_methods(self):
+        proxy = wrapt.TrackingProxy({1, 2})
+
+        proxy.add(3)
+        proxy.discard(1)
+
+        self.assertEqual(proxy.reset_dirty(), {1, 3})
+
+        proxy.update([4], iter([5]))
+
+        self.assertEqual(proxy, {2, 3, 4, 5})
+        self.assertEqual(proxy.reset_dirty(), {4, 5})
+
+        member = proxy.pop()
+
+        self.assertEqual(proxy.reset_dirty(), {member})
+
+    def test_non_mutating_methods(self):
+        proxy = wrapt.TrackingProxy([1, 2, 3])
+
+        self.assertEqual(proxy.index(2), 1)
+        self.assertEqual(proxy.count(2), 1)
+
+        self.assertEqual(proxy.dirty(), frozenset())
+
+    def test_list_items(self):
+        proxy = wrapt.TrackingProxy([0, 1, 2, 3])
+
+        proxy[-1] = 9
+
+        self.assertEqual(proxy.reset_dirty(), {3})
+
+        proxy[0:2] = [7, 8]
+
+        self.assertEqual(proxy.reset_dirty(), {0, 1})
+
+        proxy[::2] = [5, 6]
+
+        self.assertEqual(proxy.reset_dirty(), {0, 2})
+
+    def test_list_items_moved(self):
+        proxy = wrapt.TrackingProxy([0, 1, 2, 3])
+
+        del proxy[1]
+
+        self.assertEqual(proxy, [0, 2, 3])
+        self.assertEqual(proxy.reset_dirty(), {range(1, 4)})
+
+        proxy[1:2] = [4, 5, 6]
+
+        self.assertEqual(proxy, [0, 4, 5, 6, 3])
+        self.assertEqual(proxy.reset_dirty(), {range(1, 5)})
+
+        del proxy[::-2]
+
+        self.assertEqual(proxy, [4, 6])
+        self.assertEqual(proxy.reset_dirty(), {range(0, 5)})
+
+        # Replacing items without changing the length records each item.
+
+        proxy[0:2] = [7, 8]
+
+        self.assertEqual(proxy.reset_dirty(), {0, 1})
+
+    def test_list_items_moved_large(self):
+        proxy = wrapt.TrackingProxy(list(range(1000000)))
+
+        # Moving the items of a large list records a single range rather
+        # than each of the indices which moved.
+
+        del proxy[0]
+        proxy.insert(0, 0)
+        proxy.pop(10)
+
+        self.assertEqual(len(proxy), 999999)
+        self.assertEqual(proxy.dirty(), {range(0, 1000000), range(10, 1000000)})
+
+    def test_inplace_operators(self):
+        proxy = wrapt.TrackingProxy([1])
+
+        proxy += [2]
+
+        self.assertIsInstance(proxy, wrapt.TrackingProxy)
+        self.assertEqual(proxy.reset_dirty(), {1})
+
+        proxy *= 2
+
+        self.assertEqual(proxy, [1, 2, 1, 2])
+        self.assertEqual(proxy.reset_dirty(), {2, 3})
+
+        proxy *= 0
+
+        self.assertEqual(proxy.reset_dirty(), {range(0, 4)})
+
+        # Only the keys of the other operand are recorded.
+
+        proxy = wrapt.TrackingProxy({"a": 1})
+
+        proxy |= [("b", 2)]
+
+        self.assertEqual(proxy, {"a": 1, "b": 2})
+        self.assertEqual(proxy.reset_dirty(), {"b"})
+
+    def test_inplace_set_operators(self):
+        proxy = wrapt.TrackingProxy({1, 2, 3})
+
+        proxy |= {4}
+
+        self.assertEqual(proxy.reset_dirty(), {4})
+
+        proxy -= {1, 5}
+
+        self.assertEqual(proxy.reset_dirty(), {1})
+
+        proxy &= {2, 4}
+
+        self.assertEqual(proxy, {2, 4})
+        self.assertEqual(proxy.reset_dirty(), {3})
+
+        proxy ^= {4, 6}
+
+        self.assertEqual(proxy, {2, 6})
+        self.assertEqual(proxy.reset_dirty(), {4, 6})
+
+    def test_inplace_operators_immutable(self):
+        proxy = wrapt.TrackingProxy(1)
+
+        proxy += 1
+
+        self.assertEqual(proxy, 2)
+
+    def test_setattr(self):
+        instance = Object()
+
+        proxy = wrapt.TrackingProxy(instance)
+
+        proxy.value = 1
+
+        self.assertEqual(instance.value, 1)
+        self.assertEqual(proxy.reset_dirty(), {"value"})
+
+        del proxy.value
+
+        self.assertFalse(hasattr(instance, "value"))
+        self.assertEqual(proxy.reset_dirty(), {"value"})
+
+    def test_proxy_attributes_not_recorded(self):
+        class Proxy(wrapt.TrackingProxy):
+            pass
+
+        proxy = Proxy(Object())
+
+        proxy._self_value = 1
+        proxy.__wrapped__ = Object()
+
+        self.assertEqual(proxy.dirty(), frozenset())
+
+    def test_nested_not_tracked_by_default(self):
+        instance = {"nested": {"a": 1}}
+
+        proxy = wrapt.TrackingProxy(instance)
+
+        self.assertIs(proxy["nested"], instance["nested"])
+
+        proxy["nested"]["a"] = 2
+
+        self.assertEqual(proxy.dirty(), frozenset())
+
+    def test_nested_items(self):
+        instance = {"nested": {"a": 1}, "values": [1], "members": {1}, "other": 1}
+
+        proxy = wrapt.TrackingProxy(instance, nested=True)
+
+        self.assertEqual(proxy["other"], 1)
+        self.assertNotIsInstance(proxy["other"], wrapt.TrackingProxy)
+
+        nested = proxy["nested"]
+
+        self.assertIsInstance(nested, wrapt.TrackingProxy)
+        self.assertIs(nested.__wrapped__, instance["nested"])
+
+        nested["b"] = 2
+
+        self.assertEqual(nested.dirty(), {"b"})
+        self.assertEqual(proxy.reset_dirty(), {"nested"})
+
+        proxy["values"].append(2)
+        proxy["members"].add(2)
+
+        self.assertEqual(proxy.reset_dirty(), {"values", "members"})
+
+        self.assertEqual(instance["values"], [1, 2])
+        self.assertEqual(instance["members"], {1, 2})
+
+    def test_nested_attributes(self):
+        instance = Object()
+        instance.settings = {"a": 1}
+
+        proxy = wrapt.TrackingProxy(instance, nested=True)
+
+        proxy.settings["a"] = 2
+
+        self.assertEqual(proxy.dirty(), {"settings"})
+
+    def test_nested_levels(self):
+        proxy = wrapt.TrackingProxy({"a": {"b": {"c": 1}}}, nested=True)
+
+        inner = proxy["a"]["b"]
+
+        inner["c"] = 2
+
+        self.assertEqual(inner.dirty(), {"c"})
+        self.assertEqual(proxy.dirty(), {"a"})
+
+    def test_nested_reads_not_recorded(self):
+        proxy = wrapt.TrackingProxy({"a": {"b": 1}}, nested=True)
+
+        self.assertEqual(proxy["a"]["b"], 1)
+        self.assertEqual(proxy["a"].get("b"), 1)
+
+        self.assertEqual(proxy.dirty(), frozenset())
+
+    def test_custom_mutating_methods(self):
+        class Registry(dict):
+            def register(self, name):
+                self[name] = True
+
+        class RegistryProxy(wrapt.TrackingProxy):
+            _self_mutating_methods = wrapt.TrackingProxy._self_mutating_methods | {
+                "register"
+            }
+
+        proxy = RegistryProxy(Registry(a=True))
+
+        proxy.register("b")
+
+        # Where only the method name is known, all the keys present before
+        # or after the call are recorded.
+
+        self.assertEqual(proxy.dirty(), {"a", "b"})
+
+    def test_isinstance(self):
+        proxy = wrapt.TrackingProxy({})
+
+        self.assertIsInstance(proxy, dict)
+        self.assertIsInstance(proxy, wrapt.TrackingProxy)
+
+    def test_concurrent_setitem(self):
+        proxy = wrapt.TrackingProxy({})
+
+        barrier = threading.Barrier(8)
+
+        def worker(index):
+            barrier.wait()
+            for i in range(100):
+                proxy[index * 100 + i] = i
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(proxy.dirty(), set(range(800)))
+
+    def test_concurrent_reset_dirty(self):
+        proxy = wrapt.TrackingProxy({})
+
+        collected = []
+        done = threading.Event()
+
+        def worker():
+            for i in range(2000):
+                proxy[i] = i
+            done.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+
+        while not done.is_set():
+            collected.extend(proxy.reset_dirty())
+
+        thread.join()
+
+        collected.extend(proxy.reset_dirty())
+
+        # Every key is returned by exactly one of the calls.
+
+        self.assertEqual(sorted(collected), list(range(2000)))
+
+    def test_concurrent_dirty(self):
+        proxy = wrapt.TrackingProxy({})
+
+        done = threading.Event()
+
+        def worker():
+            for i in range(2000):
+                proxy[i] = i
+            done.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+
+        # Snapshots taken while keys are being added are never torn.
+
+        previous = frozenset()
+
+        while not done.is_set():
+            current = proxy.dirty()
+            self.assertLessEqual(previous, current)
+            previous = current
+
+        thread.join()
+
+        self.assertEqual(proxy.dirty(), set(range(2000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -203,6 +203,82 @@ class TestWeakFunctionProxy(unittest.TestCase):
 
         self.assertEqual(method(), "bark")
 
+    def test_instancemethod_arguments(self):
+        class Class:
+            def function(self, *args, **kwargs):
+                return self, args, kwargs
+
+        c = Class()
+
+        proxy = wrapt.WeakFunctionProxy(c.function)
+
+        self.assertEqual(proxy(), (c, (), {}))
+        self.assertEqual(proxy(1, 2), (c, (1, 2), {}))
+        self.assertEqual(proxy(1, b=2), (c, (1,), dict(b=2)))
+
+        args = tuple(range(20))
+        kwargs = dict(("k%d" % i, i) for i in range(20))
+
+        self.assertEqual(proxy(*args, **kwargs), (c, args, kwargs))
+
+    def test_instancemethod_exception(self):
+        class Class:
+            def function(self):
+                raise RuntimeError("function")
+
+        c = Class()
+
+        proxy = wrapt.WeakFunctionProxy(c.function)
+
+        with self.assertRaises(RuntimeError):
+            proxy()
+
+    def test_instancemethod_repeated_calls(self):
+        class Class:
+            def function(self, value):
+                return self, value
+
+        c = Class()
+
+        proxy = wrapt.WeakFunctionProxy(c.function)
+
+        for i in range(100):
+            self.assertEqual(proxy(i), (c, i))
+
+        del c
+        gc.collect()
+
+        with self.assertRaises(ReferenceError):
+            proxy(1)
+
+    def test_subclass(self):
+        class Proxy(wrapt.WeakFunctionProxy):
+            pass
+
+        class Class:
+            def function(self, value):
+                return self, value
+
+        def function(value):
+            return value
+
+        c = Class()
+
+        self.assertEqual(Proxy(c.function)(1), (c, 1))
+        self.assertEqual(Proxy(function)(1), 1)
+
+    def test_subclass_override_call(self):
+        class Proxy(wrapt.WeakFunctionProxy):
+            def __call__(self, *args, **kwargs):
+                return "override", super().__call__(*args, **kwargs)
+
+        def function(value):
+            return value
+
+        proxy = Proxy(function)
+
+        self.assertEqual(proxy(1), ("override", 1))
+
 
 class TestArgumentUnpackingWeakFunctionProxy(unittest.TestCase):
 
@@ -0,0 +1,331 @@
+import asyncio
+import gc
+import threading
+import unittest
+import weakref
+
+import wrapt
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestWeakSignal(unittest.TestCase):
+
+    def test_send_function(self):
+        signal = wrapt.WeakSignal()
+
+        def listener(value):
+            return value * 2
+
+        self.assertIs(signal.connect(listener), listener)
+        self.assertTrue(signal.is_connected(listener))
+        self.assertEqual(len(signal), 1)
+
+        results = signal.send(2)
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0][0], wrapt.WeakFunctionProxy)
+        self.assertEqual(results[0][1], 4)
+
+    def test_send_order(self):
+        signal = wrapt.WeakSignal()
+
+        def first(value):
+            return "first", value
+
+        def second(value):
+            return "second", value
+
+        signal.connect(first)
+        signal.connect(second)
+
+        self.assertEqual(
+            [result for _, result in signal.send(1)],
+            [("first", 1), ("second", 1)],
+        )
+
+    def test_send_keyword_arguments(self):
+        signal = wrapt.WeakSignal()
+
+        def listener(*args, **kwargs):
+            return args, kwargs
+
+        signal.connect(listener)
+
+        self.assertEqual(signal.send(1, self="self")[0][1], ((1,), dict(self="self")))
+
+    def test_connect_decorator(self):
+        signal = wrapt.WeakSignal()
+
+        @signal.connect
+        def listener():
+            return 1
+
+        self.assertEqual(signal.send()[0][1], 1)
+
+    def test_connect_twice(self):
+        signal = wrapt.WeakSignal()
+
+        def listener():
+            return 1
+
+        signal.connect(listener)
+        signal.connect(listener)
+
+        self.assertEqual(len(signal), 1)
+
+    def test_disconnect(self):
+        signal = wrapt.WeakSignal()
+
+        def listener():
+            return 1
+
+        signal.connect(listener)
+
+        self.assertTrue(signal.disconnect(listener))
+        self.assertFalse(signal.disconnect(listener))
+        self.assertFalse(signal.is_connected(listener))
+        self.assertEqual(signal.send(), [])
+
+    def test_clear(self):
+        signal = wrapt.WeakSignal()
+
+        def listener():
+            return 1
+
+        signal.connect(listener)
+        signal.clear()
+
+        self.assertEqual(len(signal), 0)
+        self.assertEqual(signal.send(), [])
+
+    def test_bound_method(self):
+        signal = wrapt.WeakSignal()
+
+        class Class:
+            def listener(self, value):
+                return self, value
+
+        c = Class()
+
+        signal.connect(c.listener)
+
+        self.assertTrue(signal.is_connected(c.listener))
+        self.assertEqual(signal.send(1)[0][1], (c, 1))
+
+        self.assertTrue(signal.disconnect(c.listener))
+        self.assertEqual(len(signal), 0)
+
+    def test_expired_function_pruned(self):
+        signal = wrapt.WeakSignal()
+
+        def listener():
+            return 1
+
+        signal.connect(listener)
+
+        del listener
+        gc.collect()
+
+        self.assertEqual(len(signal), 0)
+        self.assertEqual(signal._listeners, ())
+        self.assertEqual(signal.send(), [])
+
+    def test_expired_instance_pruned(self):
+        signal = wrapt.WeakSignal()
+
+        class Class:
+            def listener(self):
+                return 1
+
+        c = Class()
+
+        signal.connect(c.listener)
+
+        del c
+        gc.collect()
+
+        self.assertEqual(len(signal), 0)
+        self.assertEqual(signal._listeners, ())
+
+    def test_expired_while_locked(self):
+        # The listener expires while the lock is held, so cannot be pruned
+        # immediately, but must be skipped and pruned later.
+
+        signal = wrapt.WeakSignal()
+
+        def listener():
+            return 1
+
+        signal.connect(listener)
+
+        with signal._lock:
+            del listener
+            gc.collect()
+
+        self.assertEqual(len(signal._listeners), 1)
+        self.assertEqual(signal.send(), [])
+        self.assertEqual(signal._listeners, ())
+
+    def test_listener_does_not_keep_signal_alive(self):
+        signal = wrapt.WeakSignal()
+
+        def listener():
+            return 1
+
+        signal.connect(listener)
+
+        signal_ref = weakref.ref(signal)
+
+        del signal
+        gc.collect()
+
+        self.assertIsNone(signal_ref())
+
+        # Expiry of the listener after the signal has gone must be benign.
+
+        del listener
+        gc.collect()
+
+    def test_connect_during_send(self):
+        signal = wrapt.WeakSignal()
+
+        def late():
+            return "late"
+
+        def listener():
+            signal.connect(late)
+            return "listener"
+
+        signal.connect(listener)
+
+        self.assertEqual([result for _, result in signal.send()], ["listener"])
+        self.assertEqual(len(signal), 2)
+
+    def test_error_isolation(self):
+        errors = []
+
+        signal = wrapt.WeakSignal(on_error=lambda proxy, exc: errors.append(exc))
+
+        def failing():
+            raise RuntimeError("failing")
+
+        def listener():
+            return 1
+
+        signal.connect(failing)
+        signal.connect(listener)
+
+        results = signal.send()
+
+        self.assertIsInstance(results[0][1], RuntimeError)
+        self.assertEqual(results[1][1], 1)
+        self.assertEqual(len(errors), 1)
+        self.assertIs(errors[0], results[0][1])
+
+    def test_base_exception_not_isolated(self):
+        signal = wrapt.WeakSignal()
+
+        def listener():
+            raise KeyboardInterrupt()
+
+        signal.connect(listener)
+
+        with self.assertRaises(KeyboardInterrupt):
+            signal.send()
+
+    def test_concurrent_connect(self):
+        signal = wrapt.WeakSignal()
+
+        listeners = [lambda i=i: i for i in range(200)]
+
+        def connect(chunk):
+            for listener in chunk:
+                signal.connect(listener)
+
+        threads = [
+            threading.Thread(target=connect, args=(listeners[i::4],)) for i in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(signal), 200)
+        self.assertEqual(
+            sorted(result for _, result in signal.send()), list(range(200))
+        )
+
+
+class TestWeakSignalAsync(unittest.TestCase):
+
+    def test_send_async(self):
+        signal = wrapt.WeakSignal()
+
+        def sync_listener(value):
+            return "sync", value
+
+        async def async_listener(value):
+            await asyncio.sleep(0)
+            return "async", value
+
+        signal.connect(sync_listener)
+        signal.connect(async_listener)
+
+        results = _run(signal.send_async(1))
+
+        self.assertEqual([result for _, result in results], [("sync", 1), ("async", 1)])
+
+    def test_send_async_concurrent(self):
+        signal = wrapt.WeakSignal()
+
+        started = []
+
+        async def first():
+            started.append("first")
+            await asyncio.sleep(0.01)
+            return started[:]
+
+        async def second():
+            started.append("second")
+            return "second"
+
+        signal.connect(first)
+        signal.connect(second)
+
+        results = _run(signal.send_async())
+
+        self.assertEqual(results[0][1], ["first", "second"])
+
+    def test_send_async_error_isolation(self):
+        errors = []
+
+        signal = wrapt.WeakSignal(on_error=lambda proxy, exc: errors.append(exc))
+
+        async def failing():
+            raise RuntimeError("failing")
+
+        def failing_sync():
+            raise ValueError("failing")
+
+        async def listener():
+            return 1
+
+        signal.connect(failing)
+        signal.connect(failing_sync)
+        signal.connect(listener)
+
+        results = _run(signal.send_async())
+
+        self.assertIsInstance(results[0][1], RuntimeError)
+        self.assertIsInstance(results[1][1], ValueError)
+        self.assertEqual(results[2][1], 1)
+        self.assertEqual(len(errors), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
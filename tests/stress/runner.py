@@ -10,16 +10,41 @@ These are probabilistic tests, not deterministic ones. A crash proves a
 bug, while a clean run only gives confidence proportional to how long
 the scenarios ran. Control duration and concurrency with the
 WRAPT_STRESS_SECONDS and WRAPT_STRESS_THREADS environment variables.
+
+With ``--throughput``, the workloads in ``throughput.py`` are instead run
+at 1, 2, 4 and N threads, where N is the number of CPUs, or at the thread
+counts given by ``--threads``. A JSON report of operations per second,
+speedup and scaling efficiency relative to one thread is written to
+stdout or to the file given by ``--output``. Reports produced by GIL and
+free-threaded builds can then be compared with ``--compare``, which
+reports the throughput of the second relative to the first.
 """
 
+import argparse
+import json
+import os
 import pathlib
 import signal
 import subprocess
 import sys
 
+import throughput
 
-def main():
-    here = pathlib.Path(__file__).resolve().parent
+HERE = pathlib.Path(__file__).resolve().parent
+
+
+def describe_exit(code):
+    if code < 0:
+        try:
+            return signal.Signals(-code).name
+        except ValueError:
+            return f"signal {-code}"
+
+    return f"exit code {code}"
+
+
+def run_scenarios():
+    here = HERE
     scenarios = sorted(here.glob("stress_*.py"))
 
     if not scenarios:
@@ -41,10 +66,7 @@ def main():
             print(f"SKIP: {path.name}", flush=True)
             skipped.append(path.name)
         elif code < 0:
-            try:
-                reason = signal.Signals(-code).name
-            except ValueError:
-                reason = f"signal {-code}"
+            reason = describe_exit(code)
             print(f"CRASH: {path.name} (terminated by {reason})", flush=True)
             failures.append(path.name)
         else:
@@ -63,5 +85,167 @@ def main():
     return 1 if failures else 0
 
 
+def default_thread_counts():
+    cpus = os.cpu_count() or 1
+    return sorted({1, 2, 4, cpus})
+
+
+def run_throughput(workloads, thread_counts):
+    script = HERE / "throughput.py"
+
+    if not workloads:
+        workloads = list(throughput.WORKLOADS)
+
+    report = {
+        "python": sys.version.split()[0],
+        "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "cpu_count": os.cpu_count(),
+        "workloads": {},
+    }
+
+    failed = False
+
+    for workload in workloads:
+        results = []
+        baseline = None
+
+        for threads in thread_counts:
+            print(f"=== {workload} threads={threads} ===", file=sys.stderr, flush=True)
+
+            process = subprocess.run(
+                [sys.executable, str(script), workload, str(threads)],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+
+            if process.returncode != 0:
+                reason = describe_exit(process.returncode)
+                print(f"FAIL: {workload} ({reason})", file=sys.stderr, flush=True)
+                results.append({"threads": threads, "error": reason})
+                failed = True
+                continue
+
+            result = json.loads(process.stdout.strip().splitlines()[-1])
+
+            report["c_extension"] = result["c_extension"]
+
+            ops_per_sec = result["ops_per_sec"]
+
+            # Scaling is measured relative to the throughput of the lowest
+            # thread count run, which is normally a single thread.
+
+            if baseline is None:
+                baseline = (threads, ops_per_sec)
+
+            speedup = ops_per_sec / baseline[1]
+
+            results.append(
+                {
+                    "threads": threads,
+                    "ops_per_sec": round(ops_per_sec),
+                    "speedup": round(speedup, 3),
+                    "efficiency": round(speedup * baseline[0] / threads, 3),
+                }
+            )
+
+        report["workloads"][workload] = results
+
+    return report, failed
+
+
+def compare_reports(baseline, candidate):
+    comparison = {
+        "baseline": {key: baseline.get(key) for key in ("python", "gil")},
+        "candidate": {key: candidate.get(key) for key in ("python", "gil")},
+        "workloads": {},
+    }
+
+    for workload, results in candidate["workloads"].items():
+        reference = {
+            entry["threads"]: entry
+            for entry in baseline["workloads"].get(workload, [])
+            if "ops_per_sec" in entry
+        }
+
+        entries = []
+
+        for entry in results:
+            other = reference.get(entry["threads"])
+
+            if other is None or "ops_per_sec" not in entry:
+                continue
+
+            entries.append(
+                {
+                    "threads": entry["threads"],
+                    "baseline_ops_per_sec": other["ops_per_sec"],
+                    "candidate_ops_per_sec": entry["ops_per_sec"],
+                    "ratio": round(entry["ops_per_sec"] / other["ops_per_sec"], 3),
+                    "baseline_efficiency": other["efficiency"],
+                    "candidate_efficiency": entry["efficiency"],
+                }
+            )
+
+        comparison["workloads"][workload] = entries
+
+    return comparison
+
+
+def write_json(data, output):
+    text = json.dumps(data, indent=2)
+
+    if output:
+        pathlib.Path(output).write_text(text + "\n")
+    else:
+        print(text, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--throughput",
+        action="store_true",
+        help="measure throughput scaling instead of running stress scenarios",
+    )
+    parser.add_argument(
+        "--threads",
+        help="comma separated thread counts for --throughput (default 1,2,4,N)",
+    )
+    parser.add_argument(
+        "--workload",
+        action="append",
+        default=[],
+        help="workload to run for --throughput, may be repeated (default all)",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CANDIDATE"),
+        help="compare two JSON reports produced by --throughput",
+    )
+    parser.add_argument("--output", help="file to write the JSON report to")
+
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, candidate = (
+            json.loads(pathlib.Path(path).read_text()) for path in args.compare
+        )
+        write_json(compare_reports(baseline, candidate), args.output)
+        return 0
+
+    if args.throughput:
+        if args.threads:
+            thread_counts = sorted({int(count) for count in args.threads.split(",")})
+        else:
+            thread_counts = default_thread_counts()
+
+        report, failed = run_throughput(args.workload, thread_counts)
+        write_json(report, args.output)
+        return 1 if failed else 0
+
+    return run_scenarios()
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,122 @@
+"""Stress lock free reads of an AtomicObjectProxy during swaps.
+
+Writer threads continually replace the wrapped objects of two shared C
+``AtomicObjectProxy`` instances, both by assigning ``__wrapped__`` and as a
+group using ``swap_wrapped()``, while the remaining threads continually
+read them. Readers of an ``AtomicObjectProxy`` do not take the per-object
+critical section, relying instead on replaced objects only being released
+once no reader is in flight, so a premature release would show up as a
+reader touching a freed object. Readers also take snapshots of both
+proxies using ``snapshot_wrapped()``, which must always observe a pair
+installed by the same group swap.
+
+Exits 0 on survival, 1 if an inconsistent snapshot is observed, is killed
+by a signal on failure, and exits 77 (skip) if the C extension is not
+available.
+"""
+
+import os
+import sys
+import threading
+import time
+
+THREADS = max(3, int(os.environ.get("WRAPT_STRESS_THREADS", "8")))
+SECONDS = float(os.environ.get("WRAPT_STRESS_SECONDS", "5"))
+
+
+class Value:
+    def __init__(self, generation):
+        self.generation = generation
+
+
+def main():
+    try:
+        from wrapt._wrappers import (
+            AtomicObjectProxy,
+            snapshot_wrapped,
+            swap_wrapped,
+        )
+    except ImportError:
+        print("skipped: C extension not available", flush=True)
+        return 77
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+    print(
+        f"python={sys.version.split()[0]} gil={gil} "
+        f"threads={THREADS} seconds={SECONDS}",
+        flush=True,
+    )
+
+    first = AtomicObjectProxy(Value(0))
+    second = AtomicObjectProxy(Value(0))
+    single = AtomicObjectProxy(Value(0))
+
+    stop = threading.Event()
+    barrier = threading.Barrier(THREADS + 1)
+    counts = [0] * THREADS
+    inconsistent = []
+
+    def group_writer(index):
+        generation = 0
+        barrier.wait()
+        while not stop.is_set():
+            generation += 1
+            swap_wrapped([(first, Value(generation)), (second, Value(generation))])
+            counts[index] += 1
+
+    def single_writer(index):
+        generation = 0
+        barrier.wait()
+        while not stop.is_set():
+            generation += 1
+            single.__wrapped__ = Value(generation)
+            counts[index] += 1
+
+    def reader(index):
+        barrier.wait()
+        while not stop.is_set():
+            value = single.__wrapped__
+            assert type(value) is Value
+            assert value.generation >= 0
+            str(single)
+            hash(first)
+
+            a, b = snapshot_wrapped(first, second)
+
+            if a.generation != b.generation:
+                inconsistent.append((a.generation, b.generation))
+
+            counts[index] += 1
+
+    threads = [
+        threading.Thread(target=group_writer, args=(0,)),
+        threading.Thread(target=single_writer, args=(1,)),
+    ]
+    threads.extend(
+        threading.Thread(target=reader, args=(index,)) for index in range(2, THREADS)
+    )
+
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    time.sleep(SECONDS)
+    stop.set()
+
+    for thread in threads:
+        thread.join()
+
+    if inconsistent:
+        print(f"inconsistent snapshots: {inconsistent[:5]}", flush=True)
+        return 1
+
+    print(
+        f"survived: {counts[0] + counts[1]} swaps, {sum(counts[2:])} reads",
+        flush=True,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
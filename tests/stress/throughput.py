@@ -0,0 +1,170 @@
+"""Throughput workloads for measuring how wrapt scales with thread count.
+
+Unlike the ``stress_*.py`` scenarios, which hunt for crashes, each workload
+here has every thread perform the same operation against a single shared
+object for a fixed duration, so that the total number of operations can be
+compared across thread counts and between GIL and free-threaded builds.
+The workloads are run by ``runner.py --throughput``, which starts a fresh
+interpreter for each workload and thread count, but can also be run
+directly as::
+
+    python tests/stress/throughput.py <workload> <threads>
+
+The result is printed as a single line of JSON. Control the duration with
+the WRAPT_STRESS_SECONDS environment variable.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+SECONDS = float(os.environ.get("WRAPT_STRESS_SECONDS", "2"))
+
+# Operations are performed in batches between checks of the stop flag, so
+# the cost of the check does not dominate cheap operations.
+
+BATCH = 1000
+
+
+class Value:
+    attribute = 1
+
+
+def function_wrapper_call():
+    import wrapt
+
+    @wrapt.decorator
+    def passthrough(wrapped, instance, args, kwargs):
+        return wrapped(*args, **kwargs)
+
+    @passthrough
+    def function():
+        pass
+
+    return function
+
+
+def proxy_attribute_read():
+    import wrapt
+
+    proxy = wrapt.BaseObjectProxy(Value())
+
+    def operation():
+        return proxy.attribute
+
+    return operation
+
+
+def proxy_wrapped_read():
+    import wrapt
+
+    proxy = wrapt.BaseObjectProxy(Value())
+
+    def operation():
+        return proxy.__wrapped__
+
+    return operation
+
+
+def atomic_proxy_wrapped_read():
+    import wrapt
+
+    proxy = wrapt.AtomicObjectProxy(Value())
+
+    def operation():
+        return proxy.__wrapped__
+
+    return operation
+
+
+def proxy_wrapped_swap():
+    import wrapt
+
+    proxy = wrapt.BaseObjectProxy(Value())
+    values = [Value(), Value()]
+
+    def operation():
+        proxy.__wrapped__ = values[0]
+        proxy.__wrapped__ = values[1]
+
+    return operation
+
+
+WORKLOADS = {
+    "function_wrapper_call": function_wrapper_call,
+    "proxy_attribute_read": proxy_attribute_read,
+    "proxy_wrapped_read": proxy_wrapped_read,
+    "atomic_proxy_wrapped_read": atomic_proxy_wrapped_read,
+    "proxy_wrapped_swap": proxy_wrapped_swap,
+}
+
+
+def measure(workload, threads):
+    operation = WORKLOADS[workload]()
+
+    stop = threading.Event()
+    barrier = threading.Barrier(threads + 1)
+    counts = [0] * threads
+
+    def worker(index):
+        count = 0
+        barrier.wait()
+        while not stop.is_set():
+            for _ in range(BATCH):
+                operation()
+            count += BATCH
+        counts[index] = count
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+
+    for thread in workers:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    time.sleep(SECONDS)
+    stop.set()
+
+    for thread in workers:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+
+    return sum(counts), elapsed
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in WORKLOADS:
+        print(
+            "usage: throughput.py {%s} <threads>" % ",".join(WORKLOADS),
+            file=sys.stderr,
+        )
+        return 2
+
+    workload = sys.argv[1]
+    threads = int(sys.argv[2])
+
+    import wrapt.__wrapt__
+
+    operations, elapsed = measure(workload, threads)
+
+    result = {
+        "workload": workload,
+        "threads": threads,
+        "operations": operations,
+        "seconds": elapsed,
+        "ops_per_sec": operations / elapsed,
+        "python": sys.version.split()[0],
+        "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "c_extension": wrapt.__wrapt__._using_c_extension,
+    }
+
+    print(json.dumps(result), flush=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())